@@ -34,38 +34,79 @@
 except Exception:  # noqa: BLE001 — fail-open: never break a healthy install
     pass
 
-from .checks.branch_status import collect_branch_status
-from .llm.interface import prompt_llm
-from .llm.mlflow_verify import verify_mlflow
-from .llm.providers.claude.claude_cli_verification import verify_claude
-from .llm.providers.claude.claude_executable_finder import (
-    find_claude_executable,
-    verify_claude_installation,
-)
-from .llm.providers.langchain.verification import verify_langchain
-from .llm.serialization import deserialize_llm_response, serialize_llm_response
-from .llm.types import LLM_RESPONSE_VERSION, LLMResponseDict
-from .mcp_workspace_git import (
-    CommitResult,
-    commit_all_changes,
-    commit_staged_files,
-    get_full_status,
-    git_push,
-    is_git_repository,
-)
-from .mcp_workspace_github import CommentData, IssueData, IssueManager, LabelData
-from .prompt_manager import (
-    get_prompt,
-    validate_prompt_directory,
-    validate_prompt_markdown,
-)
-from .utils.subprocess_runner import (
-    CommandOptions,
-    CommandResult,
-    execute_command,
-    execute_subprocess,
-)
-from .workflow_utils.commit_operations import generate_commit_message_with_llm
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Public API names are resolved lazily (PEP 562 ``__getattr__``) so that
+# ``import mcp_coder`` — paid by every ``mcp-coder`` CLI invocation — does not
+# drag in the LLM providers, GitHub clients and workflow machinery. Each name
+# maps to the submodule that defines it.
+_LAZY_EXPORTS: dict[str, str] = {
+    "collect_branch_status": ".checks.branch_status",
+    "prompt_llm": ".llm.interface",
+    "verify_mlflow": ".llm.mlflow_verify",
+    "verify_claude": ".llm.providers.claude.claude_cli_verification",
+    "find_claude_executable": ".llm.providers.claude.claude_executable_finder",
+    "verify_claude_installation": ".llm.providers.claude.claude_executable_finder",
+    "verify_langchain": ".llm.providers.langchain.verification",
+    "deserialize_llm_response": ".llm.serialization",
+    "serialize_llm_response": ".llm.serialization",
+    "LLM_RESPONSE_VERSION": ".llm.types",
+    "LLMResponseDict": ".llm.types",
+    "CommitResult": ".mcp_workspace_git",
+    "commit_all_changes": ".mcp_workspace_git",
+    "commit_staged_files": ".mcp_workspace_git",
+    "get_full_status": ".mcp_workspace_git",
+    "git_push": ".mcp_workspace_git",
+    "is_git_repository": ".mcp_workspace_git",
+    "CommentData": ".mcp_workspace_github",
+    "IssueData": ".mcp_workspace_github",
+    "IssueManager": ".mcp_workspace_github",
+    "LabelData": ".mcp_workspace_github",
+    "get_prompt": ".prompt_manager",
+    "validate_prompt_directory": ".prompt_manager",
+    "validate_prompt_markdown": ".prompt_manager",
+    "CommandOptions": ".utils.subprocess_runner",
+    "CommandResult": ".utils.subprocess_runner",
+    "execute_command": ".utils.subprocess_runner",
+    "execute_subprocess": ".utils.subprocess_runner",
+    "generate_commit_message_with_llm": ".workflow_utils.commit_operations",
+}
+
+# Type checking imports for static analysis
+if TYPE_CHECKING:
+    from .checks.branch_status import collect_branch_status
+    from .llm.interface import prompt_llm
+    from .llm.mlflow_verify import verify_mlflow
+    from .llm.providers.claude.claude_cli_verification import verify_claude
+    from .llm.providers.claude.claude_executable_finder import (
+        find_claude_executable,
+        verify_claude_installation,
+    )
+    from .llm.providers.langchain.verification import verify_langchain
+    from .llm.serialization import deserialize_llm_response, serialize_llm_response
+    from .llm.types import LLM_RESPONSE_VERSION, LLMResponseDict
+    from .mcp_workspace_git import (
+        CommitResult,
+        commit_all_changes,
+        commit_staged_files,
+        get_full_status,
+        git_push,
+        is_git_repository,
+    )
+    from .mcp_workspace_github import CommentData, IssueData, IssueManager, LabelData
+    from .prompt_manager import (
+        get_prompt,
+        validate_prompt_directory,
+        validate_prompt_markdown,
+    )
+    from .utils.subprocess_runner import (
+        CommandOptions,
+        CommandResult,
+        execute_command,
+        execute_subprocess,
+    )
+    from .workflow_utils.commit_operations import generate_commit_message_with_llm
 
 # Version is automatically determined from git tags via setuptools-scm
 try:
@@ -119,3 +160,29 @@
     # Branch status
     "collect_branch_status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of the public API listed in ``_LAZY_EXPORTS``.
+
+    Returns:
+        The requested attribute, imported from its defining submodule.
+
+    Raises:
+        AttributeError: If the attribute is not found in this module.
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported public API in ``dir(mcp_coder)``.
+
+    Returns:
+        The sorted module attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
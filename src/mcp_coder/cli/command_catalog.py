@@ -72,3 +72,39 @@
         ],
     ),
 ]
+
+# Command key -> ``"<module>:<function>"`` of its handler, module relative to
+# ``mcp_coder.cli``. Handlers are referenced by name, not imported, so that
+# ``cli/main.py`` imports only the module of the subcommand actually selected:
+# ``mcp-coder --version`` or ``gh-tool get-base-branch`` never pay for the
+# coordinator, iCoder (Textual) or LLM-provider import graphs. Keys are the
+# display names above, plus ``"coordinator test"`` for ``coordinator --dry-run``.
+COMMAND_HANDLERS: dict[str, str] = {
+    "init": "commands.init:execute_init",
+    "verify": "commands.verify:execute_verify",
+    "create-plan": "commands.create_plan:execute_create_plan",
+    "review-plan": "commands.review:execute_review_plan",
+    "implement": "commands.implement:execute_implement",
+    "rebase": "commands.rebase:execute_rebase",
+    "review-implementation": "commands.review:execute_review_implementation",
+    "create-pr": "commands.create_pr:execute_create_pr",
+    "coordinator": "commands.coordinator:execute_coordinator_run",
+    "coordinator test": "commands.coordinator:execute_coordinator_test",
+    "icoder": "commands.icoder:execute_icoder",
+    "vscodeclaude launch": "commands.coordinator:execute_coordinator_vscodeclaude",
+    "vscodeclaude status": (
+        "commands.coordinator:execute_coordinator_vscodeclaude_status"
+    ),
+    "prompt": "commands.prompt:execute_prompt",
+    "commit auto": "commands.commit:execute_commit_auto",
+    "check branch-status": ("commands.check_branch_status:execute_check_branch_status"),
+    "check file-size": "commands.check_file_sizes:execute_check_file_sizes",
+    "gh-tool checkout-issue-branch": ("commands.gh_tool:execute_checkout_issue_branch"),
+    "gh-tool set-status": "commands.set_status:execute_set_status",
+    "gh-tool get-base-branch": "commands.gh_tool:execute_get_base_branch",
+    "gh-tool define-labels": "commands.define_labels:execute_define_labels",
+    "gh-tool issue-stats": (
+        "commands.coordinator.issue_stats:execute_coordinator_issue_stats"
+    ),
+    "git-tool compact-diff": "commands.git_tool:execute_compact_diff",
+}
@@ -1,15 +1,37 @@
-"""CLI command modules."""
-
-from . import coordinator
-from .commit import execute_commit_auto
-from .coordinator import execute_coordinator_test
-from .create_plan import execute_create_plan
-from .create_pr import execute_create_pr
-from .help import get_help_text
-from .implement import execute_implement
-from .init import execute_init
-from .prompt import execute_prompt
-from .verify import execute_verify
+"""CLI command modules.
+
+Command modules are imported lazily: ``mcp-coder`` resolves only the handler
+of the selected subcommand (see ``cli/command_catalog.py``), so importing this
+package must not import every command and its dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "get_help_text": ".help",
+    "execute_init": ".init",
+    "execute_verify": ".verify",
+    "execute_prompt": ".prompt",
+    "execute_commit_auto": ".commit",
+    "execute_implement": ".implement",
+    "execute_create_plan": ".create_plan",
+    "execute_create_pr": ".create_pr",
+    "execute_coordinator_test": ".coordinator",
+}
+
+# Type checking imports for static analysis
+if TYPE_CHECKING:
+    from . import coordinator
+    from .commit import execute_commit_auto
+    from .coordinator import execute_coordinator_test
+    from .create_plan import execute_create_plan
+    from .create_pr import execute_create_pr
+    from .help import get_help_text
+    from .implement import execute_implement
+    from .init import execute_init
+    from .prompt import execute_prompt
+    from .verify import execute_verify
 
 __all__ = [
     "coordinator",
@@ -23,3 +45,20 @@
     "execute_create_pr",
     "execute_coordinator_test",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of command handlers and the ``coordinator`` subpackage.
+
+    Returns:
+        The requested handler or submodule.
+
+    Raises:
+        AttributeError: If the attribute is not found in this module.
+    """
+    if name == "coordinator":
+        return import_module(".coordinator", __name__)
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path, __name__), name)
@@ -30,6 +30,7 @@
 )
 from ...utils.log_utils import OUTPUT
 from ...workflow_steps.ci import check_and_fix_ci
+from ...workflow_steps.ci_wait import CIDurationHistory, CIWaiter, notifier_from_env
 from ...workflows.utils import resolve_project_dir
 from ..utils import (
     parse_llm_method_from_args,
@@ -63,6 +64,9 @@ def _wait_for_ci_completion(
 ) -> Tuple[Optional[CIStatusData], bool]:
     """Wait for CI completion with timeout.
 
+    Polls are paced by the adaptive CI-wait engine shared with the CI
+    workflow step (see ``workflow_steps.ci_wait``).
+
     Args:
         ci_manager: CI results manager instance
         branch: Branch name to check
@@ -80,54 +84,56 @@ def _wait_for_ci_completion(
     if timeout_seconds <= 0:
         return None, True  # Graceful exit, no wait requested
 
-    poll_interval = 15  # seconds
-    max_attempts = timeout_seconds // poll_interval
-    log_every_n = 4  # Log every 4 polls = ~60 seconds
+    progress_every_seconds = 60  # Log progress roughly once a minute
 
     if not llm_mode:
         logger.log(
             OUTPUT, "Waiting for CI completion (timeout: %ds)...", timeout_seconds
         )
 
+    waiter = CIWaiter(
+        timeout_seconds, notifier=notifier_from_env(), history=CIDurationHistory()
+    )
+    last_progress = 0.0
     ci_status: Optional[CIStatusData] = None
-    for attempt in range(max_attempts):
-        try:
-            ci_status = ci_manager.get_latest_ci_status(branch)
-        except (
-            Exception
-        ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow to specific GitHub/CI exceptions
-            logger.error("CI API error during polling: %s", e)
-            raise RuntimeError(f"API error during CI polling: {e}") from e
-
-        run_info = ci_status.get("run", {})
-
-        # No CI run found yet
-        if len(run_info) == 0:
-            if attempt == max_attempts - 1:
-                logger.info("No CI run found within timeout")
-                return None, True  # Graceful exit
-            # Periodic progress (every ~60s)
-            if not llm_mode and attempt > 0 and attempt % log_every_n == 0:
-                elapsed = (attempt + 1) * poll_interval
-                logger.log(OUTPUT, "Still waiting for CI... (%ds elapsed)", elapsed)
-            time.sleep(poll_interval)
-            continue
-
-        # Check if CI completed
-        if run_info.get("status") == "completed":
-            conclusion = run_info.get("conclusion")
-            if conclusion == "success":
-                logger.info("CI passed")
-                return ci_status, True
-            else:
+    try:
+        while True:
+            try:
+                ci_status = ci_manager.get_latest_ci_status(branch)
+            except (
+                Exception
+            ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow to specific GitHub/CI exceptions
+                logger.error("CI API error during polling: %s", e)
+                raise RuntimeError(f"API error during CI polling: {e}") from e
+
+            waiter.observe(ci_status)
+            run_info = ci_status.get("run", {})
+
+            # Check if CI completed
+            if run_info and run_info.get("status") == "completed":
+                conclusion = run_info.get("conclusion")
+                if conclusion == "success":
+                    logger.info("CI passed")
+                    return ci_status, True
                 logger.info("CI completed with conclusion: %s", conclusion)
                 return ci_status, False
 
-        # CI still running — periodic progress
-        if not llm_mode and attempt > 0 and attempt % log_every_n == 0:
-            elapsed = (attempt + 1) * poll_interval
-            logger.log(OUTPUT, "Still waiting for CI... (%ds elapsed)", elapsed)
-        time.sleep(poll_interval)
+            if waiter.expired:
+                break
+
+            # No run yet or still running — periodic progress (~every 60s)
+            if not llm_mode and waiter.waited - last_progress >= progress_every_seconds:
+                last_progress = waiter.waited
+                logger.log(
+                    OUTPUT, "Still waiting for CI... (%ds elapsed)", int(waiter.waited)
+                )
+            waiter.wait()
+    finally:
+        waiter.close()
+
+    if not ci_status or len(ci_status.get("run", {})) == 0:
+        logger.info("No CI run found within timeout")
+        return None, True  # Graceful exit
 
     # Timeout reached
     logger.info("CI polling timeout reached")
@@ -6,6 +6,7 @@
 
 import argparse
 import logging
+import time
 from typing import Optional
 
 from ....mcp_workspace_github import (
@@ -32,6 +33,7 @@
     load_repo_config,
     validate_repo_config,
 )
+from .parallel import RepoRunResult, log_timing_summary, run_repos_in_parallel
 from .workflow_constants import WORKFLOW_MAPPING
 
 __all__ = [
@@ -161,6 +163,146 @@ def execute_coordinator_test(args: argparse.Namespace) -> int:
         raise
 
 
+def _process_repository(
+    repo_name: str,
+    args: argparse.Namespace,
+    jenkins_client: JenkinsClient,
+) -> RepoRunResult:
+    """Run the coordinator pipeline for one repository.
+
+    Loads and validates the repo config, fetches eligible issues (cache first)
+    and dispatches a workflow per issue. Dispatching is fail-fast: the first
+    failed dispatch stops this repository.
+
+    Args:
+        repo_name: Repository name from the config file
+        args: Parsed coordinator command line arguments
+        jenkins_client: Jenkins client used for dispatching
+
+    Returns:
+        RepoRunResult describing the outcome (duration is filled by the caller)
+    """  # Also raises ValueError via validate_repo_config (invalid repo config).
+    result = RepoRunResult(repo_name=repo_name, success=True)
+
+    # Load and validate repo config
+    repo_config = load_repo_config(repo_name)
+    validate_repo_config(repo_name, repo_config)
+
+    # Log repository header with URL
+    repo_url = repo_config["repo_url"]
+    logger.info(f"{'='*80}")
+    logger.info(f"Processing repository: {repo_url}")
+    logger.info(f"{'='*80}")
+
+    # Type narrowing: validate_repo_config raises if any fields are None
+    # Assert to help mypy understand the values are str after validation
+    assert isinstance(repo_config["repo_url"], str)
+    assert isinstance(repo_config["executor_job_path"], str)
+    assert isinstance(repo_config["github_credentials_id"], str)
+    executor_os_val = repo_config.get("executor_os")
+    validated_config: dict[str, str] = {
+        "repo_url": repo_config["repo_url"],
+        "executor_job_path": repo_config["executor_job_path"],
+        "github_credentials_id": repo_config["github_credentials_id"],
+        "executor_os": (
+            executor_os_val if isinstance(executor_os_val, str) else "linux"
+        ),
+    }
+
+    # Create managers
+    issue_manager = IssueManager(repo_url=validated_config["repo_url"])
+    branch_manager = IssueBranchManager(repo_url=validated_config["repo_url"])
+
+    # Get eligible issues using cache
+    # Create RepoIdentifier from repo_url
+    repo_url = validated_config["repo_url"]
+    try:
+        repo_identifier = RepoIdentifier.from_repo_url(repo_url)
+        repo_full_name = repo_identifier.full_name
+    except ValueError:
+        # Fallback: use repo_name if URL format is unexpected
+        repo_full_name = repo_name
+
+    try:
+        eligible_issues = get_cached_eligible_issues(
+            repo_full_name=repo_full_name,
+            issue_manager=issue_manager,
+            force_refresh=args.force_refresh,
+            cache_refresh_minutes=get_cache_refresh_minutes(),
+        )
+    except (
+        Exception
+    ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
+        logger.warning(f"Cache failed for {repo_full_name}: {e}, using direct fetch")
+        eligible_issues = get_eligible_issues(issue_manager)
+
+    logger.info(f"Found {len(eligible_issues)} eligible issues")
+    result.eligible_issues = len(eligible_issues)
+
+    # Skip if no eligible issues or duplicate protection triggered
+    if not eligible_issues:
+        logger.info(f"No eligible issues for {repo_name}")
+        return result
+
+    # Dispatch workflows for each eligible issue (fail-fast)
+    for issue in eligible_issues:
+        # Find current bot_pickup label to determine workflow
+        current_label = None
+        for label in issue["labels"]:
+            if label in WORKFLOW_MAPPING:
+                current_label = label
+                break
+
+        if not current_label:
+            logger.error(f"Issue #{issue['number']} has no workflow label, skipping")
+            continue
+
+        workflow_config = WORKFLOW_MAPPING[current_label]
+        workflow_name = workflow_config["workflow"]
+
+        try:
+            dispatch_workflow(
+                issue=issue,
+                workflow_name=workflow_name,
+                repo_config=validated_config,
+                jenkins_client=jenkins_client,
+                issue_manager=issue_manager,
+                branch_manager=branch_manager,
+                log_level=args.log_level,
+            )
+            result.dispatched += 1
+
+            # Update cache with new labels immediately after successful dispatch
+            try:
+                update_issue_labels_in_cache(
+                    RepoIdentifier.from_full_name(repo_full_name),
+                    issue_number=issue["number"],
+                    old_label=current_label,
+                    new_label=workflow_config["next_label"],
+                )
+            except (
+                Exception
+            ) as cache_error:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
+                logger.warning(
+                    f"Cache update failed for issue #{issue['number']}: {cache_error}"
+                )
+
+        except (
+            Exception
+        ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
+            # Fail-fast: log error and stop processing this repository
+            logger.error(
+                f"Failed processing issue #{issue['number']}: {e}",
+                exc_info=True,
+            )
+            result.success = False
+            result.error = f"issue #{issue['number']}: {e}"
+            return result
+
+    logger.info(f"Successfully processed all issues in {repo_name}")
+    return result
+
+
 def execute_coordinator_run(args: argparse.Namespace) -> int:
     """Execute coordinator run command.
 
@@ -169,6 +311,8 @@ def execute_coordinator_run(args: argparse.Namespace) -> int:
             - all: Process all repositories (bool)
             - repo: Single repository name (str, optional)
             - log_level: Logging level (str)
+            - parallel: Max repositories processed concurrently (int, optional;
+              default 1 = sequential with global fail-fast)
 
     Returns:
         int: Exit code (0 for success, 1 for error)
@@ -211,128 +355,37 @@ def execute_coordinator_run(args: argparse.Namespace) -> int:
 
         # Step 3: Get Jenkins credentials (shared across all repos)
         server_url, username, api_token = get_jenkins_credentials()
-        jenkins_client = JenkinsClient(server_url, username, api_token)
 
-        # Step 4: Process each repository
-        for repo_name in repo_names:
-            # Step 4a: Load and validate repo config
-            repo_config = load_repo_config(repo_name)
-            validate_repo_config(repo_name, repo_config)
-
-            # Log repository header with URL
-            repo_url = repo_config["repo_url"]
-            logger.info(f"{'='*80}")
-            logger.info(f"Processing repository: {repo_url}")
-            logger.info(f"{'='*80}")
-
-            # Type narrowing: validate_repo_config raises if any fields are None
-            # Assert to help mypy understand the values are str after validation
-            assert isinstance(repo_config["repo_url"], str)
-            assert isinstance(repo_config["executor_job_path"], str)
-            assert isinstance(repo_config["github_credentials_id"], str)
-            executor_os_val = repo_config.get("executor_os")
-            validated_config: dict[str, str] = {
-                "repo_url": repo_config["repo_url"],
-                "executor_job_path": repo_config["executor_job_path"],
-                "github_credentials_id": repo_config["github_credentials_id"],
-                "executor_os": (
-                    executor_os_val if isinstance(executor_os_val, str) else "linux"
+        # Step 4: Process repositories (sequentially or on a bounded pool)
+        parallel = getattr(args, "parallel", None) or 1
+        if parallel > 1 and len(repo_names) > 1:
+            # One Jenkins client per worker: clients are not shared across threads
+            results = run_repos_in_parallel(
+                repo_names,
+                lambda repo_name: _process_repository(
+                    repo_name,
+                    args,
+                    JenkinsClient(server_url, username, api_token),
                 ),
-            }
-
-            # Step 4b: Create managers
-            issue_manager = IssueManager(repo_url=validated_config["repo_url"])
-            branch_manager = IssueBranchManager(repo_url=validated_config["repo_url"])
-
-            # Step 4c: Get eligible issues using cache
-            # Create RepoIdentifier from repo_url
-            repo_url = validated_config["repo_url"]
-            try:
-                repo_identifier = RepoIdentifier.from_repo_url(repo_url)
-                repo_full_name = repo_identifier.full_name
-            except ValueError:
-                # Fallback: use repo_name if URL format is unexpected
-                repo_full_name = repo_name
+                max_workers=min(parallel, len(repo_names)),
+            )
+            log_timing_summary(results)
+            return 0 if all(result.success for result in results) else 1
 
-            try:
-                eligible_issues = get_cached_eligible_issues(
-                    repo_full_name=repo_full_name,
-                    issue_manager=issue_manager,
-                    force_refresh=args.force_refresh,
-                    cache_refresh_minutes=get_cache_refresh_minutes(),
-                )
-            except (
-                Exception
-            ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
-                logger.warning(
-                    f"Cache failed for {repo_full_name}: {e}, using direct fetch"
-                )
-                eligible_issues = get_eligible_issues(issue_manager)
-
-            logger.info(f"Found {len(eligible_issues)} eligible issues")
-
-            # Skip if no eligible issues or duplicate protection triggered
-            if not eligible_issues:
-                logger.info(f"No eligible issues for {repo_name}")
-                continue
-
-            # Step 4d: Dispatch workflows for each eligible issue (fail-fast)
-            for issue in eligible_issues:
-                # Find current bot_pickup label to determine workflow
-                current_label = None
-                for label in issue["labels"]:
-                    if label in WORKFLOW_MAPPING:
-                        current_label = label
-                        break
-
-                if not current_label:
-                    logger.error(
-                        f"Issue #{issue['number']} has no workflow label, skipping"
-                    )
-                    continue
-
-                workflow_config = WORKFLOW_MAPPING[current_label]
-                workflow_name = workflow_config["workflow"]
-
-                try:
-                    dispatch_workflow(
-                        issue=issue,
-                        workflow_name=workflow_name,
-                        repo_config=validated_config,
-                        jenkins_client=jenkins_client,
-                        issue_manager=issue_manager,
-                        branch_manager=branch_manager,
-                        log_level=args.log_level,
-                    )
-
-                    # Update cache with new labels immediately after successful dispatch
-                    try:
-                        update_issue_labels_in_cache(
-                            RepoIdentifier.from_full_name(repo_full_name),
-                            issue_number=issue["number"],
-                            old_label=current_label,
-                            new_label=workflow_config["next_label"],
-                        )
-                    except (
-                        Exception
-                    ) as cache_error:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
-                        logger.warning(
-                            f"Cache update failed for issue #{issue['number']}: {cache_error}"
-                        )
-
-                except (
-                    Exception
-                ) as e:  # pylint: disable=broad-exception-caught  # TODO: narrow per sub-workflow error types
-                    # Fail-fast: log error and exit immediately
-                    logger.error(
-                        f"Failed processing issue #{issue['number']}: {e}",
-                        exc_info=True,
-                    )
-                    return 1
-
-            logger.info(f"Successfully processed all issues in {repo_name}")
+        jenkins_client = JenkinsClient(server_url, username, api_token)
+        results = []
+        for repo_name in repo_names:
+            start = time.monotonic()
+            result = _process_repository(repo_name, args, jenkins_client)
+            result.duration_seconds = time.monotonic() - start
+            results.append(result)
+            if not result.success:
+                # Fail-fast: stop at the first repository with a failed dispatch
+                return 1
 
         # Step 5: Success - all repos processed
+        if len(results) > 1:
+            log_timing_summary(results)
         return 0
 
     except ValueError as e:
@@ -209,7 +209,10 @@ def execute_coordinator_vscodeclaude(args: argparse.Namespace) -> int:
         # (read-only: snapshot taken once, no disk writes here). Cleanup now
         # consumes the assessments directly; restart still reads the legacy
         # active_set shape, so project the verdicts onto it until it is migrated.
-        assessments = build_assessments(sessions_list, cached_issues_by_repo)
+        assessment_timings: dict[str, float] = {}
+        assessments = build_assessments(
+            sessions_list, cached_issues_by_repo, timings=assessment_timings
+        )
         active_set = {
             folder: assessment.verdict.active
             for folder, assessment in assessments.items()
@@ -254,7 +257,12 @@ def execute_coordinator_vscodeclaude(args: argparse.Namespace) -> int:
         # calls it (it is write-free). ``sessions_list`` is the build-time set
         # (captured before cleanup/restart removed any), so the audit trail still
         # records the destructive deletes that cleanup persisted out of the store.
-        apply_assessments(assessments, sessions_list, write_audit=True)
+        apply_assessments(
+            assessments,
+            sessions_list,
+            write_audit=True,
+            timings=assessment_timings,
+        )
 
         # Step 3: Check repo list (already loaded above)
         if not repo_names:
@@ -375,6 +383,10 @@ def execute_coordinator_vscodeclaude_status(args: argparse.Namespace) -> int:
         build_eligible_issues_with_branch_check,
     )
     from ....workflows.vscodeclaude.status import display_status_table
+    from ....workflows.vscodeclaude.venv_template import (
+        list_venv_templates,
+        render_venv_templates,
+    )
 
     # Load sessions first (needed for cache building)
     store = load_sessions()
@@ -425,6 +437,11 @@ def execute_coordinator_vscodeclaude_status(args: argparse.Namespace) -> int:
         issues_without_branch=issues_without_branch,
     )
 
+    templates = list_venv_templates()
+    if templates:
+        logger.log(OUTPUT, "")
+        logger.log(OUTPUT, "%s", render_venv_templates(templates))
+
     return 0
 
 
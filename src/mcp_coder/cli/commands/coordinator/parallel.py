@@ -0,0 +1,187 @@
+"""Bounded worker-pool execution for ``coordinator --all --parallel N``.
+
+Runs one callable per repository on a thread pool and keeps the log output
+readable: records emitted by a worker thread are buffered per repository and
+written to the real handlers in one block when that repository finishes, so
+output from concurrent repositories never interleaves.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from ....utils.log_utils import OUTPUT
+
+__all__ = [
+    "RepoRunResult",
+    "format_timing_summary",
+    "log_timing_summary",
+    "run_repos_in_parallel",
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RepoRunResult:
+    """Outcome of processing one repository in a coordinator run."""
+
+    repo_name: str
+    success: bool
+    duration_seconds: float = 0.0
+    eligible_issues: int = 0
+    dispatched: int = 0
+    error: Optional[str] = None
+
+
+class _PerThreadBufferingHandler(logging.Handler):
+    """Root handler that holds back records from registered worker threads.
+
+    Records from threads that are not registered are forwarded straight to the
+    original handlers, so the main thread keeps logging normally.
+    """
+
+    def __init__(self, targets: list[logging.Handler]) -> None:
+        super().__init__(level=logging.NOTSET)
+        self._targets = targets
+        self._buffers: dict[int, list[logging.LogRecord]] = {}
+        self._buffers_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def register_current_thread(self) -> None:
+        """Start buffering records emitted by the calling thread."""
+        with self._buffers_lock:
+            self._buffers[threading.get_ident()] = []
+
+    def release_current_thread(self) -> None:
+        """Stop buffering for the calling thread and flush its records as a block."""
+        with self._buffers_lock:
+            records = self._buffers.pop(threading.get_ident(), [])
+        with self._flush_lock:
+            for record in records:
+                self._forward(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._buffers_lock:
+            buffer = self._buffers.get(threading.get_ident())
+            if buffer is not None:
+                buffer.append(record)
+                return
+        with self._flush_lock:
+            self._forward(record)
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        for handler in self._targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+@contextmanager
+def _buffered_root_logging() -> Iterator[_PerThreadBufferingHandler]:
+    """Temporarily route root logging through a per-thread buffering handler.
+
+    Yields:
+        The buffering handler installed on the root logger.
+    """
+    root = logging.getLogger()
+    original_handlers = list(root.handlers)
+    buffering = _PerThreadBufferingHandler(original_handlers)
+    for handler in original_handlers:
+        root.removeHandler(handler)
+    root.addHandler(buffering)
+    try:
+        yield buffering
+    finally:
+        root.removeHandler(buffering)
+        for handler in original_handlers:
+            root.addHandler(handler)
+
+
+def run_repos_in_parallel(
+    repo_names: list[str],
+    process_repo: Callable[[str], RepoRunResult],
+    max_workers: int,
+) -> list[RepoRunResult]:
+    """Process repositories concurrently on a bounded thread pool.
+
+    Each repository keeps its own fail-fast behaviour inside ``process_repo``;
+    an exception escaping it only marks that repository as failed and never
+    stops the others.
+
+    Args:
+        repo_names: Repositories to process.
+        process_repo: Callable running the full per-repo pipeline.
+        max_workers: Upper bound on concurrently processed repositories.
+
+    Returns:
+        One result per repository, in the order of ``repo_names``.
+    """
+    results: dict[str, RepoRunResult] = {}
+
+    with _buffered_root_logging() as buffering:
+
+        def _worker(repo_name: str) -> RepoRunResult:
+            buffering.register_current_thread()
+            start = time.monotonic()
+            try:
+                result = process_repo(repo_name)
+            except (
+                Exception
+            ) as e:  # pylint: disable=broad-exception-caught  # isolate failures per repo
+                logger.error(
+                    f"Failed processing repository {repo_name}: {e}", exc_info=True
+                )
+                result = RepoRunResult(repo_name=repo_name, success=False, error=str(e))
+            finally:
+                buffering.release_current_thread()
+            result.duration_seconds = time.monotonic() - start
+            return result
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="coordinator-repo"
+        ) as executor:
+            futures = {executor.submit(_worker, name): name for name in repo_names}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.repo_name] = result
+
+    return [results[name] for name in repo_names]
+
+
+def format_timing_summary(results: list[RepoRunResult]) -> str:
+    """Format a per-repository timing summary for the end of a run.
+
+    Args:
+        results: Per-repository results, in display order.
+
+    Returns:
+        Multi-line summary string.
+    """
+    if not results:
+        return "Repository timing summary: no repositories processed"
+
+    name_width = max(len(result.repo_name) for result in results)
+    lines = ["Repository timing summary:"]
+    for result in results:
+        status = "ok" if result.success else "FAILED"
+        line = (
+            f"  {result.repo_name:<{name_width}}  {result.duration_seconds:7.2f}s  "
+            f"{status:<6}  issues={result.eligible_issues} "
+            f"dispatched={result.dispatched}"
+        )
+        if result.error:
+            line += f"  error={result.error}"
+        lines.append(line)
+    total = sum(result.duration_seconds for result in results)
+    lines.append(f"  total (sum of repos): {total:.2f}s")
+    return "\n".join(lines)
+
+
+def log_timing_summary(results: list[RepoRunResult]) -> None:
+    """Log the per-repository timing summary at OUTPUT level."""
+    logger.log(OUTPUT, "%s", format_timing_summary(results))
@@ -9,7 +9,7 @@
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict
 
 from ...config.label_config import (
     build_label_lookups,
@@ -25,6 +25,15 @@
 )
 from ...workflows.utils import resolve_project_dir
 from .define_labels_actions import write_github_actions
+from .define_labels_stale import (
+    STALE_CHECK_MAX_WORKERS,
+    LabelEventCache,
+    RateLimitGate,
+    StaleCheck,
+    get_label_event_cache_path,
+    get_rate_limit_headroom,
+    run_stale_checks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +46,8 @@ class ValidationResults(TypedDict):
     warnings: list[
         dict[str, Any]
     ]  # {'issue': int, 'label': str, 'elapsed': int, 'threshold': int}
+    skipped: NotRequired[list[int]]  # Stale checks skipped for the rate limit
+    rate_limit: NotRequired[dict[str, int]]  # {'remaining': int, 'limit': int}
 
 
 def _log_dry_run_changes(changes: dict[str, list[str]]) -> None:
@@ -146,14 +157,19 @@ def check_stale_bot_process(
     label_name: str,
     timeout_minutes: int | None,
     issue_manager: IssueManager,
+    label_cache: LabelEventCache | None = None,
 ) -> tuple[bool, int | None]:
     """Check if a bot_busy label has exceeded its timeout threshold.
 
+    Issues created less than ``timeout_minutes`` ago are not stale and need
+    no API call; a ``label_cache`` hit also saves the events request.
+
     Args:
         issue: Issue data containing the bot_busy label
         label_name: Name of the bot_busy label to check
         timeout_minutes: Configured timeout threshold (None if not configured)
         issue_manager: IssueManager instance for API calls
+        label_cache: Optional cache of label timestamps from earlier runs
 
     Returns:
         Tuple of (is_stale, elapsed_minutes or None if not found)
@@ -166,22 +182,31 @@ def check_stale_bot_process(
         )
         return (False, None)
 
-    # Get events for issue
-    issue_number = issue["number"]
-    events = issue_manager.get_issue_events(issue_number, IssueEventType.LABELED)
+    # The label was added after the issue was created
+    created_at = issue.get("created_at")
+    if created_at and calculate_elapsed_minutes(created_at) <= timeout_minutes:
+        return (False, None)
 
-    # Filter to events matching the label_name
-    label_events = [event for event in events if event["label"] == label_name]
+    labeled_at = label_cache.get(issue, label_name) if label_cache else None
+    if labeled_at is None:
+        # Get events for issue
+        issue_number = issue["number"]
+        events = issue_manager.get_issue_events(issue_number, IssueEventType.LABELED)
 
-    # If no events found, return (False, None)
-    if not label_events:
-        return (False, None)
+        # Filter to events matching the label_name
+        label_events = [event for event in events if event["label"] == label_name]
 
-    # Find most recent event by created_at
-    most_recent = max(label_events, key=lambda e: e["created_at"])
+        # If no events found, return (False, None)
+        if not label_events:
+            return (False, None)
+
+        # Find most recent event by created_at
+        labeled_at = max(label_events, key=lambda e: e["created_at"])["created_at"]
+        if label_cache is not None:
+            label_cache.put(issue, label_name, labeled_at)
 
     # Calculate elapsed minutes
-    elapsed = calculate_elapsed_minutes(most_recent["created_at"])
+    elapsed = calculate_elapsed_minutes(labeled_at)
 
     # Return (is_stale, elapsed)
     return (elapsed > timeout_minutes, elapsed)
@@ -192,6 +217,9 @@ def validate_issues(
     labels_config: dict[str, Any],
     issue_manager: IssueManager,
     dry_run: bool = False,  # pylint: disable=unused-argument
+    *,
+    label_cache: LabelEventCache | None = None,
+    max_workers: int = STALE_CHECK_MAX_WORKERS,
 ) -> ValidationResults:
     """Validate all issues for errors and warnings.
 
@@ -199,6 +227,9 @@ def validate_issues(
     1. Multiple status labels (error)
     2. Stale bot_busy processes exceeding timeout (warning)
 
+    Staleness checks run concurrently (see ``define_labels_stale``); checks
+    that would exhaust the GitHub rate limit are skipped and reported.
+
     Note: dry_run parameter is accepted for API consistency but staleness
     checks always run to provide complete validation reports.
 
@@ -207,9 +238,12 @@ def validate_issues(
         labels_config: Full labels configuration with workflow_labels
         issue_manager: IssueManager instance for API calls
         dry_run: Accepted for API consistency (staleness checks always run)
+        label_cache: Optional label timestamp cache, saved after the checks
+        max_workers: Maximum number of concurrent staleness checks
 
     Returns:
-        ValidationResults with errors, warnings, ok lists
+        ValidationResults with errors, warnings, skipped checks and the
+        remaining rate limit (when known)
     """
     # Build label lookups
     label_lookups = build_label_lookups(labels_config)
@@ -228,6 +262,7 @@ def validate_issues(
         "warnings": [],
     }
 
+    stale_checks: list[StaleCheck] = []
     for issue in issues:
         issue_number = issue["number"]
         count, found_labels = check_status_labels(issue, workflow_label_names)
@@ -242,21 +277,50 @@ def validate_issues(
 
             if category == "bot_busy":
                 # Check staleness (runs in dry-run too for complete report)
-                timeout = name_to_timeout.get(label_name)
-                is_stale, elapsed = check_stale_bot_process(
-                    issue, label_name, timeout, issue_manager
+                stale_checks.append(
+                    StaleCheck(issue, label_name, name_to_timeout.get(label_name))
                 )
 
-                if is_stale and elapsed is not None and timeout is not None:
-                    results["warnings"].append(
-                        {
-                            "issue": issue_number,
-                            "label": label_name,
-                            "elapsed": elapsed,
-                            "threshold": timeout,
-                        }
-                    )
+    if not stale_checks:
+        return results
+
+    def _check(item: StaleCheck) -> tuple[bool, int | None]:
+        return check_stale_bot_process(
+            item.issue,
+            item.label_name,
+            item.timeout_minutes,
+            issue_manager,
+            label_cache,
+        )
 
+    gate = RateLimitGate(max_workers, lambda: get_rate_limit_headroom(issue_manager))
+    outcomes = run_stale_checks(stale_checks, _check, gate, max_workers=max_workers)
+    skipped: list[int] = []
+    for item, outcome in zip(stale_checks, outcomes):
+        if outcome is None:
+            skipped.append(item.issue["number"])
+            continue
+        is_stale, elapsed = outcome
+        if is_stale and elapsed is not None and item.timeout_minutes is not None:
+            results["warnings"].append(
+                {
+                    "issue": item.issue["number"],
+                    "label": item.label_name,
+                    "elapsed": elapsed,
+                    "threshold": item.timeout_minutes,
+                }
+            )
+    if skipped:
+        results["skipped"] = skipped
+    if label_cache is not None:
+        label_cache.save()
+
+    headroom = get_rate_limit_headroom(issue_manager)
+    if headroom is not None:
+        results["rate_limit"] = {"remaining": headroom[0], "limit": headroom[1]}
+        logger.info(
+            "GitHub API rate limit after validation: %d/%d remaining", *headroom
+        )
     return results
 
 
@@ -340,6 +404,20 @@ def format_validation_summary(
                     f"{elapsed} minutes (threshold: {threshold})"
                 )
 
+        skipped = validation_results.get("skipped", [])
+        if skipped:
+            issue_list = ", ".join(f"#{n}" for n in skipped)
+            lines.append(
+                f"  Stale checks skipped (rate limit): {len(skipped)} ({issue_list})"
+            )
+
+        rate_limit = validation_results.get("rate_limit")
+        if rate_limit:
+            lines.append(
+                f"  GitHub API: {rate_limit['remaining']}/{rate_limit['limit']} "
+                "requests remaining"
+            )
+
     return "\n".join(lines)
 
 
@@ -618,11 +696,20 @@ def execute_define_labels(args: argparse.Namespace) -> int:
 
             if validate:
                 # Validate issues for errors and warnings
+                cache_path = get_label_event_cache_path(project_dir)
                 issue_validation = validate_issues(
-                    issues, labels_config, issue_manager, dry_run=dry_run
+                    issues,
+                    labels_config,
+                    issue_manager,
+                    dry_run=dry_run,
+                    label_cache=LabelEventCache(cache_path),
                 )
                 validation["errors"] = issue_validation["errors"]
                 validation["warnings"] = issue_validation["warnings"]
+                if "skipped" in issue_validation:
+                    validation["skipped"] = issue_validation["skipped"]
+                if "rate_limit" in issue_validation:
+                    validation["rate_limit"] = issue_validation["rate_limit"]
 
         # Generate GitHub Action workflow files if requested
         if gen_actions:
@@ -0,0 +1,224 @@
+"""Concurrent stale-bot checks for ``define-labels --validate``.
+
+Checking whether a ``bot_busy`` label is stale needs the issue's label
+events, i.e. one or more GitHub API requests per issue. This module runs
+those checks on a bounded thread pool behind a :class:`RateLimitGate`, and
+avoids requests where the answer is already known:
+
+- :class:`LabelEventCache` keeps each issue's last ``labeled`` timestamp in a
+  sidecar of the coordinator issue cache. An entry is reused while the
+  issue's ``updated_at`` is unchanged (re-labelling always bumps it).
+- An issue created less than ``stale_timeout_minutes`` ago cannot carry a
+  stale label, so it needs no request at all (see ``check_stale_bot_process``).
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ...mcp_workspace_git import get_repository_identifier
+from ...mcp_workspace_github import IssueData, IssueManager, get_cache_file_path
+
+logger = logging.getLogger(__name__)
+
+# Concurrent stale checks (each holds at most a few requests in flight).
+STALE_CHECK_MAX_WORKERS = 8
+
+# Core API requests left untouched for the coordinator and other tools;
+# checks that would dip below it are skipped.
+RATE_LIMIT_RESERVE = 100
+
+
+@dataclass(frozen=True)
+class StaleCheck:
+    """One ``bot_busy`` label to check for staleness."""
+
+    issue: IssueData
+    label_name: str
+    timeout_minutes: int | None
+
+
+def get_rate_limit_headroom(issue_manager: IssueManager) -> tuple[int, int] | None:
+    """Return ``(remaining, limit)`` of the core GitHub API rate limit.
+
+    Read from the client's last response headers, so it costs no request once
+    the client has made one.
+
+    Returns:
+        The headroom, or None if it cannot be determined.
+    """
+    try:
+        # pylint: disable=protected-access  # the shim exposes no public client
+        remaining, limit = issue_manager._github_client.rate_limiting
+    except Exception:  # pylint: disable=broad-exception-caught  # report only
+        return None
+    if not isinstance(remaining, int) or not isinstance(limit, int) or limit <= 0:
+        return None
+    return remaining, limit
+
+
+class RateLimitGate:
+    """Bounded semaphore that stops admitting work near the rate limit."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        headroom: Callable[[], tuple[int, int] | None],
+        reserve: int = RATE_LIMIT_RESERVE,
+    ) -> None:
+        """Create a gate.
+
+        Args:
+            max_concurrent: Maximum number of admitted checks at a time.
+            headroom: Returns ``(remaining, limit)``, or None when unknown
+                (unknown headroom never blocks).
+            reserve: Remaining requests below which nothing more is admitted.
+        """
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._headroom = headroom
+        self._reserve = reserve
+        self._exhausted = False
+
+    @contextmanager
+    def slot(self) -> Iterator[bool]:
+        """Hold a slot for one check.
+
+        Yields:
+            True if the check may make requests, False once the remaining
+            requests dropped to the reserve.
+        """
+        with self._semaphore:
+            if not self._exhausted:
+                headroom = self._headroom()
+                if headroom is not None and headroom[0] <= self._reserve:
+                    logger.warning(
+                        "GitHub API rate limit nearly exhausted (%d/%d left); "
+                        "skipping remaining stale checks",
+                        headroom[0],
+                        headroom[1],
+                    )
+                    self._exhausted = True
+            yield not self._exhausted
+
+
+class LabelEventCache:
+    """Last ``labeled`` timestamp per issue and label, persisted as JSON.
+
+    Entries are keyed by issue number and tagged with the issue's
+    ``updated_at``; an entry whose tag no longer matches is ignored. Issues
+    without ``updated_at`` are never cached.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Load the cache from ``path`` (in-memory only when None)."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug("Ignoring unreadable label event cache %s: %s", path, e)
+            else:
+                if isinstance(data, dict):
+                    self._entries = {
+                        k: v for k, v in data.items() if isinstance(v, dict)
+                    }
+
+    def get(self, issue: IssueData, label_name: str) -> str | None:
+        """Return the cached ``labeled`` timestamp, if still valid."""
+        updated_at = issue.get("updated_at")
+        if not updated_at:
+            return None
+        key = str(issue["number"])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get("updated_at") != updated_at:
+                return None
+            self._used.add(key)
+            labeled_at = entry.get("labels", {}).get(label_name)
+        return labeled_at if isinstance(labeled_at, str) else None
+
+    def put(self, issue: IssueData, label_name: str, labeled_at: str) -> None:
+        """Remember the ``labeled`` timestamp for the issue's current state."""
+        updated_at = issue.get("updated_at")
+        if not updated_at:
+            return
+        key = str(issue["number"])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get("updated_at") != updated_at:
+                entry = {"updated_at": updated_at, "labels": {}}
+                self._entries[key] = entry
+            entry["labels"][label_name] = labeled_at
+            self._used.add(key)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries used in this run back (dropping all others)."""
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty and self._used == set(self._entries):
+                return
+            kept = {k: v for k, v in self._entries.items() if k in self._used}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(kept, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to save label event cache %s: %s", self._path, e)
+
+
+def get_label_event_cache_path(project_dir: Path) -> Path | None:
+    """Return the label event cache path for the repo of ``project_dir``.
+
+    Returns:
+        ``<repo>.label_events.json`` next to the coordinator issue cache, or
+        None if the repository cannot be identified.
+    """
+    try:
+        repo_identifier = get_repository_identifier(project_dir)
+    except Exception:  # pylint: disable=broad-exception-caught  # cache is optional
+        return None
+    if repo_identifier is None:
+        return None
+    return get_cache_file_path(repo_identifier).with_name(
+        f"{repo_identifier.cache_safe_name}.label_events.json"
+    )
+
+
+def run_stale_checks(
+    checks: list[StaleCheck],
+    check: Callable[[StaleCheck], tuple[bool, int | None]],
+    gate: RateLimitGate,
+    max_workers: int = STALE_CHECK_MAX_WORKERS,
+) -> list[tuple[bool, int | None] | None]:
+    """Run ``check`` for every item concurrently, behind ``gate``.
+
+    Args:
+        checks: Labels to check.
+        check: Returns ``(is_stale, elapsed_minutes)`` for one item.
+        gate: Limits concurrency and stops near the rate limit.
+        max_workers: Thread pool size.
+
+    Returns:
+        One result per item, in order; None where the check was skipped for
+        the rate limit.
+    """
+
+    def _run(item: StaleCheck) -> tuple[bool, int | None] | None:
+        with gate.slot() as allowed:
+            return check(item) if allowed else None
+
+    if len(checks) <= 1:
+        return [_run(item) for item in checks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(checks))) as executor:
+        return list(executor.map(_run, checks))
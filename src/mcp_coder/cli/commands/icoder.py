@@ -191,7 +191,7 @@ def execute_icoder(args: argparse.Namespace) -> int:
         )
 
         # Create core components
-        from ...icoder.core.event_log import EventLog
+        from ...icoder.core.event_log import EventLog, WritePolicy
         from ...icoder.services.llm_service import RealLLMService
 
         llm_service = RealLLMService(
@@ -211,7 +211,10 @@ def execute_icoder(args: argparse.Namespace) -> int:
         from ...icoder.ui.app import ICoderApp
 
         try:
-            with EventLog(logs_dir=project_dir / "logs") as event_log:
+            with EventLog(
+                logs_dir=project_dir / "logs",
+                write_policy=WritePolicy(mode="time"),
+            ) as event_log:
                 emit_session_start(
                     event_log,
                     provider=provider,
@@ -248,6 +251,7 @@ def execute_icoder(args: argparse.Namespace) -> int:
                     resume_log_path=resume_log_path,
                 ).run()
         finally:
+            llm_service.close()
             if mcp_manager is not None:
                 mcp_manager.close()
 
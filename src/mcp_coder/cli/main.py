@@ -5,8 +5,10 @@
 
 import argparse
 import faulthandler
+import importlib
 import logging
 import sys
+from typing import Callable, cast
 
 # Enable faulthandler early to capture tracebacks on crashes (e.g. segfaults)
 # before heavy imports. Zero cost, writes to stderr.
@@ -14,28 +16,8 @@
 
 from .. import __version__
 from ..utils.log_utils import OUTPUT, setup_logging
-from .commands.check_file_sizes import execute_check_file_sizes
-from .commands.commit import execute_commit_auto
-from .commands.coordinator import (
-    execute_coordinator_run,
-    execute_coordinator_test,
-    execute_coordinator_vscodeclaude,
-    execute_coordinator_vscodeclaude_status,
-)
-from .commands.coordinator.issue_stats import execute_coordinator_issue_stats
-from .commands.create_plan import execute_create_plan
-from .commands.create_pr import execute_create_pr
-from .commands.define_labels import execute_define_labels
-from .commands.gh_tool import execute_checkout_issue_branch, execute_get_base_branch
-from .commands.git_tool import execute_compact_diff
+from .command_catalog import COMMAND_HANDLERS
 from .commands.help import get_help_text
-from .commands.icoder import execute_icoder
-from .commands.implement import execute_implement
-from .commands.init import execute_init
-from .commands.prompt import execute_prompt
-from .commands.rebase import execute_rebase
-from .commands.review import execute_review_implementation, execute_review_plan
-from .commands.verify import execute_verify
 from .gh_parsers import add_gh_tool_parsers, add_git_tool_parsers
 from .parsers import (
     HelpHintArgumentParser,
@@ -61,6 +43,50 @@
 
 _INFO_COMMANDS = frozenset({"coordinator"})
 
+# Commands without sub-subcommands whose key in COMMAND_HANDLERS is the command.
+_FLAT_COMMANDS = frozenset(
+    {
+        "init",
+        "verify",
+        "prompt",
+        "implement",
+        "rebase",
+        "icoder",
+        "create-plan",
+        "review-plan",
+        "review-implementation",
+        "create-pr",
+    }
+)
+
+CommandHandler = Callable[[argparse.Namespace], int]
+
+
+def _load_handler(command_key: str) -> CommandHandler:
+    """Import and return the handler registered for a command.
+
+    Only the selected command's module is imported, keeping startup of cheap
+    subcommands independent of the heavy ones (see ``COMMAND_HANDLERS``).
+
+    Args:
+        command_key: Key into ``COMMAND_HANDLERS`` (e.g. ``"check file-size"``).
+
+    Returns:
+        The ``execute_*`` function for the command.
+    """
+    module_name, _, function_name = COMMAND_HANDLERS[command_key].partition(":")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return cast(CommandHandler, getattr(module, function_name))
+
+
+def _run_command(command_key: str, args: argparse.Namespace) -> int:
+    """Run the handler registered for a command.
+
+    Returns:
+        Exit code from the command handler.
+    """
+    return _load_handler(command_key)(args)
+
 
 def _resolve_log_level(args: argparse.Namespace) -> str:
     """Resolve the effective log level based on command and explicit flag.
@@ -172,7 +198,7 @@ def _handle_coordinator_command(args: argparse.Namespace) -> int:
         # Map args to what execute_coordinator_test expects
         args.repo_name = args.repo
         args.log_level = args.coordinator_log_level
-        return execute_coordinator_test(args)
+        return _run_command("coordinator test", args)
     else:
         # Validate run args
         if not args.all and not args.repo:
@@ -182,7 +208,7 @@ def _handle_coordinator_command(args: argparse.Namespace) -> int:
                 "Try 'mcp-coder coordinator --help' for more information.",
             )
             return 1
-        return execute_coordinator_run(args)
+        return _run_command("coordinator", args)
 
 
 def _handle_check_command(args: argparse.Namespace) -> int:
@@ -193,11 +219,9 @@ def _handle_check_command(args: argparse.Namespace) -> int:
     """
     if hasattr(args, "check_subcommand") and args.check_subcommand:
         if args.check_subcommand == "branch-status":
-            from .commands.check_branch_status import execute_check_branch_status
-
-            return execute_check_branch_status(args)
+            return _run_command("check branch-status", args)
         elif args.check_subcommand == "file-size":
-            return execute_check_file_sizes(args)
+            return _run_command("check file-size", args)
         return 1  # unreachable: argparse validates subcommand choices
     else:
         logger.debug("Check subcommand required")
@@ -216,17 +240,15 @@ def _handle_gh_tool_command(args: argparse.Namespace) -> int:
     """
     if hasattr(args, "gh_tool_subcommand") and args.gh_tool_subcommand:
         if args.gh_tool_subcommand == "get-base-branch":
-            return execute_get_base_branch(args)
+            return _run_command("gh-tool get-base-branch", args)
         elif args.gh_tool_subcommand == "define-labels":
-            return execute_define_labels(args)
+            return _run_command("gh-tool define-labels", args)
         elif args.gh_tool_subcommand == "issue-stats":
-            return execute_coordinator_issue_stats(args)
+            return _run_command("gh-tool issue-stats", args)
         elif args.gh_tool_subcommand == "set-status":
-            from .commands.set_status import execute_set_status
-
-            return execute_set_status(args)
+            return _run_command("gh-tool set-status", args)
         elif args.gh_tool_subcommand == "checkout-issue-branch":
-            return execute_checkout_issue_branch(args)
+            return _run_command("gh-tool checkout-issue-branch", args)
         return 1  # unreachable: argparse validates subcommand choices
     else:
         logger.debug("gh-tool subcommand required")
@@ -247,9 +269,9 @@ def _handle_vscodeclaude_command(args: argparse.Namespace) -> int:
     """
     if hasattr(args, "vscodeclaude_subcommand") and args.vscodeclaude_subcommand:
         if args.vscodeclaude_subcommand == "launch":
-            return execute_coordinator_vscodeclaude(args)
+            return _run_command("vscodeclaude launch", args)
         elif args.vscodeclaude_subcommand == "status":
-            return execute_coordinator_vscodeclaude_status(args)
+            return _run_command("vscodeclaude status", args)
         return 1  # unreachable: argparse validates subcommand choices
     else:
         logger.debug("vscodeclaude subcommand required")
@@ -269,7 +291,7 @@ def _handle_git_tool_command(args: argparse.Namespace) -> int:
     """
     if hasattr(args, "git_tool_subcommand") and args.git_tool_subcommand:
         if args.git_tool_subcommand == "compact-diff":
-            return execute_compact_diff(args)
+            return _run_command("git-tool compact-diff", args)
         return 1  # unreachable: argparse validates subcommand choices
     else:
         logger.debug("git-tool subcommand required")
@@ -285,7 +307,7 @@ def _handle_commit_command(args: argparse.Namespace) -> int:
         Exit code from the executed commit subcommand.
     """
     if args.commit_mode == "auto":
-        return execute_commit_auto(args)
+        return _run_command("commit auto", args)
     else:
         logger.debug(f"Commit mode '{args.commit_mode}' not yet implemented")
         logger.error("Commit mode '%s' is not yet implemented.", args.commit_mode)
@@ -331,28 +353,10 @@ def main() -> int:
             return 0
 
         # Route to appropriate command handler
-        if args.command == "init":
-            return execute_init(args)
-        elif args.command == "verify":
-            return execute_verify(args)
-        elif args.command == "prompt":
-            return execute_prompt(args)
-        elif args.command == "commit" and hasattr(args, "commit_mode"):
+        if args.command == "commit" and hasattr(args, "commit_mode"):
             return _handle_commit_command(args)
-        elif args.command == "implement":
-            return execute_implement(args)
-        elif args.command == "rebase":
-            return execute_rebase(args)
-        elif args.command == "icoder":
-            return execute_icoder(args)
-        elif args.command == "create-plan":
-            return execute_create_plan(args)
-        elif args.command == "review-plan":
-            return execute_review_plan(args)
-        elif args.command == "review-implementation":
-            return execute_review_implementation(args)
-        elif args.command == "create-pr":
-            return execute_create_pr(args)
+        elif args.command in _FLAT_COMMANDS:
+            return _run_command(args.command, args)
         elif args.command == "coordinator":
             return _handle_coordinator_command(args)
         elif args.command == "check":
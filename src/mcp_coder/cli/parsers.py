@@ -333,6 +333,13 @@ def add_coordinator_parsers(subparsers: Any) -> None:
         action="store_true",
         help="Force full cache refresh, bypass all caching",
     )
+    coordinator_parser.add_argument(
+        "--parallel",
+        type=_validate_parallel,
+        default=1,
+        metavar="N",
+        help="Process up to N repositories concurrently (default: 1, sequential)",
+    )
 
     # Dry-run specific args (for Jenkins test trigger)
     coordinator_parser.add_argument(
@@ -351,6 +358,24 @@ def add_coordinator_parsers(subparsers: Any) -> None:
     )
 
 
+def _validate_parallel(value: str) -> int:
+    """Validate parallel argument is a positive integer.
+
+    Returns:
+        Validated positive integer value.
+
+    Raises:
+        ArgumentTypeError: If value is not a positive integer.
+    """
+    try:
+        ivalue = int(value)
+        if ivalue < 1:
+            raise argparse.ArgumentTypeError("--parallel must be at least 1")
+        return ivalue
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("--parallel must be an integer") from exc
+
+
 def _validate_ci_timeout(value: str) -> int:
     """Validate ci-timeout argument is non-negative integer.
 
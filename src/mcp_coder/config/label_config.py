@@ -24,6 +24,7 @@
 """
 
 import json
+import threading
 import tomllib
 from importlib.resources.abc import Traversable
 from pathlib import Path
@@ -174,9 +175,19 @@ def get_labels_config_path(
     return resources.files("mcp_coder.config") / "labels.json"
 
 
+# Parsed label configs keyed by path, with the (mtime_ns, size) of local
+# files at parse time (None for package resources, which do not change).
+_labels_cache: Dict[str, tuple[Optional[tuple[int, int]], Dict[str, Any]]] = {}
+_labels_cache_lock = threading.Lock()
+
+
 def load_labels_config(config_path: Path | Traversable) -> Dict[str, Any]:
     """Load label configuration from JSON file.
 
+    Each file is parsed once per process and re-parsed when its mtime or size
+    changes. The returned dict is shared between callers and must not be
+    modified.
+
     Args:
         config_path: Path or Traversable resource pointing to labels.json.
                      Use a plain Path for local overrides; use the Traversable
@@ -189,12 +200,34 @@ def load_labels_config(config_path: Path | Traversable) -> Dict[str, Any]:
         FileNotFoundError: If a Path-based config file doesn't exist
         ValueError: If required keys are missing
     """
-    if isinstance(config_path, Path) and not config_path.exists():
-        raise FileNotFoundError(f"Label configuration not found: {config_path}")
+    fingerprint: Optional[tuple[int, int]] = None
+    if isinstance(config_path, Path):
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Label configuration not found: {config_path}"
+            ) from None
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(config_path)
+
+    with _labels_cache_lock:
+        cached = _labels_cache.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     config: Dict[str, Any] = json.loads(config_path.read_text(encoding="utf-8"))
 
     # Validate required keys
     if "workflow_labels" not in config:
         raise ValueError("Configuration missing required key: 'workflow_labels'")
 
+    with _labels_cache_lock:
+        _labels_cache[cache_key] = (fingerprint, config)
     return config
+
+
+def clear_labels_config_cache() -> None:
+    """Drop cached label configs so the next load re-reads the files."""
+    with _labels_cache_lock:
+        _labels_cache.clear()
@@ -184,7 +184,14 @@ def stream_llm(
         Yields:
             StreamEvent dicts for UI to render.
         """
-        assembler = ResponseAssembler(self._llm_service.provider)
+        # Every event of the turn is written to the event log, so the stored
+        # response references them there instead of keeping them in memory.
+        assembler = ResponseAssembler(
+            self._llm_service.provider,
+            retention="summary",
+            events_file=str(self._event_log.current_path),
+            events_offset=self._event_log.tell(),
+        )
         sf = self._skill_frames.get(skill_name) if skill_name is not None else None
         self._event_log.emit("llm_request_start", text=text)
 
@@ -216,6 +223,7 @@ def _events() -> Iterator[StreamEvent]:
             yield event
 
         self._event_log.emit("llm_request_end")
+        self._event_log.sync_index()
 
         # Auto-store response for --continue-session
         response_data = assembler.result()
@@ -81,7 +81,12 @@ def _format_info(
         for s in mcp_manager.status():
             icon = "\u2713" if s.connected else "\u2717"
             state = "Connected" if s.connected else "Disconnected"
-            lines.append(f"  {s.name}    {icon} {state}   ({s.tool_count} tools)")
+            detail = f"{s.tool_count} tools"
+            if s.startup_seconds is not None:
+                detail += f", {s.startup_seconds:.2f}s"
+            lines.append(f"  {s.name}    {icon} {state}   ({detail})")
+            if s.error:
+                lines.append(f"      error: {s.error}")
 
     claude_exe = find_claude_executable(return_none_if_not_found=True)
     claude_mcp = parse_claude_mcp_list(
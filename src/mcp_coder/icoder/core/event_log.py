@@ -1,15 +1,31 @@
-"""Structured event log: in-memory list + JSONL file output."""
+"""Structured event log: JSONL file output (+ optional in-memory list).
+
+Writes follow a ``WritePolicy``: ``immediate`` writes and flushes each event
+on the calling thread; ``time`` and ``size`` hand serialized events to a
+background writer thread through a bounded queue, which writes them in
+batches. Batched logs are flushed at turn end (``flush()``), ``rotate()``,
+``close()`` and interpreter exit.
+"""
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import queue
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Iterator
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterator, Literal
 
+from mcp_coder.icoder.core.log_index import (
+    LogIndexEntry,
+    lookup_log_index_entry,
+    update_log_index,
+)
 from mcp_coder.icoder.core.types import EventEntry
 
 if TYPE_CHECKING:
@@ -17,6 +33,12 @@
 
 logger = logging.getLogger(__name__)
 
+# Substrings of the lines ``EventLog.import_log`` must decode: the skipped
+# ``session_start`` and the events ``LogIndexEntry.observe`` summarizes.
+_SUMMARY_MARKERS = ('"session_start"', '"input_received"', '"done"')
+# Characters written per batch by ``EventLog.import_log``.
+_IMPORT_BATCH_CHARS = 1 << 20
+
 
 def _make_log_filename() -> str:
     """Build a JSONL filename for the current UTC instant.
@@ -80,18 +102,122 @@ def _try_open_chat(path: Path) -> IO[str] | None:
         return None
 
 
+@dataclass(frozen=True)
+class WritePolicy:
+    """How ``EventLog`` writes events to its JSONL file.
+
+    Attributes:
+        mode: ``"immediate"`` writes and flushes every event synchronously.
+            ``"time"`` batches events on a writer thread and flushes at most
+            ``interval_seconds`` after the first pending event. ``"size"``
+            flushes once ``max_batch_bytes`` are pending (and at the explicit
+            flush points).
+        interval_seconds: Maximum latency of a pending event in ``time`` mode.
+        max_batch_bytes: Pending bytes that force a write in both batched modes.
+        queue_size: Capacity of the writer queue; ``emit`` blocks when full.
+    """
+
+    mode: Literal["immediate", "time", "size"] = "immediate"
+    interval_seconds: float = 0.1
+    max_batch_bytes: int = 64 * 1024
+    queue_size: int = 10_000
+
+
+class _FlushRequest:
+    """Writer-queue marker: write pending lines, then signal ``done``."""
+
+    def __init__(self, stop: bool = False) -> None:
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class _BatchWriter:
+    """Background thread handing queued JSONL lines to ``write_lines``."""
+
+    def __init__(
+        self, write_lines: Callable[[list[str]], None], policy: WritePolicy
+    ) -> None:
+        self._write_lines = write_lines
+        self._policy = policy
+        self._queue: queue.Queue[str | _FlushRequest] = queue.Queue(
+            maxsize=policy.queue_size
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="icoder-event-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, line: str) -> None:
+        self._queue.put(line)
+
+    def flush(self, stop: bool = False) -> None:
+        """Block until every line queued so far is written and flushed."""
+        if not self._thread.is_alive():
+            return
+        request = _FlushRequest(stop=stop)
+        self._queue.put(request)
+        request.done.wait()
+        if stop:
+            self._thread.join()
+
+    def _run(self) -> None:
+        pending: list[str] = []
+        pending_bytes = 0
+        deadline: float | None = None
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, str):
+                pending.append(item)
+                pending_bytes += len(item)
+                if deadline is None and self._policy.mode == "time":
+                    deadline = time.monotonic() + self._policy.interval_seconds
+                if pending_bytes < self._policy.max_batch_bytes:
+                    continue
+            try:
+                self._write_lines(pending)
+            except (OSError, ValueError) as exc:
+                # ValueError: file already closed. Never let the writer die
+                # with flush() callers waiting on it.
+                logger.warning("iCoder event log write failed: %s", exc)
+            pending = []
+            pending_bytes = 0
+            deadline = None
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+                if item.stop:
+                    return
+
+
 class EventLog:
-    """Structured event log: in-memory list + JSONL file output.
+    """Structured event log: JSONL file output + optional in-memory list.
 
     ``write_chat`` must be called only from the Textual UI thread; the
     chat sidecar handle has no locking.
     """
 
-    def __init__(self, logs_dir: str | Path = "logs") -> None:
+    def __init__(
+        self,
+        logs_dir: str | Path = "logs",
+        *,
+        write_policy: WritePolicy | None = None,
+        keep_entries: bool = False,
+    ) -> None:
         """Initialize event log. Creates JSONL file in logs_dir.
 
         Filename: icoder_<ISO_timestamp>.jsonl
         e.g.: icoder_2026-03-29T14-30-00-123456.jsonl
+
+        Args:
+            logs_dir: Directory for the JSONL log and chat sidecar.
+            write_policy: Write/flush policy; defaults to ``immediate``.
+            keep_entries: Also keep every event in memory (``entries``).
+                Off by default so long sessions do not grow without bound.
         """
         logs_path = Path(logs_dir)
         os.makedirs(logs_path, exist_ok=True)
@@ -103,6 +229,14 @@ def __init__(self, logs_dir: str | Path = "logs") -> None:
         self._file: IO[str] = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
         self._chat_path: Path = _chat_path_for(self._path)
         self._chat_file: IO[str] | None = _try_open_chat(self._chat_path)
+        self._summary: LogIndexEntry = LogIndexEntry()
+        self._keep_entries = keep_entries
+        self._write_lock = threading.Lock()
+        policy = write_policy or WritePolicy()
+        self._writer: _BatchWriter | None = None
+        if policy.mode != "immediate":
+            self._writer = _BatchWriter(self._write_lines, policy)
+            atexit.register(self.close)
 
     def emit(self, event: str, **data: object) -> EventEntry:
         """Record a structured event.
@@ -119,13 +253,71 @@ def emit(self, event: str, **data: object) -> EventEntry:
             event=event,
             data=dict(data),
         )
-        self._entries.append(entry)
-        self._file.write(
-            json.dumps({"t": entry.t, "event": entry.event, **entry.data}) + "\n"
-        )
-        self._file.flush()
+        if self._keep_entries:
+            self._entries.append(entry)
+        self._summary.observe(event, data)
+        line = json.dumps({"t": entry.t, "event": entry.event, **entry.data}) + "\n"
+        if self._writer is not None:
+            self._writer.put(line)
+        else:
+            self._write_lines([line])
         return entry
 
+    def _write_lines(self, lines: list[str]) -> None:
+        """Write and flush ``lines`` to the current JSONL file."""
+        if not lines:
+            return
+        with self._write_lock:
+            self._file.write("".join(lines))
+            self._file.flush()
+
+    def flush(self) -> None:
+        """Write out every event emitted so far (e.g. at turn end).
+
+        A no-op for the ``immediate`` policy, which never holds events back.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def tell(self) -> int:
+        """Flush pending events and return the JSONL file's size in bytes.
+
+        Returns:
+            Byte offset at which the next emitted event will be written.
+        """
+        self.flush()
+        try:
+            return self._path.stat().st_size
+        except OSError:
+            return 0
+
+    def sync_index(self) -> None:
+        """Write the open log's summary so far to the sidecar index.
+
+        Called at turn end and before logs are listed, so the log still
+        being written has a current entry instead of being rescanned by
+        the inventory. Any later write makes the entry stale again.
+        """
+        self.flush()
+        with self._write_lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            self._record_index_entry()
+
+    def _record_index_entry(self) -> None:
+        """Write the log's summary to the sidecar index; best-effort.
+
+        Must be called after the JSONL handle is closed, or flushed under
+        the write lock, so the recorded size/mtime match the file.
+        """
+        try:
+            self._summary.stamp(self._path.stat())
+        except OSError as exc:
+            logger.debug("Not indexing icoder log %s: %s", self._path, exc)
+            return
+        update_log_index(self._logs_dir, self._path.name, self._summary)
+
     @property
     def logs_dir(self) -> Path:
         """Directory that holds this session's log files."""
@@ -181,8 +373,16 @@ def rotate(self) -> Path:
         Returns:
             Path of the freshly opened JSONL file.
         """
-        self._file.flush()
-        self._file.close()
+        self.flush()
+        new_path = _allocate_log_path(self._logs_dir)
+        # Swap handles under the write lock so a concurrent batch-writer
+        # flush never writes to the closed file.
+        with self._write_lock:
+            self._file.flush()
+            self._file.close()
+            self._record_index_entry()
+            self._file = open(new_path, "a", encoding="utf-8")  # noqa: SIM115
+            self._path = new_path
         if self._chat_file is not None:
             try:
                 self._chat_file.flush()
@@ -194,25 +394,68 @@ def rotate(self) -> Path:
                     exc,
                 )
             self._chat_file = None
-        new_path = _allocate_log_path(self._logs_dir)
-        self._file = open(new_path, "a", encoding="utf-8")  # noqa: SIM115
         self._start = time.monotonic()
         self._entries.clear()
-        self._path = new_path
+        self._summary = LogIndexEntry()
         self._chat_path = _chat_path_for(new_path)
         self._chat_file = _try_open_chat(self._chat_path)
         return new_path
 
+    def import_log(self, path: Path | str) -> None:
+        """Append another log's events, except ``session_start``, verbatim.
+
+        Makes a resumed log self-contained without decoding and
+        re-serializing every event: lines are copied as written (keeping
+        their original ``t`` offsets) and only those the summary needs are
+        decoded. Imported events are not added to ``entries``.
+
+        Raises FileNotFoundError if path does not exist.
+        Raises json.JSONDecodeError on a malformed line the summary needs.
+
+        Args:
+            path: The JSONL log to copy from.
+        """
+        self.flush()
+        batch: list[str] = []
+        batch_chars = 0
+        with self._write_lock, open(path, "r", encoding="utf-8") as source:
+            for line in source:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                if any(marker in stripped for marker in _SUMMARY_MARKERS):
+                    data = json.loads(stripped)
+                    event = data.pop("event", None)
+                    if event == "session_start":
+                        continue
+                    if isinstance(event, str):
+                        self._summary.observe(event, data)
+                batch.append(stripped + "\n")
+                batch_chars += len(stripped) + 1
+                if batch_chars >= _IMPORT_BATCH_CHARS:
+                    self._file.write("".join(batch))
+                    batch, batch_chars = [], 0
+            self._file.write("".join(batch))
+            self._file.flush()
+
     @property
     def entries(self) -> list[EventEntry]:
-        """Copy of all recorded events (for testing/inspection)."""
+        """Copy of all recorded events (for testing/inspection).
+
+        Always empty unless the log was created with ``keep_entries=True``.
+        """
         return list(self._entries)
 
     def close(self) -> None:
         """Flush and close the JSONL file handle and the chat sidecar."""
+        if self._writer is not None:
+            self._writer.flush(stop=True)
+            self._writer = None
+            atexit.unregister(self.close)
         if not self._file.closed:
             self._file.flush()
             self._file.close()
+            self._record_index_entry()
         if self._chat_file is not None and not self._chat_file.closed:
             try:
                 self._chat_file.flush()
@@ -286,6 +529,61 @@ def iter_events(path: Path | str) -> Iterator[dict[str, Any]]:
                 yield json.loads(stripped)
 
 
+def iter_events_reversed(
+    path: Path | str, end: int | None = None
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(byte offset, event)`` pairs from the last event to the first.
+
+    Only the part of the file before byte ``end`` (default: its size) is
+    read, backwards in chunks, so paging from the tail costs the size of
+    the pages read. ``end`` is typically an offset yielded earlier.
+
+    Raises FileNotFoundError if path does not exist.
+    Raises json.JSONDecodeError on malformed lines (no swallowing).
+    """
+    for offset, line in _iter_offset_lines_reversed(Path(path), end):
+        yield offset, json.loads(line)
+
+
+def _iter_lines_reversed(path: Path, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Yield the non-blank lines of a text file from last to first.
+
+    Reads fixed-size chunks backwards from the end, so finding a recent
+    event costs the size of the tail, not of the whole file.
+    """
+    for _, line in _iter_offset_lines_reversed(path, None, chunk_size):
+        yield line
+
+
+def _iter_offset_lines_reversed(
+    path: Path, end: int | None, chunk_size: int = 64 * 1024
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(start offset, line)`` for non-blank lines before ``end``, last first."""
+    with open(path, "rb") as f:
+        if end is None:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+        position = end
+        remainder = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+            lines = block.split(b"\n")
+            remainder = lines[0]
+            cursor = position + len(block)
+            for raw in reversed(lines[1:]):
+                cursor -= len(raw)
+                stripped = raw.strip()
+                if stripped:
+                    yield cursor, stripped.decode("utf-8")
+                cursor -= 1
+        stripped = remainder.strip()
+        if stripped:
+            yield 0, stripped.decode("utf-8")
+
+
 def read_session_id_from_log(path: Path | str) -> str | None:
     """Resolve the recorded session_id from a JSONL event log.
 
@@ -293,22 +591,34 @@ def read_session_id_from_log(path: Path | str) -> str | None:
     back to the most recent ``stream_event{type=done}`` entry's
     ``session_id``.
 
+    The sidecar log index answers this without opening the log when its
+    entry is current. Otherwise only the first event (``session_start`` is
+    always written first) and, if needed, the log's tail are read.
+
     Returns:
         The recovered session id, or ``None`` when no candidate is found.
     """
-    session_id: str | None = None
-    last_done_sid: str | None = None
-    for event in iter_events(path):
-        kind = event.get("event")
-        if kind == "session_start":
-            raw = event.get("session_id")
-            if isinstance(raw, str):
-                session_id = raw
+    log_path = Path(path)
+    entry = lookup_log_index_entry(log_path)
+    if entry is not None:
+        return entry.resolved_session_id
+
+    first: dict[str, Any] | None = None
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                first = json.loads(line)
                 break
-        elif kind == "stream_event" and event.get("type") == "done":
+    if first is not None and first.get("event") == "session_start":
+        raw = first.get("session_id")
+        if isinstance(raw, str):
+            return raw
+    for line in _iter_lines_reversed(log_path):
+        if '"done"' not in line:
+            continue
+        event = json.loads(line)
+        if event.get("event") == "stream_event" and event.get("type") == "done":
             raw = event.get("session_id")
             if isinstance(raw, str):
-                last_done_sid = raw
-    if session_id is None:
-        session_id = last_done_sid
-    return session_id
+                return raw
+    return None
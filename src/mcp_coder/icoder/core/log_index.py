@@ -0,0 +1,146 @@
+"""Sidecar index of icoder JSONL log summaries.
+
+``list_icoder_logs`` only needs the provider, turn count and first prompt of
+each log. Re-parsing every log on every ``/load`` grows with the log history,
+so those summaries are kept in a small JSON index next to the logs, keyed by
+file name and validated against the file's size and mtime.
+
+The index also records the log's Claude session id (``session_start`` or
+the last ``done`` stream event), so resuming a log does not re-read it.
+
+``EventLog`` maintains its current log's summary in memory as events are
+emitted and writes it to the index at turn end, before ``/load`` lists the
+logs, and when the log is rotated or closed. Logs without an index entry, or
+whose size/mtime no longer match (older versions, crashed sessions, logs
+written to since), are rescanned lazily by the inventory and their entries
+refreshed.
+
+This module must not import ``event_log`` (which imports it).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".icoder_log_index.json"
+FIRST_PROMPT_MAX = 80
+_INDEX_VERSION = 2
+
+
+@dataclass
+class LogIndexEntry:
+    """Summary of one log file plus the size/mtime it was computed for."""
+
+    size: int = -1
+    mtime_ns: int = -1
+    provider: str | None = None
+    n_turns: int = 0
+    first_prompt: str = ""
+    session_id: str | None = None
+    last_done_session_id: str | None = None
+
+    @property
+    def resolved_session_id(self) -> str | None:
+        """``session_start.session_id``, else the last ``done`` event's id."""
+        return self.session_id or self.last_done_session_id
+
+    def observe(self, event: str, data: Mapping[str, Any]) -> None:
+        """Fold one event into the summary."""
+        if event == "session_start":
+            raw_provider = data.get("provider")
+            self.provider = raw_provider if isinstance(raw_provider, str) else None
+            raw_session_id = data.get("session_id")
+            if self.session_id is None and isinstance(raw_session_id, str):
+                self.session_id = raw_session_id
+        elif event == "stream_event" and data.get("type") == "done":
+            raw_session_id = data.get("session_id")
+            if isinstance(raw_session_id, str):
+                self.last_done_session_id = raw_session_id
+        elif event == "input_received":
+            self.n_turns += 1
+            if not self.first_prompt:
+                text = data.get("text") or ""
+                if isinstance(text, str):
+                    self.first_prompt = text[:FIRST_PROMPT_MAX]
+
+    def stamp(self, stat: os.stat_result) -> None:
+        """Record the file size/mtime this summary is valid for."""
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Return True if the summary is still valid for a file with ``stat``."""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+def load_log_index(logs_dir: Path) -> dict[str, LogIndexEntry]:
+    """Read the index for ``logs_dir``; missing or unreadable -> empty.
+
+    Returns:
+        Index entries keyed by log file name.
+    """
+    try:
+        data = json.loads((logs_dir / INDEX_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+        return {}
+    entries: dict[str, LogIndexEntry] = {}
+    raw_logs = data.get("logs")
+    if not isinstance(raw_logs, dict):
+        return {}
+    for name, raw in raw_logs.items():
+        try:
+            entries[name] = LogIndexEntry(**raw)
+        except TypeError:
+            continue
+    return entries
+
+
+def lookup_log_index_entry(log_path: Path) -> LogIndexEntry | None:
+    """Return the index entry for ``log_path`` if it is still current.
+
+    Returns:
+        The entry, or ``None`` when missing or stale (size/mtime changed).
+    """
+    entry = load_log_index(log_path.parent).get(log_path.name)
+    if entry is None:
+        return None
+    try:
+        stat = log_path.stat()
+    except OSError:
+        return None
+    return entry if entry.matches(stat) else None
+
+
+def save_log_index(logs_dir: Path, entries: Mapping[str, LogIndexEntry]) -> None:
+    """Atomically replace the index for ``logs_dir`` (best effort)."""
+    payload = {
+        "version": _INDEX_VERSION,
+        "logs": {name: asdict(entry) for name, entry in sorted(entries.items())},
+    }
+    path = logs_dir / INDEX_FILENAME
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.debug("Failed to write icoder log index %s: %s", path, exc)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def update_log_index(logs_dir: Path, name: str, entry: LogIndexEntry) -> None:
+    """Merge a single entry into the index for ``logs_dir``."""
+    entries = load_log_index(logs_dir)
+    entries[name] = entry
+    save_log_index(logs_dir, entries)
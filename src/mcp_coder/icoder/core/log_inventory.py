@@ -1,15 +1,26 @@
-"""Log inventory: scan icoder JSONL logs and summarise each file."""
+"""Log inventory: list icoder JSONL logs and summarise each file.
+
+Summaries come from the sidecar index (see ``log_index``); only logs whose
+index entry is missing or stale are parsed.
+"""
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 
 from mcp_coder.icoder.core.event_log import iter_events
+from mcp_coder.icoder.core.log_index import (
+    FIRST_PROMPT_MAX,
+    LogIndexEntry,
+    load_log_index,
+    save_log_index,
+)
 from mcp_coder.icoder.core.types import LogSummary
 
-FIRST_PROMPT_MAX = 80
+__all__ = ["FIRST_PROMPT_MAX", "list_icoder_logs"]
 
 _FILENAME_RE = re.compile(
     r"^icoder_(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}(?:-\d{1,6})?)$"
@@ -36,9 +47,24 @@ def _parse_iso_from_name(path: Path) -> datetime | None:
     return parsed.replace(tzinfo=timezone.utc)
 
 
-def _mtime_dt(path: Path) -> datetime:
+def _mtime_dt(stat: os.stat_result) -> datetime:
     """Return the file's mtime as a UTC-aware datetime."""
-    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+
+def _scan_log(path: Path, stat: os.stat_result) -> LogIndexEntry:
+    """Parse a log file into a fresh index entry.
+
+    Returns:
+        Summary of ``path`` stamped with ``stat``.
+    """
+    entry = LogIndexEntry()
+    for event in iter_events(path):
+        kind = event.get("event")
+        if isinstance(kind, str):
+            entry.observe(kind, event)
+    entry.stamp(stat)
+    return entry
 
 
 def list_icoder_logs(
@@ -55,33 +81,30 @@ def list_icoder_logs(
         Log summaries sorted newest first.
     """
     logs_path = Path(logs_dir)
+    index = load_log_index(logs_path)
+    fresh_index: dict[str, LogIndexEntry] = {}
+    rescanned = False
     summaries: list[LogSummary] = []
     for path in logs_path.glob("icoder_*.jsonl"):
-        ts = _parse_iso_from_name(path) or _mtime_dt(path)
-        prov: str | None = None
-        n_turns = 0
-        first_prompt = ""
-        for event in iter_events(path):
-            kind = event.get("event")
-            if kind == "session_start":
-                raw_provider = event.get("provider")
-                prov = raw_provider if isinstance(raw_provider, str) else None
-            elif kind == "input_received":
-                n_turns += 1
-                if not first_prompt:
-                    text = event.get("text") or ""
-                    if isinstance(text, str):
-                        first_prompt = text[:FIRST_PROMPT_MAX]
-        if provider is not None and prov != provider:
+        stat = path.stat()
+        entry = index.get(path.name)
+        if entry is None or not entry.matches(stat):
+            entry = _scan_log(path, stat)
+            rescanned = True
+        fresh_index[path.name] = entry
+        if provider is not None and entry.provider != provider:
             continue
         summaries.append(
             LogSummary(
                 path=path,
-                timestamp=ts,
-                provider=prov,
-                n_turns=n_turns,
-                first_prompt=first_prompt,
+                timestamp=_parse_iso_from_name(path) or _mtime_dt(stat),
+                provider=entry.provider,
+                n_turns=entry.n_turns,
+                first_prompt=entry.first_prompt,
             )
         )
+    # Persist rescans and drop entries of deleted logs.
+    if rescanned or fresh_index.keys() != index.keys():
+        save_log_index(logs_path, fresh_index)
     summaries.sort(key=lambda s: s.timestamp, reverse=True)
     return summaries
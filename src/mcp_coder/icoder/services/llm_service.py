@@ -10,6 +10,7 @@
 from mcp_coder.llm.types import StreamEvent
 
 if TYPE_CHECKING:
+    from mcp_coder.llm.providers.claude.claude_cli_worker import ClaudeCliWorker
     from mcp_coder.llm.providers.langchain.mcp_manager import MCPManager
 
 ICODER_LLM_TIMEOUT_SECONDS = 300  # 5-minute inactivity timeout for interactive use
@@ -45,6 +46,8 @@ def session_id(self) -> str | None:
 class RealLLMService:
     """Production LLM service wrapping prompt_llm_stream()."""
 
+    _claude_worker: ClaudeCliWorker | None = None
+
     def __init__(
         self,
         provider: str = "claude",
@@ -68,6 +71,17 @@ def __init__(
         self._mcp_manager = mcp_manager
         self._project_dir = project_dir
         self._gateway = gateway
+        # With MCP_CODER_CLAUDE_WARM_WORKER=1, Claude turns run on one warm CLI
+        # process per session, so follow-up turns skip process and MCP server
+        # startup.
+        if provider == "claude":
+            from mcp_coder.llm.providers.claude.claude_cli_worker import (  # noqa: PLC0415
+                ClaudeCliWorker,
+                warm_worker_enabled,
+            )
+
+            if warm_worker_enabled():
+                self._claude_worker = ClaudeCliWorker()
 
     def stream(
         self,
@@ -112,6 +126,7 @@ def stream(
             env_vars=self._env_vars,
             tools=tools,
             project_dir=self._project_dir,
+            claude_worker=self._claude_worker,
         ):
             if event.get("type") == "done":
                 sid = event.get("session_id")
@@ -127,6 +142,11 @@ def set_session_id(self, session_id: str | None) -> None:
         """Replace the current session_id. None = fresh conversation."""
         self._session_id = session_id
 
+    def close(self) -> None:
+        """Stop the warm Claude CLI process, if one is running."""
+        if self._claude_worker is not None:
+            self._claude_worker.close()
+
     @property
     def provider(self) -> str:
         """LLM provider name."""
@@ -201,6 +201,8 @@ def open_picker_for_load(self) -> None:
         """
         output = self.query_one(OutputLog)
         logs_dir = self._project_dir / "logs"
+        # Index this session's own log so the inventory does not rescan it.
+        self._core.event_log.sync_index()
         summaries = list_icoder_logs(logs_dir, provider=self._core.provider)
         if not summaries:
             output.append_text("No previous sessions in this project.")
@@ -220,8 +222,9 @@ def do_resume(self, log_path: Path) -> None:
           2. ``AppCore.prepare_for_resume(log_path)`` — sets session_id
              on the LLM service and rotates the event log.
           3. ``replay_log(self, log_path, event_log=...)`` — re-renders
-             prior UI lines AND re-emits each event into the new event
-             log so it is self-contained.
+             the prior session's latest turns (older ones page in on
+             scroll) AND copies its events into the new event log so it
+             is self-contained.
           4. Render a dim ``────── Resumed YYYY-MM-DD HH:MM ──────``
              divider.
           5. Re-render the live runtime banner from the current
@@ -393,6 +396,44 @@ def _cleanup_orphan_tools(self) -> None:
                 )
                 dq.clear()
 
+    def _render_detached(self, render: Callable[[], None]) -> None:
+        """Run ``render`` with the streaming state set aside, then restore it.
+
+        Used to page in replayed history while a live turn may be
+        streaming: the renderer, text buffer, open turn and open tool units
+        are swapped for fresh ones, whatever ``render`` leaves open is
+        closed, and the live state and streaming tail are put back.
+
+        Args:
+            render: Callback rendering through the UI primitives.
+        """
+        saved = (
+            self._renderer,
+            self._text_buffer,
+            self._current_turn_id,
+            self._current_turn_text,
+            self._open_tool_units,
+        )
+        self._renderer = StreamEventRenderer(format_tools=self._renderer._format_tools)
+        self._text_buffer = ""
+        self._current_turn_id = None
+        self._current_turn_text = ""
+        self._open_tool_units = {}
+        try:
+            render()
+            self._flush_buffer()
+            self._finalize_turn()
+            self._cleanup_orphan_tools()
+        finally:
+            (
+                self._renderer,
+                self._text_buffer,
+                self._current_turn_id,
+                self._current_turn_text,
+                self._open_tool_units,
+            ) = saved
+            self.query_one("#streaming-tail", Static).update(self._text_buffer)
+
     def _handle_stream_event(
         self, event: StreamEvent, *, replay_mode: bool = False
     ) -> None:
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from mcp_coder.icoder.core.event_log import EventLog, iter_events
+from mcp_coder.icoder.core.event_log import EventLog, iter_events_reversed
 from mcp_coder.icoder.ui import runtime_banner
 from mcp_coder.icoder.ui.widgets.output_log import ContentUnit, OutputLog
 
@@ -15,22 +18,39 @@
 if TYPE_CHECKING:
     from .app import ICoderApp
 
+logger = logging.getLogger(__name__)
+
+# Turns rendered immediately on replay; older turns are paged in on scroll.
+REPLAY_TAIL_TURNS = 20
+# Turns rendered per scroll-to-top page.
+REPLAY_PAGE_TURNS = 20
+
 
 def replay_log(
     app: "ICoderApp",
     path: Path,
     event_log: EventLog | None = None,
+    *,
+    tail_turns: int | None = REPLAY_TAIL_TURNS,
 ) -> None:
     """Replay a JSONL event log into ``app``'s UI primitives.
 
     Renders banner, user inputs, slash output, stream events, tool blocks,
-    and the cancelled marker (when an LLM turn was interrupted) using the
-    same UI methods as the live path. Updates ``app.command_history``.
-    Does NOT update token usage.
+    and the cancelled marker (when the last rendered LLM turn was
+    interrupted) using the same UI methods as the live path. Updates
+    ``app.command_history``. Does NOT update token usage.
 
-    When ``event_log`` is supplied, every replayed event other than
-    ``session_start`` is re-emitted into it, making the new run's log
-    self-contained.
+    Only the last ``tail_turns`` turns (split at ``input_received``) are
+    read, backwards from the end of the file, and rendered up front below
+    the session banner(s) and a history marker; older turns are read and
+    rendered page by page when the user scrolls to the top.
+    ``tail_turns=None`` renders everything. Command history and banners
+    come from one forward pass that decodes only ``input_received`` and
+    ``session_start`` lines.
+
+    When ``event_log`` is supplied, every logged event other than
+    ``session_start`` is copied into it verbatim (``EventLog.import_log``),
+    making the new run's log self-contained.
 
     Replayed ``ContentUnit`` timestamps are approximated as
     ``session_start_time + timedelta(seconds=event["t"])`` using the event's
@@ -40,48 +60,190 @@ def replay_log(
     """
     output = app.query_one(OutputLog)
     session_start_time = datetime.now()
+    inputs, banners = _scan_log(path)
+    for text in inputs:
+        if isinstance(text, str):
+            app._core.command_history.add(text)
+    if event_log is not None:
+        event_log.import_log(path)
+
+    hidden = 0
+    if tail_turns is not None and len(inputs) > tail_turns:
+        hidden = len(inputs) - tail_turns
+    events, boundary = _read_turns(path, None, len(inputs) - hidden, not hidden)
     in_flight = False
-    for event in iter_events(path):
+    for event in events:
         kind = event.get("event")
-        if kind == "session_start":
-            output.append_text(
-                "\n".join(runtime_banner.format_runtime_banner(event)), style="dim"
-            )
-        elif kind == "input_received":
-            text = event.get("text")
-            if isinstance(text, str):
-                app._core.command_history.add(text)
-                offset = event.get("t", 0.0)
-                timestamp = session_start_time + timedelta(
-                    seconds=float(offset) if isinstance(offset, (int, float)) else 0.0
-                )
-                unit = ContentUnit(
-                    id=app._new_unit_id("user_input"),
-                    kind="user_input",
-                    timestamp=timestamp,
-                    full_text=text,
-                )
-                output.append_unit(unit, [f"> {text}"], style=STYLE_USER_INPUT)
-        elif kind == "output_emitted":
-            text = event.get("text")
-            if isinstance(text, str):
-                output.append_text(text)
-        elif kind == "llm_request_start":
+        if kind == "llm_request_start":
             in_flight = True
         elif kind == "llm_request_end":
             in_flight = False
-        elif kind == "stream_event":
-            payload: dict[str, Any] = {
-                k: v for k, v in event.items() if k not in ("event", "t")
-            }
-            app._handle_stream_event(payload, replay_mode=True)
-        # any other event type → ignored (forward-compat)
-        if event_log is not None and isinstance(kind, str) and kind != "session_start":
-            extra = {k: v for k, v in event.items() if k not in ("event", "t")}
-            event_log.emit(kind, **extra)
-    if in_flight:
-        app._flush_buffer()
-        app._finalize_turn()
-        app._cleanup_orphan_tools()
-        app._append_cancelled_marker()
-        app._append_blank_line()
+    with output.batch_updates():
+        if hidden:
+            for offset, banner in banners:
+                if offset < boundary:
+                    _render_event(app, output, banner, session_start_time)
+            pager = _HistoryPager(app, path, boundary, hidden, session_start_time)
+            output.append_history_marker(pager.marker_text(), pager.load_earlier)
+        for event in events:
+            _render_event(app, output, event, session_start_time)
+        if in_flight:
+            app._flush_buffer()
+            app._finalize_turn()
+            app._cleanup_orphan_tools()
+            app._append_cancelled_marker()
+            app._append_blank_line()
+
+
+def _scan_log(path: Path) -> tuple[list[object], list[tuple[int, dict[str, Any]]]]:
+    """Collect the logged inputs and session banners in one forward pass.
+
+    Only lines that can hold an ``input_received`` or ``session_start``
+    event are decoded.
+
+    Returns:
+        The ``text`` of every ``input_received`` event, and the byte offset
+        and event of every ``session_start`` event.
+    """
+    inputs: list[object] = []
+    banners: list[tuple[int, dict[str, Any]]] = []
+    offset = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            if b'"input_received"' in raw or b'"session_start"' in raw:
+                event = json.loads(raw)
+                kind = event.get("event")
+                if kind == "input_received":
+                    inputs.append(event.get("text"))
+                elif kind == "session_start":
+                    banners.append((offset, event))
+            offset += len(raw)
+    return inputs, banners
+
+
+def _read_turns(
+    path: Path, end: int | None, n_turns: int, to_start: bool
+) -> tuple[list[dict[str, Any]], int]:
+    """Read the last ``n_turns`` turns before byte ``end``, seeking backwards.
+
+    Args:
+        path: The JSONL log.
+        end: Byte offset to read up to; ``None`` for the end of the file.
+        n_turns: Turns (``input_received`` onwards) to read.
+        to_start: Read on to the start of the file instead, e.g. for the
+            last page, whose events before the first turn belong to it.
+
+    Returns:
+        The events in file order, and the byte offset of the first one
+        (``end`` when nothing was read).
+    """
+    if end is None:
+        end = path.stat().st_size
+    events: list[dict[str, Any]] = []
+    boundary = end
+    if n_turns <= 0 and not to_start:
+        return events, boundary
+    turns = 0
+    for offset, event in iter_events_reversed(path, end):
+        events.append(event)
+        boundary = offset
+        if event.get("event") == "input_received":
+            turns += 1
+            if turns >= n_turns and not to_start:
+                break
+    events.reverse()
+    return events, boundary
+
+
+def _render_event(
+    app: "ICoderApp",
+    output: OutputLog,
+    event: dict[str, Any],
+    session_start_time: datetime,
+) -> None:
+    """Render one logged event through the live UI primitives."""
+    kind = event.get("event")
+    if kind == "session_start":
+        output.append_text(
+            "\n".join(runtime_banner.format_runtime_banner(event)), style="dim"
+        )
+    elif kind == "input_received":
+        text = event.get("text")
+        if isinstance(text, str):
+            offset = event.get("t", 0.0)
+            timestamp = session_start_time + timedelta(
+                seconds=float(offset) if isinstance(offset, (int, float)) else 0.0
+            )
+            unit = ContentUnit(
+                id=app._new_unit_id("user_input"),
+                kind="user_input",
+                timestamp=timestamp,
+                full_text=text,
+            )
+            output.append_unit(unit, [f"> {text}"], style=STYLE_USER_INPUT)
+    elif kind == "output_emitted":
+        text = event.get("text")
+        if isinstance(text, str):
+            output.append_text(text)
+    elif kind == "stream_event":
+        payload: dict[str, Any] = {
+            k: v for k, v in event.items() if k not in ("event", "t")
+        }
+        app._handle_stream_event(payload, replay_mode=True)
+    # any other event type → ignored (forward-compat)
+
+
+class _HistoryPager:
+    """Reads and renders older replayed turns on demand, newest page first."""
+
+    def __init__(
+        self,
+        app: "ICoderApp",
+        path: Path,
+        end: int,
+        hidden: int,
+        session_start_time: datetime,
+    ) -> None:
+        self._app = app
+        self._path = path
+        self._end = end
+        self._hidden = hidden
+        self._session_start_time = session_start_time
+
+    def marker_text(self) -> str:
+        """Return the history marker text for the still-hidden turns."""
+        noun = "turn" if self._hidden == 1 else "turns"
+        return f"↑ {self._hidden} earlier {noun} — scroll up to load"
+
+    def load_earlier(self) -> None:
+        """Render the next page of older turns above the rendered ones."""
+        if not self._hidden:
+            return
+        output = self._app.query_one(OutputLog)
+        page_turns = min(REPLAY_PAGE_TURNS, self._hidden)
+        try:
+            events, end = _read_turns(
+                self._path, self._end, page_turns, page_turns == self._hidden
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning("Cannot load earlier turns from %s: %s", self._path, exc)
+            self._hidden = 0
+            output.insert_history(
+                lambda: output.append_text(
+                    f"(earlier turns unavailable: {exc})", style="dim"
+                )
+            )
+            return
+        self._end = end
+        self._hidden -= page_turns
+        # Session banners above the marker are already on screen.
+        page = [event for event in events if event.get("event") != "session_start"]
+        marker = self.marker_text() if self._hidden else None
+        render = functools.partial(self._render_page, page)
+        output.insert_history(lambda: self._app._render_detached(render), marker)
+
+    def _render_page(self, page: list[dict[str, Any]]) -> None:
+        """Render ``page`` through the live UI primitives."""
+        output = self._app.query_one(OutputLog)
+        for event in page:
+            _render_event(self._app, output, event, self._session_start_time)
@@ -10,18 +10,47 @@
   right now and is recomputed wholesale on every ``rebuild()`` (e.g. after a
   tier toggle in step 6). Screen-state assertions ("what is visible after a
   re-render?") belong here.
+
+``rebuild()`` does not re-render the whole session. Every script entry's
+buffer strips are cached as a ``_Block`` keyed by entry (literal lines) or
+by ``(unit id, tier)`` (atomic units) and tagged with the width they were
+wrapped at, so a tier toggle renders only the toggled unit and a resize
+re-wraps only the entries in (or near) the viewport; the remaining blocks
+keep their old wrap until ``_refresh_stale_blocks`` re-wraps them in
+chunks in the background. Blocks no longer referenced by the script
+(e.g. the other tier of a toggled unit) are kept as spares, at most
+``_MAX_SPARE_BLOCKS`` of them; the oldest are dropped on ``rebuild()``.
+
+The block splicing reaches into ``RichLog`` internals: ``lines``,
+``_line_cache``, ``_widest_line_width``, ``_start_line``, ``_size_known``
+and ``_make_renderable``. These exist unchanged from Textual 1.0 (the
+``textual>=1.0.0`` pin in ``pyproject.toml``) through the current release;
+``tests/icoder/ui/test_output_log.py`` fails fast if an upgrade drops one.
+
+Bulk rendering (log replay) wraps its appends in ``batch_updates()`` so the
+per-tool-result ``rebuild()`` runs once at the end instead of once per unit.
+Replayed history older than the visible tail is represented by a history
+marker line and rendered on demand (``insert_history``) when the user
+scrolls to the top.
 """
 
 from __future__ import annotations
 
 import dataclasses
+from bisect import bisect_left, bisect_right
+from collections.abc import Hashable
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterator, Literal
 
 from rich.console import ConsoleRenderable, RichCast
+from rich.measure import measure_renderables
+from rich.segment import Segment
 from rich.text import Text
 from textual.events import Click
+from textual.geometry import Size
+from textual.strip import Strip
 from textual.timer import Timer
 from textual.widgets import RichLog
 
@@ -32,6 +61,13 @@
     format_tool_start,
 )
 
+# Buffer lines above/below the viewport re-wrapped synchronously on resize.
+_MATERIALIZE_MARGIN = 200
+# Stale blocks re-wrapped per background refresh step.
+_STALE_REFRESH_CHUNK = 500
+# Cached blocks kept beyond those the current script renders.
+_MAX_SPARE_BLOCKS = 1000
+
 
 @dataclass(frozen=True)
 class _ScriptEntry:
@@ -52,6 +88,21 @@ class _ScriptEntry:
     style: str | None = None
 
 
+@dataclass(frozen=True)
+class _Block:
+    """Cached buffer strips of one script entry, wrapped at ``width``.
+
+    ``source`` is the ``ContentUnit`` an atomic block was rendered from
+    (``None`` for literal lines); a replaced unit invalidates the block.
+    """
+
+    width: int
+    strips: tuple[Strip, ...]
+    lines: tuple[str, ...]
+    widest: int
+    source: ContentUnit | None = None
+
+
 @dataclass(frozen=True)
 class ContentUnit:
     """A clickable unit of output (one tool, user input, or assistant turn).
@@ -117,11 +168,24 @@ def __init__(
         self._script: list[_ScriptEntry] = []  # replay script (see _ScriptEntry)
         self._ranges: list[tuple[int, int, str]] = []  # (start, end, unit_id)
         self._screen_lines: list[str] = []  # current screen state
+        # Set when an in-place block splice left ``_screen_lines`` outdated.
+        self._screen_lines_stale: bool = False
         # Global default tier and per-unit overrides. ``set_tool_display_default``
         # (the /display hard reset) updates the default AND wipes the overrides;
         # ``toggle_unit_tier`` populates the overrides. clear_state() wipes them.
         self._tool_display_default: Literal["oneline", "compressed"] = "compressed"
         self._tool_tier_overrides: dict[str, Literal["oneline", "compressed"]] = {}
+        # Deferred rebuilds (see ``batch_updates``).
+        self._batch_depth: int = 0
+        self._rebuild_pending: bool = False
+        # Placeholder for not-yet-rendered history (see ``append_history_marker``).
+        self._history_marker: _ScriptEntry | None = None
+        self._history_loader: Callable[[], None] | None = None
+        # Render cache (see ``_Block``) and the buffer start of each script
+        # entry (aligned with ``_script``; emptied when they diverge).
+        self._blocks: dict[Hashable, _Block] = {}
+        self._starts: list[int] = []
+        self._stale_generation: int = 0
 
     def clear_state(self) -> None:
         """Wipe all registry state and the recorded-line history.
@@ -135,7 +199,13 @@ def clear_state(self) -> None:
         self._script.clear()
         self._ranges.clear()
         self._screen_lines.clear()
+        self._screen_lines_stale = False
         self._tool_tier_overrides.clear()
+        self._history_marker = None
+        self._history_loader = None
+        self._blocks.clear()
+        self._starts.clear()
+        self._stale_generation += 1
 
     @property
     def recorded_lines(self) -> list[str]:
@@ -154,6 +224,11 @@ def rendered_lines(self) -> list[str]:
             Copy of the logical lines currently displayed (one entry per
             written line, no wrap expansion).
         """
+        if self._screen_lines_stale:
+            self._screen_lines = [
+                line for entry in self._script for line in self._logical_lines(entry)
+            ]
+            self._screen_lines_stale = False
         return list(self._screen_lines)
 
     def write(  # type: ignore[override]  # pylint: disable=arguments-differ
@@ -200,14 +275,38 @@ def append_text(self, text: str, style: str | None = None) -> None:
             style: Optional Rich style string.
         """
         self._recorded.append(text)
-        self._screen_lines.append(text)
         if self._mirror is not None:
             self._mirror(text)
-        self._write_line(text, style)
         # Recorded in the replay script as a non-unit literal line so it
         # survives rebuild(); unit_id=None keeps it out of _ranges (= not
         # clickable).
-        self._script.append(_ScriptEntry(None, text, style))
+        self._append_literal(_ScriptEntry(None, text, style))
+
+    def _append_literal(self, entry: _ScriptEntry) -> None:
+        """Write a literal script entry and cache the strips it produced.
+
+        Args:
+            entry: A literal entry (``entry.line`` is set).
+        """
+        assert entry.line is not None
+        buffer_start = len(self.lines)
+        self._screen_lines.append(entry.line)
+        self._write_line(entry.line, entry.style)
+        self._script.append(entry)
+        # Writes are deferred (nothing lands in ``lines``) until the size is
+        # known; those entries are rendered by the next rebuild instead, and
+        # the missing start leaves ``_starts`` unaligned until then.
+        if not self._size_known:
+            return
+        self._starts.append(buffer_start)
+        if len(self.lines) > buffer_start:
+            strips = tuple(self.lines[buffer_start:])
+            self._blocks[entry] = _Block(
+                width=self.scrollable_content_region.width,
+                strips=strips,
+                lines=(entry.line,),
+                widest=max(strip.cell_length for strip in strips),
+            )
 
     def _write_line(self, line: str, style: str | None) -> None:
         """Write one literal line to the RichLog buffer, applying ``style``.
@@ -260,6 +359,8 @@ def _write_unit_atomic(
             self._write_line(line, style)
         buffer_end = len(self.lines)
         self._script.append(_ScriptEntry(unit.id, None))
+        if self._size_known:
+            self._starts.append(buffer_start)
         self._ranges.append((buffer_start, buffer_end, unit.id))
 
     def extend_open_unit(
@@ -286,13 +387,10 @@ def extend_open_unit(
         for line in lines:
             buffer_start = len(self.lines)
             self._recorded.append(line)
-            self._screen_lines.append(line)
             if self._mirror is not None:
                 self._mirror(line)
-            self._write_line(line, style)
-            buffer_end = len(self.lines)
-            self._script.append(_ScriptEntry(unit_id, line, style))
-            self._ranges.append((buffer_start, buffer_end, unit_id))
+            self._append_literal(_ScriptEntry(unit_id, line, style))
+            self._ranges.append((buffer_start, len(self.lines), unit_id))
 
     def finalize_open_unit(self, unit_id: str) -> None:
         """Mark an open unit as finished.
@@ -317,7 +415,7 @@ def update_unit_and_rerender(self, unit_id: str, **fields: object) -> ContentUni
         # mypy cannot narrow **dict[str, object] to the typed dataclass fields.
         new_unit = dataclasses.replace(self._units[unit_id], **fields)  # type: ignore[arg-type]
         self._units[unit_id] = new_unit
-        self.rebuild()
+        self._rerender_unit(unit_id)
         return new_unit
 
     def unit_at_line(self, line: int) -> ContentUnit | None:
@@ -380,7 +478,7 @@ def toggle_unit_tier(self, unit_id: str) -> Literal["oneline", "compressed"]:
             "oneline" if self.effective_tier(unit_id) == "compressed" else "compressed"
         )
         self._tool_tier_overrides[unit_id] = new_tier
-        self.rebuild()
+        self._rerender_unit(unit_id)
         return new_tier
 
     def set_tool_display_default(self, tier: Literal["oneline", "compressed"]) -> None:
@@ -464,15 +562,134 @@ def _handle_single(self, unit: ContentUnit) -> None:
                 {"unit_id": unit.id, "new_tier": new_tier},
             )
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer ``rebuild()`` until the outermost block exits, then run it once.
+
+        Yields:
+            None; appends and unit updates inside the block are batched.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._rebuild_pending:
+                self._rebuild_pending = False
+                self.rebuild()
+
+    @property
+    def has_pending_history(self) -> bool:
+        """Whether a history marker stands in for unrendered older output."""
+        return self._history_marker is not None
+
+    def append_history_marker(self, text: str, loader: Callable[[], None]) -> None:
+        """Append a placeholder line standing in for older, unrendered history.
+
+        The marker is neither recorded nor mirrored. ``loader`` runs when the
+        user scrolls to the top; it is expected to call :meth:`insert_history`.
+
+        Args:
+            text: Placeholder text (e.g. "12 earlier turns - scroll up").
+            loader: Callback rendering (part of) the hidden history.
+        """
+        entry = _ScriptEntry(None, text, "dim")
+        self._append_literal(entry)
+        self._history_marker = entry
+        self._history_loader = loader
+
+    def insert_history(
+        self, render: Callable[[], None], marker: str | None = None
+    ) -> None:
+        """Render older output in place of the history marker.
+
+        ``render`` appends through the normal ``append_*`` API; its units,
+        script entries and recorded lines are spliced in where the marker
+        stood, then the screen is rebuilt once with the viewport kept on the
+        same content.
+
+        Args:
+            render: Callback appending the older output.
+            marker: Text of a new marker when still more history remains,
+                or ``None`` when this was the last page.
+        """
+        placeholder = self._history_marker
+        if placeholder is None:
+            return
+        saved_recorded, saved_units, saved_script = (
+            self._recorded,
+            self._units,
+            self._script,
+        )
+        self._recorded, self._units, self._script = [], {}, []
+        mirror, self._mirror = self._mirror, None
+        self._batch_depth += 1
+        try:
+            render()
+        finally:
+            self._batch_depth -= 1
+            self._rebuild_pending = False
+            self._mirror = mirror
+            index = next(i for i, e in enumerate(saved_script) if e is placeholder)
+            new_marker = _ScriptEntry(None, marker, "dim") if marker else None
+            self._script = (
+                saved_script[:index]
+                + ([new_marker] if new_marker is not None else [])
+                + self._script
+                + saved_script[index + 1 :]
+            )
+            self._units = {**self._units, **saved_units}
+            self._recorded = self._recorded + saved_recorded
+            self._history_marker = new_marker
+            if new_marker is None:
+                self._history_loader = None
+            # Buffer starts of the spliced-in entries are unknown.
+            self._starts = []
+        lines_before = len(self.lines)
+        top = self.scroll_offset.y
+        self.rebuild()
+        self.scroll_to(y=top + len(self.lines) - lines_before, animate=False)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Load hidden history when the user scrolls to the very top.
+
+        Args:
+            old_value: Previous vertical scroll offset.
+            new_value: New vertical scroll offset.
+        """
+        super().watch_scroll_y(old_value, new_value)
+        if new_value <= 0 < old_value and self._history_loader is not None:
+            self.call_later(self._history_loader)
+
     def rebuild(self) -> None:
         """Re-render the screen from the registry script.
 
-        Walks ``_script`` and rewrites the RichLog buffer, recomputing
-        ``_screen_lines`` and ``_ranges``. ``_recorded`` is untouched.
+        Reassembles the RichLog buffer from cached blocks, recomputing
+        ``_screen_lines`` and ``_ranges``; only entries without a valid
+        block are rendered. After a width change, only entries in or near
+        the viewport (and the tail, which auto-scroll reveals) are re-wrapped
+        now; the rest are re-wrapped in the background. ``_recorded`` is
+        untouched. Inside ``batch_updates()`` the rebuild is deferred to the
+        block exit.
         """
+        if self._batch_depth:
+            self._rebuild_pending = True
+            return
+        if not self._size_known:
+            self._rebuild_deferred()
+            return
+        self._stale_generation += 1
+        stale = self._assemble(self._materialize_window(), follow=self.auto_scroll)
+        if stale:
+            self.call_later(self._refresh_stale_blocks, self._stale_generation, stale)
+
+    def _rebuild_deferred(self) -> None:
+        """Rewrite the whole script while RichLog still defers writes."""
         super().clear()
         self._screen_lines = []
+        self._screen_lines_stale = False
         self._ranges = []
+        self._starts = []
         for entry in self._script:
             start_idx = len(self.lines)
             if entry.line is None:
@@ -491,6 +708,288 @@ def rebuild(self) -> None:
             if entry.unit_id is not None and end_idx > start_idx:
                 self._ranges.append((start_idx, end_idx, entry.unit_id))
 
+    def _rerender_unit(self, unit_id: str) -> None:
+        """Re-render one unit, splicing its block into the buffer in place.
+
+        Falls back to a full ``rebuild()`` whenever the buffer starts are
+        not known (batched updates, deferred writes, spliced history) or
+        the unit has no atomic script entry (e.g. an assistant turn).
+
+        Args:
+            unit_id: The id of the unit whose fields or tier changed.
+        """
+        index = self._atomic_entry_index(unit_id)
+        if (
+            index is None
+            or self._batch_depth
+            or not self._size_known
+            or len(self._starts) != len(self._script)
+        ):
+            self.rebuild()
+            return
+        entry = self._script[index]
+        unit = self._units[unit_id]
+        key = self._block_key(entry)
+        block = self._blocks.get(key)
+        width = self.scrollable_content_region.width
+        if block is None or block.source is not unit or block.width != width:
+            block = self._render_block(entry, unit)
+            self._blocks[key] = block
+        start = self._starts[index]
+        end = (
+            self._starts[index + 1]
+            if index + 1 < len(self._starts)
+            else len(self.lines)
+        )
+        self.lines[start:end] = block.strips
+        delta = len(block.strips) - (end - start)
+        if delta:
+            tail = index + 1
+            self._starts[tail:] = [offset + delta for offset in self._starts[tail:]]
+        first = bisect_left(self._ranges, (start,))
+        ranges = [(start, start + len(block.strips), unit_id)] if block.strips else []
+        ranges.extend(
+            (range_start + delta, range_end + delta, uid)
+            for range_start, range_end, uid in self._ranges[first:]
+            if range_start >= end
+        )
+        self._ranges[first:] = ranges
+        self._screen_lines_stale = True
+        self._line_cache.clear()
+        self._widest_line_width = max(self._widest_line_width, block.widest)
+        self.virtual_size = Size(self._widest_line_width, len(self.lines))
+        self.refresh()
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+
+    def _atomic_entry_index(self, unit_id: str) -> int | None:
+        """Return the script index of ``unit_id``'s atomic entry, if any.
+
+        Scans from the end: updated and toggled units are usually recent.
+        """
+        if self._units[unit_id].kind == "assistant_turn":
+            return None
+        for index in range(len(self._script) - 1, -1, -1):
+            entry = self._script[index]
+            if entry.unit_id == unit_id and entry.line is None:
+                return index
+        return None
+
+    def _logical_lines(self, entry: _ScriptEntry) -> tuple[str, ...]:
+        """Return the logical lines ``entry`` currently renders to."""
+        if entry.line is not None:
+            return (entry.line,)
+        unit = self._units[entry.unit_id]  # type: ignore[index]
+        block = self._blocks.get(self._block_key(entry))
+        if block is not None and block.source is unit:
+            return block.lines
+        return tuple(self._render_unit_atomic(unit))
+
+    def _materialize_window(self) -> set[int]:
+        """Return the script indices that must be wrapped at the current width.
+
+        Covers the viewport plus ``_MATERIALIZE_MARGIN`` buffer lines, and
+        the tail when auto-scroll will jump there. Every entry is included
+        when the buffer starts are unknown.
+
+        Returns:
+            Script indices to render now if their block is stale.
+        """
+        if len(self._starts) != len(self._script):
+            return set(range(len(self._script)))
+        height = self.scrollable_content_region.height
+        top = self.scroll_offset.y
+        spans = [(top - _MATERIALIZE_MARGIN, top + height + _MATERIALIZE_MARGIN)]
+        if self.auto_scroll:
+            spans.append(
+                (len(self.lines) - height - _MATERIALIZE_MARGIN, len(self.lines))
+            )
+        window: set[int] = set()
+        for low, high in spans:
+            first = max(0, bisect_right(self._starts, low) - 1)
+            window.update(range(first, bisect_left(self._starts, high + 1)))
+        return window
+
+    def _block_key(self, entry: _ScriptEntry) -> Hashable:
+        """Return the ``_blocks`` key of ``entry``.
+
+        Literal entries are keyed by value (equal entries render equally);
+        atomic units by ``(unit id, effective tier)``.
+        """
+        if entry.line is None:
+            assert entry.unit_id is not None
+            return (entry.unit_id, self.effective_tier(entry.unit_id))
+        return entry
+
+    def _assemble(self, window: set[int], *, follow: bool) -> list[_ScriptEntry]:
+        """Rebuild the buffer from blocks, rendering missing/invalid ones.
+
+        Args:
+            window: Script indices whose stale (other-width) blocks are
+                re-wrapped now; stale blocks elsewhere are reused as is.
+            follow: Scroll to the end afterwards (RichLog auto-scroll).
+
+        Returns:
+            Entries whose reused block is stale, for background refresh.
+        """
+        width = self.scrollable_content_region.width
+        lines: list[Strip] = []
+        screen_lines: list[str] = []
+        ranges: list[tuple[int, int, str]] = []
+        starts: list[int] = []
+        stale: dict[Hashable, _ScriptEntry] = {}
+        live: set[Hashable] = set()
+        widest = 0
+        for index, entry in enumerate(self._script):
+            key = self._block_key(entry)
+            live.add(key)
+            block = self._blocks.get(key)
+            unit = self._units[entry.unit_id] if entry.line is None else None  # type: ignore[index]
+            if (
+                block is None
+                or block.source is not unit
+                or (block.width != width and index in window)
+            ):
+                block = self._render_block(entry, unit)
+                self._blocks[key] = block
+            elif block.width != width:
+                stale[key] = entry
+            start = len(lines)
+            starts.append(start)
+            lines.extend(block.strips)
+            screen_lines.extend(block.lines)
+            widest = max(widest, block.widest)
+            # Only unit-owned entries get a clickable range; non-unit lines
+            # (unit_id is None) stay non-clickable.
+            if entry.unit_id is not None and len(lines) > start:
+                ranges.append((start, len(lines), entry.unit_id))
+        self.lines = lines
+        self._screen_lines = screen_lines
+        self._screen_lines_stale = False
+        self._ranges = ranges
+        self._starts = starts
+        self._prune_blocks(live)
+        self._line_cache.clear()
+        self._start_line = 0
+        self._widest_line_width = widest
+        self.virtual_size = Size(widest, len(lines))
+        self.refresh()
+        if follow:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        return list(stale.values())
+
+    def _prune_blocks(self, live: set[Hashable]) -> None:
+        """Drop the oldest spare blocks beyond ``_MAX_SPARE_BLOCKS``.
+
+        Args:
+            live: Keys of the blocks the current script renders.
+        """
+        excess = len(self._blocks) - len(live) - _MAX_SPARE_BLOCKS
+        if excess <= 0:
+            return
+        spares = [key for key in self._blocks if key not in live]
+        for key in spares[:excess]:
+            del self._blocks[key]
+
+    def _refresh_stale_blocks(
+        self, generation: int, entries: list[_ScriptEntry]
+    ) -> None:
+        """Re-wrap stale blocks in chunks, then reassemble once.
+
+        Abandoned when another rebuild (``generation`` mismatch) happened
+        in between. The first visible entry keeps its screen row unless the
+        view was following the end.
+
+        Args:
+            generation: ``_stale_generation`` at scheduling time.
+            entries: Entries whose blocks are wrapped at another width.
+        """
+        if generation != self._stale_generation:
+            return
+        width = self.scrollable_content_region.width
+        chunk, rest = entries[:_STALE_REFRESH_CHUNK], entries[_STALE_REFRESH_CHUNK:]
+        for entry in chunk:
+            key = self._block_key(entry)
+            block = self._blocks.get(key)
+            if block is not None and block.width != width:
+                self._blocks[key] = self._render_block(entry, block.source)
+        if rest:
+            self.call_later(self._refresh_stale_blocks, generation, rest)
+            return
+        follow = self.auto_scroll and self.is_vertical_scroll_end
+        top = self.scroll_offset.y
+        anchor = max(0, bisect_right(self._starts, top) - 1)
+        offset = top - self._starts[anchor] if self._starts else 0
+        self._assemble(set(), follow=follow)
+        if not follow and anchor < len(self._starts):
+            self.scroll_to(y=self._starts[anchor] + offset, animate=False)
+
+    def _render_block(self, entry: _ScriptEntry, unit: ContentUnit | None) -> _Block:
+        """Render one script entry at the current width.
+
+        Args:
+            entry: The script entry.
+            unit: The entry's unit for atomic entries, else ``None``.
+
+        Returns:
+            The freshly rendered block.
+        """
+        if unit is not None:
+            logical = tuple(self._render_unit_atomic(unit))
+            style = None
+        else:
+            assert entry.line is not None
+            logical = (entry.line,)
+            style = entry.style
+        strips: list[Strip] = []
+        widest = 0
+        for line in logical:
+            line_strips, line_widest = self._render_strips(line, style)
+            strips.extend(line_strips)
+            widest = max(widest, line_widest)
+        return _Block(
+            width=self.scrollable_content_region.width,
+            strips=tuple(strips),
+            lines=logical,
+            widest=widest,
+            source=unit,
+        )
+
+    def _render_strips(self, line: str, style: str | None) -> tuple[list[Strip], int]:
+        """Wrap one line exactly as ``RichLog.write`` would, without writing it.
+
+        Args:
+            line: The literal text.
+            style: Optional Rich style string.
+
+        Returns:
+            The wrapped strips and the widest unpadded strip width.
+        """
+        renderable = self._make_renderable(Text(line, style=style) if style else line)
+        console = self.app.console
+        options = console.options
+        if isinstance(renderable, Text) and not self.wrap:
+            options = options.update(overflow="ignore", no_wrap=True)
+        measured = measure_renderables(console, options, [renderable]).maximum
+        render_width = max(
+            min(measured, self.scrollable_content_region.width), self.min_width
+        )
+        segment_lines = list(
+            Segment.split_lines(
+                console.render(renderable, options.update_width(render_width))
+            )
+        )
+        if not segment_lines:
+            return [Strip.blank(render_width)], render_width
+        strips = Strip.from_lines(segment_lines)
+        for strip in strips:
+            strip.adjust_cell_length(render_width)
+        widest = max(
+            sum(segment.cell_length for segment in segment_line)
+            for segment_line in segment_lines
+        )
+        return strips, widest
+
     def _render_unit_atomic(self, unit: ContentUnit) -> list[str]:
         """Render an atomic unit (tool / user_input) to logical lines.
 
@@ -18,6 +18,8 @@
 if TYPE_CHECKING:
     from mcp_coder.utils.pyproject_config import PromptsConfig
 
+    from .providers.claude.claude_cli_worker import ClaudeCliWorker
+
 
 logger = logging.getLogger(__name__)
 
@@ -295,6 +297,7 @@ def prompt_llm_stream(
     branch_name: str | None = None,
     tools: list[Any] | None = None,
     project_dir: str | None = None,
+    claude_worker: "ClaudeCliWorker | None" = None,
 ) -> Iterator[StreamEvent]:
     """Stream LLM responses as events.
 
@@ -319,6 +322,8 @@ def prompt_llm_stream(
         branch_name: Optional git branch name to include in log filename.
         tools: Optional list of langchain tools (langchain provider only).
         project_dir: Optional project directory for loading system/project prompts.
+        claude_worker: Optional warm Claude CLI process that serves the turn
+            instead of a fresh ``claude`` subprocess (claude provider only).
 
     Yields:
         StreamEvent dicts from the underlying provider.
@@ -410,7 +415,12 @@ def prompt_llm_stream(
                 system_prompt, project_prompt, prompts_config, project_dir
             )
 
-        yield from ask_claude_code_cli_stream(
+        stream_claude = (
+            claude_worker.stream
+            if claude_worker is not None
+            else ask_claude_code_cli_stream
+        )
+        yield from stream_claude(
             question,
             session_id=session_id,
             timeout=timeout,
@@ -0,0 +1,322 @@
+"""Warm, persistent Claude CLI process for multi-turn sessions.
+
+``ask_claude_code_cli_stream`` spawns a fresh ``claude`` process per turn,
+which reloads settings, reconnects every MCP server and resumes the session
+from disk before the first token. ``ClaudeCliWorker`` keeps one process per
+session open instead: the CLI runs with ``--input-format stream-json``, so
+each follow-up user message is written to the same process's stdin and its
+reply read from stdout up to the turn's ``result`` message.
+
+The worker is opt-in (``MCP_CODER_CLAUDE_WARM_WORKER=1``). It falls back to
+spawn-per-turn (``ask_claude_code_cli_stream``):
+
+- for the current turn, only when the process could not take the message:
+  writing it failed, or the process exited without any output for the turn
+  (the question is re-asked through a fresh process),
+- for all later turns, once the warm process has crashed or timed out.
+
+A turn that times out or exits after the process produced output is not
+re-asked: the message may already be in the session transcript, so a resumed
+session would see it twice. It ends with the same inactivity-timeout or
+nonzero-exit error event as the spawn-per-turn path.
+
+A process is (re)started whenever the session id or the CLI configuration
+(cwd, MCP config, settings, system prompts, env) differs from the one it was
+started with, e.g. after ``/clear`` or loading another session.
+"""
+
+import logging
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ....utils.subprocess_runner import CommandOptions
+from ....utils.subprocess_session import InteractiveProcess
+from ...types import StreamEvent
+from .claude_code_cli import (
+    _find_claude_executable,
+    build_cli_command,
+    format_stream_json_input,
+)
+from .claude_code_cli_log_paths import get_stream_log_path
+from .claude_code_cli_streaming import (
+    _inactivity_timeout_event,
+    _nonzero_exit_event,
+    _open_stream_log,
+    _process_stream_lines,
+    ask_claude_code_cli_stream,
+)
+from .claude_mcp_guard import load_mcp_server_names
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CLAUDE_WARM_WORKER_ENV",
+    "ClaudeCliWorker",
+    "warm_worker_enabled",
+]
+
+# Set to "1" to enable the warm worker (by default every turn spawns its own
+# process).
+CLAUDE_WARM_WORKER_ENV = "MCP_CODER_CLAUDE_WARM_WORKER"
+
+# Events a turn can produce before any answer content (init, raw NDJSON).
+_PREAMBLE_EVENT_TYPES = frozenset({"stream_file", "raw_line", "system"})
+
+
+@dataclass(frozen=True)
+class _ProcessConfig:
+    """CLI configuration a warm process was started with."""
+
+    cwd: str | None
+    mcp_config: str | None
+    settings_file: str | None
+    append_system_prompt: str | None
+    system_prompt_replace: str | None
+    env_vars: tuple[tuple[str, str], ...]
+
+
+def warm_worker_enabled() -> bool:
+    """Return True when ``MCP_CODER_CLAUDE_WARM_WORKER`` is ``"1"``."""
+    return os.environ.get(CLAUDE_WARM_WORKER_ENV, "0").strip() == "1"
+
+
+class ClaudeCliWorker:
+    """One long-lived Claude CLI process, fed one user message per turn.
+
+    ``stream()`` takes the same arguments as ``ask_claude_code_cli_stream``
+    and yields the same events. Not thread-safe: turns must not overlap.
+    """
+
+    def __init__(self) -> None:
+        """Create an idle worker; the process starts on the first turn."""
+        self._process: InteractiveProcess | None = None
+        self._config: _ProcessConfig | None = None
+        self._session_id: str | None = None
+        self._configured_servers: set[str] | None = None
+        self._disabled = False
+
+    @property
+    def disabled(self) -> bool:
+        """True once the worker fell back to spawn-per-turn for good."""
+        return self._disabled
+
+    def stream(
+        self,
+        question: str,
+        session_id: str | None = None,
+        timeout: int = 30,
+        env_vars: dict[str, str] | None = None,
+        cwd: str | None = None,
+        mcp_config: str | None = None,
+        settings_file: str | None = None,
+        logs_dir: str | None = None,
+        branch_name: str | None = None,
+        append_system_prompt: str | None = None,
+        system_prompt_replace: str | None = None,
+    ) -> Iterator[StreamEvent]:
+        """Run one turn on the warm process, yielding StreamEvents.
+
+        Yields:
+            ``stream_file`` first, then the turn's events as produced by
+            ``ask_claude_code_cli_stream`` (ending with ``done`` or ``error``).
+
+        Raises:
+            ValueError: If the question is empty or timeout is not positive,
+                or ``mcp_config`` cannot be read.
+            McpServersUnavailableError: If a configured MCP server failed.
+        """
+        if not question or not question.strip():
+            raise ValueError("Question cannot be empty or whitespace only")
+        if timeout <= 0:
+            raise ValueError("Timeout must be a positive number")
+
+        def _spawn_per_turn() -> Iterator[StreamEvent]:
+            return ask_claude_code_cli_stream(
+                question,
+                session_id=session_id,
+                timeout=timeout,
+                env_vars=env_vars,
+                cwd=cwd,
+                mcp_config=mcp_config,
+                settings_file=settings_file,
+                logs_dir=logs_dir,
+                branch_name=branch_name,
+                append_system_prompt=append_system_prompt,
+                system_prompt_replace=system_prompt_replace,
+            )
+
+        if self._disabled:
+            yield from _spawn_per_turn()
+            return
+
+        config = _ProcessConfig(
+            cwd=cwd,
+            mcp_config=mcp_config,
+            settings_file=settings_file,
+            append_system_prompt=append_system_prompt,
+            system_prompt_replace=system_prompt_replace,
+            env_vars=tuple(sorted((env_vars or {}).items())),
+        )
+        process = self._ensure_process(config, session_id)
+        if process is None:
+            yield from _spawn_per_turn()
+            return
+
+        try:
+            process.write_line(format_stream_json_input(question))
+        except OSError:
+            self._fail("crashed")
+            yield from _spawn_per_turn()
+            return
+
+        stream_file = get_stream_log_path(logs_dir, cwd, branch_name)
+        # Events are held back until the turn's first content event, so a
+        # process that dies before taking the message can be replaced by a
+        # fresh one without the consumer seeing a partial turn.
+        pending: list[StreamEvent] | None = [
+            {"type": "stream_file", "path": str(stream_file)}
+        ]
+        outcome: list[str] = []  # "timeout" | "exit" when the turn broke off
+        completed = False
+        try:
+            with _open_stream_log(stream_file) as log:
+                events = _process_stream_lines(
+                    _turn_lines(process, timeout, outcome),
+                    log,
+                    self._configured_servers,
+                    stream_file,
+                )
+                for event in events:
+                    if event.get("type") == "done":
+                        done_session_id = event.get("session_id")
+                        if isinstance(done_session_id, str):
+                            self._session_id = done_session_id
+                        completed = True
+                    if pending is None:
+                        yield event
+                    else:
+                        pending.append(event)
+                        if event.get("type") not in _PREAMBLE_EVENT_TYPES:
+                            yield from pending
+                            pending = None
+                    if completed:
+                        # End of turn: stop reading, the process now waits
+                        # for the next message.
+                        break
+            if outcome:
+                completed = True
+        finally:
+            if not completed:
+                # Abandoned mid-turn (consumer stopped, MCP guard raised): the
+                # rest of this turn's output would leak into the next one.
+                self.close()
+
+        if outcome == ["exit"] and pending is not None and not _has_output(pending):
+            # Exited without a line for this turn: the message was never
+            # taken up, so re-asking cannot duplicate it in the transcript.
+            self._fail("crashed")
+            yield from _spawn_per_turn()
+            return
+        if outcome and pending is not None:
+            yield from pending
+        if outcome == ["timeout"]:
+            self._fail("timed out")
+            yield _inactivity_timeout_event(timeout)
+        elif outcome == ["exit"]:
+            self._fail("exited mid-turn")
+            return_code = process.returncode
+            yield _nonzero_exit_event(
+                return_code if return_code is not None else 1, process.stderr
+            )
+
+    def close(self) -> None:
+        """Stop the warm process, if any."""
+        process, self._process = self._process, None
+        self._config = None
+        if process is not None:
+            process.close()
+
+    def _ensure_process(
+        self, config: _ProcessConfig, session_id: str | None
+    ) -> InteractiveProcess | None:
+        """Return a live process for ``config``/``session_id``, starting one if needed.
+
+        Returns:
+            The process, or ``None`` if it could not be started (the worker
+            is then disabled).
+        """
+        process = self._process
+        if (
+            process is not None
+            and process.is_alive()
+            and config == self._config
+            and session_id == self._session_id
+        ):
+            return process
+        self.close()
+
+        # Raises ValueError for a bad --mcp-config, as the spawn path does.
+        self._configured_servers = (
+            load_mcp_server_names(config.mcp_config, config.cwd)
+            if config.mcp_config
+            else None
+        )
+        command = build_cli_command(
+            session_id,
+            _find_claude_executable(),
+            config.mcp_config,
+            use_stream_json=True,
+            append_system_prompt=config.append_system_prompt,
+            system_prompt_replace=config.system_prompt_replace,
+            settings_file=config.settings_file,
+        )
+        options = CommandOptions(
+            env=dict(config.env_vars) or None,
+            cwd=config.cwd,
+            env_remove=["CLAUDECODE"],  # Allow nested Claude CLI invocations
+        )
+        try:
+            self._process = InteractiveProcess(command, options)
+        except OSError as exc:
+            logger.warning("Cannot start warm Claude CLI process: %s", exc)
+            self._disabled = True
+            return None
+        logger.debug("Started warm Claude CLI process %d", self._process.pid)
+        self._config = config
+        self._session_id = session_id
+        return self._process
+
+    def _fail(self, reason: str) -> None:
+        """Drop the warm process and use spawn-per-turn from now on."""
+        logger.warning(
+            "Warm Claude CLI process %s; falling back to one process per turn",
+            reason,
+        )
+        self.close()
+        self._disabled = True
+
+
+def _has_output(events: list[StreamEvent]) -> bool:
+    """Return True if the process wrote any stdout line among ``events``."""
+    return any(event.get("type") == "raw_line" for event in events)
+
+
+def _turn_lines(
+    process: InteractiveProcess, timeout: int, outcome: list[str]
+) -> Iterator[str]:
+    """Yield stdout lines of the current turn until the consumer stops.
+
+    The consumer stops at the turn's ``done`` event. If the output breaks off
+    first, ``"timeout"`` or ``"exit"`` is appended to ``outcome``.
+    """
+    while True:
+        try:
+            line = process.read_line(timeout=timeout)
+        except TimeoutError:
+            outcome.append("timeout")
+            return
+        if line is None:
+            outcome.append("exit")
+            return
+        yield line
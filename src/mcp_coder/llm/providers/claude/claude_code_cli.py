@@ -336,8 +336,9 @@ def ask_claude_code_cli(
     Session management is handled by Claude Code CLI - no manual history needed.
 
     All CLI interactions are logged to NDJSON files in the logs directory for
-    debugging and progress monitoring. The stream log file is continuously
-    updated during execution, allowing real-time monitoring via `tail -f`.
+    debugging and progress monitoring. The stream log file is updated during
+    execution (flushed at every turn boundary and at least once a second while
+    output arrives), allowing near real-time monitoring via `tail -f`.
 
     Args:
         question: The question to ask Claude
@@ -372,8 +373,10 @@ def ask_claude_code_cli(
 
     Returns:
         LLMResponseDict with complete response data including session_id.
-        The raw_response is the assembler's ``events`` shape:
-        - events: List of every StreamEvent seen during the run
+        The raw_response is the assembler's ``summary`` shape:
+        - event_count: Number of StreamEvents seen during the run
+        - events_ref: Byte range of the run in the NDJSON stream file
+        - tool_trace: Tool calls with truncated outputs (when present)
         - stream_file: Path to the NDJSON log file
         - usage: Token usage statistics (when present)
 
@@ -423,7 +426,9 @@ def ask_claude_code_cli(
     )
 
     start_time = time.time()
-    assembler = ResponseAssembler("claude")
+    # Every event is already in the NDJSON stream file; keep only a summary
+    # (and a byte-range reference to that file) in memory.
+    assembler = ResponseAssembler("claude", retention="summary")
     last_error: StreamEvent | None = None
     done: StreamEvent | None = None
     stream_file: str | None = None
@@ -8,7 +8,8 @@
 
 import logging
 import os
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
 from ....utils.subprocess_runner import CommandOptions, CommandResult
 from ....utils.subprocess_streaming import stream_subprocess
@@ -28,6 +29,7 @@
     load_mcp_server_names,
     parse_stream_json_line,
 )
+from .claude_stream_pipeline import BufferedStreamLog
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +83,175 @@ def _map_stream_message_to_event(msg: StreamMessage) -> Iterator[StreamEvent]:
         }
 
 
+def _open_stream_log(stream_file: Path) -> BufferedStreamLog:
+    """Open the NDJSON stream log, falling back to ``os.devnull``.
+
+    Args:
+        stream_file: Path of the stream log to create.
+
+    Returns:
+        A BufferedStreamLog; the log is flushed per turn (the ``result``
+        message) and on a timer rather than after every line.
+    """
+    try:
+        # newline="" keeps "\n" on Windows too: events_ref byte ranges are
+        # computed from the UTF-8 length of each line plus one.
+        log_fh = open(stream_file, "w", encoding="utf-8", newline="")  # noqa: SIM115
+    except OSError:
+        logger.warning(
+            "Cannot open stream log %s; continuing without file logging", stream_file
+        )
+        log_fh = open(os.devnull, "w", encoding="utf-8")  # noqa: SIM115
+    return BufferedStreamLog(log_fh)
+
+
+def _process_stream_lines(
+    lines: Iterable[str],
+    log: BufferedStreamLog,
+    configured_servers: set[str] | None,
+    stream_file: Path,
+) -> Iterator[StreamEvent]:
+    """Log, parse and map Claude CLI NDJSON lines to StreamEvents.
+
+    Shared by the spawn-per-call streaming core and the warm
+    ``ClaudeCliWorker``. Each line is parsed exactly once.
+
+    Args:
+        lines: NDJSON lines of one turn, as read from the CLI's stdout.
+        log: Stream log every line is appended to.
+        configured_servers: Servers from ``--mcp-config`` that may abort the
+            session, or ``None`` to guard every listed server.
+        stream_file: Stream log path, quoted in the MCP abort message.
+
+    Yields:
+        ``raw_line``, ``system`` and the mapped content/``done`` events.
+
+    Raises:
+        McpServersUnavailableError: If the init event reports a fatal
+            configured MCP server.
+    """
+    saw_system_init = False
+    for line in lines:
+        log.write_line(line)
+        yield {"type": "raw_line", "line": line}
+        msg = parse_stream_json_line(line)
+        if not msg:
+            continue
+        if msg.get("type") == "result":
+            log.end_turn()
+        if msg.get("type") == "system":
+            # Surface the init/system message to the assembler so the
+            # blocking path can repopulate raw_response["system"] (parity
+            # with main). Keep only the init event: later `system` heartbeats
+            # (e.g. thinking_tokens) carry no mcp_servers/tools and must not
+            # overwrite it, matching _parse_stream_lines. (#998, #1004)
+            if msg.get("subtype") == "init" or not saw_system_init:
+                saw_system_init = True
+                yield {"type": "system", "data": dict(msg)}
+            # MCP availability guard (matches the blocking path). Abort only
+            # on fatal (terminal, non-pending) servers so the model never
+            # runs blind on hallucinated tools. Pending servers self-heal
+            # within the session via the ToolSearch wait-bridge, so they are
+            # tolerated and only logged.
+            fatal_servers = find_fatal_mcp_servers(msg)
+            if configured_servers is not None:
+                # Scope fatality to the supplied --mcp-config: servers the
+                # operator did not configure (e.g. injected account-level
+                # connectors) must never abort the session.
+                ignored = {
+                    name: status
+                    for name, status in fatal_servers.items()
+                    if name not in configured_servers
+                }
+                fatal_servers = {
+                    name: status
+                    for name, status in fatal_servers.items()
+                    if name in configured_servers
+                }
+                if ignored:
+                    logger.info(
+                        "Ignoring non-configured MCP server(s) outside "
+                        "--mcp-config: %s",
+                        ignored,
+                    )
+            if fatal_servers:
+                detail = ", ".join(
+                    f"{name}={status}" for name, status in fatal_servers.items()
+                )
+                mcp_error_msg = (
+                    f"MCP servers not available: {detail}. The session started "
+                    f"without its configured tools; aborting before the model "
+                    f"runs blind. Stream log: {stream_file}"
+                )
+                logger.error(mcp_error_msg)
+                raise McpServersUnavailableError(
+                    mcp_error_msg, unavailable_servers=fatal_servers
+                )
+
+            # Fatal servers already aborted above, so any remaining
+            # non-connected servers are pending or needs-auth. Log the two
+            # groups separately: pending servers self-heal, needs-auth
+            # connectors are optional account-level connectors and must not
+            # be described as starting.
+            non_connected = find_unavailable_mcp_servers(msg)
+            pending_servers = {
+                name: status
+                for name, status in non_connected.items()
+                if status != MCP_NEEDS_AUTH_STATUS
+            }
+            needs_auth_servers = {
+                name: status
+                for name, status in non_connected.items()
+                if status == MCP_NEEDS_AUTH_STATUS
+            }
+            if pending_servers:
+                logger.info(
+                    "MCP server(s) still starting; ToolSearch will wait: %s",
+                    pending_servers,
+                )
+            if needs_auth_servers:
+                logger.info(
+                    "Unauthenticated account connector(s) (not part of "
+                    "configured-server health): %s",
+                    needs_auth_servers,
+                )
+        yield from _map_stream_message_to_event(msg)
+
+
+def _inactivity_timeout_event(timeout: int) -> StreamEvent:
+    """Build the ``error`` event for a CLI killed by the inactivity watchdog.
+
+    Returns:
+        The ``error`` StreamEvent (reason ``inactivity_timeout``).
+    """
+    return {
+        "type": "error",
+        "reason": "inactivity_timeout",
+        "timeout": timeout,
+        "message": (
+            f"LLM inactivity timeout (claude): no output for {timeout}s. "
+            "Process terminated. You can retry, or use --timeout to increase the limit."
+        ),
+    }
+
+
+def _nonzero_exit_event(return_code: int, stderr: str) -> StreamEvent:
+    """Build the ``error`` event for a CLI that exited with ``return_code``.
+
+    Returns:
+        The ``error`` StreamEvent (reason ``nonzero_exit``).
+    """
+    error_msg = f"CLI failed with code {return_code}"
+    if stderr:
+        error_msg += f": {stderr[:500]}"
+    return {
+        "type": "error",
+        "reason": "nonzero_exit",
+        "return_code": return_code,
+        "message": error_msg,
+    }
+
+
 def ask_claude_code_cli_stream(
     question: str,
     session_id: str | None = None,
@@ -156,118 +327,11 @@ def ask_claude_code_cli_stream(
     )
 
     stream = stream_subprocess(command, options, inactivity_timeout_seconds=timeout)
-    try:
-        log_fh = open(stream_file, "w", encoding="utf-8")  # noqa: SIM115
-    except OSError:
-        logger.warning(
-            "Cannot open stream log %s; continuing without file logging", stream_file
-        )
-        log_fh = open(os.devnull, "w", encoding="utf-8")  # noqa: SIM115
-    saw_system_init = False
-    with log_fh as log:
-        for line in stream:
-            log.write(line + "\n")
-            log.flush()
-            yield {"type": "raw_line", "line": line}
-            msg = parse_stream_json_line(line)
-            if not msg:
-                continue
-            if msg.get("type") == "system":
-                # Surface the init/system message to the assembler so the
-                # blocking path can repopulate raw_response["system"] (parity
-                # with main). Keep only the init event: later `system` heartbeats
-                # (e.g. thinking_tokens) carry no mcp_servers/tools and must not
-                # overwrite it, matching _parse_stream_lines. (#998, #1004)
-                if msg.get("subtype") == "init" or not saw_system_init:
-                    saw_system_init = True
-                    yield {"type": "system", "data": dict(msg)}
-                # MCP availability guard (matches the blocking path). Abort only
-                # on fatal (terminal, non-pending) servers so the model never
-                # runs blind on hallucinated tools. Pending servers self-heal
-                # within the session via the ToolSearch wait-bridge, so they are
-                # tolerated and only logged.
-                fatal_servers = find_fatal_mcp_servers(msg)
-                if configured_servers is not None:
-                    # Scope fatality to the supplied --mcp-config: servers the
-                    # operator did not configure (e.g. injected account-level
-                    # connectors) must never abort the session.
-                    ignored = {
-                        name: status
-                        for name, status in fatal_servers.items()
-                        if name not in configured_servers
-                    }
-                    fatal_servers = {
-                        name: status
-                        for name, status in fatal_servers.items()
-                        if name in configured_servers
-                    }
-                    if ignored:
-                        logger.info(
-                            "Ignoring non-configured MCP server(s) outside "
-                            "--mcp-config: %s",
-                            ignored,
-                        )
-                if fatal_servers:
-                    detail = ", ".join(
-                        f"{name}={status}" for name, status in fatal_servers.items()
-                    )
-                    mcp_error_msg = (
-                        f"MCP servers not available: {detail}. The session started "
-                        f"without its configured tools; aborting before the model "
-                        f"runs blind. Stream log: {stream_file}"
-                    )
-                    logger.error(mcp_error_msg)
-                    raise McpServersUnavailableError(
-                        mcp_error_msg, unavailable_servers=fatal_servers
-                    )
-
-                # Fatal servers already aborted above, so any remaining
-                # non-connected servers are pending or needs-auth. Log the two
-                # groups separately: pending servers self-heal, needs-auth
-                # connectors are optional account-level connectors and must not
-                # be described as starting.
-                non_connected = find_unavailable_mcp_servers(msg)
-                pending_servers = {
-                    name: status
-                    for name, status in non_connected.items()
-                    if status != MCP_NEEDS_AUTH_STATUS
-                }
-                needs_auth_servers = {
-                    name: status
-                    for name, status in non_connected.items()
-                    if status == MCP_NEEDS_AUTH_STATUS
-                }
-                if pending_servers:
-                    logger.info(
-                        "MCP server(s) still starting; ToolSearch will wait: %s",
-                        pending_servers,
-                    )
-                if needs_auth_servers:
-                    logger.info(
-                        "Unauthenticated account connector(s) (not part of "
-                        "configured-server health): %s",
-                        needs_auth_servers,
-                    )
-            yield from _map_stream_message_to_event(msg)
+    with _open_stream_log(stream_file) as log:
+        yield from _process_stream_lines(stream, log, configured_servers, stream_file)
 
     cmd_result: CommandResult = stream.result
     if cmd_result.timed_out:
-        yield {
-            "type": "error",
-            "reason": "inactivity_timeout",
-            "timeout": timeout,
-            "message": (
-                f"LLM inactivity timeout (claude): no output for {timeout}s. "
-                "Process terminated. You can retry, or use --timeout to increase the limit."
-            ),
-        }
+        yield _inactivity_timeout_event(timeout)
     elif cmd_result.return_code != 0:
-        error_msg = f"CLI failed with code {cmd_result.return_code}"
-        if cmd_result.stderr:
-            error_msg += f": {cmd_result.stderr[:500]}"
-        yield {
-            "type": "error",
-            "reason": "nonzero_exit",
-            "return_code": cmd_result.return_code,
-            "message": error_msg,
-        }
+        yield _nonzero_exit_event(cmd_result.return_code, cmd_result.stderr)
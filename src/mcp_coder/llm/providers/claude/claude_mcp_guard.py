@@ -15,6 +15,8 @@
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
+from .claude_stream_pipeline import loads
+
 logger = logging.getLogger(__name__)
 
 # MCP server status (from the init event) that means the server is ready to use.
@@ -246,7 +248,7 @@ def parse_stream_json_line(line: str) -> StreamMessage | None:
         return None
 
     try:
-        parsed = json.loads(line)
+        parsed = loads(line)
         return cast(StreamMessage, parsed)
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse stream line: {e}")
@@ -0,0 +1,176 @@
+"""NDJSON parsing and buffered logging for the Claude CLI stream.
+
+Every NDJSON line the Claude CLI emits is parsed exactly once (by
+``parse_stream_json_line``) and appended to the session's stream log. This
+module provides the two pieces of that pipeline:
+
+- ``loads``: JSON decoding through ``orjson`` when it is installed (the
+  ``fast-json`` extra), falling back to the standard library.
+- ``BufferedStreamLog``: a line writer that batches stream log writes and
+  flushes them at turn boundaries, on a timer and when the buffer grows large,
+  instead of flushing the file after every line.
+
+This module must stay free of other claude provider imports, since
+``claude_mcp_guard`` imports it.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, Any, Protocol
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep
+# catching the standard exception type with either backend.
+loads: Callable[[str], Any]
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    loads = json.loads
+    JSON_BACKEND = "json"
+
+# Maximum age in seconds of buffered lines before a timer flushes them.
+FLUSH_INTERVAL_SECONDS = 1.0
+# Buffered characters after which the buffer is flushed immediately.
+FLUSH_MAX_CHARS = 256 * 1024
+
+
+class _Timer(Protocol):
+    """The part of ``threading.Timer`` the stream log uses."""
+
+    def start(self) -> None:
+        """Start counting down; the callback runs once the interval elapses."""
+
+    def cancel(self) -> None:
+        """Stop the timer if its callback has not run yet."""
+
+
+def _daemon_timer(interval: float, callback: Callable[[], None]) -> _Timer:
+    """Return an unstarted daemon ``threading.Timer``.
+
+    Returns:
+        The timer; a pending one never keeps the interpreter alive.
+    """
+    timer = threading.Timer(interval, callback)
+    timer.daemon = True
+    return timer
+
+
+class BufferedStreamLog:
+    """Append-only NDJSON stream log with batched flushes.
+
+    Lines are held in memory and written to ``file`` when one of these occurs:
+
+    - ``end_turn()`` is called (the caller saw a ``result`` message),
+    - ``flush_interval`` seconds have passed since the last flush: checked on
+      each write, and by a timer started with the first buffered line, so
+      lines reach the file during a long silent tool call or MCP wait,
+    - more than ``max_chars`` characters are buffered,
+    - the log is closed.
+
+    The log file therefore always contains complete lines, and a finished
+    turn is on disk before its ``done`` event reaches consumers. The timer
+    flushes from its own thread; a lock serializes it with the writer.
+    """
+
+    def __init__(
+        self,
+        file: IO[str],
+        *,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_chars: int = FLUSH_MAX_CHARS,
+        clock: Callable[[], float] = time.monotonic,
+        timer_factory: Callable[[float, Callable[[], None]], _Timer] = _daemon_timer,
+    ) -> None:
+        """Wrap an open text file.
+
+        Args:
+            file: Text file the lines are appended to; closed by ``close()``.
+            flush_interval: Maximum age in seconds of buffered lines before
+                they are flushed, by the next ``write_line`` or the timer.
+            max_chars: Buffer size in characters that forces a flush.
+            clock: Monotonic time source (injectable for tests).
+            timer_factory: Builds the flush timer from an interval and a
+                callback (injectable for tests).
+        """
+        self._file = file
+        self._flush_interval = flush_interval
+        self._max_chars = max_chars
+        self._clock = clock
+        self._timer_factory = timer_factory
+        self._timer: _Timer | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_flush = clock()
+
+    def write_line(self, line: str) -> None:
+        """Buffer one NDJSON line (without its trailing newline)."""
+        with self._lock:
+            self._pending.append(line)
+            self._pending.append("\n")
+            self._pending_chars += len(line) + 1
+            if (
+                self._pending_chars >= self._max_chars
+                or self._clock() - self._last_flush >= self._flush_interval
+            ):
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = self._timer_factory(self._flush_interval, self._on_timer)
+                self._timer.start()
+
+    def end_turn(self) -> None:
+        """Mark a turn boundary; everything buffered so far is flushed."""
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the file and flush it."""
+        with self._lock:
+            self._flush_locked()
+
+    def _on_timer(self) -> None:
+        """Flush lines that have been buffered for ``flush_interval``."""
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Flush with ``_lock`` held; cancels a pending timer."""
+        self._last_flush = self._clock()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        self._file.write("".join(self._pending))
+        self._file.flush()
+        self._pending.clear()
+        self._pending_chars = 0
+
+    def close(self) -> None:
+        """Flush remaining lines and close the file."""
+        with self._lock:
+            self._closed = True
+            try:
+                self._flush_locked()
+            finally:
+                self._file.close()
+
+    def __enter__(self) -> BufferedStreamLog:
+        """Support context manager usage.
+
+        Returns:
+            Self for use in with-statements.
+        """
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Flush and close on context manager exit."""
+        self.close()
@@ -7,9 +7,10 @@
 
 from __future__ import annotations
 
-import asyncio
+import hashlib
 import json
 import logging
+import os
 import queue
 import threading
 import time
@@ -18,6 +19,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from mcp_coder.llm.storage.langchain_history import load_langchain_history_window
 from mcp_coder.llm.storage.session_storage import (
     load_langchain_history,
     store_langchain_history,
@@ -37,9 +39,11 @@
     raise_auth_error,
     raise_connection_error,
 )
+from ._http import pool_key
 from ._messages import assemble_messages, serialize_messages
 from ._preflight import _ollama_preflight
 from ._usage import _extract_usage
+from .agent_runtime import get_agent_runtime
 
 if TYPE_CHECKING:
     from langchain_core.language_models import BaseChatModel
@@ -47,6 +51,28 @@
 
 logger = logging.getLogger(__name__)
 
+# Byte budget for the stored history sent with each prompt; unset sends it all.
+HISTORY_MAX_BYTES_ENV = "MCP_CODER_LANGCHAIN_HISTORY_MAX_BYTES"
+
+
+def _load_history(session_id: str) -> tuple[int, list[dict[str, Any]]]:
+    """Load the conversation history to send with the next prompt.
+
+    With ``MCP_CODER_LANGCHAIN_HISTORY_MAX_BYTES`` set, only the tail window
+    of whole turns that fits that many bytes of stored messages is loaded.
+
+    Returns:
+        ``(start, history)``: the index of ``history[0]`` in the stored
+        history (pass it back when storing), and the messages.
+    """
+    raw = os.environ.get(HISTORY_MAX_BYTES_ENV, "").strip()
+    if raw:
+        try:
+            return load_langchain_history_window(session_id, max_bytes=int(raw))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", HISTORY_MAX_BYTES_ENV, raw)
+    return 0, load_langchain_history(session_id)
+
 
 def _build_system_messages(
     system_prompt: str | None, project_prompt: str | None
@@ -224,6 +250,60 @@ def _create_chat_model(
     )
 
 
+#: Environment variables the backend factories read API keys from (they take
+#: precedence over ``config["api_key"]``).
+_API_KEY_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "OLLAMA_API_KEY",
+)
+
+
+def _agent_chat_model(
+    config: dict[str, str | None],
+    timeout: int,
+) -> BaseChatModel:
+    """Return the agent runtime's chat model for *config*, building it once.
+
+    The cache key covers everything the backend factories read: the config,
+    the timeout, the API-key environment variables and the pooled HTTP client
+    key (proxy and TLS environment). API keys and proxy URLs may hold
+    credentials, so the key keeps only a SHA-256 digest of them and the log
+    names only the backend and model. The Ollama pre-flight check therefore
+    runs only when a model is built, not on every turn.
+
+    Args:
+        config: LangChain configuration dict.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        The cached or newly built chat model.
+    """  # Also raises ImportError / ValueError from _ollama_preflight.
+    backend = config.get("backend") or ""
+    material = repr(
+        (
+            tuple(sorted(config.items())),
+            timeout,
+            tuple(os.getenv(name) for name in _API_KEY_ENV_VARS),
+            pool_key(backend, config.get("endpoint")),
+        )
+    )
+    key = (
+        backend,
+        config.get("model"),
+        hashlib.sha256(material.encode("utf-8")).hexdigest(),
+    )
+
+    def _build() -> BaseChatModel:
+        _ollama_preflight(config)
+        return _create_chat_model(config, timeout=timeout)
+
+    return get_agent_runtime().chat_model(
+        key, _build, label=f"{backend}/{config.get('model')}"
+    )
+
+
 def ask_langchain(
     question: str,
     session_id: str | None = None,
@@ -318,7 +398,7 @@ def _ask_text(
     Raises:
         ValueError: If the model is not found on the configured backend.
     """  # Also raises LLMAuthError / LLMConnectionError via _handle_provider_error.
-    history = load_langchain_history(session_id)
+    history_start, history = _load_history(session_id)
     lc_messages = assemble_messages(system_messages, history, question)
 
     chat_model = _create_chat_model(config, timeout=timeout)
@@ -340,7 +420,11 @@ def _ask_text(
         "usage": _extract_usage(ai_msg),
     }
 
-    store_langchain_history(session_id, serialize_messages(lc_messages + [ai_msg]))
+    store_langchain_history(
+        session_id,
+        serialize_messages(lc_messages + [ai_msg]),
+        start=history_start,
+    )
 
     return LLMResponseDict(
         version=LLM_RESPONSE_VERSION,
@@ -381,14 +465,13 @@ def _ask_agent(
     from .agent import _check_agent_dependencies, run_agent
 
     _check_agent_dependencies()
-    _ollama_preflight(config)
 
-    chat_model = _create_chat_model(config, timeout=timeout)
-    history: list[dict[str, Any]] = load_langchain_history(session_id)
+    chat_model = _agent_chat_model(config, timeout)
+    history_start, history = _load_history(session_id)
 
     agent_backend = config.get("backend")
     try:
-        text, messages, stats = asyncio.run(
+        text, messages, stats = get_agent_runtime().run(
             run_agent(
                 question=question,
                 chat_model=chat_model,
@@ -399,6 +482,7 @@ def _ask_agent(
                 env_vars=env_vars,
                 timeout=timeout,
                 system_messages=system_messages,
+                history_start=history_start,
             )
         )
     except Exception as exc:
@@ -468,10 +552,14 @@ def _ask_agent_stream(
     tools: list[Any] | None = None,
     system_messages: list[Any] | None = None,
 ) -> Iterator[StreamEvent]:
-    """Stream agent events via thread+queue bridge from async to sync.
+    """Stream agent events from the shared agent runtime to the caller.
 
-    Runs ``run_agent_stream()`` in a background thread with ``asyncio.run()``
-    and bridges events through a ``queue.Queue``.
+    Runs ``run_agent_stream()`` as a task on the persistent
+    :class:`~.agent_runtime.AgentRuntime` loop, with the runtime's cached chat
+    model (and, for pre-built *tools*, its cached compiled graph), and
+    bridges events through a ``queue.Queue`` that wakes the consumer as soon
+    as an event is put. When the consumer stops early or a timeout fires,
+    the task is cancelled at its current ``await``.
 
     Args:
         question: The user's prompt text.
@@ -494,13 +582,14 @@ def _ask_agent_stream(
     from .agent import _check_agent_dependencies, run_agent_stream
 
     _check_agent_dependencies()
-    _ollama_preflight(config)
-    chat_model = _create_chat_model(config, timeout=timeout)
-    history: list[dict[str, Any]] = load_langchain_history(session_id)
+    runtime = get_agent_runtime()
+    chat_model = _agent_chat_model(config, timeout)
+    history_start, history = _load_history(session_id)
 
     q: queue.Queue[StreamEvent | None] = queue.Queue()
     error_holder: list[Exception] = []
     cancel = threading.Event()
+    unwound = threading.Event()
 
     async def _run() -> None:
         try:
@@ -515,20 +604,22 @@ async def _run() -> None:
                 env_vars=env_vars,
                 tools=tools,
                 system_messages=system_messages,
+                # Per-turn tools (tools=None) are new objects every turn, so
+                # only a pre-built tool list can hit the graph cache.
+                agent_factory=runtime.agent_graph if tools is not None else None,
+                history_start=history_start,
             ):
                 q.put(_strip_internal_done_keys(event))
         except Exception as exc:  # pylint: disable=broad-except
             error_holder.append(exc)
         finally:
             q.put(None)  # sentinel
+            unwound.set()
 
-    def _thread_main() -> None:
-        asyncio.run(_run())
-
-    thread = threading.Thread(target=_thread_main, daemon=True)
-    thread.start()
+    future = runtime.submit(_run())
 
     cancelled = False
+    finished = False
     start = time.monotonic()
 
     try:
@@ -536,26 +627,30 @@ def _thread_main() -> None:
             try:
                 event = q.get(timeout=timeout)
             except queue.Empty as exc:
-                cancel.set()
                 raise TimeoutError(
                     f"LLM inactivity timeout (langchain): no response for {timeout}s. "
                     "Connection closed. You can retry, or use --timeout to increase the limit."
                 ) from exc
             if event is None:
+                finished = True
                 break
             if time.monotonic() - start > _AGENT_OVERALL_TIMEOUT:
-                cancel.set()
                 raise TimeoutError(
                     f"Agent execution exceeded {_AGENT_OVERALL_TIMEOUT}s overall timeout"
                 )
             yield event
     except GeneratorExit:
-        cancel.set()
         cancelled = True
     finally:
-        thread.join(timeout=5)
-
-    # If the async thread raised an exception but the consumer exited
+        if not finished:
+            # Timed out or abandoned: cancel the task where it is waiting now
+            # (LLM call, tool call) rather than at its next stream event.
+            cancel.set()
+            future.cancel()
+            # Let the task unwind (close MCP sessions) before returning.
+            unwound.wait(timeout=5)
+
+    # If the agent task raised an exception but the consumer exited
     # normally (sentinel received), re-raise that error. Skipped when
     # cancelled (GeneratorExit) to avoid masking the exit.
     if error_holder and not cancelled:
@@ -580,7 +675,7 @@ def ask_langchain_stream(
     Same parameters as ask_langchain(). For text mode (no mcp_config),
     routes to _ask_text_stream() for real streaming. For agent mode
     (mcp_config present), routes to _ask_agent_stream() for real
-    streaming via thread+queue bridge.
+    streaming from the shared agent runtime.
 
     Yields:
         StreamEvent dicts: text_delta, tool_use_start, tool_result, done, error, raw_line
@@ -645,7 +740,7 @@ def _ask_text_stream(
     """
     from langchain_core.messages import AIMessage
 
-    history = load_langchain_history(session_id)
+    history_start, history = _load_history(session_id)
     lc_messages = assemble_messages(system_messages, history, question)
 
     chat_model = _create_chat_model(config, timeout=timeout)
@@ -676,7 +771,11 @@ def _ask_text_stream(
         # Store history with the complete AI response
         full_text = "".join(all_text_parts)
         ai_msg = AIMessage(content=full_text)
-        store_langchain_history(session_id, serialize_messages(lc_messages + [ai_msg]))
+        store_langchain_history(
+            session_id,
+            serialize_messages(lc_messages + [ai_msg]),
+            start=history_start,
+        )
 
         usage = _extract_usage(last_chunk_with_usage) if last_chunk_with_usage else {}
         yield {"type": "done", "session_id": session_id, "usage": usage}
@@ -6,14 +6,29 @@
 
 Both clients automatically respect HTTPS_PROXY / HTTP_PROXY environment
 variables (httpx native behaviour).
+
+``get_pooled_http_client`` / ``get_pooled_async_http_client`` return
+long-lived keep-alive clients from a process-wide :class:`HttpClientPool`
+instead, keyed by backend, endpoint, proxy and TLS environment, so the chat
+models, preflights and model listings of successive turns reuse open
+connections rather than repeating TCP and TLS setup.
 """
 
+import asyncio
+import importlib.util
 import logging
 import os
 import ssl
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def create_ssl_context() -> ssl.SSLContext:
     """Create an SSL context using truststore if available, else default.
@@ -79,3 +94,193 @@ def create_async_http_client() -> "httpx.AsyncClient":  # type: ignore[name-defi
     ctx = create_ssl_context()
     _log_proxy_status()
     return httpx.AsyncClient(verify=ctx)
+
+
+# --- Process-wide pooled clients ---------------------------------------------
+
+# Set to "1" to negotiate HTTP/2 on pooled clients (needs the ``h2`` package).
+HTTP2_ENV = "MCP_CODER_HTTP2"
+
+# Seconds an idle pooled connection is kept open for the next turn.
+KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+# (max_connections, max_keepalive_connections) per backend.
+_DEFAULT_LIMITS = (20, 10)
+_BACKEND_LIMITS: dict[str, tuple[int, int]] = {
+    # A local daemon serves requests one model at a time anyway.
+    "ollama": (4, 4),
+}
+
+_PROXY_VARS = ("HTTPS_PROXY", "https_proxy", "HTTP_PROXY", "http_proxy", "NO_PROXY")
+_TLS_VARS = ("SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE")
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    """Identity of a pooled client: clients are shared only on an exact match.
+
+    ``proxy`` holds the proxy environment (it may contain credentials and is
+    never logged); ``tls`` holds the certificate environment.
+    """
+
+    backend: str
+    endpoint: str | None
+    proxy: tuple[str, ...]
+    tls: tuple[str, ...]
+    http2: bool
+
+
+def _http2_enabled() -> bool:
+    """Return True when HTTP/2 is requested and the ``h2`` package is installed."""
+    if os.environ.get(HTTP2_ENV, "0").strip() != "1":
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.debug("%s=1 but h2 is not installed; using HTTP/1.1", HTTP2_ENV)
+        return False
+    return True
+
+
+def pool_key(backend: str, endpoint: str | None = None) -> PoolKey:
+    """Return the pool key for ``backend``/``endpoint`` in the current environment."""
+    return PoolKey(
+        backend=backend,
+        endpoint=endpoint or None,
+        proxy=tuple(os.environ.get(name, "") for name in _PROXY_VARS),
+        tls=tuple(os.environ.get(name, "") for name in _TLS_VARS),
+        http2=_http2_enabled(),
+    )
+
+
+class HttpClientPool:
+    """Registry of keep-alive httpx clients (and SDK clients) per :class:`PoolKey`.
+
+    Sync clients are shared by the whole process. Async clients are bound to
+    the event loop they were created on, so they are pooled per running loop
+    and dropped with it.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty pool."""
+        self._lock = threading.Lock()
+        self._ssl_contexts: dict[tuple[str, ...], ssl.SSLContext] = {}
+        self._clients: dict[PoolKey, Any] = {}
+        self._async_clients: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[PoolKey, Any]]"
+        ) = weakref.WeakKeyDictionary()
+        self._sdk_clients: dict[Hashable, Any] = {}
+
+    def _client_kwargs(self, key: PoolKey) -> dict[str, Any]:
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            ctx = self._ssl_contexts.get(key.tls)
+            if ctx is None:
+                ctx = self._ssl_contexts[key.tls] = create_ssl_context()
+        max_connections, max_keepalive = _BACKEND_LIMITS.get(
+            key.backend, _DEFAULT_LIMITS
+        )
+        _log_proxy_status()
+        return {
+            "verify": ctx,
+            "http2": key.http2,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        }
+
+    def client(self, backend: str, endpoint: str | None = None) -> "httpx.Client":  # type: ignore[name-defined]  # noqa: F821
+        """Return the shared sync client for ``backend``/``endpoint``."""
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        key = pool_key(backend, endpoint)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and not client.is_closed:
+                return client
+        client = httpx.Client(**self._client_kwargs(key))
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is not None and not existing.is_closed:
+                client.close()
+                return existing
+            self._clients[key] = client
+        logger.debug("Pooled HTTP client created for backend %s", backend)
+        return client
+
+    def async_client(
+        self, backend: str, endpoint: str | None = None
+    ) -> "httpx.AsyncClient":  # type: ignore[name-defined]  # noqa: F821
+        """Return the async client for ``backend``/``endpoint`` on the running loop.
+
+        Outside a running event loop there is nothing to bind a pooled
+        client to, so a fresh (unpooled) client is returned.
+        """
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        key = pool_key(backend, endpoint)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return httpx.AsyncClient(**self._client_kwargs(key))
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is not None and not client.is_closed:
+                return client
+        client = httpx.AsyncClient(**self._client_kwargs(key))
+        with self._lock:
+            clients[key] = client
+        return client
+
+    def sdk_client(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Return the SDK client cached under ``key``, creating it with ``factory``.
+
+        For SDKs that build their own connection pool (e.g. ``ollama.Client``).
+        """
+        with self._lock:
+            if key in self._sdk_clients:
+                return cast(_T, self._sdk_clients[key])
+        client = factory()
+        with self._lock:
+            return cast(_T, self._sdk_clients.setdefault(key, client))
+
+    def close(self) -> None:
+        """Close the sync clients and forget every pooled client."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+            self._sdk_clients.clear()
+            self._ssl_contexts.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.debug("Error closing pooled HTTP client", exc_info=True)
+
+
+_POOL = HttpClientPool()
+
+
+def get_pooled_http_client(backend: str, endpoint: str | None = None) -> "httpx.Client":  # type: ignore[name-defined]  # noqa: F821
+    """Return the process-wide keep-alive sync client for ``backend``/``endpoint``."""
+    return _POOL.client(backend, endpoint)
+
+
+def get_pooled_async_http_client(
+    backend: str, endpoint: str | None = None
+) -> "httpx.AsyncClient":  # type: ignore[name-defined]  # noqa: F821
+    """Return the keep-alive async client for ``backend``/``endpoint`` (per loop)."""
+    return _POOL.async_client(backend, endpoint)
+
+
+def get_pooled_sdk_client(key: Hashable, factory: Callable[[], _T]) -> _T:
+    """Return the process-wide SDK client cached under ``key``."""
+    return _POOL.sdk_client(key, factory)
+
+
+def close_pooled_http_clients() -> None:
+    """Close and forget every pooled client (e.g. in tests or at shutdown)."""
+    _POOL.close()
@@ -21,7 +21,7 @@
     raise_auth_error,
     raise_connection_error,
 )
-from ._http import create_http_client
+from ._http import get_pooled_http_client, get_pooled_sdk_client
 
 
 def _resolve_ollama_host(endpoint: str | None) -> str | None:
@@ -40,6 +40,31 @@ def _resolve_ollama_host(endpoint: str | None) -> str | None:
     return host
 
 
+def _ollama_client(ollama: Any, client_kwargs: dict[str, Any]) -> Any:
+    """Return the pooled ``ollama.Client`` for ``client_kwargs``.
+
+    ``ollama.Client`` keeps its own httpx connection pool, so one client per
+    host/headers/timeout is reused by the preflight, verification and model
+    listing. Older ``ollama`` SDKs that reject ``headers``/``timeout`` fall
+    back to a host-only client.
+    """
+
+    def _create() -> Any:
+        try:
+            return ollama.Client(**client_kwargs)
+        except TypeError:
+            host = client_kwargs.get("host")
+            return ollama.Client(host=host) if host else ollama.Client()
+
+    key = (
+        "ollama",
+        client_kwargs.get("host"),
+        tuple(sorted((client_kwargs.get("headers") or {}).items())),
+        client_kwargs.get("timeout"),
+    )
+    return get_pooled_sdk_client(key, _create)
+
+
 def _check_ollama_daemon(
     api_key: str | None,
     endpoint: str | None,
@@ -75,10 +100,7 @@ def _check_ollama_daemon(
         client_kwargs["headers"] = headers
 
     try:
-        try:
-            client = ollama.Client(**client_kwargs)
-        except TypeError:
-            client = ollama.Client(host=host)
+        client = _ollama_client(ollama, client_kwargs)
         client.list()
         return {
             "ok": True,
@@ -146,10 +168,7 @@ def check_ollama_tool_capability(
         client_kwargs["headers"] = headers
 
     try:
-        try:
-            client = ollama.Client(**client_kwargs)
-        except TypeError:
-            client = ollama.Client(host=host)
+        client = _ollama_client(ollama, client_kwargs)
         info: Any = client.show(model=model)
         if isinstance(info, dict):
             caps = info.get("capabilities") or []
@@ -235,7 +254,7 @@ def list_openai_models(api_key: str | None, endpoint: str | None = None) -> list
         client = openai.OpenAI(
             api_key=api_key if api_key else None,
             base_url=endpoint if endpoint else None,
-            http_client=create_http_client(),
+            http_client=get_pooled_http_client("openai", endpoint),
         )
         return sorted(m.id for m in client.models.list())
     except OPENAI_AUTH_ERRORS as exc:
@@ -271,7 +290,7 @@ def list_anthropic_models(api_key: str | None) -> list[str]:
     try:
         client = anthropic.Anthropic(
             api_key=api_key if api_key else None,
-            http_client=create_http_client(),
+            http_client=get_pooled_http_client("anthropic"),
         )
         return sorted(m.id for m in client.models.list())
     except ANTHROPIC_AUTH_ERRORS as exc:
@@ -319,10 +338,7 @@ def list_ollama_models(
         client_kwargs["headers"] = headers
 
     try:
-        try:
-            client = ollama.Client(**client_kwargs)
-        except TypeError:
-            client = ollama.Client(host=host) if host else ollama.Client()
+        client = _ollama_client(ollama, client_kwargs)
         data: Any = client.list()
         if isinstance(data, dict):
             models_iter = data.get("models", [])
@@ -22,9 +22,10 @@
 from ._exceptions import LLMMCPLaunchError
 from ._messages import assemble_messages, serialize_messages
 from ._usage import _extract_usage, _sum_usage
+from .tool_cache import ToolSchemaCache, list_raw_tools, revalidate_server_tools
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable
 
     from langchain_core.language_models import BaseChatModel
 
@@ -108,6 +109,11 @@ def _assert_tool_interceptors_supported() -> None:
 
 _KNOWN_FIELDS = {"command", "args", "env", "transport", "type"}
 
+# Strong references to in-flight background tool-cache revalidations: the event
+# loop only keeps weak references to tasks, so an unreferenced one may be
+# garbage-collected before it finishes.
+_revalidation_tasks: set[asyncio.Task[bool]] = set()
+
 
 def _format_launch_error(server_name: str, command: object, exc: BaseException) -> str:
     """Format the user-facing message for a failed MCP server launch.
@@ -401,6 +407,7 @@ async def run_agent(
     env_vars: dict[str, str] | None = None,
     timeout: int = 30,
     system_messages: list[Any] | None = None,
+    history_start: int = 0,
 ) -> tuple[str, list[dict[str, Any]], dict[str, Any]]:
     """Run a LangGraph ReAct agent with MCP tools (non-streaming).
 
@@ -428,6 +435,8 @@ async def run_agent(
             ``ainvoke`` call and left tool loading untimed.
         system_messages: Optional list of system messages to prepend to the
             conversation.
+        history_start: Index of ``messages[0]`` in the stored history, when
+            *messages* is only its tail window.
 
     Returns:
         ``(final_text, stored_messages, stats_dict)``.
@@ -456,6 +465,7 @@ async def _drain() -> tuple[str, list[dict[str, Any]], dict[str, Any]]:
             execution_dir=execution_dir,
             env_vars=env_vars,
             system_messages=system_messages,
+            history_start=history_start,
         ):
             if event.get("type") == "done":
                 final_text = str(event.get("result", ""))
@@ -477,6 +487,8 @@ async def run_agent_stream(
     env_vars: dict[str, str] | None = None,
     tools: list[Any] | None = None,
     system_messages: list[Any] | None = None,
+    agent_factory: Callable[[BaseChatModel, list[Any]], Any] | None = None,
+    history_start: int = 0,
 ) -> AsyncIterator[StreamEvent]:
     """Stream agent execution events as an async generator.
 
@@ -496,6 +508,12 @@ async def run_agent_stream(
             When provided, skips MultiServerMCPClient creation.
         system_messages: Optional list of system messages to prepend to the
             conversation.
+        agent_factory: Optional ``(chat_model, tools) -> graph`` builder, e.g.
+            ``AgentRuntime.agent_graph`` to reuse a compiled graph across
+            turns. Defaults to ``create_react_agent``.
+        history_start: Index of ``messages[0]`` in the stored history, when
+            *messages* is only its tail window; the stored messages before it
+            are kept.
 
     Yields:
         ``StreamEvent`` dicts: ``text_delta``, ``tool_use_start``,
@@ -527,22 +545,33 @@ async def run_agent_stream(
         # passes raw MCP schemas to StructuredTool, which fails on properties
         # without a 'type' field (e.g. FastMCP Any-typed params).
         client = MultiServerMCPClient(cast(Any, server_config))
+        # Cached descriptors skip the spawn + handshake; the live server is
+        # re-listed in the background and the cache refreshed for the next run.
+        tool_cache = ToolSchemaCache.from_env()
         all_tools = []
         for server_name, connection in client.connections.items():
-            try:
-                async with client.session(server_name) as session:
-                    raw_tools = await session.list_tools()
-                    all_tools.extend(
-                        _convert_server_tools(raw_tools.tools, connection, server_name)
-                    )
-            except (FileNotFoundError, PermissionError) as exc:
-                raise LLMMCPLaunchError(
-                    _format_launch_error(
-                        server_name, server_config[server_name].get("command"), exc
-                    )
-                ) from exc
+            server_cfg = cast(dict[str, Any], server_config[server_name])
+            raw_tools = tool_cache.load(server_name, server_cfg) if tool_cache else None
+            if tool_cache is not None and raw_tools is not None:
+                task = asyncio.create_task(
+                    revalidate_server_tools(tool_cache, client, server_name, server_cfg)
+                )
+                _revalidation_tasks.add(task)
+                task.add_done_callback(_revalidation_tasks.discard)
+            else:
+                try:
+                    raw_tools = await list_raw_tools(client, server_name)
+                except (FileNotFoundError, PermissionError) as exc:
+                    raise LLMMCPLaunchError(
+                        _format_launch_error(
+                            server_name, server_cfg.get("command"), exc
+                        )
+                    ) from exc
+                if tool_cache is not None:
+                    tool_cache.store(server_name, server_cfg, raw_tools)
+            all_tools.extend(_convert_server_tools(raw_tools, connection, server_name))
 
-    agent = create_react_agent(chat_model, all_tools)
+    agent = (agent_factory or create_react_agent)(chat_model, all_tools)
 
     input_messages = assemble_messages(system_messages, messages, question)
 
@@ -704,7 +733,7 @@ async def run_agent_stream(
         store_langchain_history as _store_history,
     )
 
-    _store_history(session_id, stored)
+    _store_history(session_id, stored, start=history_start)
 
     final_text, stats = _summarize_messages(final_messages)
 
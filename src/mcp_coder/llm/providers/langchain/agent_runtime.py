@@ -0,0 +1,189 @@
+"""Persistent asyncio runtime shared by LangChain agent turns.
+
+Running each agent prompt on its own thread under ``asyncio.run()`` means a
+fresh event loop, chat model and LangGraph ReAct graph per turn. The
+process-wide :class:`AgentRuntime` instead keeps:
+
+- one event loop on a daemon thread; agent turns run on it as tasks and
+  ``MCPManager`` keeps its MCP server connections on it,
+- chat models per configuration, built on that loop so that their pooled
+  async HTTP clients (see ``_http``) stay bound to it and keep connections
+  alive between turns,
+- compiled ReAct graphs per chat model and tool list.
+
+Because a turn is a task on a loop that outlives it, the consuming thread can
+cancel it through its future: the task is interrupted at its current
+``await`` instead of at the agent's next stream event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Least recently used entries beyond these are dropped.
+MAX_CACHED_MODELS = 8
+MAX_CACHED_GRAPHS = 8
+
+
+async def _call(factory: Callable[[], _T]) -> _T:
+    """Run *factory* on the runtime loop (so ``get_running_loop()`` sees it).
+
+    Returns:
+        What *factory* returned.
+    """
+    return factory()
+
+
+class AgentRuntime:
+    """Long-lived event loop plus the chat models and graphs built on it.
+
+    The loop starts lazily on first use. All methods may be called from any
+    thread except the loop thread itself (they block on the loop).
+    """
+
+    def __init__(self) -> None:
+        """Create the runtime; the loop thread starts on first use."""
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._models: OrderedDict[Hashable, Any] = OrderedDict()
+        # (id(model), tool ids) -> (model, tools, graph); holding the model and
+        # tools keeps their ids from being reused while the entry exists.
+        self._graphs: OrderedDict[
+            tuple[int, tuple[int, ...]], tuple[Any, tuple[Any, ...], Any]
+        ] = OrderedDict()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop, started on first access."""
+        with self._lock:
+            if (
+                self._loop is None
+                or self._thread is None
+                or not self._thread.is_alive()
+            ):
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    daemon=True,
+                    name="langchain-agent-loop",
+                )
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, _T]) -> concurrent.futures.Future[_T]:
+        """Schedule *coro* on the runtime loop.
+
+        Returns:
+            A future for the result; cancelling it cancels the task.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run *coro* on the runtime loop and wait for its result.
+
+        If the wait is interrupted (e.g. ``KeyboardInterrupt``), the task is
+        cancelled before the interruption propagates.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the runtime loop itself.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AgentRuntime.run() called from its own loop")
+        future = self.submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def chat_model(
+        self, key: Hashable, factory: Callable[[], _T], label: str = "model"
+    ) -> _T:
+        """Return the chat model cached under *key*, building it on first use.
+
+        *factory* runs on the runtime loop, so the model's async HTTP client
+        is pooled for that loop. Exceptions from *factory* propagate and
+        nothing is cached. Only *label* is logged, never *key*, which may be
+        derived from credentials.
+        """
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return cast(_T, self._models[key])
+        model = self.run(_call(factory))
+        with self._lock:
+            self._models[key] = model
+            while len(self._models) > MAX_CACHED_MODELS:
+                self._models.popitem(last=False)
+        logger.debug("Agent runtime: chat model built for %s", label)
+        return model
+
+    def agent_graph(self, chat_model: Any, tools: list[Any]) -> Any:
+        """Return the compiled ReAct graph for *chat_model* and *tools*.
+
+        Graphs are cached by the identity of the model and of each tool, so
+        a rediscovered tool list (new tool objects) gets a new graph.
+        """
+        key = (id(chat_model), tuple(id(tool) for tool in tools))
+        with self._lock:
+            entry = self._graphs.get(key)
+            if entry is not None:
+                self._graphs.move_to_end(key)
+                return entry[2]
+
+        # pylint: disable-next=import-outside-toplevel
+        from langgraph.prebuilt import create_react_agent
+
+        graph = create_react_agent(chat_model, tools)
+        with self._lock:
+            self._graphs[key] = (chat_model, tuple(tools), graph)
+            while len(self._graphs) > MAX_CACHED_GRAPHS:
+                self._graphs.popitem(last=False)
+        return graph
+
+    def close(self) -> None:
+        """Drop cached models and graphs and stop the loop thread.
+
+        The next use starts a new loop.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+            self._models.clear()
+            self._graphs.clear()
+        if loop is None or thread is None:
+            return
+        if loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+_RUNTIME = AgentRuntime()
+
+
+def get_agent_runtime() -> AgentRuntime:
+    """Return the process-wide agent runtime."""
+    return _RUNTIME
+
+
+def close_agent_runtime() -> None:
+    """Stop the process-wide agent runtime (e.g. in tests or at shutdown)."""
+    _RUNTIME.close()
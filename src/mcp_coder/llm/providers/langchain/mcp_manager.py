@@ -1,23 +1,38 @@
 """Persistent MCP client manager for long-lived MCP server connections.
 
-Owns MCP server connections for the app's lifetime via a background daemon
-thread with its own asyncio event loop. Lazy: connects on first tools() call.
+Owns MCP server connections for the app's lifetime on the shared agent
+runtime loop (``agent_runtime``), the same loop agent turns run on. Lazy:
+connects on first tools() call.
+Servers are discovered concurrently, each under its own timeout, so one slow
+or broken server does not hold back the tools of the others. Tool descriptors
+come from the on-disk ``ToolSchemaCache`` when available and are revalidated
+against the live server in the background.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import threading
+import time
 from dataclasses import dataclass
 from typing import Any, cast
 
 from mcp_coder.llm.providers.langchain.agent import (  # noqa: PLC2701
     _convert_server_tools,
 )
+from mcp_coder.llm.providers.langchain.agent_runtime import get_agent_runtime
+from mcp_coder.llm.providers.langchain.tool_cache import (
+    ToolSchemaCache,
+    list_raw_tools,
+    revalidate_server_tools,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-server budget for spawn + handshake + list_tools(). Kept below the 60s
+# overall tools() wait so a hung server is reported instead of timing out all.
+SERVER_DISCOVERY_TIMEOUT_SECONDS = 45.0
+
 
 @dataclass(frozen=True)
 class MCPServerStatus:
@@ -26,10 +41,22 @@ class MCPServerStatus:
     name: str
     tool_count: int
     connected: bool
+    error: str | None = None
+    startup_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class _ServerDiscovery:
+    """Outcome of discovering one server's tools."""
+
+    name: str
+    tools: list[Any]
+    seconds: float
+    error: str | None = None
 
 
 class MCPManager:
-    """Persistent MCP client with background event loop.
+    """Persistent MCP client on the shared agent runtime loop.
 
     Owns MCP server connections for the app's lifetime.
     Lazy: connects on first tools() call, not at construction.
@@ -41,22 +68,33 @@ def __init__(
         self,
         server_config: dict[str, dict[str, object]],
         tool_interceptors: list[Any] | None = None,
+        tool_cache: ToolSchemaCache | None = None,
     ) -> None:
+        """Create the manager on the shared agent runtime loop.
+
+        Args:
+            server_config: Resolved MCP server configuration by server name.
+            tool_interceptors: Optional interceptors forwarded to tool conversion.
+            tool_cache: On-disk tool descriptor cache. Defaults to
+                ``ToolSchemaCache.from_env()`` (None when disabled).
+        """
         self._server_names = list(server_config.keys())
         self._server_config = server_config
         self._tool_interceptors = tool_interceptors
         self._cached_tools: list[Any] | None = None
         self._client: Any | None = None
         self._tool_counts: dict[str, int] = {}
-
-        # Create a dedicated event loop on a daemon thread
-        self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(
-            target=self._loop.run_forever,
-            daemon=True,
-            name="mcp-manager-loop",
+        self._server_errors: dict[str, str] = {}
+        self._startup_seconds: dict[str, float] = {}
+        self._tool_cache = (
+            tool_cache if tool_cache is not None else ToolSchemaCache.from_env()
         )
-        self._thread.start()
+        self._tools_stale = False
+        self._revalidation_tasks: set[asyncio.Task[None]] = set()
+
+        # The agent runtime owns the loop (and its thread) for the process
+        # lifetime; MCP connections live there next to the agent turns.
+        self._loop = get_agent_runtime().loop
 
     def canonical_name(self, tool: Any) -> str | None:
         """Return the stamped ``mcp__server__tool`` identity, or None if absent.
@@ -79,10 +117,13 @@ def canonical_name(self, tool: Any) -> str | None:
     def tools(self) -> list[Any]:
         """Return cached LangChain tools. Connects lazily on first call.
 
-        On failure, clears cache so the next call retries.
+        On failure, clears cache so the next call retries. When a background
+        revalidation found that a server's tool list changed, the next call
+        rediscovers so the fresh descriptors are picked up.
         """
-        if self._cached_tools is not None:
+        if self._cached_tools is not None and not self._tools_stale:
             return self._cached_tools
+        self._tools_stale = False
 
         try:
             future = asyncio.run_coroutine_threadsafe(
@@ -100,55 +141,165 @@ def tools(self) -> list[Any]:
     async def _connect_and_discover(self) -> list[Any]:
         """Connect to MCP servers and discover tools (runs on background loop).
 
+        All servers are discovered concurrently. A server that fails or exceeds
+        ``SERVER_DISCOVERY_TIMEOUT_SECONDS`` is reported through ``status()``
+        while the tools of the other servers are still returned.
+
         Returns:
-            List of discovered LangChain-compatible tools from all servers.
+            List of discovered LangChain-compatible tools from all servers,
+            in server configuration order.
+
+        Raises:
+            RuntimeError: If every configured server failed discovery.
         """
         from langchain_mcp_adapters.client import MultiServerMCPClient
 
         client = MultiServerMCPClient(cast(Any, self._server_config))
         self._client = client
+
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                self._discover_server(client, server_name, connection)
+                for server_name, connection in client.connections.items()
+            )
+        )
+
         all_tools: list[Any] = []
-        tool_counts: dict[str, int] = {}
-
-        for server_name, connection in client.connections.items():
-            async with client.session(server_name) as session:
-                raw_tools = await session.list_tools()
-                lc_tools = _convert_server_tools(
-                    raw_tools.tools,
-                    connection,
-                    server_name,
-                    self._tool_interceptors,
-                )
-                # Re-apply canonical-name stamping from the raw MCP tool name
-                # (NOT lc_tool.name) so the stamp stays identical to the
-                # interceptor's f"mcp__{server}__{request.name}" reconstruction.
-                # Order is preserved by the helper, so zip pairs each returned
-                # lc_tool with its source raw tool.
-                for raw_tool, lc_tool in zip(raw_tools.tools, lc_tools, strict=True):
-                    lc_tool.metadata = {
-                        **(lc_tool.metadata or {}),
-                        "mcp_canonical_name": f"mcp__{server_name}__{raw_tool.name}",
-                    }
-                    all_tools.append(lc_tool)
-            tool_counts[server_name] = len(lc_tools)
-
-        self._tool_counts = tool_counts
+        self._tool_counts = {}
+        self._server_errors = {}
+        self._startup_seconds = {}
+        for result in results:
+            self._startup_seconds[result.name] = result.seconds
+            if result.error is not None:
+                self._server_errors[result.name] = result.error
+                continue
+            self._tool_counts[result.name] = len(result.tools)
+            all_tools.extend(result.tools)
+
+        logger.info(
+            "MCP discovery finished in %.2fs: %s",
+            time.monotonic() - start,
+            ", ".join(
+                f"{r.name}={r.seconds:.2f}s"
+                + (f" (failed: {r.error})" if r.error else f" ({len(r.tools)} tools)")
+                for r in results
+            )
+            or "no servers",
+        )
+
+        if results and len(self._server_errors) == len(results):
+            raise RuntimeError(
+                "All MCP servers failed discovery: "
+                + "; ".join(f"{n}: {e}" for n, e in self._server_errors.items())
+            )
         return all_tools
 
+    async def _discover_server(
+        self, client: Any, server_name: str, connection: Any
+    ) -> _ServerDiscovery:
+        """Discover one server's tools under its own timeout.
+
+        Returns:
+            The discovered tools and timing, or the error that stopped discovery.
+        """
+        start = time.monotonic()
+        try:
+            tools = await asyncio.wait_for(
+                self._list_server_tools(client, server_name, connection),
+                timeout=SERVER_DISCOVERY_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            error = f"timed out after {SERVER_DISCOVERY_TIMEOUT_SECONDS:.0f}s"
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error = f"{type(exc).__name__}: {exc}"
+        else:
+            return _ServerDiscovery(server_name, tools, time.monotonic() - start)
+
+        elapsed = time.monotonic() - start
+        logger.warning("MCP server %r discovery failed: %s", server_name, error)
+        return _ServerDiscovery(server_name, [], elapsed, error=error)
+
+    async def _list_server_tools(
+        self, client: Any, server_name: str, connection: Any
+    ) -> list[Any]:
+        """Fetch one server's tools (cache first) and convert them.
+
+        Returns:
+            LangChain tools stamped with their canonical ``mcp__server__tool`` name.
+        """
+        server_cfg = self._server_config.get(server_name, {})
+        raw_tools: list[Any] | None = None
+        if self._tool_cache is not None:
+            raw_tools = self._tool_cache.load(server_name, server_cfg)
+            if raw_tools is not None:
+                logger.debug("MCP server %r: tools loaded from cache", server_name)
+                self._schedule_revalidation(client, server_name)
+        if raw_tools is None:
+            raw_tools = await list_raw_tools(client, server_name)
+            if self._tool_cache is not None:
+                self._tool_cache.store(server_name, server_cfg, raw_tools)
+
+        lc_tools = _convert_server_tools(
+            raw_tools,
+            connection,
+            server_name,
+            self._tool_interceptors,
+        )
+        # Re-apply canonical-name stamping from the raw MCP tool name
+        # (NOT lc_tool.name) so the stamp stays identical to the
+        # interceptor's f"mcp__{server}__{request.name}" reconstruction.
+        # Order is preserved by the helper, so zip pairs each returned
+        # lc_tool with its source raw tool.
+        for raw_tool, lc_tool in zip(raw_tools, lc_tools, strict=True):
+            lc_tool.metadata = {
+                **(lc_tool.metadata or {}),
+                "mcp_canonical_name": f"mcp__{server_name}__{raw_tool.name}",
+            }
+        return list(lc_tools)
+
+    def _schedule_revalidation(self, client: Any, server_name: str) -> None:
+        """Refresh a cache-served server in the background (runs on the loop)."""
+        assert self._tool_cache is not None
+        cache = self._tool_cache
+        server_cfg = self._server_config.get(server_name, {})
+
+        async def _revalidate() -> None:
+            if await revalidate_server_tools(cache, client, server_name, server_cfg):
+                self._tools_stale = True
+
+        task = asyncio.get_running_loop().create_task(_revalidate())
+        self._revalidation_tasks.add(task)
+        task.add_done_callback(self._revalidation_tasks.discard)
+
     def status(self) -> list[MCPServerStatus]:
-        """Return connection status for each configured server."""
-        connected = self._cached_tools is not None
+        """Return connection status for each configured server.
+
+        Includes the per-server discovery time and, for servers that failed
+        discovery, the error.
+        """
+        discovered = self._cached_tools is not None
         return [
             MCPServerStatus(
                 name=name,
                 tool_count=self._tool_counts.get(name, 0),
-                connected=connected,
+                connected=discovered and name in self._tool_counts,
+                error=self._server_errors.get(name),
+                startup_seconds=self._startup_seconds.get(name),
             )
             for name in self._server_names
         ]
 
     def close(self) -> None:
-        """Shut down MCP servers, stop event loop, join thread."""
+        """Shut down MCP servers; the shared runtime loop keeps running."""
+        if self._loop.is_closed():
+            # The runtime was shut down first; its tasks are gone with it.
+            self._revalidation_tasks.clear()
+            self._client = None
+
+        for task in list(self._revalidation_tasks):
+            self._loop.call_soon_threadsafe(task.cancel)
+
         if self._client is not None:
             try:
                 future = asyncio.run_coroutine_threadsafe(
@@ -159,9 +310,7 @@ def close(self) -> None:
                 logger.debug("Error closing MCP client", exc_info=True)
             self._client = None
 
-        if self._loop.is_running():
-            self._loop.call_soon_threadsafe(self._loop.stop)
-            self._thread.join(timeout=5)
-
         self._cached_tools = None
         self._tool_counts = {}
+        self._server_errors = {}
+        self._startup_seconds = {}
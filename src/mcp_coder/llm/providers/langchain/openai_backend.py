@@ -8,7 +8,7 @@
 
 import os
 
-from ._http import create_async_http_client, create_http_client
+from ._http import get_pooled_async_http_client, get_pooled_http_client
 
 # pylint: disable=import-error
 try:
@@ -36,8 +36,10 @@ def create_openai_model(
     effective_api_key = os.getenv("OPENAI_API_KEY") or api_key
     secret_key = SecretStr(effective_api_key) if effective_api_key else None
 
-    http_client = create_http_client()
-    async_http_client = create_async_http_client()
+    # Pooled per backend and endpoint, so later turns reuse open connections.
+    backend = "azure" if api_version else "openai"
+    http_client = get_pooled_http_client(backend, endpoint)
+    async_http_client = get_pooled_async_http_client(backend, endpoint)
 
     if api_version:
         return AzureChatOpenAI(
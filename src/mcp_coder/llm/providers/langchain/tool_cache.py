@@ -0,0 +1,269 @@
+"""Persistent on-disk cache of MCP tool descriptors.
+
+Discovering MCP tools means spawning every server and running ``list_tools()``
+over its handshake — the dominant cold-start cost of iCoder and of one-shot
+``mcp-coder prompt --llm-method langchain`` runs. This module stores the raw
+tool descriptors (name, description, input schema, ...) per server under the
+user app-data dir so later runs can hand them to ``_convert_server_tools``
+immediately and revalidate against the live server in the background.
+
+Entries are keyed by a hash of the server ``command``, ``args`` and ``env``,
+the installed mcp-coder version and the mtime/size of the resolved server
+executable (which changes whenever the server package is reinstalled). For
+``python -m <module>`` servers the executable is the interpreter, so the key
+also covers the mtimes of that environment's site-packages directories, which
+change whenever a package is installed, upgraded or removed there. Edits to
+the sources of an editable install are not detected; clear the cache (or set
+``MCP_CODER_MCP_TOOL_CACHE=0``) while developing a server that way.
+
+Each server keeps at most ``_MAX_ENTRIES_PER_SERVER`` entries (one per key,
+e.g. per project configuring it differently); storing a new entry deletes the
+least recently validated ones.
+
+Set ``MCP_CODER_MCP_TOOL_CACHE=0`` to disable the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from mcp_coder.utils.user_app_data import get_user_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+TOOL_CACHE_ENV = "MCP_CODER_MCP_TOOL_CACHE"
+_CACHE_FORMAT_VERSION = 1
+# Cache files kept per server name; older keys are pruned on store.
+_MAX_ENTRIES_PER_SERVER = 4
+
+
+def _package_version() -> str:
+    try:
+        return version("mcp-coder")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _executable_fingerprint(command: object) -> str:
+    """Return ``path:mtime:size`` of the server executable, or ``""``."""
+    if not isinstance(command, str) or not command:
+        return ""
+    resolved = shutil.which(command) or command
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return resolved
+    return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _site_packages_fingerprint(command: object, args: object) -> str:
+    """Return the interpreter's site-packages mtimes for ``-m`` servers, or ``""``.
+
+    The interpreter lives at ``<prefix>/bin/python`` (POSIX) or
+    ``<prefix>/Scripts/python.exe`` (Windows). Symlinks are not resolved, so a
+    venv maps to its own prefix rather than the base installation.
+    """
+    if not isinstance(command, str) or not command:
+        return ""
+    if not isinstance(args, list) or "-m" not in args:
+        return ""
+    prefix = Path(shutil.which(command) or command).parent.parent
+    candidates = [prefix / "Lib" / "site-packages"]
+    candidates += sorted(prefix.glob("lib/python*/site-packages"))
+    candidates += sorted(prefix.glob("lib/python*/dist-packages"))
+    stamps = []
+    for directory in candidates:
+        try:
+            stamps.append(f"{directory}:{directory.stat().st_mtime_ns}")
+        except OSError:
+            continue
+    return ";".join(stamps)
+
+
+def tool_cache_enabled() -> bool:
+    """Return False when ``MCP_CODER_MCP_TOOL_CACHE`` disables the cache."""
+    value = os.environ.get(TOOL_CACHE_ENV, "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+class ToolSchemaCache:
+    """Per-server MCP tool descriptor cache stored as small JSON files."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or (
+            get_user_app_data_dir("mcp_coder") / "mcp_tool_cache"
+        )
+
+    @classmethod
+    def from_env(cls) -> ToolSchemaCache | None:
+        """Return the default cache, or None when disabled via environment."""
+        return cls() if tool_cache_enabled() else None
+
+    def cache_key(self, server_name: str, server_cfg: dict[str, Any]) -> str:
+        """Hash of everything that can change a server's tool list.
+
+        Returns:
+            Hex digest identifying this server configuration.
+        """
+        material = {
+            "format": _CACHE_FORMAT_VERSION,
+            "server": server_name,
+            "command": server_cfg.get("command"),
+            "args": server_cfg.get("args"),
+            "env": server_cfg.get("env"),
+            "mcp_coder": _package_version(),
+            "executable": _executable_fingerprint(server_cfg.get("command")),
+            "site_packages": _site_packages_fingerprint(
+                server_cfg.get("command"), server_cfg.get("args")
+            ),
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def _safe_name(server_name: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_" else "_" for c in server_name)
+
+    def _path(self, server_name: str, key: str) -> Path:
+        return self.cache_dir / f"{self._safe_name(server_name)}-{key[:16]}.json"
+
+    def _prune(self, server_name: str) -> None:
+        """Delete all but the newest ``_MAX_ENTRIES_PER_SERVER`` server entries."""
+        pattern = re.compile(
+            rf"{re.escape(self._safe_name(server_name))}-[0-9a-f]{{16}}\.json"
+        )
+        entries: list[tuple[int, Path]] = []
+        for path in self.cache_dir.glob("*.json"):
+            if not pattern.fullmatch(path.name):
+                continue
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        for _, path in entries[_MAX_ENTRIES_PER_SERVER:]:
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.debug("Failed to prune MCP tool cache %s: %s", path, exc)
+
+    def load(self, server_name: str, server_cfg: dict[str, Any]) -> list[Any] | None:
+        """Return cached raw MCP tools for the server, or None on a miss.
+
+        Returns:
+            ``mcp.types.Tool`` objects ready for ``_convert_server_tools``.
+        """
+        from mcp.types import Tool
+
+        key = self.cache_key(server_name, server_cfg)
+        path = self._path(server_name, key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("key") != key:
+                return None
+            return [Tool.model_validate(item) for item in data["tools"]]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug("Ignoring unreadable MCP tool cache %s: %s", path, exc)
+            return None
+
+    def store(
+        self, server_name: str, server_cfg: dict[str, Any], raw_tools: list[Any]
+    ) -> bool:
+        """Write the server's raw tool descriptors (best effort).
+
+        An unchanged entry only has its mtime refreshed; writing a new entry
+        prunes the server's least recently validated ones.
+
+        Returns:
+            True if the cache now holds a different descriptor set than before
+            (i.e. the previously cached tools were stale), False otherwise.
+        """
+        key = self.cache_key(server_name, server_cfg)
+        path = self._path(server_name, key)
+        try:
+            tools = [
+                tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+                for tool in raw_tools
+            ]
+            payload = json.dumps(
+                {
+                    "key": key,
+                    "server": server_name,
+                    "stored_at": datetime.now(timezone.utc).isoformat(),
+                    "tools": tools,
+                }
+            )
+        except (TypeError, ValueError, AttributeError) as exc:
+            logger.debug("Not caching tools of %r: %s", server_name, exc)
+            return False
+
+        previous = self._read_tools(path)
+        if previous == tools:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.debug("Failed to write MCP tool cache %s: %s", path, exc)
+            return False
+        self._prune(server_name)
+        return previous is not None
+
+    @staticmethod
+    def _read_tools(path: Path) -> list[Any] | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        tools = data.get("tools") if isinstance(data, dict) else None
+        return tools if isinstance(tools, list) else None
+
+
+async def list_raw_tools(client: Any, server_name: str) -> list[Any]:
+    """Open a session to one server and list its tools.
+
+    Returns:
+        The server's raw MCP tool descriptors.
+    """
+    async with client.session(server_name) as session:
+        result = await session.list_tools()
+    return list(result.tools)
+
+
+async def revalidate_server_tools(
+    cache: ToolSchemaCache,
+    client: Any,
+    server_name: str,
+    server_cfg: dict[str, Any],
+) -> bool:
+    """Refresh one server's cache entry from the live server.
+
+    Returns:
+        True if the live tool list differed from the cached one.
+    """
+    try:
+        raw_tools = await list_raw_tools(client, server_name)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.debug("MCP tool cache revalidation of %r failed: %s", server_name, exc)
+        return False
+    changed = cache.store(server_name, server_cfg, raw_tools)
+    if changed:
+        logger.info("MCP server %r tool list changed; cache refreshed", server_name)
+    return changed
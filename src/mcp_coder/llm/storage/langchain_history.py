@@ -0,0 +1,416 @@
+"""Append-only on-disk history of LangChain conversations.
+
+Each session is stored as ``{session_id}.jsonl`` under
+``~/.mcp_coder/sessions/langchain/``, one compact JSON message per line:
+
+- a store that extends the stored history (the usual case: the previous
+  history plus this turn's messages) only appends the new lines,
+- a store that diverges from it appends a truncate marker before its lines,
+  and the file is compacted (rewritten with only the live messages) once
+  superseded lines outweigh live ones,
+- a sidecar ``{session_id}.idx`` records the byte offset and length of every
+  live message and where human turns start, so a load can read just the tail
+  window that fits a byte budget (:func:`load_langchain_history_window`).
+  The index is a cache: when it is missing or does not match the file (e.g.
+  after a crash mid-write) it is rebuilt with one scan of the file.
+
+Sessions in the previous format (``{session_id}.json``, one JSON array) are
+migrated on first access. A ``.latest`` pointer file names the most recently
+stored session, so finding it does not stat every session file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from ...utils.user_app_data import get_user_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "langchain_history_path",
+    "latest_langchain_session",
+    "load_langchain_history",
+    "load_langchain_history_window",
+    "store_langchain_history",
+]
+
+_INDEX_VERSION = 1
+_MARKER_KEY = "__mcp_coder_history__"
+_LATEST_FILE = ".latest"
+
+
+@dataclass
+class _HistoryIndex:
+    """Where the live messages of one history file are."""
+
+    size: int = 0  # bytes of the history file covered by this index
+    offsets: list[int] = field(default_factory=list)
+    lengths: list[int] = field(default_factory=list)
+    human: list[int] = field(default_factory=list)  # indices of human messages
+    last_digest: str = ""  # sha256 of the last live line
+
+    @property
+    def live_bytes(self) -> int:
+        """Bytes of the live message lines."""
+        return sum(self.lengths)
+
+
+def _session_dir(base_dir: Optional[str] = None) -> Path:
+    return (
+        Path(base_dir)
+        if base_dir
+        else get_user_app_data_dir("mcp_coder") / "sessions" / "langchain"
+    )
+
+
+def langchain_history_path(session_id: str, base_dir: Optional[str] = None) -> Path:
+    """Return the history file of a session.
+
+    Default: ~/.mcp_coder/sessions/langchain/{session_id}.jsonl
+
+    Args:
+        session_id: Unique session identifier
+        base_dir: Optional custom base directory for session files
+
+    Returns:
+        Path to the session's JSONL history file.
+    """
+    return _session_dir(base_dir) / f"{session_id}.jsonl"
+
+
+def _line(message: dict[str, Any]) -> bytes:
+    return (
+        json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        + b"\n"
+    )
+
+
+def _digest(line: bytes) -> str:
+    return hashlib.sha256(line).hexdigest()
+
+
+def _is_human(message: Any) -> bool:
+    return isinstance(message, dict) and message.get("type") == "human"
+
+
+def _truncate_marker(keep: int) -> bytes:
+    return _line({_MARKER_KEY: {"truncate": keep}})
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_suffix(".idx")
+
+
+def _save_index(path: Path, index: _HistoryIndex) -> None:
+    payload = {"version": _INDEX_VERSION, **asdict(index)}
+    _write_atomic(_index_path(path), json.dumps(payload).encode("utf-8"))
+
+
+def _load_index(path: Path, size: int) -> _HistoryIndex | None:
+    """Return the stored index if it describes the ``size``-byte file."""
+    try:
+        raw = json.loads(_index_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(raw, dict)
+        or raw.get("version") != _INDEX_VERSION
+        or raw.get("size") != size
+    ):
+        return None
+    try:
+        return _HistoryIndex(
+            size=size,
+            offsets=list(raw["offsets"]),
+            lengths=list(raw["lengths"]),
+            human=list(raw["human"]),
+            last_digest=str(raw["last_digest"]),
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def _truncate_index(path: Path, index: _HistoryIndex, keep: int) -> None:
+    """Drop the live messages from ``keep`` on (the file is left as is)."""
+    del index.offsets[keep:]
+    del index.lengths[keep:]
+    index.human = [i for i in index.human if i < keep]
+    index.last_digest = ""
+    if keep:
+        with path.open("rb") as f:
+            f.seek(index.offsets[-1])
+            index.last_digest = _digest(f.read(index.lengths[-1]))
+
+
+def _scan(path: Path) -> _HistoryIndex:
+    """Rebuild the index by replaying the history file.
+
+    A trailing line without a newline (an interrupted append) is not covered.
+
+    Returns:
+        The index of the file's complete lines.
+    """
+    index = _HistoryIndex()
+    offset = 0
+    with path.open("rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            record = json.loads(line)
+            if isinstance(record, dict) and _MARKER_KEY in record:
+                index.size = offset
+                _truncate_index(path, index, int(record[_MARKER_KEY]["truncate"]))
+            else:
+                if _is_human(record):
+                    index.human.append(len(index.offsets))
+                index.offsets.append(offset)
+                index.lengths.append(len(line))
+                index.last_digest = _digest(line)
+            offset += len(line)
+    index.size = offset
+    return index
+
+
+def _migrate_legacy(path: Path) -> None:
+    """Convert a ``{session_id}.json`` history into the JSONL format."""
+    legacy = path.with_suffix(".json")
+    if path.exists() or not legacy.exists():
+        return
+    messages = json.loads(legacy.read_text(encoding="utf-8"))
+    lines = [_line(m) for m in messages]
+    _write_atomic(path, b"".join(lines))
+    index = _HistoryIndex()
+    _append_to_index(index, messages, lines)
+    _save_index(path, index)
+    legacy.unlink()
+    logger.debug("Migrated langchain history %s to %s", legacy.name, path.name)
+
+
+def _append_to_index(
+    index: _HistoryIndex, messages: list[dict[str, Any]], lines: list[bytes]
+) -> None:
+    for message, line in zip(messages, lines, strict=True):
+        if _is_human(message):
+            index.human.append(len(index.offsets))
+        index.offsets.append(index.size)
+        index.lengths.append(len(line))
+        index.size += len(line)
+        index.last_digest = _digest(line)
+
+
+def _open_history(path: Path) -> _HistoryIndex | None:
+    """Return the index of the history at ``path`` (None if there is none)."""
+    _migrate_legacy(path)
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return None
+    index = _load_index(path, size)
+    if index is None:
+        index = _scan(path)
+        _save_index(path, index)
+    return index
+
+
+def _read_messages(
+    path: Path, index: _HistoryIndex, start: int
+) -> list[dict[str, Any]]:
+    if start >= len(index.offsets):
+        return []
+    offsets, lengths = index.offsets[start:], index.lengths[start:]
+    with path.open("rb") as f:
+        if offsets[-1] + lengths[-1] - offsets[0] == sum(lengths):
+            # Contiguous live lines: one read.
+            f.seek(offsets[0])
+            lines = f.read(sum(lengths)).splitlines()
+        else:
+            lines = []
+            for offset, length in zip(offsets, lengths):
+                f.seek(offset)
+                lines.append(f.read(length))
+    return [json.loads(line) for line in lines]
+
+
+def _window_start(index: _HistoryIndex, max_bytes: int) -> int:
+    """Return the first message of the tail window within ``max_bytes``.
+
+    The window starts at a human message, so it never opens with a tool
+    result whose call is cut off. It always includes the last human turn,
+    even if that alone exceeds the budget.
+    """
+    if index.live_bytes <= max_bytes or not index.human:
+        return 0
+    start = index.human[-1]
+    tail = sum(index.lengths[start:])
+    for previous in reversed(index.human[:-1]):
+        tail += sum(index.lengths[previous:start])
+        if tail > max_bytes:
+            break
+        start = previous
+    return start
+
+
+def load_langchain_history_window(
+    session_id: str,
+    max_bytes: Optional[int] = None,
+    base_dir: Optional[str] = None,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Load the tail of a session's history that fits ``max_bytes``.
+
+    Args:
+        session_id: Unique session identifier
+        max_bytes: Budget for the serialized messages; None loads them all
+        base_dir: Optional custom base directory for session files
+
+    Returns:
+        ``(start, messages)``: the index of the first loaded message within
+        the whole history, and the loaded messages. Pass ``start`` to
+        :func:`store_langchain_history` when storing them back.
+    """
+    path = langchain_history_path(session_id, base_dir)
+    index = _open_history(path)
+    if index is None:
+        return 0, []
+    start = 0 if max_bytes is None else _window_start(index, max_bytes)
+    return start, _read_messages(path, index, start)
+
+
+def load_langchain_history(
+    session_id: str,
+    base_dir: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Load message history from disk.
+
+    Returns:
+        List of message dicts, or empty list if no file exists.
+    """
+    return load_langchain_history_window(session_id, base_dir=base_dir)[1]
+
+
+def _shared_length(
+    index: _HistoryIndex, messages: list[dict[str, Any]], start: int
+) -> int:
+    """Return how many stored messages ``messages`` (placed at ``start``) keeps.
+
+    ``messages`` extends the stored history when it contains the stored last
+    message where the history puts it; only that message is compared, as
+    callers build ``messages`` from the history they loaded.
+    """
+    count = len(index.offsets)
+    overlap = count - start
+    if overlap <= 0:
+        return count
+    if overlap <= len(messages) and (
+        _digest(_line(messages[overlap - 1])) == index.last_digest
+    ):
+        return count
+    return start
+
+
+def _compact(path: Path, index: _HistoryIndex) -> _HistoryIndex:
+    """Rewrite the history file with only its live messages.
+
+    Returns:
+        The index of the rewritten file.
+    """
+    with path.open("rb") as f:
+        lines = []
+        for offset, length in zip(index.offsets, index.lengths):
+            f.seek(offset)
+            lines.append(f.read(length))
+    _write_atomic(path, b"".join(lines))
+    compacted = _HistoryIndex(
+        size=sum(index.lengths),
+        lengths=list(index.lengths),
+        human=list(index.human),
+        last_digest=index.last_digest,
+    )
+    offset = 0
+    for length in index.lengths:
+        compacted.offsets.append(offset)
+        offset += length
+    logger.debug("Compacted langchain history %s", path.name)
+    return compacted
+
+
+def _set_latest(session_dir: Path, session_id: str) -> None:
+    try:
+        _write_atomic(session_dir / _LATEST_FILE, session_id.encode("utf-8"))
+    except OSError as e:
+        logger.debug("Could not record latest langchain session: %s", e)
+
+
+def store_langchain_history(
+    session_id: str,
+    messages: list[dict[str, Any]],
+    base_dir: Optional[str] = None,
+    start: int = 0,
+) -> str:
+    """Persist message history to disk.
+
+    The stored history becomes its first ``start`` messages followed by
+    ``messages``. When that extends what is stored, only the new messages
+    are appended.
+
+    Args:
+        session_id: Unique session identifier
+        messages: The history from message ``start`` on
+        base_dir: Optional custom base directory for session files
+        start: Index of ``messages[0]`` in the history, as returned by
+            :func:`load_langchain_history_window`
+
+    Returns:
+        The file path written.
+    """
+    path = langchain_history_path(session_id, base_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index = _open_history(path) or _HistoryIndex()
+    start = min(start, len(index.offsets))
+
+    keep = _shared_length(index, messages, start)
+    new = messages[len(index.offsets) - start :] if keep > start else messages
+
+    with path.open("ab") as f:
+        if f.tell() != index.size:
+            f.truncate(index.size)  # drop an interrupted append
+        if keep < len(index.offsets):
+            marker = _truncate_marker(keep)
+            f.write(marker)
+            _truncate_index(path, index, keep)
+            index.size += len(marker)
+        lines = [_line(m) for m in new]
+        f.write(b"".join(lines))
+    _append_to_index(index, new, lines)
+
+    if index.size - index.live_bytes > index.live_bytes:
+        index = _compact(path, index)
+    _save_index(path, index)
+    _set_latest(path.parent, session_id)
+    return str(path)
+
+
+def latest_langchain_session(base_dir: Optional[str] = None) -> Path | None:
+    """Return the history file of the most recently stored session.
+
+    Returns:
+        The path named by the ``.latest`` pointer, or None if there is no
+        pointer (e.g. only migrated-before sessions) or its file is gone.
+    """
+    session_dir = _session_dir(base_dir)
+    try:
+        session_id = (session_dir / _LATEST_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    path = langchain_history_path(session_id, base_dir) if session_id else None
+    return path if path is not None and path.exists() else None
@@ -13,6 +13,7 @@
 from typing import Optional
 
 from ...utils.user_app_data import get_user_app_data_dir
+from .langchain_history import latest_langchain_session
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +23,12 @@
 
 
 def _find_latest_langchain_session() -> Optional[str]:
-    """Find the most recent langchain session file by modification time.
+    """Find the most recently stored langchain session file.
 
-    Searches ~/.mcp_coder/sessions/langchain/ for JSON files and returns
-    the most recently modified one. Filenames are UUIDs, so mtime is used
-    for ordering.
+    Searches ~/.mcp_coder/sessions/langchain/ for history files. The latest
+    one is named by the pointer that storing a history updates; sessions
+    only stored before that pointer existed fall back to modification time
+    (filenames are UUIDs).
 
     Returns:
         Path to latest langchain session file, or None if none found
@@ -39,16 +41,24 @@ def _find_latest_langchain_session() -> Optional[str]:
         return None
 
     try:
-        json_files = list(session_dir.glob("*.json"))
-        if not json_files:
+        with os.scandir(session_dir) as entries:
+            session_names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith((".jsonl", ".json"))
+            ]
+        if not session_names:
             logger.debug("No langchain session files found in: %s", session_dir)
             return None
 
-        # Sort by modification time, newest first
-        json_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        latest = json_files[0]
+        latest = latest_langchain_session(str(session_dir))
+        if latest is None:
+            # Sort by modification time, newest first
+            session_files = [session_dir / name for name in session_names]
+            session_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+            latest = session_files[0]
 
-        num_sessions = len(json_files)
+        num_sessions = len(session_names)
         print(
             f"Found {num_sessions} previous langchain sessions, "
             f"continuing from: {latest.name}"
@@ -69,7 +79,7 @@ def find_latest_session(
     """Find the most recent session file.
 
     For claude provider: searches responses_dir for timestamp-named response files.
-    For langchain provider: searches ~/.mcp_coder/sessions/langchain/ by mtime.
+    For langchain provider: searches ~/.mcp_coder/sessions/langchain/.
 
     Args:
         responses_dir: Directory containing response files (used for claude)
@@ -11,8 +11,8 @@
 from pathlib import Path
 from typing import Any, Optional
 
-from ...utils.user_app_data import get_user_app_data_dir
 from ..types import LLMResponseDict
+from .langchain_history import load_langchain_history, store_langchain_history
 
 logger = logging.getLogger(__name__)
 
@@ -149,73 +149,19 @@ def extract_session_id(file_path: str) -> Optional[str]:
         return None
 
 
-def _langchain_session_path(
-    session_id: str,
-    base_dir: Optional[str] = None,
-) -> Path:
-    """Return Path for a session's history JSON file.
-
-    Default: ~/.mcp_coder/sessions/langchain/{session_id}.json
-
-    Args:
-        session_id: Unique session identifier
-        base_dir: Optional custom base directory for session files
-
-    Returns:
-        Path to the session history JSON file.
-    """
-    root = (
-        Path(base_dir)
-        if base_dir
-        else get_user_app_data_dir("mcp_coder") / "sessions" / "langchain"
-    )
-    return root / f"{session_id}.json"
-
-
 def extract_langchain_session_id(file_path: str) -> str:
     """Extract session ID from a langchain session file path.
 
-    Langchain session files are named {uuid}.json, so the stem is the session ID.
+    Langchain session files are named {uuid}.jsonl, so the stem is the session ID.
 
     Args:
-        file_path: Path to the langchain session JSON file
+        file_path: Path to the langchain session history file
 
     Returns:
         Session ID string (the filename stem)
 
     Example:
-        >>> extract_langchain_session_id("/path/to/abc-def-123.json")
+        >>> extract_langchain_session_id("/path/to/abc-def-123.jsonl")
         'abc-def-123'
     """
     return Path(file_path.replace("\\", "/")).stem
-
-
-def store_langchain_history(
-    session_id: str,
-    messages: list[dict[str, Any]],
-    base_dir: Optional[str] = None,
-) -> str:
-    """Persist message history to disk.
-
-    Returns:
-        The file path written.
-    """
-    path = _langchain_session_path(session_id, base_dir)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(messages, indent=2), encoding="utf-8")
-    return str(path)
-
-
-def load_langchain_history(
-    session_id: str,
-    base_dir: Optional[str] = None,
-) -> list[dict[str, Any]]:
-    """Load message history from disk.
-
-    Returns:
-        List of message dicts, or empty list if no file exists.
-    """
-    path = _langchain_session_path(session_id, base_dir)
-    if not path.exists():
-        return []
-    return json.loads(path.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
@@ -4,16 +4,22 @@
 LLM responses with session management and versioned serialization support.
 """
 
+import json
+import os
+from collections.abc import Iterator
 from datetime import datetime
-from typing import TypedDict
+from typing import Literal, TypedDict, get_args
 
 __all__ = [
+    "EVENT_RETENTION_ENV",
     "LLMResponseDict",
     "LLM_RESPONSE_VERSION",
     "ResponseAssembler",
+    "RetentionMode",
     "StreamEvent",
     "SUPPORTED_PROVIDERS",
     "UsageInfo",
+    "iter_spilled_records",
 ]
 
 
@@ -100,12 +106,114 @@ class LLMResponseDict(TypedDict):
 """
 
 
+RetentionMode = Literal["full", "summary", "off"]
+"""How much of the event stream ``ResponseAssembler`` keeps in memory:
+
+- ``"full"`` — every event in ``raw_response["events"]`` plus the complete
+  ``tool_trace``.
+- ``"summary"`` — text plus a ``tool_trace`` whose outputs (and long string
+  arguments) are truncated to ``SUMMARY_VALUE_MAX_CHARS``.
+- ``"off"`` — text and metadata only.
+
+In ``summary``/``off`` mode the events are referenced by byte range in the log
+they were already written to (``raw_response["events_ref"]``; read back with
+:func:`iter_spilled_records`) instead of being kept in memory.
+"""
+
+EVENT_RETENTION_ENV = "MCP_CODER_EVENT_RETENTION"
+SUMMARY_VALUE_MAX_CHARS = 2000
+
+
+def _retention_override() -> RetentionMode | None:
+    """Return the ``MCP_CODER_EVENT_RETENTION`` mode, if validly set."""
+    value = os.environ.get(EVENT_RETENTION_ENV, "").strip().lower()
+    for mode in get_args(RetentionMode):
+        if value == mode:
+            return mode  # type: ignore[no-any-return]
+    return None
+
+
+def _truncate(value: object) -> object:
+    """Shorten long strings to ``SUMMARY_VALUE_MAX_CHARS`` (with a marker).
+
+    Returns:
+        ``value``, or its shortened form if it is a long string.
+    """
+    if isinstance(value, str) and len(value) > SUMMARY_VALUE_MAX_CHARS:
+        dropped = len(value) - SUMMARY_VALUE_MAX_CHARS
+        return f"{value[:SUMMARY_VALUE_MAX_CHARS]}... [{dropped} chars truncated]"
+    return value
+
+
+def _summarize_tool_event(event: StreamEvent) -> StreamEvent:
+    summary: StreamEvent = {k: _truncate(v) for k, v in event.items()}
+    args = event.get("args")
+    if isinstance(args, dict):
+        summary["args"] = {k: _truncate(v) for k, v in args.items()}
+    return summary
+
+
+def iter_spilled_records(events_ref: dict[str, object]) -> Iterator[dict[str, object]]:
+    """Read back the log records an ``events_ref`` points at.
+
+    Args:
+        events_ref: ``raw_response["events_ref"]`` of a summary/off response
+            (``path``, byte ``offset`` and ``length``).
+
+    Yields:
+        Each JSON object line in the byte range, as written by the producer
+        (Claude CLI NDJSON messages or iCoder event-log records).
+    """  # Also raises OSError via open() if the log file cannot be read.
+    path, offset, length = (
+        events_ref.get("path"),
+        events_ref.get("offset"),
+        events_ref.get("length"),
+    )
+    if not isinstance(path, str) or not isinstance(offset, int):
+        return
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        data = fh.read(length) if isinstance(length, int) else fh.read()
+    for raw in data.splitlines():
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
 class ResponseAssembler:
     """Accumulates StreamEvents into a complete LLMResponseDict."""
 
-    def __init__(self, provider: str) -> None:
-        """Initialize assembler for given provider name."""
+    def __init__(
+        self,
+        provider: str,
+        *,
+        retention: RetentionMode = "full",
+        events_file: str | None = None,
+        events_offset: int = 0,
+    ) -> None:
+        """Initialize assembler for given provider name.
+
+        Args:
+            provider: Provider name recorded in the result.
+            retention: Event retention mode (see :data:`RetentionMode`),
+                default ``"full"``. ``MCP_CODER_EVENT_RETENTION``, when set,
+                overrides it (e.g. ``full`` to debug a summary-mode caller).
+            events_file: Log the caller already writes this run's events to
+                (e.g. the iCoder event log), starting at ``events_offset``.
+                Without it, the ``stream_file`` announced by the stream is
+                referenced, measured from its ``raw_line`` events.
+            events_offset: Byte offset of this run's first record in
+                ``events_file``.
+        """
         self._provider = provider
+        self._retention: RetentionMode = _retention_override() or retention
+        self._events_file = events_file
+        self._events_offset = events_offset
+        self._stream_file_bytes = 0
+        self._event_count = 0
         self._text_parts: list[str] = []
         self._session_id: str | None = None
         self._usage: dict[str, object] = {}
@@ -124,7 +232,14 @@ def add(self, event: StreamEvent) -> None:
         # separately in `stream_file`; keep them out of the assembled `events`
         # list to avoid ~2x payload. Live consumers still receive them from the
         # generator directly.
-        if event_type != "raw_line":
+        if event_type == "raw_line":
+            line = event.get("line")
+            if isinstance(line, str):
+                # Written to stream_file as ``line + "\n"`` (UTF-8).
+                self._stream_file_bytes += len(line.encode("utf-8")) + 1
+            return
+        self._event_count += 1
+        if self._retention == "full":
             self._raw_events.append(event)
         if event_type == "text_delta":
             self._saw_assistant_text = True
@@ -151,7 +266,10 @@ def add(self, event: StreamEvent) -> None:
             # MCP-guard consumers (env_setup, verify) read.
             self._system = event.get("data")
         elif event_type in ("tool_use_start", "tool_result"):
-            self._tool_trace.append(event)
+            if self._retention == "full":
+                self._tool_trace.append(event)
+            elif self._retention == "summary":
+                self._tool_trace.append(_summarize_tool_event(event))
         elif event_type == "error":
             message = event.get("message")
             if isinstance(message, str):
@@ -168,7 +286,14 @@ def result(self) -> LLMResponseDict:
         Returns:
             LLMResponseDict with text, session info, and raw events.
         """
-        raw_response: dict[str, object] = {"events": list(self._raw_events)}
+        raw_response: dict[str, object] = {}
+        if self._retention == "full":
+            raw_response["events"] = list(self._raw_events)
+        else:
+            raw_response["event_count"] = self._event_count
+            events_ref = self._events_ref()
+            if events_ref is not None:
+                raw_response["events_ref"] = events_ref
         if self._stream_file is not None:
             raw_response["stream_file"] = self._stream_file
         if self._system is not None:
@@ -193,3 +318,27 @@ def result(self) -> LLMResponseDict:
             provider=self._provider,
             raw_response=raw_response,
         )
+
+    def _events_ref(self) -> dict[str, object] | None:
+        """Byte range of this run's events in an already-written log.
+
+        Returns:
+            The ``events_ref`` dict, or None if no log holds the events.
+        """
+        if self._events_file is not None:
+            try:
+                length = os.path.getsize(self._events_file) - self._events_offset
+            except OSError:
+                return None
+            return {
+                "path": self._events_file,
+                "offset": self._events_offset,
+                "length": length,
+            }
+        if self._stream_file is not None and self._stream_file_bytes:
+            return {
+                "path": self._stream_file,
+                "offset": 0,
+                "length": self._stream_file_bytes,
+            }
+        return None
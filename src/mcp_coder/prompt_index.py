@@ -0,0 +1,229 @@
+"""Process-wide index of parsed prompt sources.
+
+Parsing a prompt source (possibly a whole directory concatenated) means
+extracting every header, checking for duplicates and locating each code
+block. ``PromptIndex`` does that once per source and keeps the resulting
+``PromptDocument`` (a header -> code block map) until one of the source's
+files changes size or mtime, or files are added to or removed from it.
+String-content sources are cached by content in a small LRU.
+
+``get_prompt``, ``get_prompt_with_substitutions`` and the validation
+functions in ``prompt_manager`` all read through the shared index.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import prompt_sources
+from .prompt_parsing import (
+    _extract_code_block_from_lines,
+    _extract_headers,
+    _find_duplicates,
+)
+from .prompt_sources import _resolve_source_files
+
+# [placeholder] markers substituted by get_prompt_with_substitutions.
+_PLACEHOLDER = re.compile(r"\[([^\[\]\n]+)\]")
+
+# Number of string-content sources kept parsed.
+_STRING_CACHE_SIZE = 64
+
+# (path, mtime_ns, size) of every file a source resolves to.
+_Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class PromptTemplate:
+    """A prompt pre-split at its ``[placeholder]`` markers.
+
+    Rendering is a single pass: substituted values are never scanned for
+    further placeholders.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Split ``text`` into literal segments and placeholder names."""
+        parts = _PLACEHOLDER.split(text)
+        self._literals = parts[0::2]
+        self._names = parts[1::2]
+
+    def render(self, substitutions: Dict[str, str]) -> str:
+        """Return the text with ``[name]`` replaced by ``substitutions[name]``.
+
+        Placeholders without a substitution are left as they are.
+        """
+        out = [self._literals[0]]
+        for name, literal in zip(self._names, self._literals[1:]):
+            out.append(substitutions.get(name, f"[{name}]"))
+            out.append(literal)
+        return "".join(out)
+
+
+class PromptDocument:
+    """One parsed prompt source: its headers and the code block of each."""
+
+    def __init__(self, content: str) -> None:
+        """Parse markdown ``content`` (headers, code blocks, duplicates)."""
+        lines = content.split("\n")
+        self.headers: List[Dict[str, Any]] = _extract_headers(content)
+        self.duplicates: List[str] = _find_duplicates([h["name"] for h in self.headers])
+        # Code block per header, in header order (duplicates included).
+        self._header_blocks: List[Optional[str]] = [
+            _extract_code_block_from_lines(lines, h["position"]) for h in self.headers
+        ]
+        self._blocks: Dict[str, int] = {}
+        for i, header in enumerate(self.headers):
+            self._blocks.setdefault(header["name"], i)
+        self._templates: Dict[str, PromptTemplate] = {}
+
+    def get(self, header: str) -> str:
+        """Return the code block after ``header``.
+
+        Raises:
+            ValueError: If the source has duplicate headers, ``header`` is
+                missing, or no code block follows it.
+        """
+        if self.duplicates:
+            duplicate_locations = []
+            for dup_name in self.duplicates:
+                locations = [
+                    f"line {h['line']}" for h in self.headers if h["name"] == dup_name
+                ]
+                duplicate_locations.append(
+                    f"'{dup_name}' found at: {', '.join(locations)}"
+                )
+            raise ValueError(
+                f"Duplicate header(s) found: {'; '.join(duplicate_locations)}"
+            )
+
+        index = self._blocks.get(header)
+        if index is None:
+            available_headers = [h["name"] for h in self.headers]
+            raise ValueError(
+                f"Header '{header}' not found. Available headers: {available_headers}"
+            )
+
+        code_block = self._header_blocks[index]
+        if code_block is None:
+            raise ValueError(
+                f"No code block found after header '{header}' "
+                f"at line {self.headers[index]['line']}"
+            )
+        return code_block
+
+    def template(self, header: str) -> PromptTemplate:
+        """Return the precompiled substitution template for ``header``.
+
+        Returns:
+            The template, compiled on first use.
+        """  # Also raises ValueError via get() (unknown header or no code block).
+        template = self._templates.get(header)
+        if template is None:
+            template = PromptTemplate(self.get(header))
+            self._templates[header] = template
+        return template
+
+    def validation_errors(self) -> List[str]:
+        """Return duplicate-header and missing-code-block errors."""
+        errors = []
+        for dup_name in self.duplicates:
+            locations = [
+                f"line {h['line']}" for h in self.headers if h["name"] == dup_name
+            ]
+            errors.append(
+                f"Duplicate header '{dup_name}' found at: {', '.join(locations)}"
+            )
+        for header, code_block in zip(self.headers, self._header_blocks):
+            if code_block is None:
+                errors.append(
+                    f"No code block found after header '{header['name']}' "
+                    f"at line {header['line']}"
+                )
+        return errors
+
+
+class PromptIndex:
+    """Cache of PromptDocuments keyed by source, validated by file stat."""
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[_Fingerprint, PromptDocument]] = {}
+        self._strings: "OrderedDict[str, PromptDocument]" = OrderedDict()
+
+    def document(self, source: str) -> PromptDocument:
+        """Return the parsed document for ``source``, parsing only if changed.
+
+        Args:
+            source: File path, directory, wildcard, or string content
+                (see ``prompt_manager.get_prompt``).
+
+        Returns:
+            The parsed document.
+        """  # Also raises FileNotFoundError via _load_content (unreadable file).
+        files = _resolve_source_files(source)
+        if files is None:
+            return self._string_document(source)
+
+        fingerprint = _fingerprint(files)
+        if fingerprint is not None:
+            with self._lock:
+                cached = self._files.get(source)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+
+        document = PromptDocument(prompt_sources._load_content(source))
+        if fingerprint is not None:
+            with self._lock:
+                self._files[source] = (fingerprint, document)
+        return document
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._files.clear()
+            self._strings.clear()
+
+    def _string_document(self, content: str) -> PromptDocument:
+        with self._lock:
+            document = self._strings.get(content)
+            if document is not None:
+                self._strings.move_to_end(content)
+                return document
+        document = PromptDocument(content)
+        with self._lock:
+            self._strings[content] = document
+            while len(self._strings) > _STRING_CACHE_SIZE:
+                self._strings.popitem(last=False)
+        return document
+
+
+def _fingerprint(files: List[str]) -> Optional[_Fingerprint]:
+    """Stat ``files`` for cache validation.
+
+    Returns:
+        ``(path, mtime_ns, size)`` per file, or None if any is missing (such
+        sources are not cached).
+    """
+    entries = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+_PROMPT_INDEX = PromptIndex()
+
+
+def get_prompt_document(source: str) -> PromptDocument:
+    """Return the parsed document for ``source`` from the process-wide index."""
+    return _PROMPT_INDEX.document(source)
+
+
+def clear_prompt_index() -> None:
+    """Drop all parsed prompt sources from the process-wide index."""
+    _PROMPT_INDEX.clear()
@@ -15,6 +15,8 @@
 - Cross-file duplicate header detection when using directories/wildcards
 - Clear error messages with file locations and line numbers
 - Comprehensive validation with detailed results
+- Each source is parsed once per process (see prompt_index) and re-parsed only
+  when one of its files changes size or mtime
 
 Markdown Format Requirements:
 - Headers: Use # ## ### #### ##### (1-5 levels)
@@ -76,12 +78,8 @@
 import os
 from typing import Any, Dict, List
 
-from .prompt_parsing import (
-    _extract_code_block_after_header,
-    _extract_headers,
-    _find_duplicates,
-)
-from .prompt_sources import _is_file_path, _load_content
+from .prompt_index import get_prompt_document
+from .prompt_sources import _is_file_path
 
 
 def get_prompt(source: str, header: str) -> str:
@@ -144,44 +142,8 @@ def get_prompt(source: str, header: str) -> str:
         except ValueError as e:
             print(f"Error: {e}")
             # Prints available headers for reference
-    """
-    # Auto-detect input type and get content
-    content = _load_content(source)
-
-    # Find all headers and their positions
-    headers = _extract_headers(content)
-
-    # Check for duplicate headers
-    header_names = [h["name"] for h in headers]
-    duplicates = _find_duplicates(header_names)
-    if duplicates:
-        duplicate_locations = []
-        for dup_name in duplicates:
-            locations = [f"line {h['line']}" for h in headers if h["name"] == dup_name]
-            duplicate_locations.append(f"'{dup_name}' found at: {', '.join(locations)}")
-        raise ValueError(f"Duplicate header(s) found: {'; '.join(duplicate_locations)}")
-
-    # Find the target header
-    target_header = None
-    for h in headers:
-        if h["name"] == header:
-            target_header = h
-            break
-
-    if target_header is None:
-        available_headers = [h["name"] for h in headers]
-        raise ValueError(
-            f"Header '{header}' not found. Available headers: {available_headers}"
-        )
-
-    # Extract code block after the header
-    code_block = _extract_code_block_after_header(content, target_header)
-    if code_block is None:
-        raise ValueError(
-            f"No code block found after header '{header}' at line {target_header['line']}"
-        )
-
-    return code_block
+    """  # noqa: DOC502 - raised by PromptDocument.get, which this delegates to.
+    return get_prompt_document(source).get(header)
 
 
 def get_prompt_with_substitutions(
@@ -193,6 +155,8 @@ def get_prompt_with_substitutions(
 
     This is a convenience wrapper around get_prompt() that handles
     placeholder substitution for prompts that use [placeholder] syntax.
+    The prompt is split at its placeholders once and cached with the
+    parsed source, and all placeholders are replaced in a single pass.
 
     Args:
         source: File path, directory path, wildcard pattern, or string content
@@ -218,10 +182,7 @@ def get_prompt_with_substitutions(
             }
         )
     """
-    prompt = get_prompt(source, header)
-    for key, value in substitutions.items():
-        prompt = prompt.replace(f"[{key}]", value)
-    return prompt
+    return get_prompt_document(source).template(header).render(substitutions)
 
 
 def validate_prompt_markdown(source: str) -> Dict[str, Any]:
@@ -277,7 +238,7 @@ def validate_prompt_markdown(source: str) -> Dict[str, Any]:
         # result['valid'] will be False with file error in result['errors']
     """
     try:
-        content = _load_content(source)
+        document = get_prompt_document(source)
         source_type = "file" if _is_file_path(source) else "string"
     except FileNotFoundError as e:
         return {
@@ -287,31 +248,11 @@ def validate_prompt_markdown(source: str) -> Dict[str, Any]:
             "source_type": "file",
         }
 
-    errors = []
-    headers = _extract_headers(content)
-
-    # Check for duplicate headers
-    header_names = [h["name"] for h in headers]
-    duplicates = _find_duplicates(header_names)
-    if duplicates:
-        for dup_name in duplicates:
-            locations = [f"line {h['line']}" for h in headers if h["name"] == dup_name]
-            errors.append(
-                f"Duplicate header '{dup_name}' found at: {', '.join(locations)}"
-            )
-
-    # Check that each header has a code block
-    for header in headers:
-        code_block = _extract_code_block_after_header(content, header)
-        if code_block is None:
-            errors.append(
-                f"No code block found after header '{header['name']}' at line {header['line']}"
-            )
-
+    errors = document.validation_errors()
     return {
         "valid": len(errors) == 0,
         "errors": errors,
-        "headers": headers,
+        "headers": [dict(h) for h in document.headers],
         "source_type": source_type,
     }
 
@@ -403,8 +344,7 @@ def validate_prompt_directory(directory: str) -> Dict[str, Any]:
         file_headers: Dict[str, List[str]] = {}
 
         for file_path in sorted(md_files):  # Sort for consistent ordering
-            file_content = _load_content(file_path)
-            file_headers_list = _extract_headers(file_content)
+            file_headers_list = get_prompt_document(file_path).headers
             filename = os.path.basename(file_path)
 
             for header in file_headers_list:
@@ -421,12 +361,8 @@ def validate_prompt_directory(directory: str) -> Dict[str, Any]:
                 )
 
         # Also check using the concatenated approach for consistency with get_prompt
-        combined_content = _load_content(
-            directory
-        )  # This will concatenate all .md files
-        combined_headers = _extract_headers(combined_content)
-        header_names = [h["name"] for h in combined_headers]
-        duplicates = _find_duplicates(header_names)
+        # (the concatenated document is the one get_prompt(directory) uses)
+        duplicates = get_prompt_document(directory).duplicates
         if duplicates:
             for dup_name in duplicates:
                 # Only add if not already added above
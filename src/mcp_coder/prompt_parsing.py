@@ -7,6 +7,9 @@
 import re
 from typing import Any, Dict, List, Union
 
+_HEADER = re.compile(r"^(#{1,5})\s+(.+)$")
+_HEADER_START = re.compile(r"^#{1,5}\s+")
+
 
 def _extract_headers(content: str) -> List[Dict[str, Any]]:
     """Extract all headers from markdown content.
@@ -29,7 +32,7 @@ def _extract_headers(content: str) -> List[Dict[str, Any]]:
 
     for line_num, line in enumerate(lines, 1):
         # Match headers with any level (# ## ### #### #####)
-        match = re.match(r"^(#{1,5})\s+(.+)$", line.strip())
+        match = _HEADER.match(line.strip())
         if match:
             level = len(match.group(1))
             name = match.group(2).strip()
@@ -46,24 +49,21 @@ def _extract_headers(content: str) -> List[Dict[str, Any]]:
     return headers
 
 
-def _extract_code_block_after_header(
-    content: str, header: Dict[str, Any]
-) -> Union[str, None]:
-    """Extract the first code block after a header.
+def _extract_code_block_from_lines(lines: List[str], position: int) -> Union[str, None]:
+    """Extract the first code block after the header at ``lines[position]``.
 
-    This function looks for the first ``` fenced code block that appears
-    after the given header, stopping if it encounters another header first.
+    Works on content already split into lines, so a document can be scanned
+    for all headers with one split.
 
     Args:
-        content: Full markdown content
-        header: Header dictionary with position info
+        lines: Markdown content split on newlines
+        position: 0-based line index of the header
 
     Returns:
         str or None: Code block content (excluding ``` markers), or None
                      if no code block found before the next header
     """
-    lines = content.split("\n")
-    start_line = header["position"] + 1  # Start searching after the header
+    start_line = position + 1  # Start searching after the header
 
     # Look for the start of a code block (```)
     code_start = None
@@ -72,7 +72,7 @@ def _extract_code_block_after_header(
             code_start = i
             break
         # Stop if we hit another header
-        if re.match(r"^#{1,5}\s+", lines[i].strip()):
+        if _HEADER_START.match(lines[i].strip()):
             break
 
     if code_start is None:
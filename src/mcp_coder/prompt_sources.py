@@ -7,7 +7,7 @@
 import glob
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from .utils.data_files import find_data_file
 
@@ -200,6 +200,33 @@ def _load_content(source: str) -> str:
         return source
 
 
+def _resolve_source_files(source: str) -> Optional[List[str]]:
+    """List the files ``_load_content`` reads for ``source``.
+
+    Mirrors the resolution order of ``_load_content`` (package-relative path,
+    directory, wildcard, single file) without reading anything, so callers
+    can detect changes by stat-ing the returned files.
+
+    Args:
+        source: File path, directory, wildcard, or string content
+
+    Returns:
+        list or None: File paths in concatenation order (a missing single
+        file is still listed), or None if ``source`` is string content.
+    """
+    if not _is_file_path(source):
+        return None
+    if _is_package_relative_path(source):
+        resolved_path = _resolve_package_path(source)
+        if resolved_path and resolved_path.exists():
+            return [str(resolved_path)]
+    if os.path.isdir(source):
+        return sorted(glob.glob(os.path.join(source, "*.md")))
+    if "*" in source or "?" in source:
+        return [path for path in sorted(glob.glob(source)) if path.endswith(".md")]
+    return [source]
+
+
 def _is_file_path(source: str) -> bool:
     """Detect if source is a file path vs string content using simple heuristics.
 
@@ -9,10 +9,15 @@
 
 Note: Import order is critical to prevent circular imports.
       isort is disabled for this file - do not reorder imports.
+      Layer 2 (GitHub/Jenkins clients) is imported lazily so that importing
+      ``mcp_coder.utils`` (e.g. for logging at CLI startup) stays cheap.
 """
 
 # isort: skip_file
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 # Layer 1: Core utilities (no dependencies on other utils submodules)
 from .log_utils import OUTPUT, log_function_call, setup_logging
 from .subprocess_runner import (
@@ -25,13 +30,24 @@
 from .mlflow_config_loader import load_mlflow_config
 from .folder_deletion import DeletionFailureReason, DeletionResult, safe_delete_folder
 
-from ..mcp_workspace_github import PullRequestManager
-from .jenkins_operations import (
-    JenkinsClient,
-    JenkinsError,
-    JobStatus,
-    QueueSummary,
-)
+# Layer 2: Operations on external services (lazy loaded, see __getattr__)
+_LAZY_EXPORTS: dict[str, str] = {
+    "PullRequestManager": "..mcp_workspace_github",
+    "JenkinsClient": ".jenkins_operations",
+    "JenkinsError": ".jenkins_operations",
+    "JobStatus": ".jenkins_operations",
+    "QueueSummary": ".jenkins_operations",
+}
+
+# Type checking imports for static analysis
+if TYPE_CHECKING:
+    from ..mcp_workspace_github import PullRequestManager
+    from .jenkins_operations import (
+        JenkinsClient,
+        JenkinsError,
+        JobStatus,
+        QueueSummary,
+    )
 
 __all__ = [
     # Logging utilities
@@ -61,3 +77,18 @@
     "DeletionResult",
     "safe_delete_folder",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for the Layer 2 GitHub and Jenkins clients.
+
+    Returns:
+        The requested attribute from its defining module.
+
+    Raises:
+        AttributeError: If the attribute is not found in this module.
+    """
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path, __name__), name)
@@ -0,0 +1,175 @@
+"""Long-lived subprocess with line-oriented stdin/stdout.
+
+``stream_subprocess`` runs one command to completion. ``InteractiveProcess``
+keeps a process running so that successive requests can be written to its
+stdin and their responses read from its stdout, line by line, without paying
+the process startup cost again (e.g. a Claude CLI in stream-json input mode).
+
+stdout is read on a background thread into a queue, so ``read_line`` can
+enforce an inactivity timeout; stderr is drained on another thread to avoid
+pipe-buffer deadlocks and kept for error messages.
+"""
+
+import logging
+import os
+import queue
+import signal
+import subprocess
+import threading
+
+from .subprocess_runner import CommandOptions, prepare_env
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["InteractiveProcess"]
+
+# Characters of stderr kept for error messages.
+_STDERR_TAIL_CHARS = 4000
+
+
+class InteractiveProcess:
+    """A running subprocess driven one stdin line at a time.
+
+    Example:
+        >>> proc = InteractiveProcess(["cat"])
+        >>> proc.write_line("hello")
+        >>> proc.read_line(timeout=5)
+        'hello'
+        >>> proc.close()
+    """
+
+    def __init__(
+        self, command: list[str], options: CommandOptions | None = None
+    ) -> None:
+        """Start ``command`` with piped stdin, stdout and stderr.
+
+        Args:
+            command: Command and arguments as a list.
+            options: ``cwd``, ``env`` and ``env_remove`` are honoured;
+                ``input_data`` and timeouts are not used.
+
+        Raises:
+            OSError: If the process cannot be started.
+        """
+        if options is None:
+            options = CommandOptions()
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=options.cwd,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            env=prepare_env(command, options.env, options.env_remove),
+            start_new_session=os.name != "nt",
+        )
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._stderr_chunks: list[str] = []
+        self._stderr_chars = 0
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        """Process id."""
+        return self._process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code, or ``None`` while the process is running."""
+        return self._process.poll()
+
+    def is_alive(self) -> bool:
+        """Return True while the process is running."""
+        return self._process.poll() is None
+
+    @property
+    def stderr(self) -> str:
+        """The last few thousand characters the process wrote to stderr."""
+        return "".join(self._stderr_chunks)[-_STDERR_TAIL_CHARS:]
+
+    def write_line(self, line: str) -> None:
+        """Write ``line`` plus a newline to stdin and flush.
+
+        Raises:
+            OSError: If stdin is closed (e.g. the process exited).
+        """
+        assert self._process.stdin is not None  # guaranteed by PIPE
+        self._process.stdin.write(line + "\n")
+        self._process.stdin.flush()
+
+    def read_line(self, timeout: float | None = None) -> str | None:
+        """Return the next stdout line without its newline.
+
+        Args:
+            timeout: Seconds to wait for a line; ``None`` waits indefinitely.
+
+        Returns:
+            The line, or ``None`` once stdout is closed (the process exited).
+
+        Raises:
+            TimeoutError: If no line arrived within ``timeout`` seconds.
+        """
+        try:
+            return self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No output for {timeout}s") from None
+
+    def close(self, grace_seconds: float = 2.0) -> None:
+        """Close stdin, give the process time to exit, then kill it."""
+        if self._process.poll() is None:
+            try:
+                assert self._process.stdin is not None
+                self._process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self._process.wait(timeout=grace_seconds)
+            except subprocess.TimeoutExpired:
+                self.kill()
+
+    def kill(self) -> None:
+        """Kill the process and its children (its process group on POSIX)."""
+        if self._process.poll() is not None:
+            return
+        try:
+            if os.name == "nt":
+                self._process.kill()
+            else:
+                os.killpg(  # type: ignore[attr-defined,unused-ignore]
+                    self._process.pid,
+                    signal.SIGKILL,  # type: ignore[attr-defined,unused-ignore]
+                )
+        except OSError as exc:
+            logger.debug("Kill of process %d failed: %s", self._process.pid, exc)
+        try:
+            self._process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def _read_stdout(self) -> None:
+        assert self._process.stdout is not None
+        try:
+            for raw_line in self._process.stdout:
+                self._lines.put(raw_line.rstrip("\n").rstrip("\r"))
+        except (OSError, ValueError):
+            pass  # pipe closed by kill()
+        finally:
+            self._lines.put(None)
+
+    def _drain_stderr(self) -> None:
+        assert self._process.stderr is not None
+        try:
+            for line in self._process.stderr:
+                self._stderr_chunks.append(line)
+                self._stderr_chars += len(line)
+                while (
+                    len(self._stderr_chunks) > 1
+                    and self._stderr_chars - len(self._stderr_chunks[0])
+                    >= _STDERR_TAIL_CHARS
+                ):
+                    self._stderr_chars -= len(self._stderr_chunks.pop(0))
+        except (OSError, ValueError):
+            pass
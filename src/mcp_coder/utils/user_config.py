@@ -11,6 +11,7 @@
 
 import logging
 import os
+import threading
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -171,9 +172,18 @@ def get_config_file_path() -> Path:
     return get_user_app_data_dir("mcp_coder") / "config.toml"
 
 
+# Parsed config.toml per path with the (mtime_ns, size) it was parsed at.
+_config_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+_config_cache_lock = threading.Lock()
+
+
 def load_config() -> dict[str, Any]:
     """Load user configuration from TOML file.
 
+    The file is parsed once per process and re-parsed only when its mtime or
+    size changes (or after ``reload_config()``). The returned dict is shared
+    between callers and must not be modified.
+
     Returns:
         Configuration dictionary. Empty dict if file doesn't exist.
 
@@ -183,18 +193,44 @@ def load_config() -> dict[str, Any]:
     """
     config_path = get_config_file_path()
 
-    # Return empty dict if config file doesn't exist
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        # Return empty dict if config file doesn't exist
         return {}
+    except OSError:
+        stat = None
+    fingerprint = (stat.st_mtime_ns, stat.st_size) if stat is not None else None
+
+    if fingerprint is not None:
+        with _config_cache_lock:
+            cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
 
     try:
         with open(config_path, "rb") as f:
-            return tomllib.load(f)
+            config_data = tomllib.load(f)
     except tomllib.TOMLDecodeError as e:
         raise ValueError(_format_toml_error(config_path, e)) from e
     except OSError as e:
         raise ValueError(f"Error reading config file: {config_path}\n{e}") from e
 
+    if fingerprint is not None:
+        with _config_cache_lock:
+            _config_cache[config_path] = (fingerprint, config_data)
+    return config_data
+
+
+def reload_config() -> None:
+    """Drop the cached config so the next ``load_config()`` re-reads the file.
+
+    Changes are normally picked up by mtime/size; long-running processes
+    (e.g. iCoder) can call this to force a re-read.
+    """
+    with _config_cache_lock:
+        _config_cache.clear()
+
 
 def _get_nested_value(
     config_data: dict[str, Any], section: str, key: str
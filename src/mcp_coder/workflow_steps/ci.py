@@ -33,12 +33,17 @@
     run_formatters,
 )
 
+from .ci_wait import (
+    AdaptivePollSchedule,
+    CIDurationHistory,
+    CIWaiter,
+    notifier_from_env,
+)
 from .constants import (
     CI_MAX_FIX_ATTEMPTS,
-    CI_MAX_POLL_ATTEMPTS,
-    CI_NEW_RUN_MAX_POLL_ATTEMPTS,
+    CI_MAX_WAIT_SECONDS,
+    CI_NEW_RUN_MAX_WAIT_SECONDS,
     CI_NEW_RUN_POLL_INTERVAL_SECONDS,
-    CI_POLL_INTERVAL_SECONDS,
     LLM_CI_ANALYSIS_TIMEOUT_SECONDS,
     LLM_INACTIVITY_TIMEOUT_SECONDS,
     PR_INFO_DIR,
@@ -263,23 +268,50 @@ def _run_ci_fix(
 
 
 def _poll_for_ci_completion(
-    ci_manager: CIResultsManager, branch: str
+    ci_manager: CIResultsManager,
+    branch: str,
+    waiter: Optional[CIWaiter] = None,
 ) -> tuple[Optional[CIStatusData], bool]:
     """Poll for CI run completion.
 
+    Polls are paced by the adaptive CI-wait engine (see ``ci_wait``) within a
+    budget of ``CI_MAX_WAIT_SECONDS``.
+
     Args:
         ci_manager: CIResultsManager instance
         branch: Branch name to check
+        waiter: Optional pre-configured CIWaiter (tests, custom budgets)
 
     Returns:
         Tuple of (ci_status dict or None, success bool).
         success=True means CI passed, success=False means CI failed or needs fixing.
         If ci_status is None and success is True, it means graceful exit (no CI found).
     """
+    if waiter is None:
+        waiter = CIWaiter(
+            CI_MAX_WAIT_SECONDS,
+            notifier=notifier_from_env(),
+            history=CIDurationHistory(),
+        )
+    try:
+        return _poll_with_waiter(ci_manager, branch, waiter)
+    finally:
+        waiter.close()
+
+
+def _poll_with_waiter(
+    ci_manager: CIResultsManager, branch: str, waiter: CIWaiter
+) -> tuple[Optional[CIStatusData], bool]:
+    """Polling loop of _poll_for_ci_completion, paced by ``waiter``.
+
+    Returns:
+        Same contract as _poll_for_ci_completion.
+    """
     poll_start_time = time.time()
-    heartbeat_iteration_interval = 8  # ~2min at 15s intervals
+    heartbeat_iteration_interval = 8  # ~2min at nominal intervals
 
-    for poll_attempt in range(CI_MAX_POLL_ATTEMPTS):
+    while True:
+        poll_attempt = waiter.attempts
         try:
             ci_status = ci_manager.get_latest_ci_status(branch)
         except Exception as e:
@@ -288,18 +320,19 @@ def _poll_for_ci_completion(
             )
             return None, True  # Graceful exit on API errors
 
+        waiter.observe(ci_status)
         run_info = ci_status.get("run", {})
 
         elapsed = time.time() - poll_start_time
         elapsed_min, elapsed_sec = divmod(int(elapsed), 60)
 
         if len(run_info) == 0:
-            if poll_attempt < CI_MAX_POLL_ATTEMPTS - 1:
+            if not waiter.expired:
                 logger.debug(
-                    f"No CI run found yet (attempt {poll_attempt + 1}/{CI_MAX_POLL_ATTEMPTS}, "
+                    f"No CI run found yet (attempt {poll_attempt + 1}, "
                     f"elapsed: {elapsed_min}m {elapsed_sec}s)"
                 )
-                time.sleep(CI_POLL_INTERVAL_SECONDS)
+                waiter.wait()
                 continue
             logger.info("CI_NOT_CONFIGURED: No workflow runs found - skipping CI check")
             return None, True  # Graceful exit
@@ -322,66 +355,87 @@ def _poll_for_ci_completion(
             )
             return ci_status, False  # Needs fixing
 
+        if waiter.expired:
+            break
+
         logger.debug(
             f"CI run in progress (status: {run_status}, "
-            f"attempt {poll_attempt + 1}/{CI_MAX_POLL_ATTEMPTS}, "
-            f"elapsed: {elapsed_min}m {elapsed_sec}s)"
+            f"attempt {poll_attempt + 1}, "
+            f"elapsed: {elapsed_min}m {elapsed_sec}s, "
+            f"next poll in {waiter.next_interval():.0f}s)"
         )
 
         if (poll_attempt + 1) % heartbeat_iteration_interval == 0:
             logger.info(
                 "CI polling heartbeat: waiting for CI completion "
-                "(attempt %d/%d, elapsed: %dm %ds)",
+                "(attempt %d, elapsed: %dm %ds)",
                 poll_attempt + 1,
-                CI_MAX_POLL_ATTEMPTS,
                 elapsed_min,
                 elapsed_sec,
             )
 
-        time.sleep(CI_POLL_INTERVAL_SECONDS)
+        waiter.wait()
 
     logger.info("CI_TIMEOUT: No completed run after polling - skipping CI check")
     return None, True  # Graceful exit after max polling
 
 
 def _wait_for_new_ci_run(
-    ci_manager: CIResultsManager, branch: str, previous_run_ids: set[int]
+    ci_manager: CIResultsManager,
+    branch: str,
+    previous_run_ids: set[int],
+    waiter: Optional[CIWaiter] = None,
 ) -> tuple[Optional[CIStatusData], bool]:
     """Wait for a new CI run to start after pushing changes.
 
+    Right after a push no run is visible yet, so the CI-wait engine polls at
+    its fastest rate within a budget of ``CI_NEW_RUN_MAX_WAIT_SECONDS``.
+
     Args:
         ci_manager: CIResultsManager instance
         branch: Branch name to check
         previous_run_ids: Set of run IDs to compare against
+        waiter: Optional pre-configured CIWaiter (tests, custom budgets)
 
     Returns:
         Tuple of (new ci_status or None, new_run_detected bool)
     """
     logger.info("Waiting for new CI run to start...")
+    if waiter is None:
+        waiter = CIWaiter(
+            CI_NEW_RUN_MAX_WAIT_SECONDS,
+            schedule=AdaptivePollSchedule(
+                min_interval=CI_NEW_RUN_POLL_INTERVAL_SECONDS
+            ),
+        )
 
-    for attempt in range(CI_NEW_RUN_MAX_POLL_ATTEMPTS):
-        time.sleep(CI_NEW_RUN_POLL_INTERVAL_SECONDS)
+    try:
+        while not waiter.expired:
+            waiter.wait()
 
-        try:
-            new_status = ci_manager.get_latest_ci_status(branch)
-        except Exception as e:
-            logger.warning(f"API error checking for new CI run: {e}")
-            continue
+            try:
+                new_status = ci_manager.get_latest_ci_status(branch)
+            except Exception as e:
+                logger.warning(f"API error checking for new CI run: {e}")
+                continue
 
-        new_run_ids = set(new_status.get("run", {}).get("run_ids", []))
+            new_run_ids = set(new_status.get("run", {}).get("run_ids", []))
 
-        if new_run_ids and not new_run_ids.issubset(previous_run_ids):
-            new_sha = new_status.get("run", {}).get("commit_sha") or "unknown"
-            logger.info(
-                f"New CI run detected: {new_run_ids} (sha: {_short_sha(new_sha)})"
-            )
-            return new_status, True
+            if new_run_ids and not new_run_ids.issubset(previous_run_ids):
+                new_sha = new_status.get("run", {}).get("commit_sha") or "unknown"
+                logger.info(
+                    f"New CI run detected: {new_run_ids} (sha: {_short_sha(new_sha)})"
+                )
+                return new_status, True
 
-        logger.debug(
-            f"Waiting for new CI run (attempt {attempt + 1}/{CI_NEW_RUN_MAX_POLL_ATTEMPTS})"
-        )
+            logger.debug(
+                f"Waiting for new CI run (attempt {waiter.attempts}, "
+                f"waited {waiter.waited:.0f}s)"
+            )
+    finally:
+        waiter.close()
 
-    logger.warning("No new CI run detected after 30s")
+    logger.warning(f"No new CI run detected after {waiter.budget_seconds:.0f}s")
     return None, False
 
 
@@ -0,0 +1,454 @@
+"""Adaptive CI-wait engine shared by the CI step and ``check branch-status``.
+
+Replaces fixed-interval ``time.sleep`` polling between
+``CIResultsManager.get_latest_ci_status`` calls with three pluggable parts:
+
+- ``AdaptivePollSchedule`` decides how long to wait before the next poll: fast
+  right after a push (no run seen yet), backing off during long runs, and fast
+  again near the run's expected finish (taken from ``CIDurationHistory``).
+- ``CIDurationHistory`` remembers how long recent runs of a workflow took.
+- An optional notification source (``FileDropNotifier`` / ``WebhookNotifier``)
+  wakes the waiter the moment a local stand-in reports that a run completed,
+  instead of waiting for the next scheduled poll.
+
+``CIWaiter`` ties them together. Without a notifier its wait budget is counted
+in *scheduled* seconds, so it behaves deterministically when ``time.sleep`` is
+patched.
+"""
+
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Mapping, Optional, Protocol
+
+from ..utils.user_app_data import get_user_app_data_dir
+from .constants import (
+    CI_POLL_BACKOFF_FACTOR,
+    CI_POLL_MAX_INTERVAL_SECONDS,
+    CI_POLL_MIN_INTERVAL_SECONDS,
+)
+
+__all__ = [
+    "AdaptivePollSchedule",
+    "CIDurationHistory",
+    "CINotifier",
+    "CIWaiter",
+    "FileDropNotifier",
+    "WebhookNotifier",
+    "notifier_from_env",
+]
+
+logger = logging.getLogger(__name__)
+
+# Environment variables selecting an optional completion notification source
+CI_NOTIFY_FILE_ENV = "MCP_CODER_CI_NOTIFY_FILE"
+CI_WEBHOOK_PORT_ENV = "MCP_CODER_CI_WEBHOOK_PORT"
+
+# Number of recent run durations kept per workflow
+MAX_DURATION_SAMPLES = 10
+# Number of recorded run ids kept per workflow (a run may span several ids)
+MAX_RECORDED_RUN_IDS = 5 * MAX_DURATION_SAMPLES
+
+
+class CINotifier(Protocol):
+    """Source of "a CI run completed" notifications."""
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds; return True if notified."""
+
+    def close(self) -> None:
+        """Release any resources held by the source."""
+
+
+class FileDropNotifier:
+    """Wakes when a marker file appears (and consumes it).
+
+    A local stand-in (webhook relay, CI post-step, shell script) touches the
+    file when a run completes. Checking it is a local ``stat``, so it can be
+    done far more often than a GitHub API call.
+    """
+
+    def __init__(self, path: Path, check_interval: float = 0.5) -> None:
+        self.path = path
+        self.check_interval = check_interval
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the marker file.
+
+        Returns:
+            True if the marker appeared (and was consumed), False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._consume():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.check_interval, remaining))
+
+    def _consume(self) -> bool:
+        if not self.path.exists():
+            return False
+        try:
+            self.path.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove CI notify file {self.path}: {e}")
+        return True
+
+    def close(self) -> None:
+        """Nothing to release for a file-based source."""
+
+
+class WebhookNotifier:
+    """Local HTTP listener; any POST to it signals a completed run."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1") -> None:
+        self._event = threading.Event()
+        event = self._event
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                event.set()
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(
+                self, format: str, *args: Any  # pylint: disable=redefined-builtin
+            ) -> None:
+                logger.debug("CI webhook: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="ci-webhook", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """Port the listener is bound to (useful when created with port 0)."""
+        return int(self._server.server_address[1])
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a POST.
+
+        Returns:
+            True if a POST arrived, False on timeout.
+        """
+        notified = self._event.wait(timeout)
+        self._event.clear()
+        return notified
+
+    def close(self) -> None:
+        """Stop the listener thread and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def notifier_from_env() -> Optional[CINotifier]:
+    """Build the notification source configured via environment variables.
+
+    ``MCP_CODER_CI_NOTIFY_FILE`` selects a file-drop source,
+    ``MCP_CODER_CI_WEBHOOK_PORT`` a local webhook listener. Neither set means
+    pure polling.
+
+    Returns:
+        The configured notifier, or None.
+    """
+    notify_file = os.environ.get(CI_NOTIFY_FILE_ENV, "").strip()
+    if notify_file:
+        return FileDropNotifier(Path(notify_file))
+
+    port = os.environ.get(CI_WEBHOOK_PORT_ENV, "").strip()
+    if port:
+        try:
+            return WebhookNotifier(int(port))
+        except (ValueError, OSError) as e:
+            logger.warning(f"CI webhook listener unavailable on port {port}: {e}")
+    return None
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _history_key(run_info: Mapping[str, Any]) -> Optional[str]:
+    """Key a run by repository and workflow, e.g. ``owner/repo:CI``.
+
+    Returns:
+        The key, or None if the run names no workflow.
+    """
+    workflow = run_info.get("workflow_name") or run_info.get("workflow_path")
+    if not workflow:
+        return None
+    url = str(run_info.get("url") or "")
+    repo = url.split("/actions/")[0].removeprefix("https://github.com/")
+    return f"{repo}:{workflow}"
+
+
+def run_duration_seconds(ci_status: Mapping[str, Any]) -> Optional[float]:
+    """Wall-clock duration of a completed run (run created -> last job done).
+
+    Returns:
+        Duration in seconds, or None if timestamps are missing.
+    """
+    created = _parse_timestamp(ci_status.get("run", {}).get("created_at"))
+    finished = [
+        ts
+        for ts in (
+            _parse_timestamp(job.get("completed_at"))
+            for job in ci_status.get("jobs", [])
+        )
+        if ts is not None
+    ]
+    if created is None or not finished:
+        return None
+    duration = (max(finished) - created).total_seconds()
+    return duration if duration > 0 else None
+
+
+class CIDurationHistory:
+    """Recent run durations per workflow, persisted as a small JSON file.
+
+    Each workflow entry also keeps the ids of the runs it recorded, so a run
+    polled again (by a later wait or another command) is counted once.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or (
+            get_user_app_data_dir("mcp_coder")
+            / "coordinator_cache"
+            / "ci_durations.json"
+        )
+
+    def _load(self) -> dict[str, dict[str, list[Any]]]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug(f"Failed to load CI duration history: {e}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        history: dict[str, dict[str, list[Any]]] = {}
+        for key, entry in data.items():
+            if isinstance(entry, list):
+                # Written before run ids were kept: durations only.
+                entry = {"durations": entry, "run_ids": []}
+            if isinstance(entry, dict):
+                history[key] = {
+                    "durations": list(entry.get("durations", [])),
+                    "run_ids": list(entry.get("run_ids", [])),
+                }
+        return history
+
+    def expected_duration(self, run_info: Mapping[str, Any]) -> Optional[float]:
+        """Median of the recorded durations for the run's workflow, if any.
+
+        Returns:
+            The median in seconds, or None without recorded durations.
+        """
+        key = _history_key(run_info)
+        entry = self._load().get(key, {}) if key else {}
+        samples = entry.get("durations", [])
+        return float(statistics.median(samples)) if samples else None
+
+    def record(self, ci_status: Mapping[str, Any]) -> None:
+        """Record the duration of a completed run once per run (best effort).
+
+        Runs without run ids, and runs whose ids were all recorded before,
+        are skipped.
+        """
+        run_info = ci_status.get("run", {})
+        key = _history_key(run_info)
+        duration = run_duration_seconds(ci_status)
+        run_ids = list(run_info.get("run_ids") or [])
+        if key is None or duration is None or not run_ids:
+            return
+        data = self._load()
+        entry = data.get(key, {"durations": [], "run_ids": []})
+        if set(run_ids) <= set(entry["run_ids"]):
+            return
+        entry["durations"] = (entry["durations"] + [round(duration, 1)])[
+            -MAX_DURATION_SAMPLES:
+        ]
+        entry["run_ids"] = (entry["run_ids"] + run_ids)[-MAX_RECORDED_RUN_IDS:]
+        data[key] = entry
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Failed to save CI duration history: {e}")
+
+
+@dataclass(frozen=True)
+class AdaptivePollSchedule:
+    """Decides the delay before the next CI status poll.
+
+    - No run seen yet (just pushed): back off geometrically from
+      ``min_interval`` up to ``max_interval``, so a run that starts right away
+      is found quickly and a repository without CI costs few polls.
+    - Run in progress, expected duration known: wait about half the remaining
+      time, dropping to ``min_interval`` inside ``near_finish_seconds`` of the
+      expected finish or once the run is overdue.
+    - Run in progress, no history: back off geometrically from
+      ``min_interval`` up to ``max_interval``.
+    """
+
+    min_interval: float = CI_POLL_MIN_INTERVAL_SECONDS
+    max_interval: float = CI_POLL_MAX_INTERVAL_SECONDS
+    backoff_factor: float = CI_POLL_BACKOFF_FACTOR
+    near_finish_seconds: float = 30.0
+
+    def next_interval(
+        self,
+        run_seen: bool,
+        polls: int,
+        run_elapsed: float,
+        expected_duration: Optional[float],
+    ) -> float:
+        """Return the number of seconds to wait before the next poll.
+
+        Args:
+            run_seen: Whether a CI run has been observed yet.
+            polls: Polls so far in the current phase: that found no run (while
+                ``run_seen`` is False), else that saw the run in progress.
+            run_elapsed: Seconds since the run started.
+            expected_duration: Typical run duration in seconds, if known.
+
+        Returns:
+            Delay in seconds, clamped to [min_interval, max_interval].
+        """
+        if run_seen and expected_duration is not None:
+            remaining = expected_duration - run_elapsed
+            if remaining <= self.near_finish_seconds:
+                return self.min_interval
+            interval = remaining / 2
+        else:
+            interval = self.min_interval * self.backoff_factor ** max(polls - 1, 0)
+        return max(self.min_interval, min(self.max_interval, interval))
+
+
+class CIWaiter:
+    """Paces CI status polls within a wait budget.
+
+    Usage: poll, feed the result to :meth:`observe`, stop if the run completed,
+    otherwise call :meth:`wait` until :attr:`expired`.
+    """
+
+    def __init__(
+        self,
+        budget_seconds: float,
+        schedule: Optional[AdaptivePollSchedule] = None,
+        notifier: Optional[CINotifier] = None,
+        history: Optional[CIDurationHistory] = None,
+    ) -> None:
+        self.budget_seconds = budget_seconds
+        self.schedule = schedule or AdaptivePollSchedule()
+        self.notifier = notifier
+        self.history = history
+        self.waited = 0.0
+        self.attempts = 0
+        self._polls = 0
+        self._run_seen = False
+        self._no_run_polls = 0
+        self._in_progress_polls = 0
+        self._run_started: Optional[datetime] = None
+        self._expected_duration: Optional[float] = None
+        self._expected_loaded = False
+
+    @property
+    def expired(self) -> bool:
+        """True once the scheduled wait time has used up the budget."""
+        return self.waited >= self.budget_seconds
+
+    def observe(self, ci_status: Mapping[str, Any]) -> None:
+        """Feed the latest polled status into the schedule and history.
+
+        A run already completed on the first poll finished before this wait
+        began; its duration is not recorded.
+        """
+        self._polls += 1
+        run_info = ci_status.get("run", {})
+        if not run_info:
+            self._no_run_polls += 1
+            return
+        self._run_seen = True
+        if self._run_started is None:
+            self._run_started = _parse_timestamp(run_info.get("created_at"))
+        if self.history is not None and not self._expected_loaded:
+            self._expected_loaded = True
+            self._expected_duration = self.history.expected_duration(run_info)
+            if self._expected_duration is not None:
+                logger.debug(
+                    f"Expected CI duration from history: {self._expected_duration:.0f}s"
+                )
+        if run_info.get("status") == "completed":
+            if self.history is not None and self._polls > 1:
+                self.history.record(ci_status)
+        else:
+            self._in_progress_polls += 1
+
+    def _run_elapsed(self) -> float:
+        if self._run_started is None:
+            return self.waited
+        return (datetime.now(timezone.utc) - self._run_started).total_seconds()
+
+    def next_interval(self) -> float:
+        """Delay before the next poll, capped by the remaining budget.
+
+        Returns:
+            Seconds to wait before the next poll.
+        """
+        interval = self.schedule.next_interval(
+            self._run_seen,
+            self._in_progress_polls if self._run_seen else self._no_run_polls,
+            self._run_elapsed(),
+            self._expected_duration,
+        )
+        return max(0.0, min(interval, self.budget_seconds - self.waited))
+
+    def wait(self) -> float:
+        """Wait until the next poll is due or a notification arrives.
+
+        Only a notification cuts a wait short; the budget is charged for the
+        time actually waited in that case and for the scheduled interval
+        otherwise.
+
+        Returns:
+            The number of seconds charged against the budget.
+        """
+        interval = self.next_interval()
+        self.attempts += 1
+        spent = interval
+        if self.notifier is not None:
+            start = time.monotonic()
+            if self.notifier.wait(interval):
+                logger.debug("CI completion notification received")
+                spent = min(interval, time.monotonic() - start)
+        else:
+            time.sleep(interval)
+        self.waited += spent
+        return spent
+
+    def close(self) -> None:
+        """Release the notification source, if any."""
+        if self.notifier is not None:
+            self.notifier.close()
@@ -30,9 +30,18 @@
 # Inactivity budget (was wall-clock), kept below the CI step cap. CI-analysis is a
 # pure-LLM call (no MCP tools), so 300s is safe: an LLM emits a token quickly.
 LLM_CI_ANALYSIS_TIMEOUT_SECONDS = 300  # 5 minutes of silence for CI failure analysis
-CI_POLL_INTERVAL_SECONDS = 15  # Poll CI status every 15 seconds
-CI_MAX_POLL_ATTEMPTS = 50  # Max 50 attempts = 12.5 minutes max wait
+CI_POLL_INTERVAL_SECONDS = 15  # Nominal poll interval (sizes the wait budget)
+CI_MAX_POLL_ATTEMPTS = 50  # 50 x 15s = 12.5 minutes max wait
+CI_MAX_WAIT_SECONDS = CI_MAX_POLL_ATTEMPTS * CI_POLL_INTERVAL_SECONDS
+# Adaptive CI wait (see workflow_steps/ci_wait.py): fast right after a push,
+# backing off during long runs, fast again near the expected finish.
+CI_POLL_MIN_INTERVAL_SECONDS = 5
+CI_POLL_MAX_INTERVAL_SECONDS = 60
+CI_POLL_BACKOFF_FACTOR = 1.5
 CI_MAX_FIX_ATTEMPTS = 4  # Max 4 fix attempts before giving up
 CI_NEW_RUN_POLL_INTERVAL_SECONDS = 5  # Poll for new CI run every 5 seconds
 CI_NEW_RUN_MAX_POLL_ATTEMPTS = 6  # Max 6 attempts = 30 seconds to detect new run
+CI_NEW_RUN_MAX_WAIT_SECONDS = (
+    CI_NEW_RUN_MAX_POLL_ATTEMPTS * CI_NEW_RUN_POLL_INTERVAL_SECONDS
+)
 # Note: CI fix is a tool-using site and uses LLM_INACTIVITY_TIMEOUT_SECONDS (600s).
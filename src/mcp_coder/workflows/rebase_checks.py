@@ -3,8 +3,23 @@
 Runs pytest, pylint and mypy and reduces their results to line-insensitive
 failure keys so the orchestrator in ``rebase.py`` can compare a pre-rebase
 baseline against a post-rebase verification run as a pure set difference.
+
+The three checkers run concurrently. The failure keys of a clean, committed
+tree are cached by content: the key combines the git tree SHA, the Python
+toolchain (interpreter and installed distributions, which include
+pytest/pylint/mypy and their plugins) and the checker config files. A tree
+that was checked before — typically the post-rebase tree verified by the
+previous rebase of a branch, which is the next rebase's baseline — is then
+not checked again.
 """
 
+import hashlib
+import importlib.metadata
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -15,6 +30,31 @@
     run_pylint_check,
     run_pytest_check,
 )
+from mcp_coder.utils.subprocess_runner import execute_command
+from mcp_coder.utils.user_app_data import get_user_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the failure-key format changes, invalidating cached results.
+_CHECK_CACHE_VERSION = 1
+
+# Cached results kept (oldest are pruned).
+CHECK_CACHE_MAX_ENTRIES = 64
+
+# Checker configuration files hashed into the cache key (ignored ones, e.g. a
+# local .pylintrc, are not part of the git tree).
+_CONFIG_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+    "pytest.ini",
+    "conftest.py",
+    ".pylintrc",
+    "pylintrc",
+    "mypy.ini",
+    ".mypy.ini",
+)
 
 
 class CheckRunError(Exception):
@@ -101,29 +141,135 @@ def _mypy_failure_keys(result: MypyResult) -> set[FailureKey]:
     }
 
 
-def _run_all_checks(project_dir: Path) -> set[FailureKey]:
-    """Run pytest, pylint and mypy and union their failure keys.
+def get_check_cache_dir() -> Path:
+    """Return the directory of cached check results.
 
-    Findings (failed tests, lint messages, type errors) become keys; a check
-    that fails to *run* raises ``CheckRunError`` naming the checker.
+    Returns:
+        Path to ~/.mcp_coder/rebase_check_cache.
+    """
+    return get_user_app_data_dir("mcp_coder") / "rebase_check_cache"
+
+
+@lru_cache(maxsize=1)
+def _toolchain_fingerprint() -> str:
+    """Hash the interpreter version and every installed distribution.
+
+    Returns:
+        The hex digest.
+    """
+    distributions = sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in importlib.metadata.distributions()
+    )
+    payload = "\n".join([sys.version, *distributions])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _check_cache_key(project_dir: Path) -> str | None:
+    """Return the content key of the checked-out tree, if it is cacheable.
+
+    Returns:
+        A hex digest, or None if the working tree has uncommitted or
+        untracked changes (or is not a git repository).
+    """
+    tree = execute_command(["git", "rev-parse", "HEAD^{tree}"], cwd=str(project_dir))
+    if tree.return_code != 0:
+        return None
+    status = execute_command(["git", "status", "--porcelain"], cwd=str(project_dir))
+    if status.return_code != 0 or status.stdout.strip():
+        return None
+    digest = hashlib.sha256()
+    digest.update(f"v{_CHECK_CACHE_VERSION}\n{tree.stdout.strip()}\n".encode())
+    digest.update(_toolchain_fingerprint().encode())
+    for name in _CONFIG_FILES:
+        path = project_dir / name
+        if path.is_file():
+            digest.update(f"\n{name}\n".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_cached_keys(cache_key: str) -> set[FailureKey] | None:
+    """Return the cached failure keys for ``cache_key``, if any."""
+    path = get_check_cache_dir() / f"{cache_key}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, list):
+        return None
+    return {tuple(str(part) for part in key) for key in data}
+
+
+def _store_cached_keys(cache_key: str, keys: set[FailureKey]) -> None:
+    """Cache ``keys`` under ``cache_key`` and prune the oldest entries."""
+    cache_dir = get_check_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{cache_key}.json.tmp"
+        tmp.write_text(json.dumps(sorted(keys)), encoding="utf-8")
+        tmp.replace(cache_dir / f"{cache_key}.json")
+        entries = sorted(
+            cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        for stale in entries[CHECK_CACHE_MAX_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.debug("Could not cache check results: %s", exc)
+
+
+def _run_checkers(project_dir: Path) -> set[FailureKey]:
+    """Run pytest, pylint and mypy concurrently and union their failure keys.
 
     Returns:
         The union of failure keys across all three checks.
 
     Raises:
-        CheckRunError: If any check fails to run.
+        CheckRunError: If any check fails to run (the first in checker order
+            is reported).
     """
     checkers: list[tuple[str, Callable[[], set[FailureKey]]]] = [
         ("pytest", lambda: _pytest_failure_keys(run_pytest_check(project_dir))),
         ("pylint", lambda: _pylint_failure_keys(run_pylint_check(project_dir))),
         ("mypy", lambda: _mypy_failure_keys(run_mypy_check(project_dir))),
     ]
+    # Each checker runs its tool in a subprocess; the threads only wait.
+    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+        futures = [(name, executor.submit(run)) for name, run in checkers]
     keys: set[FailureKey] = set()
-    for name, run_checker in checkers:
+    for name, future in futures:
         try:
-            keys |= run_checker()
+            keys |= future.result()
         except CheckRunError as exc:
             raise CheckRunError(f"{name}: {exc}") from exc
         except Exception as exc:  # pylint: disable=broad-exception-caught
             raise CheckRunError(f"{name}: {exc}") from exc
     return keys
+
+
+def _run_all_checks(project_dir: Path, *, use_cache: bool = True) -> set[FailureKey]:
+    """Run pytest, pylint and mypy and union their failure keys.
+
+    Findings (failed tests, lint messages, type errors) become keys; a check
+    that fails to *run* raises ``CheckRunError`` naming the checker. Results
+    for a clean tree are served from, and stored in, the check cache.
+
+    Args:
+        project_dir: Repository to check.
+        use_cache: Set to False to always run the checkers.
+
+    Returns:
+        The union of failure keys across all three checks.
+    """  # Also raises CheckRunError via _run_checkers (a check failed to run).
+    cache_key = _check_cache_key(project_dir) if use_cache else None
+    if cache_key is not None:
+        cached = _load_cached_keys(cache_key)
+        if cached is not None:
+            logger.info(
+                "Reusing check results for this tree (%d failure(s))", len(cached)
+            )
+            return cached
+    keys = _run_checkers(project_dir)
+    if cache_key is not None:
+        _store_cached_keys(cache_key, keys)
+    return keys
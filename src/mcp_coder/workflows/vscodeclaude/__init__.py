@@ -255,7 +255,9 @@
 from .audit import (
     append_run,
     assessment_to_record,
+    get_audit_dir,
     get_audit_file_path,
+    iter_runs,
 )
 
 # Cleanup
@@ -399,8 +401,10 @@
     "apply_assessments",
     "render_explain",
     # Audit trail
+    "get_audit_dir",
     "get_audit_file_path",
     "append_run",
+    "iter_runs",
     "assessment_to_record",
     # Detection (Windows / IO boundary)
     "DetectionSnapshot",
@@ -12,7 +12,10 @@
 pure issue-state layer classifies issues identically to today's cleanup path.
 """
 
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -31,7 +34,7 @@
     get_matching_ignore_label,
     is_status_eligible_for_session,
 )
-from .sessions import get_pid_create_time, load_sessions, save_sessions
+from .sessions import get_pid_create_time, modify_session
 from .status import get_folder_git_status, is_session_stale
 from .types import (
     Decision,
@@ -47,6 +50,10 @@
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sessions (or repos, for issue fetches) assessed concurrently.
+# Each worker mostly waits on a git subprocess or a GitHub request.
+ASSESSMENT_MAX_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class IssueFacts:
@@ -250,25 +257,36 @@ def assess_session(
 def build_assessments(
     sessions: list[VSCodeClaudeSession],
     cached_issues_by_repo: dict[str, dict[int, IssueData]] | None = None,
+    *,
+    timings: dict[str, float] | None = None,
 ) -> dict[str, SessionAssessment]:
     """READ-ONLY builder: snapshot once, then gather + assess each session.
 
     Captures a single :class:`DetectionSnapshot` (R4: all detection caches at
     one instant, no age-skew), then per session: gathers signals, derives frozen
-    :class:`IssueFacts` from the cache (with the individual-issue fallback), reads
-    the git status, and composes a frozen :class:`SessionAssessment`. The prior
-    ``last_active`` baseline is read from the session dict and threaded into the
-    transition layer. Performs NO disk writes — every mutation lives in
-    :func:`apply_assessments`, so read-only consumers (status) can call this
-    safely.
+    :class:`IssueFacts` from the cache, reads the git status, and composes a
+    frozen :class:`SessionAssessment`. The prior ``last_active`` baseline is read
+    from the session dict and threaded into the transition layer. Performs NO
+    disk writes — every mutation lives in :func:`apply_assessments`, so
+    read-only consumers (status) can call this safely.
+
+    Issues missing from the cache are fetched in ONE ``additional_issues``
+    request per repo (instead of one per session), and the per-session work
+    (signals, issue facts, git status subprocesses) runs on a thread pool of at
+    most :data:`ASSESSMENT_MAX_WORKERS`. Every worker reads the same snapshot;
+    assessments and their log lines keep the order of ``sessions``.
 
     Args:
         sessions: Sessions to assess (typically ``load_sessions()["sessions"]``).
         cached_issues_by_repo: Optional pre-fetched issues for issue-state facts.
+        timings: Optional dict that receives the wall-clock seconds of each
+            phase (``snapshot``, ``issue_fetch``, ``sessions``); pass it on to
+            :func:`apply_assessments` to record it in the audit trail.
 
     Returns:
         Mapping of each session's folder path to its :class:`SessionAssessment`.
     """
+    phase_start = time.perf_counter()
     snapshot = capture_detection_snapshot()
 
     ignore_labels = get_ignore_labels()
@@ -277,25 +295,42 @@ def build_assessments(
     except ValueError:
         logger.debug("GitHub username not configured, skipping assignment checks")
         github_username = None
+    snapshot_seconds = time.perf_counter() - phase_start
 
-    assessments: dict[str, SessionAssessment] = {}
-    for session in sessions:
+    phase_start = time.perf_counter()
+    fetched_by_repo = (
+        _fetch_missing_issues_by_repo(sessions, cached_issues_by_repo)
+        if cached_issues_by_repo
+        else {}
+    )
+    issue_fetch_seconds = time.perf_counter() - phase_start
+
+    def _assess(
+        session: VSCodeClaudeSession,
+    ) -> tuple[DetectionSignals, SessionAssessment]:
         signals = gather_signals(session, snapshot)
 
         # Mirror get_stale_sessions: issue-state facts (and the individual-issue
-        # API fallback inside _issue_facts) are derived ONLY when a cache is
-        # available. Without one, default to an all-clear (eligible) IssueFacts
-        # so the read-only liveness projection stays network-free.
+        # API fallback) are derived ONLY when a cache is available. Without one,
+        # default to an all-clear (eligible) IssueFacts so the read-only
+        # liveness projection stays network-free.
         if cached_issues_by_repo:
             repo_issues = cached_issues_by_repo.get(session["repo"], {})
             cached_issue = repo_issues.get(session["issue_number"])
             cached_for_stale_check = repo_issues if cached_issue is not None else None
+            if cached_issue is None:
+                fetched = fetched_by_repo.get(session["repo"])
+                if fetched is not None:
+                    cached_issue = fetched.get(session["issue_number"])
+                    if cached_issue is not None:
+                        cached_for_stale_check = fetched
             issue_facts = _issue_facts(
                 session,
                 cached_issue,
                 github_username=github_username,
                 ignore_labels=ignore_labels,
                 cached_for_stale_check=cached_for_stale_check,
+                fetch_missing=False,  # already fetched per repo above
             )
         else:
             issue_facts = IssueFacts(
@@ -317,8 +352,36 @@ def build_assessments(
             directory_empty=signals.directory_empty,
             prior_last_active=session.get("last_active"),
         )
+        return signals, assessment
+
+    phase_start = time.perf_counter()
+    if len(sessions) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(ASSESSMENT_MAX_WORKERS, len(sessions)),
+            thread_name_prefix="vscodeclaude-assess",
+        ) as executor:
+            results = list(executor.map(_assess, sessions))
+    else:
+        results = [_assess(session) for session in sessions]
+    sessions_seconds = time.perf_counter() - phase_start
+
+    assessments: dict[str, SessionAssessment] = {}
+    for session, (signals, assessment) in zip(sessions, results):
         assessments[session["folder"]] = assessment
         _log_assessment(session, signals, assessment)
+
+    logger.debug(
+        "build_assessments: %d sessions, snapshot=%.2fs issue_fetch=%.2fs "
+        "sessions=%.2fs",
+        len(sessions),
+        snapshot_seconds,
+        issue_fetch_seconds,
+        sessions_seconds,
+    )
+    if timings is not None:
+        timings["snapshot"] = round(snapshot_seconds, 3)
+        timings["issue_fetch"] = round(issue_fetch_seconds, 3)
+        timings["sessions"] = round(sessions_seconds, 3)
     return assessments
 
 
@@ -372,7 +435,7 @@ def build_active_session_set(
     Computes one ``DetectionSnapshot`` and assesses every session, projecting the
     result onto the legacy ``dict[folder, bool]`` contract that the cleanup,
     restart, and status consumers still read. READ-ONLY: unlike the apply path
-    this performs no ``sessions.json`` writes — the PID refresh and ``last_active``
+    this performs no session-store writes — the PID refresh and ``last_active``
     advance moved into :func:`apply_assessments`.
 
     Returns:
@@ -406,19 +469,34 @@ def render_explain(assessments: dict[str, SessionAssessment]) -> str:
     return "\n\n".join(assessment.to_explain() for assessment in assessments.values())
 
 
+def _apply_assessment(assessment: SessionAssessment, session: dict[str, Any]) -> None:
+    """Refresh the stale PID and advance ``last_active`` of one stored session."""
+    if (
+        assessment.pid_needs_refresh
+        and assessment.found_pid is not None
+        and assessment.found_pid != session.get("vscode_pid")
+    ):
+        session["vscode_pid"] = assessment.found_pid
+        session["vscode_pid_create_time"] = get_pid_create_time(assessment.found_pid)
+    session["last_active"] = assessment.verdict.active
+    session["last_active_rule"] = assessment.verdict.rule.value
+
+
 def apply_assessments(
     assessments: dict[str, SessionAssessment],
     sessions: list[VSCodeClaudeSession],
     *,
     write_audit: bool,
+    timings: dict[str, float] | None = None,
 ) -> None:
     """Apply-only: refresh stale PIDs, advance ``last_active``, write the audit.
 
-    The single mutation point of the pipeline. Loads the session store once and
-    applies each assessment's PID refresh and ``last_active``/``last_active_rule``
-    advance over the LIVE post-cleanup store — only surviving sessions are mutated
-    (sessions deleted by cleanup/restart are correctly gone from the store), then
-    writes the store back in ONE atomic save (no double-write).
+    The single mutation point of the pipeline. Applies each assessment's PID
+    refresh and ``last_active``/``last_active_rule`` advance to its session's
+    row in the LIVE post-cleanup store, one transaction per session — only
+    surviving sessions are mutated (sessions deleted by cleanup/restart, or by
+    another coordinator process, are skipped), and sessions added concurrently
+    by another process are never touched or dropped.
 
     When ``write_audit`` is True, also appends ONE audit run-block. The audit is
     sourced from ``assessments`` — the FULL set assessed at build time, threaded
@@ -436,24 +514,11 @@ def apply_assessments(
             cleanup/restart removed any). Supplies repo/issue/status for the audit
             records so deleted sessions still appear in the trail.
         write_audit: When True, append one run-block to the audit trail.
+        timings: Optional per-phase timings filled by :func:`build_assessments`;
+            recorded in the audit run-block.
     """
-    store = load_sessions()
-    for session in store["sessions"]:
-        assessment = assessments.get(session["folder"])
-        if assessment is None:
-            continue
-        if (
-            assessment.pid_needs_refresh
-            and assessment.found_pid is not None
-            and assessment.found_pid != session.get("vscode_pid")
-        ):
-            session["vscode_pid"] = assessment.found_pid
-            session["vscode_pid_create_time"] = get_pid_create_time(
-                assessment.found_pid
-            )
-        session["last_active"] = assessment.verdict.active
-        session["last_active_rule"] = assessment.verdict.rule.value
-    save_sessions(store)
+    for folder, assessment in assessments.items():
+        modify_session(folder, functools.partial(_apply_assessment, assessment))
     if write_audit:
         sessions_by_folder = {s["folder"]: s for s in sessions}
         audit_records: list[dict[str, Any]] = [
@@ -461,7 +526,7 @@ def apply_assessments(
             for folder, assessment in assessments.items()
             if folder in sessions_by_folder
         ]
-        append_run(audit_records)
+        append_run(audit_records, timings=timings)
 
 
 def _fetch_issue_individually(
@@ -474,6 +539,19 @@ def _fetch_issue_individually(
     caching layer with ``additional_issues=[issue_number]`` so the missing issue
     is populated without a double API round-trip.
 
+    Returns:
+        The fetched issues keyed by issue number, or ``None`` when the fetch
+        fails.
+    """
+    return _fetch_missing_issues(repo_full_name, [issue_number])
+
+
+def _fetch_missing_issues(
+    repo_full_name: str,
+    issue_numbers: list[int],
+) -> dict[int, IssueData] | None:
+    """Fetch a repo's cached issues plus ``issue_numbers`` in one request.
+
     Returns:
         The fetched issues keyed by issue number, or ``None`` when the fetch
         fails.
@@ -484,19 +562,54 @@ def _fetch_issue_individually(
         fetched = get_all_cached_issues(
             RepoIdentifier.from_full_name(repo_full_name),
             issue_manager=issue_manager,
-            additional_issues=[issue_number],
+            additional_issues=issue_numbers,
         )
         return {issue["number"]: issue for issue in fetched}
     except (
         Exception
     ):  # pylint: disable=broad-exception-caught  # TODO: narrow exception type
         logger.debug(
-            "Failed to fetch issue #%d individually; skipping eligibility checks",
-            issue_number,
+            "Failed to fetch issue(s) %s of %s; skipping eligibility checks",
+            ", ".join(f"#{n}" for n in issue_numbers),
+            repo_full_name,
         )
         return None
 
 
+def _fetch_missing_issues_by_repo(
+    sessions: list[VSCodeClaudeSession],
+    cached_issues_by_repo: dict[str, dict[int, IssueData]],
+) -> dict[str, dict[int, IssueData] | None]:
+    """Fetch every session issue missing from the cache, batched per repo.
+
+    Issue numbers are de-duplicated and requested in one ``additional_issues``
+    fetch per repo; repos are fetched concurrently.
+
+    Returns:
+        Per repo with missing issues: the fetched issues keyed by number, or
+        ``None`` when that repo's fetch failed.
+    """
+    missing: dict[str, list[int]] = {}
+    for session in sessions:
+        repo_issues = cached_issues_by_repo.get(session["repo"], {})
+        if session["issue_number"] not in repo_issues:
+            numbers = missing.setdefault(session["repo"], [])
+            if session["issue_number"] not in numbers:
+                numbers.append(session["issue_number"])
+    if not missing:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(ASSESSMENT_MAX_WORKERS, len(missing)),
+        thread_name_prefix="vscodeclaude-issues",
+    ) as executor:
+        futures = {
+            repo: executor.submit(_fetch_missing_issues, repo, numbers)
+            for repo, numbers in missing.items()
+        }
+        return {repo: future.result() for repo, future in futures.items()}
+
+
 def _issue_facts(
     session: VSCodeClaudeSession,
     cached_issue: IssueData | None,
@@ -504,6 +617,7 @@ def _issue_facts(
     github_username: str | None,
     ignore_labels: set[str],
     cached_for_stale_check: dict[int, IssueData] | None,
+    fetch_missing: bool = True,
 ) -> IssueFacts:
     """Derive frozen :class:`IssueFacts` from cached issue data.
 
@@ -513,7 +627,9 @@ def _issue_facts(
     re-implementing them.
 
     When ``cached_issue`` is ``None`` (the issue is missing from the cache) the
-    individual-issue API fallback is invoked to populate it. Staleness is computed
+    individual-issue API fallback is invoked to populate it, unless
+    ``fetch_missing`` is False (:func:`build_assessments` already fetched the
+    missing issues in one batch per repo). Staleness is computed
     ONLY when the issue is not closed/blocked/unassigned/ineligible — calling
     ``is_session_stale`` on such an issue triggers a spurious staleness warning the
     current code explicitly guards against (cleanup.py short-circuit).
@@ -526,7 +642,7 @@ def _issue_facts(
     stale_cache = cached_for_stale_check
 
     # Individual-issue API fallback when the issue is missing from the cache.
-    if issue is None:
+    if issue is None and fetch_missing:
         fetched_dict = _fetch_issue_individually(
             session["repo"], session["issue_number"]
         )
@@ -1,9 +1,20 @@
 """Persisted audit trail for vscodeclaude session assessments.
 
-One **global** file (sibling of ``sessions.json``), one **run-block** per command
-invocation (spanning all repos), trimmed to the **last 50 runs** as a ring buffer,
-written **only** by ``apply()`` runs. Reuses the ``sessions.json`` write discipline:
-``mkdir(parents=True, exist_ok=True)`` + ``write_text(json.dumps(..., indent=2))``.
+One **global** append-only store (a directory next to ``sessions.json``), one
+**run-block** per command invocation (spanning all repos), written **only** by
+``apply()`` runs. Each run-block is one JSON line appended to the newest
+*segment* file (``runs-000001.jsonl``, ``runs-000002.jsonl``, ...):
+
+- appending never rewrites earlier runs, so its cost does not grow with
+  retention and an interrupted write can at most lose its own line,
+- a segment is closed once it reaches :data:`SEGMENT_MAX_BYTES`,
+- the ring buffer is trimmed by deleting whole old segments once the newer
+  segments hold at least :data:`MAX_AUDIT_RUNS` runs (so between
+  ``MAX_AUDIT_RUNS`` and ``MAX_AUDIT_RUNS`` + one segment of runs are kept),
+- :func:`iter_runs` streams runs newest-first, one segment at a time.
+
+The pre-segment single-file trail (``vscodeclaude_audit.json``) is imported
+into the first segment on the first append, then removed.
 
 The serializer is NOT re-implemented here: :func:`assessment_to_record` delegates to
 the ONE serializer (:meth:`SessionAssessment.to_audit_record`) so the audit trail,
@@ -13,6 +24,7 @@
 
 import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -22,17 +34,35 @@
 
 logger = logging.getLogger(__name__)
 
-# Ring-buffer size: keep at most this many run-blocks (newest kept).
-MAX_AUDIT_RUNS = 50
+# Ring-buffer size: keep at least this many run-blocks (newest kept).
+MAX_AUDIT_RUNS = 5000
 
+# A segment is closed (and a new one started) once it reaches this size.
+SEGMENT_MAX_BYTES = 1024 * 1024
 
-def get_audit_file_path() -> Path:
-    """Get path to the global audit JSON file.
+_SEGMENT_GLOB = "runs-*.jsonl"
+
+
+def get_audit_dir() -> Path:
+    """Get path to the global audit segment directory.
 
     Returns:
-        Path to ~/.mcp_coder/coordinator_cache/vscodeclaude_audit.json
+        Path to ~/.mcp_coder/coordinator_cache/vscodeclaude_audit
         (global, a sibling of vscodeclaude_sessions.json).
     """
+    return (
+        get_user_app_data_dir("mcp_coder") / "coordinator_cache" / "vscodeclaude_audit"
+    )
+
+
+def get_audit_file_path() -> Path:
+    """Get path to the legacy single-file audit JSON.
+
+    Only read to import its runs into the segment store.
+
+    Returns:
+        Path to ~/.mcp_coder/coordinator_cache/vscodeclaude_audit.json.
+    """
     return (
         get_user_app_data_dir("mcp_coder")
         / "coordinator_cache"
@@ -40,50 +70,186 @@ def get_audit_file_path() -> Path:
     )
 
 
-def _load_audit() -> dict[str, Any]:
-    """Load the audit file, returning ``{"runs": []}`` on any failure.
+def _segment_path(audit_dir: Path, index: int) -> Path:
+    return audit_dir / f"runs-{index:06d}.jsonl"
+
+
+def _segment_index(path: Path) -> int:
+    try:
+        return int(path.stem.split("-", 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _list_segments(audit_dir: Path) -> list[Path]:
+    """Return the segment files, oldest first."""
+    if not audit_dir.is_dir():
+        return []
+    segments = [p for p in audit_dir.glob(_SEGMENT_GLOB) if _segment_index(p) >= 0]
+    return sorted(segments, key=_segment_index)
+
+
+def _legacy_audit_file(audit_dir: Path) -> Path:
+    """Locate the legacy audit JSON.
+
+    Returns:
+        The legacy audit file path, next to the segment directory.
+    """
+    return audit_dir.with_name(get_audit_file_path().name)
+
+
+def _load_legacy_runs(audit_file: Path) -> list[dict[str, Any]]:
+    """Load the runs of the legacy audit JSON, or ``[]`` on any failure.
 
     Returns:
-        The parsed audit dict with a guaranteed ``runs`` list.
+        The legacy run-blocks, oldest first.
     """
-    audit_file = get_audit_file_path()
     if not audit_file.exists():
-        return {"runs": []}
+        return []
     try:
-        data: dict[str, Any] = json.loads(audit_file.read_text(encoding="utf-8"))
-        if "runs" not in data:
-            data["runs"] = []
-        return data
+        data = json.loads(audit_file.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError) as e:
-        logger.warning("Failed to load audit file: %s", e)
-        return {"runs": []}
+        logger.warning("Failed to load legacy audit file: %s", e)
+        return []
+    runs = data.get("runs", []) if isinstance(data, dict) else []
+    return [run for run in runs if isinstance(run, dict)]
+
+
+def _import_legacy_file(audit_dir: Path) -> None:
+    """Move the runs of the legacy audit JSON into the first segment."""
+    legacy_file = _legacy_audit_file(audit_dir)
+    legacy_runs = _load_legacy_runs(legacy_file)
+    if legacy_runs:
+        _segment_path(audit_dir, 1).write_text(
+            "".join(json.dumps(run) + "\n" for run in legacy_runs),
+            encoding="utf-8",
+        )
+    try:
+        legacy_file.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Failed to remove legacy audit file: %s", e)
+
+
+def _count_runs(segment: Path) -> int:
+    try:
+        return segment.read_bytes().count(b"\n")
+    except OSError:
+        return 0
+
+
+def _trim_segments(segments: list[Path], max_runs: int) -> None:
+    """Delete old segments whose runs are all beyond the newest ``max_runs``.
+
+    Args:
+        segments: All segments, oldest first; the newest is never deleted.
+        max_runs: Number of newest runs that must stay available.
+    """
+    newer_runs = 0
+    for index in range(len(segments) - 1, -1, -1):
+        if newer_runs >= max_runs:
+            for old in segments[: index + 1]:
+                try:
+                    old.unlink()
+                except OSError as e:
+                    logger.warning("Failed to delete audit segment %s: %s", old, e)
+            return
+        newer_runs += _count_runs(segments[index])
 
 
 def append_run(
-    records: list[dict[str, Any]], *, max_runs: int = MAX_AUDIT_RUNS
+    records: list[dict[str, Any]],
+    *,
+    max_runs: int = MAX_AUDIT_RUNS,
+    timings: dict[str, float] | None = None,
+    segment_max_bytes: int = SEGMENT_MAX_BYTES,
 ) -> None:
-    """Append one run-block, trim to the last ``max_runs`` runs (ring buffer).
+    """Append one run-block as a JSON line to the newest segment.
 
-    Reuses the ``sessions.json`` atomic-rewrite discipline: load the whole file,
-    append the new run-block (newest last), trim to the last ``max_runs`` runs,
-    then rewrite the file in one ``write_text``.
+    A new segment is started when the newest one would exceed
+    ``segment_max_bytes``; old segments are then trimmed so that at least the
+    newest ``max_runs`` runs remain.
 
     Args:
         records: One audit record per assessed session for this invocation.
-        max_runs: Ring-buffer size; only the newest ``max_runs`` runs are kept.
+        max_runs: Ring-buffer size; at least the newest ``max_runs`` runs are
+            kept (whole segments are deleted, never single runs).
+        timings: Optional per-phase seconds of the run (e.g. from
+            ``build_assessments``), stored as the run-block's ``timings``.
+        segment_max_bytes: Size at which a segment is closed.
     """
-    data = _load_audit()
-    data["runs"].append(
-        {
-            "run_at": datetime.now(timezone.utc).isoformat(),
-            "records": records,
-        }
-    )
-    data["runs"] = data["runs"][-max_runs:]
+    run: dict[str, Any] = {
+        "run_at": datetime.now(timezone.utc).isoformat(),
+        "records": records,
+    }
+    if timings:
+        run["timings"] = dict(timings)
+    line = (json.dumps(run) + "\n").encode("utf-8")
+
+    audit_dir = get_audit_dir()
+    audit_dir.mkdir(parents=True, exist_ok=True)
+    segments = _list_segments(audit_dir)
+    if not segments:
+        _import_legacy_file(audit_dir)
+        segments = _list_segments(audit_dir)
+
+    rotated = False
+    if not segments:
+        segment = _segment_path(audit_dir, 1)
+        segments = [segment]
+    else:
+        segment = segments[-1]
+        size = segment.stat().st_size
+        if size > 0 and size + len(line) > segment_max_bytes:
+            segment = _segment_path(audit_dir, _segment_index(segment) + 1)
+            segments.append(segment)
+            rotated = True
+        elif size > 0:
+            with open(segment, "rb") as f:
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    # Terminate a line torn by an interrupted earlier write.
+                    line = b"\n" + line
+
+    with open(segment, "ab") as f:
+        f.write(line)
+
+    if rotated:
+        # Older segments may now be entirely beyond the retained runs.
+        _trim_segments(segments, max_runs)
 
-    audit_file = get_audit_file_path()
-    audit_file.parent.mkdir(parents=True, exist_ok=True)
-    audit_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+def iter_runs(limit: int | None = None) -> Iterator[dict[str, Any]]:
+    """Stream run-blocks newest-first, reading one segment at a time.
+
+    Lines that are not valid JSON (e.g. torn by an interrupted write) are
+    skipped.
+
+    Args:
+        limit: Maximum number of runs to yield (all when ``None``).
+
+    Yields:
+        Run-block dicts with ``run_at``, ``records`` and optional ``timings``.
+    """
+    if limit is not None and limit <= 0:
+        return
+    yielded = 0
+    for segment in reversed(_list_segments(get_audit_dir())):
+        try:
+            lines = segment.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            logger.warning("Failed to read audit segment %s: %s", segment, e)
+            continue
+        for raw in reversed(lines):
+            try:
+                run = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(run, dict):
+                continue
+            yield run
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
 
 
 def assessment_to_record(
@@ -12,14 +12,17 @@
 as plain bools.
 """
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .process_tracker import build_folder_index, find_folder_pids
 from .sessions import (
     HAS_WIN32GUI,
     LAUNCH_GRACE_SECONDS,
+    _get_vscode_folder_index,
     _get_vscode_pids,
     _get_vscode_processes,
     _get_vscode_window_titles,
@@ -40,14 +43,23 @@ class DetectionSnapshot:
     window_titles: tuple[tuple[int, str], ...]  # (owning_pid, title)
     pids: frozenset[int]
     captured_at: datetime
+    # Folder path/name -> PIDs over ``processes``; built from them if omitted.
+    folder_pids: Mapping[str, list[int]] = field(default_factory=dict, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index ``processes`` by folder when no index was passed in."""
+        if not self.folder_pids and self.processes:
+            object.__setattr__(self, "folder_pids", build_folder_index(self.processes))
 
 
 def capture_detection_snapshot() -> DetectionSnapshot:
     """Populate ALL THREE caches at one instant and freeze the result.
 
-    Refreshes the process cache, then the window-title cache (which also
-    refreshes the PID cache), then reads the PID cache. Capturing them in
+    Refreshes the process tracker, then the window-title cache, then reads
+    the PIDs (derived from the same process refresh). Capturing them in
     immediate succession is what guarantees R4 (no age-skew between signals).
+    The tracker's folder index is carried along so per-session cmdline
+    checks are lookups.
 
     Returns:
         A frozen :class:`DetectionSnapshot` over the just-refreshed caches.
@@ -60,6 +72,7 @@ def capture_detection_snapshot() -> DetectionSnapshot:
         window_titles=tuple(window_titles),
         pids=frozenset(pids),
         captured_at=datetime.now(timezone.utc),
+        folder_pids=_get_vscode_folder_index(processes),
     )
 
 
@@ -99,18 +112,15 @@ def _title_binds(
 def _cmdline_scan(
     snapshot: DetectionSnapshot, folder_path: str
 ) -> tuple[bool, int | None]:
-    """Scan snapshot processes for one referencing the folder by path or name.
+    """Look up a snapshot process referencing the folder by path or name.
 
     Returns:
         ``(matched, pid)`` where ``pid`` is the first matching VSCode PID, or
         ``(False, None)`` when no process references the folder.
     """
-    folder_str = str(folder_path).lower()
-    folder_name = Path(folder_path).name.lower()
-    for proc in snapshot.processes:
-        cmdline_lower = proc.get("cmdline_lower", "")
-        if folder_str in cmdline_lower or folder_name in cmdline_lower:
-            return True, proc.get("pid")
+    pids = find_folder_pids(snapshot.folder_pids, folder_path)
+    if pids:
+        return True, pids[0]
     return False, None
 
 
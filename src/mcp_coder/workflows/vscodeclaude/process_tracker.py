@@ -0,0 +1,199 @@
+"""Incremental tracker of running VSCode processes.
+
+Finding the VSCode processes used to read the name *and* command line of
+every process on the machine on each refresh, and every per-session check
+then substring-scanned all VSCode command lines. ``VSCodeProcessTracker``
+instead remembers each process it has seen by ``(pid, create_time)``:
+
+- a refresh still lists all processes (pid, name, create_time), but reads
+  the command line only of VSCode processes it has not seen before,
+- processes that exited (or whose PID was reused) are evicted,
+- a folder -> PIDs index over the VSCode command lines
+  (:func:`build_folder_index`) is rebuilt only when the set of VSCode
+  processes changed, so "is this folder open?" is a dict lookup
+  (:func:`find_folder_pids`).
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Any
+from urllib.parse import unquote
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Exact process names for VSCode on each platform.
+# Using exact match prevents false positives from processes whose names
+# contain "code" as a substring (e.g. "my-code-tool.exe").
+VSCODE_PROCESS_NAMES = {"code.exe", "code"}  # Windows / Linux+macOS
+
+_WORKSPACE_SUFFIX = ".code-workspace"
+_PATH_SEPARATORS = re.compile(r"[\\/]")
+
+# (pid, create_time) identifying one process across PID reuse.
+_ProcessKey = tuple[int, float | None]
+
+
+def _folder_keys(arg: str) -> Iterable[str]:
+    """Yield the index keys of one lowercased command-line argument.
+
+    An argument contributes its full path and its last path component;
+    ``.code-workspace`` files also contribute their stem (the workspace file
+    is named after its session folder). ``--flag=value`` arguments and
+    ``file://`` URIs (``--folder-uri``) are reduced to their path first.
+    """
+    value = arg
+    if value.startswith("--") and "=" in value:
+        value = value.split("=", 1)[1]
+    if value.startswith("file://"):
+        value = unquote(value[len("file://") :])
+        if len(value) > 2 and value[0] == "/" and value[2] == ":":
+            value = value[1:]  # /c:/path -> c:/path
+    value = value.rstrip("/\\") or value
+    yield value
+    name = _PATH_SEPARATORS.split(value)[-1]
+    if name != value:
+        yield name
+    if name.endswith(_WORKSPACE_SUFFIX):
+        yield name[: -len(_WORKSPACE_SUFFIX)]
+
+
+def build_folder_index(
+    processes: Iterable[Mapping[str, Any]],
+) -> dict[str, list[int]]:
+    """Map every path and path name on VSCode command lines to their PIDs.
+
+    Args:
+        processes: Process dicts with ``pid`` and either ``args_lower``
+            (lowercased argv) or ``cmdline_lower`` (split on whitespace).
+
+    Returns:
+        Lowercased path or folder name -> PIDs, in process order.
+    """
+    index: dict[str, list[int]] = {}
+    for proc in processes:
+        pid = proc.get("pid")
+        if pid is None:
+            continue
+        args = proc.get("args_lower")
+        if args is None:
+            args = str(proc.get("cmdline_lower", "")).split()
+        for arg in args:
+            for key in _folder_keys(arg):
+                pids = index.setdefault(key, [])
+                if pid not in pids:
+                    pids.append(pid)
+    return index
+
+
+def find_folder_pids(index: Mapping[str, list[int]], folder_path: str) -> list[int]:
+    """Return the PIDs whose command line references ``folder_path``.
+
+    A process matches by the folder's full path or by its name (which also
+    covers the session's ``<folder>.code-workspace`` launcher).
+
+    Returns:
+        Matching PIDs, full-path matches first; empty if none.
+    """
+    folder_str = str(folder_path).lower().rstrip("/\\")
+    folder_name = _PATH_SEPARATORS.split(folder_str)[-1]
+    pids = list(index.get(folder_str, ()))
+    for pid in index.get(folder_name, ()):
+        if pid not in pids:
+            pids.append(pid)
+    return pids
+
+
+class VSCodeProcessTracker:
+    """VSCode processes on this machine, updated incrementally per refresh."""
+
+    def __init__(self) -> None:
+        """Create a tracker that has not scanned yet."""
+        self._lock = threading.Lock()
+        # Every process seen by the last refresh; None for non-VSCode ones.
+        self._seen: dict[_ProcessKey, dict[str, Any] | None] = {}
+        self._processes: list[dict[str, Any]] = []
+        self._folder_index: dict[str, list[int]] = {}
+        self._scanned = False
+
+    @property
+    def scanned(self) -> bool:
+        """True once ``refresh`` ran (and ``invalidate`` was not called since)."""
+        return self._scanned
+
+    @property
+    def processes(self) -> list[dict[str, Any]]:
+        """VSCode processes of the last refresh.
+
+        Each dict has ``pid``, ``name``, ``create_time``, ``args_lower`` and
+        ``cmdline_lower``. The list object is replaced (never mutated) when
+        the set of processes changes.
+        """
+        return self._processes
+
+    @property
+    def folder_index(self) -> dict[str, list[int]]:
+        """:func:`build_folder_index` over :attr:`processes`."""
+        return self._folder_index
+
+    def refresh(self) -> list[dict[str, Any]]:
+        """Re-list processes, reading command lines of new VSCode processes only.
+
+        Returns:
+            The VSCode processes now running.
+        """
+        with self._lock:
+            seen: dict[_ProcessKey, dict[str, Any] | None] = {}
+            added = 0
+            for proc in psutil.process_iter(["pid", "name", "create_time"]):
+                try:
+                    info = proc.info
+                    key: _ProcessKey = (info.get("pid"), info.get("create_time"))
+                    if key in self._seen:
+                        seen[key] = self._seen[key]
+                        continue
+                    name = (info.get("name") or "").lower()
+                    if name not in VSCODE_PROCESS_NAMES:
+                        seen[key] = None
+                        continue
+                    args = tuple(str(arg).lower() for arg in proc.cmdline() or [])
+                except (
+                    psutil.NoSuchProcess,
+                    psutil.AccessDenied,
+                    psutil.ZombieProcess,
+                ):
+                    continue
+                seen[key] = {
+                    "pid": key[0],
+                    "name": name,
+                    "create_time": key[1],
+                    "args_lower": args,
+                    "cmdline_lower": " ".join(args),
+                }
+                added += 1
+
+            removed = sum(
+                1 for key, entry in self._seen.items() if entry and key not in seen
+            )
+            self._seen = seen
+            if added or removed or not self._scanned:
+                self._processes = [entry for entry in seen.values() if entry]
+                self._folder_index = build_folder_index(self._processes)
+            self._scanned = True
+            logger.debug(
+                "Tracking %d VSCode processes (%d new, %d exited)",
+                len(self._processes),
+                added,
+                removed,
+            )
+            return self._processes
+
+    def invalidate(self) -> None:
+        """Make the next ``processes`` consumer refresh first.
+
+        Known processes are kept, so that refresh stays incremental.
+        """
+        self._scanned = False
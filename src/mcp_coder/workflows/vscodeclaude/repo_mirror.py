@@ -0,0 +1,167 @@
+"""Shared local mirrors that new vscodeclaude session clones borrow from.
+
+Every new session folder is a full ``git clone`` of its repository. With
+``MCP_CODER_VSCODECLAUDE_GIT_MIRROR=1`` the coordinator instead keeps one
+bare mirror per repository under ``~/.mcp_coder/git_mirrors`` and clones
+session folders with ``git clone --reference <mirror>``:
+
+- the mirror is created on first use and fetched at most once per
+  :data:`MIRROR_REFRESH_SECONDS` (i.e. once per coordinator tick),
+- a session clone then only downloads objects the mirror does not have yet,
+  and shares the mirror's objects on disk (through ``objects/info/alternates``)
+  instead of copying them,
+- automatic ``git gc`` is disabled in the mirror, so objects a session
+  borrowed are never pruned, even after force-pushes.
+
+Because session clones borrow objects, a mirror must not be deleted while
+sessions cloned from it still exist. Any mirror failure falls back to a
+plain clone.
+"""
+
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from ...utils.subprocess_runner import CommandOptions, execute_subprocess
+from ...utils.user_app_data import get_user_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Set to "1" to clone new session folders with --reference to a shared mirror.
+GIT_MIRROR_ENV = "MCP_CODER_VSCODECLAUDE_GIT_MIRROR"
+
+# Minimum seconds between two fetches of the same mirror.
+MIRROR_REFRESH_SECONDS = 60.0
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+_lock = threading.Lock()
+# Mirror path -> time.monotonic() of its last successful fetch.
+_last_refresh: dict[Path, float] = {}
+
+
+def git_mirror_enabled() -> bool:
+    """Return True when ``MCP_CODER_VSCODECLAUDE_GIT_MIRROR`` is ``"1"``."""
+    return os.environ.get(GIT_MIRROR_ENV, "0").strip() == "1"
+
+
+def get_mirror_dir() -> Path:
+    """Return the directory holding the per-repository mirrors."""
+    return get_user_app_data_dir("mcp_coder") / "git_mirrors"
+
+
+def get_mirror_path(repo_url: str) -> Path:
+    """Return the mirror path for ``repo_url``.
+
+    The name is built from the URL's last two path components, e.g.
+    ``https://github.com/owner/repo.git`` -> ``owner_repo.git``.
+    """
+    path = re.sub(r"\.git$", "", repo_url.rstrip("/"))
+    parts = [p for p in re.split(r"[/:\\]", path) if p][-2:]
+    name = _UNSAFE_NAME_CHARS.sub("_", "_".join(parts)) or "repo"
+    return get_mirror_dir() / f"{name}.git"
+
+
+def _git(args: list[str], cwd: Path | None = None) -> bool:
+    """Run a git command (failures are logged).
+
+    Returns:
+        True if the command succeeded.
+    """
+    result = execute_subprocess(
+        ["git", *args], CommandOptions(cwd=str(cwd) if cwd else None)
+    )
+    if result.return_code != 0:
+        logger.warning("git %s failed for mirror: %s", args[0], result.stderr.strip())
+        return False
+    return True
+
+
+def _create_mirror(repo_url: str, mirror_path: Path) -> bool:
+    """Clone a bare mirror of ``repo_url`` to ``mirror_path``.
+
+    The clone goes to a temporary sibling first and is renamed into place, so
+    a concurrent coordinator never sees a half-created mirror.
+
+    Returns:
+        True if the mirror was created.
+    """
+    mirror_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = mirror_path.with_name(f"{mirror_path.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    logger.info("Creating git mirror of %s in %s", repo_url, mirror_path)
+    if not (
+        _git(["clone", "--bare", "--quiet", repo_url, str(tmp_path)])
+        and _git(["config", "gc.auto", "0"], cwd=tmp_path)
+    ):
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return False
+    try:
+        tmp_path.rename(mirror_path)
+    except OSError:
+        # Another process created it first; use theirs.
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        return mirror_path.exists()
+    return True
+
+
+def ensure_repo_mirror(repo_url: str) -> Path | None:
+    """Create or refresh the mirror of ``repo_url``.
+
+    The mirror is fetched only if its last fetch by this process is older
+    than :data:`MIRROR_REFRESH_SECONDS`; a stale mirror is still usable, as
+    the clone fetches whatever it lacks from ``repo_url`` itself.
+
+    Returns:
+        The mirror path, or None if the mirror could not be created.
+    """
+    mirror_path = get_mirror_path(repo_url)
+    with _lock:
+        if not (mirror_path / "HEAD").exists():
+            if not _create_mirror(repo_url, mirror_path):
+                return None
+            _last_refresh[mirror_path] = time.monotonic()
+            return mirror_path
+
+        last = _last_refresh.get(mirror_path)
+        if last is None or time.monotonic() - last >= MIRROR_REFRESH_SECONDS:
+            logger.info("Refreshing git mirror %s", mirror_path)
+            if _git(
+                [
+                    "fetch",
+                    "--prune",
+                    "--quiet",
+                    repo_url,
+                    "+refs/heads/*:refs/heads/*",
+                ],
+                cwd=mirror_path,
+            ):
+                _last_refresh[mirror_path] = time.monotonic()
+        return mirror_path
+
+
+def clone_with_mirror(repo_url: str, folder_path: Path) -> bool:
+    """Clone ``repo_url`` into ``folder_path``, borrowing objects from its mirror.
+
+    Returns:
+        True if the clone succeeded; False if the mirror is disabled or
+        unavailable, or the clone failed (``folder_path`` is then empty again).
+    """
+    if not git_mirror_enabled():
+        return False
+    mirror_path = ensure_repo_mirror(repo_url)
+    if mirror_path is None:
+        return False
+    logger.info("Cloning %s into %s (reference %s)", repo_url, folder_path, mirror_path)
+    if _git(["clone", "--reference", str(mirror_path), repo_url, str(folder_path)]):
+        return True
+    for child in folder_path.iterdir() if folder_path.exists() else ():
+        if child.is_dir():
+            shutil.rmtree(child, ignore_errors=True)
+        else:
+            child.unlink(missing_ok=True)
+    return False
@@ -10,12 +10,19 @@
 """
 
 import os
+import shutil
 import subprocess
 import sys
 import traceback
 from pathlib import Path
 
 from .types import SessionSpec, read_session_spec
+from .venv_template import (
+    clone_venv_template,
+    save_venv_template,
+    venv_template_key,
+    venv_templates_enabled,
+)
 
 # MCP tool timeout (ms) forwarded to subprocesses. See
 # src/mcp_coder/llm/claude_settings.py for the canonical value.
@@ -108,7 +115,8 @@ def build_subprocess_env(spec: SessionSpec, cwd: Path) -> dict[str, str]:
 def build_install_argv(spec: SessionSpec, cwd: Path) -> list[str]:
     """Build the argv that provisions the project venv via ``install.py``.
 
-    Mirrors the exact flags used by the retired shell templates; appends
+    Mirrors the exact flags used by the retired shell templates, plus
+    ``--relocatable`` so the venv can become a venv template; appends
     ``--skip-overrides`` iff ``spec.skip_github_install`` is set.
 
     Args:
@@ -130,6 +138,7 @@ def build_install_argv(spec: SessionSpec, cwd: Path) -> list[str]:
         "dev",
         "--use-sync",
         "--refresh",
+        "--relocatable",
     ]
     if spec.skip_github_install:
         argv.append("--skip-overrides")
@@ -333,6 +342,48 @@ def orchestrate(spec: SessionSpec, cwd: Path, env: dict[str, str]) -> None:
     )
 
 
+def provision_venv(spec: SessionSpec, cwd: Path, env: dict[str, str]) -> None:
+    """Provision ``<cwd>/.venv``, seeded from a venv template when possible.
+
+    A missing venv is first cloned from the template of its key (see
+    ``venv_template``), so ``install.py`` only reconciles what changed. If the
+    install fails on a cloned venv, it is wiped and installed from scratch.
+    A venv installed without a template becomes the template of its key.
+
+    Args:
+        spec: The session spec.
+        cwd: The session/project directory.
+        env: The shared subprocess environment.
+
+    Raises:
+        CalledProcessError: If the install fails (on a venv not seeded from a
+            template, or again after reinstalling from scratch).
+    """
+    venv = cwd / ".venv"
+    key = (
+        venv_template_key(cwd, spec.skip_github_install)
+        if venv_templates_enabled()
+        else None
+    )
+    seeded = key is not None and clone_venv_template(key, venv)
+    if seeded:
+        print(f"Seeded .venv from venv template {key}")
+
+    argv = build_install_argv(spec, cwd)
+    try:
+        subprocess.run(argv, env=env, cwd=str(cwd), check=True)
+    except subprocess.CalledProcessError:
+        if not seeded:
+            raise
+        print("WARNING: Install into the templated .venv failed. Reinstalling...")
+        shutil.rmtree(venv, ignore_errors=True)
+        seeded = False
+        subprocess.run(argv, env=env, cwd=str(cwd), check=True)
+
+    if key is not None and not seeded and save_venv_template(key, venv):
+        print(f"Saved .venv as venv template {key}")
+
+
 def run_session(cwd: Path) -> None:
     """Read the spec, print the banner, provision the venv, then orchestrate.
 
@@ -342,7 +393,7 @@ def run_session(cwd: Path) -> None:
     spec = read_session_spec(cwd)
     print(render_banner(spec))
     env = build_subprocess_env(spec, cwd)
-    subprocess.run(build_install_argv(spec, cwd), env=env, cwd=str(cwd), check=True)
+    provision_venv(spec, cwd, env)
     orchestrate(spec, cwd, env)
 
 
@@ -0,0 +1,318 @@
+"""Transactional SQLite store behind the vscodeclaude session functions.
+
+Sessions used to live in ``vscodeclaude_sessions.json``, rewritten as a whole
+whenever one field changed. They now live in a SQLite database next to it
+(``vscodeclaude_sessions.sqlite3``) in WAL mode:
+
+- one row per session, keyed by folder and indexed by ``(repo, issue_number)``,
+- single-session changes (add/remove/PID/status) touch only their row,
+- every write runs in a ``BEGIN IMMEDIATE`` transaction, so overlapping
+  coordinator processes serialize on SQLite's file lock (waiting up to
+  :data:`BUSY_TIMEOUT_SECONDS`) instead of overwriting each other.
+
+Each row stores the full session dict as JSON, so fields can be added to
+:class:`VSCodeClaudeSession` without a schema change.
+
+The JSON file is the migration source: it is imported the first time the
+database is opened, and again whenever the file changes afterwards (e.g. an
+older mcp-coder wrote it), replacing the stored sessions.
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, cast
+
+from .types import VSCodeClaudeSession, VSCodeClaudeSessionStore
+
+logger = logging.getLogger(__name__)
+
+# Seconds a writer waits for another process's transaction to finish.
+BUSY_TIMEOUT_SECONDS = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    folder TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_issue ON sessions (repo, issue_number);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# meta key holding the (mtime_ns, size) of the JSON file last imported.
+_IMPORTED_JSON_KEY = "imported_json"
+
+
+def get_sessions_db_path(json_path: Path) -> Path:
+    """Return the database path that belongs to a sessions JSON path.
+
+    Returns:
+        ``json_path`` with the suffix ``.sqlite3``.
+    """
+    return json_path.with_suffix(".sqlite3")
+
+
+def _with_defaults(session: dict[str, Any]) -> VSCodeClaudeSession:
+    """Backfill fields added after a session was first stored.
+
+    Returns:
+        ``session``, updated in place.
+    """
+    session.setdefault("vscode_pid_create_time", None)
+    session.setdefault("last_active", None)
+    session.setdefault("last_active_rule", None)
+    return cast(VSCodeClaudeSession, session)
+
+
+def _json_fingerprint(json_path: Path) -> str | None:
+    try:
+        stat = json_path.stat()
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _read_json_sessions(json_path: Path) -> tuple[list[dict[str, Any]], str]:
+    """Read sessions and ``last_updated`` from the legacy JSON file.
+
+    Returns:
+        The sessions (empty when the file is unreadable) and ``last_updated``.
+    """
+    try:
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to load sessions file: %s", e)
+        return [], ""
+    if not isinstance(data, dict):
+        return [], ""
+    sessions = [s for s in data.get("sessions", []) if isinstance(s, dict)]
+    return sessions, str(data.get("last_updated", ""))
+
+
+class SessionStore:
+    """SQLite-backed session store; one short-lived connection per operation."""
+
+    def __init__(self, json_path: Path) -> None:
+        """Bind the store to a sessions JSON path (the migration source).
+
+        Args:
+            json_path: Path of ``vscodeclaude_sessions.json``; the database is
+                created next to it.
+        """
+        self._json_path = json_path
+        self._db_path = get_sessions_db_path(json_path)
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the SQLite database."""
+        return self._db_path
+
+    # -- reads -------------------------------------------------------------
+
+    def load(self) -> VSCodeClaudeSessionStore:
+        """Return every session (in insertion order) plus ``last_updated``.
+
+        Returns:
+            Session store dict; empty when nothing is stored or the database
+            cannot be read.
+        """
+        if not self._db_path.exists() and not self._json_path.exists():
+            return {"sessions": [], "last_updated": ""}
+        try:
+            with self._transaction(write=False) as conn:
+                rows = conn.execute(
+                    "SELECT data FROM sessions ORDER BY rowid"
+                ).fetchall()
+                last_updated = self._get_meta(conn, "last_updated") or ""
+        except sqlite3.Error as e:
+            logger.warning("Failed to load sessions store: %s", e)
+            return {"sessions": [], "last_updated": ""}
+        return {
+            "sessions": [_with_defaults(json.loads(row[0])) for row in rows],
+            "last_updated": last_updated,
+        }
+
+    def find_by_issue(
+        self, repo_full_name: str, issue_number: int
+    ) -> list[VSCodeClaudeSession]:
+        """Return the sessions of one issue via the ``(repo, issue_number)`` index.
+
+        Returns:
+            Matching sessions in insertion order.
+        """
+        if not self._db_path.exists() and not self._json_path.exists():
+            return []
+        try:
+            with self._transaction(write=False) as conn:
+                rows = conn.execute(
+                    "SELECT data FROM sessions WHERE repo = ? AND issue_number = ? "
+                    "ORDER BY rowid",
+                    (repo_full_name, issue_number),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Failed to query sessions store: %s", e)
+            return []
+        return [_with_defaults(json.loads(row[0])) for row in rows]
+
+    # -- writes ------------------------------------------------------------
+
+    def replace_all(self, store: VSCodeClaudeSessionStore) -> None:
+        """Replace the stored sessions with ``store["sessions"]``.
+
+        Sets ``store["last_updated"]`` to the current time.
+        """
+        store["last_updated"] = datetime.now(timezone.utc).isoformat()
+        with self._transaction(write=True) as conn:
+            conn.execute("DELETE FROM sessions")
+            self._insert(conn, store["sessions"])
+            self._touch(conn, store["last_updated"])
+
+    def add(self, session: VSCodeClaudeSession) -> None:
+        """Insert a session (replacing any session with the same folder)."""
+        with self._transaction(write=True) as conn:
+            conn.execute("DELETE FROM sessions WHERE folder = ?", (session["folder"],))
+            self._insert(conn, [session])
+            self._touch(conn)
+
+    def remove(self, folder: str) -> bool:
+        """Delete the session of ``folder``.
+
+        Returns:
+            True if a session was removed.
+        """
+        with self._transaction(write=True) as conn:
+            removed = (
+                conn.execute(
+                    "DELETE FROM sessions WHERE folder = ?", (folder,)
+                ).rowcount
+                > 0
+            )
+            if removed:
+                self._touch(conn)
+        return removed
+
+    def update(self, folder: str, **fields: Any) -> bool:
+        """Set ``fields`` on the session of ``folder`` (one row, one transaction).
+
+        Returns:
+            True if the session exists and was updated.
+        """
+        return self.modify(folder, lambda session: session.update(fields))
+
+    def modify(self, folder: str, change: Callable[[dict[str, Any]], None]) -> bool:
+        """Apply ``change`` to the session of ``folder`` inside one transaction.
+
+        Args:
+            folder: Session folder (the row key).
+            change: Mutates the session dict in place.
+
+        Returns:
+            True if the session exists and was updated.
+        """
+        with self._transaction(write=True) as conn:
+            row = conn.execute(
+                "SELECT data FROM sessions WHERE folder = ?", (folder,)
+            ).fetchone()
+            if row is None:
+                return False
+            session: dict[str, Any] = json.loads(row[0])
+            change(session)
+            conn.execute(
+                "UPDATE sessions SET repo = ?, issue_number = ?, data = ? "
+                "WHERE folder = ?",
+                (session["repo"], session["issue_number"], json.dumps(session), folder),
+            )
+            self._touch(conn)
+        return True
+
+    # -- internals ---------------------------------------------------------
+
+    @contextmanager
+    def _transaction(self, *, write: bool) -> Iterator[sqlite3.Connection]:
+        """Open the database, import the JSON file if needed, run a transaction.
+
+        Write transactions start with ``BEGIN IMMEDIATE`` so they take the
+        database's write lock up front.
+
+        Yields:
+            A connection inside an open transaction; committed on success and
+            rolled back on error.
+        """
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(
+            sqlite3.connect(
+                self._db_path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+        ) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._import_json_if_changed(conn)
+            conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _import_json_if_changed(self, conn: sqlite3.Connection) -> None:
+        """Import the JSON file if it is new or changed since the last import."""
+        fingerprint = _json_fingerprint(self._json_path)
+        if fingerprint is None or fingerprint == self._get_meta(
+            conn, _IMPORTED_JSON_KEY
+        ):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock: another process may have imported.
+            if fingerprint != self._get_meta(conn, _IMPORTED_JSON_KEY):
+                sessions, last_updated = _read_json_sessions(self._json_path)
+                conn.execute("DELETE FROM sessions")
+                self._insert(conn, sessions)
+                self._touch(conn, last_updated)
+                self._set_meta(conn, _IMPORTED_JSON_KEY, fingerprint)
+                logger.debug(
+                    "Imported %d sessions from %s", len(sessions), self._json_path
+                )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, sessions: list[Any]) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sessions (folder, repo, issue_number, data) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (s["folder"], s["repo"], s["issue_number"], json.dumps(s))
+                for s in sessions
+            ],
+        )
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else str(row[0])
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _touch(self, conn: sqlite3.Connection, when: str | None = None) -> None:
+        self._set_meta(
+            conn,
+            "last_updated",
+            when if when is not None else datetime.now(timezone.utc).isoformat(),
+        )
@@ -1,20 +1,28 @@
 """Session management for vscodeclaude feature.
 
-Handles JSON file I/O for session tracking and VSCode process checking.
+Handles session tracking (persisted by the transactional
+:class:`~.session_store.SessionStore`) and VSCode process checking.
 """
 
-import json
 import logging
 import re
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import psutil
 
 from ...utils.user_app_data import get_user_app_data_dir
 from .config import sanitize_folder_name
 from .helpers import load_to_be_deleted
+from .process_tracker import (
+    VSCODE_PROCESS_NAMES,
+    VSCodeProcessTracker,
+    build_folder_index,
+    find_folder_pids,
+)
+from .session_store import SessionStore
 from .types import VSCodeClaudeSession, VSCodeClaudeSessionStore
 
 # Optional Windows-only imports for window title detection
@@ -28,11 +36,6 @@
 
 logger = logging.getLogger(__name__)
 
-# Exact process names for VSCode on each platform.
-# Using exact match prevents false positives from processes whose names
-# contain "code" as a substring (e.g. "my-code-tool.exe").
-VSCODE_PROCESS_NAMES = {"code.exe", "code"}  # Windows / Linux+macOS
-
 # Seconds after launch during which a negative window-title check is not
 # trusted (covers VSCode cold-start and extension reinstall delays). Beyond
 # this window the title check is authoritative on Windows.
@@ -52,46 +55,36 @@ def get_sessions_file_path() -> Path:
     )
 
 
+def _session_store() -> SessionStore:
+    """Return the store for the current sessions path.
+
+    The database lives next to ``get_sessions_file_path()``, which it imports
+    sessions from on first use.
+    """
+    return SessionStore(get_sessions_file_path())
+
+
 def load_sessions() -> VSCodeClaudeSessionStore:
-    """Load sessions from JSON file.
+    """Load all sessions from the session store.
 
     Returns:
-        Session store dict. Empty sessions list if file doesn't exist.
+        Session store dict. Empty sessions list if nothing is stored.
     """
-    sessions_file = get_sessions_file_path()
-    if not sessions_file.exists():
-        return {"sessions": [], "last_updated": ""}
-
-    try:
-        content = sessions_file.read_text(encoding="utf-8")
-        data: dict[str, Any] = json.loads(content)
-        # Validate structure
-        if "sessions" not in data:
-            data["sessions"] = []
-        if "last_updated" not in data:
-            data["last_updated"] = ""
-        for session in data["sessions"]:
-            session.setdefault("vscode_pid_create_time", None)
-            session.setdefault("last_active", None)
-            session.setdefault("last_active_rule", None)
-        return cast(VSCodeClaudeSessionStore, data)
-    except (json.JSONDecodeError, OSError) as e:
-        logger.warning("Failed to load sessions file: %s", e)
-        return {"sessions": [], "last_updated": ""}
+    return _session_store().load()
 
 
 def save_sessions(store: VSCodeClaudeSessionStore) -> None:
-    """Save sessions to JSON file.
+    """Replace all stored sessions with ``store`` in one transaction.
+
+    Prefer the single-session functions (``add_session``, ``remove_session``,
+    ``update_session_pid``, ``update_session_status``), which update one row.
 
     Args:
         store: Session store to save
 
     Creates parent directories if needed.
     """
-    sessions_file = get_sessions_file_path()
-    sessions_file.parent.mkdir(parents=True, exist_ok=True)
-    store["last_updated"] = datetime.now(timezone.utc).isoformat()
-    sessions_file.write_text(json.dumps(store, indent=2), encoding="utf-8")
+    _session_store().replace_all(store)
 
 
 def check_vscode_running(
@@ -150,60 +143,45 @@ def check_vscode_running(
         return False
 
 
-# Cache for VSCode processes to avoid repeated slow process iteration
-_vscode_process_cache: dict[str, list[dict[str, Any]]] | None = None
+# Process-wide tracker of VSCode processes (see process_tracker).
+_PROCESS_TRACKER = VSCodeProcessTracker()
 
 
 def _get_vscode_processes(refresh: bool = False) -> list[dict[str, Any]]:
     """Get list of VSCode processes with their command lines.
 
-    Caches results to avoid repeated slow process iteration.
-    Call with refresh=True at the start of operations to refresh the cache.
+    Served from the incremental process tracker. Call with refresh=True at
+    the start of operations to pick up processes started or exited since.
 
     Returns:
-        List of dicts with 'pid' and 'cmdline_lower' keys
+        List of dicts with 'pid' and 'cmdline_lower' keys (plus 'name',
+        'create_time' and 'args_lower')
     """
-    global _vscode_process_cache  # pylint: disable=global-statement  # module-level singleton
+    if refresh or not _PROCESS_TRACKER.scanned:
+        return _PROCESS_TRACKER.refresh()
+    return _PROCESS_TRACKER.processes
 
-    if _vscode_process_cache is not None and not refresh:
-        return _vscode_process_cache.get("processes", [])
-
-    logger.debug("Scanning VSCode processes (this may be slow on Windows)...")
-    processes: list[dict[str, Any]] = []
-    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-        try:
-            proc_name = proc.info.get("name", "") or ""
-            if proc_name.lower() not in VSCODE_PROCESS_NAMES:
-                continue
 
-            cmdline = proc.info.get("cmdline") or []
-            # Store lowercase cmdline for fast matching
-            cmdline_lower = " ".join(str(arg).lower() for arg in cmdline)
-            processes.append(
-                {
-                    "pid": proc.info.get("pid"),
-                    "cmdline_lower": cmdline_lower,
-                }
-            )
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
+def _get_vscode_folder_index(
+    processes: list[dict[str, Any]],
+) -> dict[str, list[int]]:
+    """Return the folder -> PIDs index for ``processes``.
 
-    _vscode_process_cache = {"processes": processes}
-    logger.debug("Cached %d VSCode processes", len(processes))
-    # Log first cmdline for debugging (truncated)
-    if processes:
-        sample = processes[0].get("cmdline_lower", "")[:200]
-        logger.debug("Sample VSCode cmdline: %s...", sample)
-    return processes
+    The tracker's own list comes with a prebuilt index; any other list (e.g.
+    a test double) is indexed on the fly.
+    """
+    if processes is _PROCESS_TRACKER.processes:
+        return _PROCESS_TRACKER.folder_index
+    return build_folder_index(processes)
 
 
 def clear_vscode_process_cache() -> None:
     """Clear the VSCode process cache.
 
-    Call this at the start of operations to ensure fresh data.
+    Call this at the start of operations to ensure fresh data. The next
+    lookup refreshes the tracker (incrementally).
     """
-    global _vscode_process_cache  # pylint: disable=global-statement  # module-level singleton
-    _vscode_process_cache = None
+    _PROCESS_TRACKER.invalidate()
 
 
 # Cache for VSCode window titles (Windows only).
@@ -213,31 +191,20 @@ def clear_vscode_process_cache() -> None:
 _vscode_window_cache: list[tuple[int, str]] | None = None
 
 
-# Cache for VSCode process PIDs to avoid repeated lookups
-_vscode_pids_cache: set[int] | None = None
-
-
 def _get_vscode_pids() -> set[int]:
     """Get set of VSCode process IDs.
 
+    Taken from the tracked process list, so the PIDs match the processes
+    of the same refresh.
+
     Returns:
         Set of PIDs for Code.exe processes
     """
-    global _vscode_pids_cache  # pylint: disable=global-statement  # module-level singleton
-    if _vscode_pids_cache is not None:
-        return _vscode_pids_cache
-
-    pids: set[int] = set()
-    for proc in psutil.process_iter(["pid", "name"]):
-        try:
-            proc_name = proc.info.get("name", "") or ""
-            if proc_name.lower() == "code.exe":
-                pids.add(proc.info.get("pid"))
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-
-    _vscode_pids_cache = pids
-    return pids
+    return {
+        proc["pid"]
+        for proc in _get_vscode_processes()
+        if proc.get("name") == "code.exe"
+    }
 
 
 def _get_vscode_window_titles(refresh: bool = False) -> list[tuple[int, str]]:
@@ -258,7 +225,7 @@ def _get_vscode_window_titles(refresh: bool = False) -> list[tuple[int, str]]:
         List of (pid, title) tuples for visible VSCode-owned windows,
         or empty list on non-Windows.
     """
-    global _vscode_window_cache, _vscode_pids_cache  # pylint: disable=global-statement  # module-level singleton
+    global _vscode_window_cache  # pylint: disable=global-statement  # module-level singleton
 
     if not HAS_WIN32GUI:
         return []
@@ -266,10 +233,6 @@ def _get_vscode_window_titles(refresh: bool = False) -> list[tuple[int, str]]:
     if _vscode_window_cache is not None and not refresh:
         return _vscode_window_cache
 
-    # Refresh PID cache when refreshing window cache
-    if refresh:
-        _vscode_pids_cache = None
-
     vscode_pids = _get_vscode_pids()
     logger.debug("Found %d VSCode processes: %s", len(vscode_pids), vscode_pids)
 
@@ -310,9 +273,8 @@ def enum_callback(hwnd: int, _: Any) -> bool:
 
 def clear_vscode_window_cache() -> None:
     """Clear the VSCode window title cache."""
-    global _vscode_window_cache, _vscode_pids_cache  # pylint: disable=global-statement  # module-level singleton
+    global _vscode_window_cache  # pylint: disable=global-statement  # module-level singleton
     _vscode_window_cache = None
-    _vscode_pids_cache = None
 
 
 def is_vscode_window_open_for_folder(
@@ -343,7 +305,6 @@ def is_vscode_window_open_for_folder(
         return False
 
     titles = _get_vscode_window_titles()
-    folder_str = str(folder_path).lower()
     folder_name = Path(folder_path).name.lower()
 
     # For vscodeclaude sessions: Only match if issue number is in window title
@@ -360,12 +321,11 @@ def is_vscode_window_open_for_folder(
         # Bind the title match to the VSCode process that actually has the
         # folder open: only accept a title from a PID whose cmdline references
         # the folder.
-        matching_pids = {
-            proc["pid"]
-            for proc in _get_vscode_processes()
-            if folder_str in proc.get("cmdline_lower", "")
-            or folder_name in proc.get("cmdline_lower", "")
-        }
+        matching_pids = set(
+            find_folder_pids(
+                _get_vscode_folder_index(_get_vscode_processes()), folder_path
+            )
+        )
 
         for pid, title in titles:
             if pid not in matching_pids:
@@ -396,8 +356,8 @@ def is_vscode_open_for_folder(folder_path: str) -> tuple[bool, int | None]:
     More reliable than PID-based check on Windows where the launcher
     process exits immediately after spawning VSCode.
 
-    Uses cached process list for performance - call clear_vscode_process_cache()
-    at the start of batch operations to refresh.
+    Looks the folder up in the tracked processes' folder index - call
+    clear_vscode_process_cache() at the start of batch operations to refresh.
 
     Args:
         folder_path: Full path to the workspace folder
@@ -407,25 +367,18 @@ def is_vscode_open_for_folder(folder_path: str) -> tuple[bool, int | None]:
         - is_open: True if VSCode has this folder open
         - pid: The VSCode process PID if found, None otherwise
     """
-    folder_str = str(folder_path).lower()
-    # Also check for workspace file pattern
     folder_name = Path(folder_path).name.lower()
-
-    for proc_info in _get_vscode_processes():
-        cmdline_lower = proc_info.get("cmdline_lower", "")
-        # Check if folder path or folder name appears in command line
-        if folder_str in cmdline_lower or folder_name in cmdline_lower:
-            logger.debug(
-                "Found VSCode with folder %s (pid=%s)",
-                folder_name,
-                proc_info.get("pid"),
-            )
-            return True, proc_info.get("pid")
+    processes = _get_vscode_processes()
+    # Matches the folder path or name (incl. the workspace file pattern)
+    pids = find_folder_pids(_get_vscode_folder_index(processes), folder_path)
+    if pids:
+        logger.debug("Found VSCode with folder %s (pid=%s)", folder_name, pids[0])
+        return True, pids[0]
 
     logger.debug(
         "No VSCode process found for folder: %s (checked %d processes)",
         folder_name,
-        len(_get_vscode_processes()),
+        len(processes),
     )
     return False, None
 
@@ -448,17 +401,12 @@ def get_session_for_issue(
     Returns:
         Session dict if found, None otherwise
     """
-    store = load_sessions()
     to_be_deleted = load_to_be_deleted(workspace_base)
-
-    matches: list[VSCodeClaudeSession] = []
-    for session in store["sessions"]:
-        if (
-            session["repo"] == repo_full_name
-            and session["issue_number"] == issue_number
-        ):
-            if Path(session["folder"]).name not in to_be_deleted:
-                matches.append(session)
+    matches = [
+        session
+        for session in _session_store().find_by_issue(repo_full_name, issue_number)
+        if Path(session["folder"]).name not in to_be_deleted
+    ]
 
     if len(matches) > 1:
         logger.error("Multiple active folders for %s #%d", repo_full_name, issue_number)
@@ -476,7 +424,7 @@ def warn_orphan_folders(
     r"""Scan disk for folders matching the issue that aren't tracked.
 
     Checks for {base} and {base}-folder\d+ folders on disk that are
-    not in sessions.json and not in .to_be_deleted. Logs a warning
+    not in the session store and not in .to_be_deleted. Logs a warning
     for each orphan found.
 
     Note: repo_full_name is "owner/repo" format. The short repo name
@@ -507,14 +455,14 @@ def warn_orphan_folders(
 def add_session(session: VSCodeClaudeSession) -> None:
     """Add new session to store.
 
+    A stored session with the same folder is replaced.
+
     Args:
         session: Session to add
 
     Automatically updates last_updated timestamp.
     """
-    store = load_sessions()
-    store["sessions"].append(session)
-    save_sessions(store)
+    _session_store().add(session)
 
 
 def remove_session(folder: str) -> bool:
@@ -526,13 +474,7 @@ def remove_session(folder: str) -> bool:
     Returns:
         True if session was found and removed
     """
-    store = load_sessions()
-    original_count = len(store["sessions"])
-    store["sessions"] = [s for s in store["sessions"] if s["folder"] != folder]
-    if len(store["sessions"]) < original_count:
-        save_sessions(store)
-        return True
-    return False
+    return _session_store().remove(folder)
 
 
 def session_has_artifacts(folder: str) -> bool:
@@ -579,9 +521,9 @@ def is_session_active(session: VSCodeClaudeSession) -> bool:
 
     Side effect: on cmdline match where the found PID differs from the
     stored ``vscode_pid``, calls ``update_session_pid(folder, found_pid)``,
-    which writes ``sessions.json``.
+    which updates that session's row in the session store.
 
-    Subscript access on ``vscode_pid_create_time`` is safe: ``load_sessions``
+    Subscript access on ``vscode_pid_create_time`` is safe: the session store
     backfills the key on read and ``build_session`` initializes it on create.
 
     Args:
@@ -697,13 +639,23 @@ def update_session_pid(folder: str, pid: int) -> None:
         pid: New VSCode process ID
     """
     create_time = get_pid_create_time(pid)
-    store = load_sessions()
-    for session in store["sessions"]:
-        if session["folder"] == folder:
-            session["vscode_pid"] = pid
-            session["vscode_pid_create_time"] = create_time
-            break
-    save_sessions(store)
+    _session_store().update(folder, vscode_pid=pid, vscode_pid_create_time=create_time)
+
+
+def modify_session(folder: str, change: Callable[[dict[str, Any]], None]) -> bool:
+    """Apply ``change`` to one stored session inside a single transaction.
+
+    Only that session's row is read and rewritten, so sessions added or
+    removed concurrently by another coordinator process are left alone.
+
+    Args:
+        folder: Session folder path (used as session identifier)
+        change: Mutates the stored session dict in place
+
+    Returns:
+        True if session was found and updated, False if it no longer exists
+    """
+    return _session_store().modify(folder, change)
 
 
 def update_session_status(folder: str, new_status: str) -> bool:
@@ -716,10 +668,4 @@ def update_session_status(folder: str, new_status: str) -> bool:
     Returns:
         True if session was found and updated, False otherwise
     """
-    store = load_sessions()
-    for session in store["sessions"]:
-        if session["folder"] == folder:
-            session["status"] = new_status
-            save_sessions(store)
-            return True
-    return False
+    return _session_store().update(folder, status=new_status)
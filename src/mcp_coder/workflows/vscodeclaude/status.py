@@ -268,7 +268,7 @@ def display_status_table(
     :class:`SessionAssessment` (verdict + decision) instead of recomputing
     liveness / staleness / closed / next-action (R1), so the enriched
     ``VSCode``/``Next Action`` columns cannot drift from cleanup, restart, audit,
-    or ``--explain``. WRITE-FREE: this path performs no ``sessions.json`` writes
+    or ``--explain``. WRITE-FREE: this path performs no session-store writes
     (the PID refresh + ``last_active`` advance live in ``apply_assessments``).
 
     Args:
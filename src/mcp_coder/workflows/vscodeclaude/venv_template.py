@@ -0,0 +1,301 @@
+"""Cache of ready-made project venvs for new vscodeclaude sessions.
+
+Every session provisions ``<folder>/.venv`` with ``install.py`` (``uv sync``
+plus the GitHub overrides). ``session_setup`` now seeds a missing venv from a
+template first, so that install step only reconciles what differs:
+
+- a template is keyed by the coordinator's Python version and platform, the
+  project's ``uv.lock`` / ``pyproject.toml`` / ``.python-version``, the
+  mcp-coder version and whether GitHub overrides are skipped
+  (:func:`venv_template_key`),
+- it is captured from the first session venv of its key that installed
+  successfully, and only if that venv is relocatable (``install.py
+  --relocatable``), so its entry points do not hard-code the venv's path,
+- a venv is cloned from it with hardlinks for package files (as uv links
+  from its own cache) and real copies of the files tools rewrite in place
+  (``*.pth``, ``pyvenv.cfg``, scripts),
+- templates unused for :data:`TEMPLATE_MAX_AGE_DAYS`, or beyond the
+  :data:`MAX_TEMPLATES` most recently used, are stale and get evicted
+  whenever a template is captured.
+
+Set ``MCP_CODER_VSCODECLAUDE_VENV_TEMPLATE=0`` to provision every venv from
+scratch.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from ...utils.user_app_data import get_user_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Set to "0" to disable venv templates.
+VENV_TEMPLATE_ENV = "MCP_CODER_VSCODECLAUDE_VENV_TEMPLATE"
+
+# Most recently used templates kept; older ones are stale.
+MAX_TEMPLATES = 4
+
+# Templates unused for longer than this are stale.
+TEMPLATE_MAX_AGE_DAYS = 14
+
+# Project files whose contents are part of the template key.
+_KEY_FILES = ("uv.lock", "pyproject.toml", ".python-version")
+
+_METADATA_FILE = "template.json"
+_VENV_DIR = "venv"
+
+# Files copied instead of hardlinked: installers rewrite them in place.
+_COPIED_SUFFIXES = frozenset({".pth", ".cfg"})
+_SCRIPT_DIRS = frozenset({"bin", "Scripts"})
+
+
+@dataclass(frozen=True)
+class VenvTemplate:
+    """One cached venv template."""
+
+    key: str
+    path: Path
+    python: str
+    mcp_coder_version: str
+    last_used: float
+    stale: bool
+
+
+def venv_templates_enabled() -> bool:
+    """Return False when ``MCP_CODER_VSCODECLAUDE_VENV_TEMPLATE`` is ``"0"``."""
+    return os.environ.get(VENV_TEMPLATE_ENV, "1").strip() != "0"
+
+
+def get_venv_template_dir() -> Path:
+    """Return the directory holding the venv templates."""
+    return get_user_app_data_dir("mcp_coder") / "venv_templates"
+
+
+def _mcp_coder_version() -> str:
+    try:
+        return version("mcp-coder")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def venv_template_key(project_dir: Path, skip_github_install: bool) -> str | None:
+    """Return the template key for the venv of ``project_dir``.
+
+    Args:
+        project_dir: Session folder holding ``pyproject.toml``.
+        skip_github_install: Whether the install skips the GitHub overrides.
+
+    Returns:
+        A 16-character hex key, or None if ``project_dir`` has no
+        ``pyproject.toml`` (nothing to key the venv on).
+    """
+    if not (project_dir / "pyproject.toml").is_file():
+        return None
+    digest = hashlib.sha256()
+    for name in _KEY_FILES:
+        try:
+            content_hash = hashlib.sha256((project_dir / name).read_bytes()).hexdigest()
+        except OSError:
+            content_hash = "-"
+        digest.update(f"{name}={content_hash}\n".encode())
+    digest.update(
+        "|".join(
+            [
+                f"{sys.version_info.major}.{sys.version_info.minor}",
+                sys.platform,
+                platform.machine(),
+                _mcp_coder_version(),
+                str(skip_github_install),
+            ]
+        ).encode()
+    )
+    return digest.hexdigest()[:16]
+
+
+def _is_relocatable(venv: Path) -> bool:
+    """Return True if ``venv``'s ``pyvenv.cfg`` has ``relocatable = true``."""
+    try:
+        lines = (venv / "pyvenv.cfg").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+    for line in lines:
+        name, _, value = line.partition("=")
+        if name.strip() == "relocatable":
+            return value.strip().lower() == "true"
+    return False
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """``copytree`` copy function: hardlink package files, copy the rest.
+
+    Returns:
+        ``dst``, as ``copytree`` expects.
+    """
+    source = Path(src)
+    if source.suffix not in _COPIED_SUFFIXES and source.parent.name not in _SCRIPT_DIRS:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass  # e.g. another filesystem
+    return str(shutil.copy2(src, dst))
+
+
+def _clone_tree(source: Path, target: Path) -> None:
+    """Clone ``source`` to ``target`` via a temporary sibling and a rename.
+
+    If the clone or the rename fails, nothing is left behind.
+    """  # Also raises OSError via copytree()/rename() on failure.
+    tmp = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        shutil.copytree(source, tmp, symlinks=True, copy_function=_link_or_copy)
+        tmp.rename(target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def clone_venv_template(key: str, venv: Path) -> bool:
+    """Create the missing ``venv`` as a clone of the template ``key``.
+
+    Returns:
+        True if ``venv`` was created from the template; False if it already
+        exists, there is no template for ``key``, or cloning failed.
+    """
+    template = get_venv_template_dir() / key
+    if venv.exists() or not (template / _VENV_DIR / "pyvenv.cfg").is_file():
+        return False
+    try:
+        _clone_tree(template / _VENV_DIR, venv)
+    except OSError as e:
+        logger.warning("Failed to clone venv template %s: %s", key, e)
+        return False
+    try:
+        os.utime(template / _METADATA_FILE)  # last used
+    except OSError:
+        pass
+    return True
+
+
+def save_venv_template(key: str, venv: Path) -> bool:
+    """Capture ``venv`` as the template ``key`` unless one exists already.
+
+    Evicts stale templates afterwards.
+
+    Returns:
+        True if a template was captured; False if it already existed, or
+        ``venv`` is not relocatable, or capturing failed.
+    """
+    template = get_venv_template_dir() / key
+    if (template / _VENV_DIR / "pyvenv.cfg").is_file() or not _is_relocatable(venv):
+        return False
+    try:
+        template.mkdir(parents=True, exist_ok=True)
+        _clone_tree(venv, template / _VENV_DIR)
+        (template / _METADATA_FILE).write_text(
+            json.dumps(
+                {
+                    "key": key,
+                    "python": platform.python_version(),
+                    "mcp_coder_version": _mcp_coder_version(),
+                    "source": str(venv),
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.warning("Failed to save venv template %s: %s", key, e)
+        return False
+    evict_stale_venv_templates()
+    return True
+
+
+def list_venv_templates(now: float | None = None) -> list[VenvTemplate]:
+    """Return the templates on disk, most recently used first.
+
+    Args:
+        now: Reference time for staleness (default: current time).
+
+    Returns:
+        The templates; incomplete ones (no metadata) are always stale.
+    """
+    base = get_venv_template_dir()
+    if not base.is_dir():
+        return []
+    now = time.time() if now is None else now
+    max_age = TEMPLATE_MAX_AGE_DAYS * 86400
+    found: list[tuple[Path, dict[str, str] | None, float]] = []
+    for path in base.iterdir():
+        if not path.is_dir():
+            continue
+        metadata_path = path / _METADATA_FILE
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            last_used = metadata_path.stat().st_mtime
+        except (OSError, json.JSONDecodeError):
+            metadata, last_used = None, path.stat().st_mtime
+        found.append(
+            (path, metadata if isinstance(metadata, dict) else None, last_used)
+        )
+    found.sort(key=lambda entry: entry[2], reverse=True)
+
+    templates = []
+    kept = 0
+    for path, metadata, last_used in found:
+        stale = metadata is None or now - last_used > max_age or kept >= MAX_TEMPLATES
+        if not stale:
+            kept += 1
+        templates.append(
+            VenvTemplate(
+                key=path.name,
+                path=path,
+                python=(metadata or {}).get("python", "?"),
+                mcp_coder_version=(metadata or {}).get("mcp_coder_version", "?"),
+                last_used=last_used,
+                stale=stale,
+            )
+        )
+    return templates
+
+
+def evict_stale_venv_templates() -> list[str]:
+    """Delete stale templates.
+
+    Returns:
+        Keys of the deleted templates.
+    """
+    evicted = []
+    for template in list_venv_templates():
+        if template.stale:
+            shutil.rmtree(template.path, ignore_errors=True)
+            evicted.append(template.key)
+    if evicted:
+        logger.debug("Evicted stale venv templates: %s", ", ".join(evicted))
+    return evicted
+
+
+def render_venv_templates(templates: list[VenvTemplate]) -> str:
+    """Render templates as lines for ``coordinator vscodeclaude --status``.
+
+    Returns:
+        The rendered lines, joined with newlines.
+    """
+    lines = [f"Venv templates ({get_venv_template_dir()}):"]
+    for template in templates:
+        last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(template.last_used))
+        lines.append(
+            f"  {template.key}  python {template.python}  "
+            f"mcp-coder {template.mcp_coder_version}  last used {last_used}"
+            + ("  (stale)" if template.stale else "")
+        )
+    return "\n".join(lines)
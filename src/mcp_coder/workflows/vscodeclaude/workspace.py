@@ -22,6 +22,7 @@
 )
 from .config import get_vscodeclaude_config, sanitize_folder_name
 from .helpers import load_to_be_deleted
+from .repo_mirror import clone_with_mirror
 from .types import DEFAULT_PROMPT_TIMEOUT, SessionSpec, write_session_spec
 
 logger = logging.getLogger(__name__)
@@ -220,7 +221,8 @@ def setup_git_repo(
         branch_name: Branch to checkout (None = use main)
 
     Steps:
-    1. If folder empty: git clone
+    1. If folder empty: git clone (``--reference`` to the shared repo mirror
+       when ``MCP_CODER_VSCODECLAUDE_GIT_MIRROR=1``, see ``repo_mirror``)
     2. If folder has .git: checkout branch, pull
     3. Uses system git credentials
     4. Logs progress using logger.info()
@@ -260,13 +262,14 @@ def setup_git_repo(
             has_git = False
 
     if is_empty:
-        # Clone into folder
-        logger.info("Cloning %s into %s", repo_url, folder_path)
-        clone_options = CommandOptions(check=True)
-        execute_subprocess(
-            ["git", "clone", repo_url, str(folder_path)],
-            clone_options,
-        )
+        # Clone into folder (borrowing from the shared mirror when enabled)
+        if not clone_with_mirror(repo_url, folder_path):
+            logger.info("Cloning %s into %s", repo_url, folder_path)
+            clone_options = CommandOptions(check=True)
+            execute_subprocess(
+                ["git", "clone", repo_url, str(folder_path)],
+                clone_options,
+            )
     elif not has_git:
         # Folder has content but no .git - error
         raise ValueError(
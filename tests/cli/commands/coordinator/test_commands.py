@@ -252,3 +252,96 @@ def test_execute_coordinator_run_creates_config_if_missing(
 
         # Verify message logged
         assert "Created default config file" in caplog.text
+
+
+class TestExecuteCoordinatorRunParallel:
+    """Tests for execute_coordinator_run with --parallel N."""
+
+    @staticmethod
+    def _issue(number: int) -> IssueData:
+        return IssueData(
+            number=number,
+            title=f"Issue {number}",
+            body="",
+            state="open",
+            labels=["status-05:plan-ready"],
+            assignees=[],
+            user=None,
+            created_at=None,
+            updated_at=None,
+            url=f"https://github.com/user/repo/issues/{number}",
+            locked=False,
+        )
+
+    @patch("mcp_coder.cli.commands.coordinator.commands.get_cache_refresh_minutes")
+    @patch("mcp_coder.cli.commands.coordinator.commands.load_config")
+    @patch("mcp_coder.cli.commands.coordinator.commands.IssueManager")
+    @patch("mcp_coder.cli.commands.coordinator.commands.IssueBranchManager")
+    @patch("mcp_coder.cli.commands.coordinator.commands.JenkinsClient")
+    @patch("mcp_coder.cli.commands.coordinator.commands.get_jenkins_credentials")
+    @patch("mcp_coder.cli.commands.coordinator.commands.load_repo_config")
+    @patch("mcp_coder.cli.commands.coordinator.commands.get_cached_eligible_issues")
+    @patch("mcp_coder.cli.commands.coordinator.commands.dispatch_workflow")
+    @patch("mcp_coder.cli.commands.coordinator.commands.create_default_config")
+    def test_failure_in_one_repo_does_not_stop_others(
+        self,
+        mock_create_config: MagicMock,
+        mock_dispatch_workflow: MagicMock,
+        mock_get_cached_issues: MagicMock,
+        mock_load_repo: MagicMock,
+        mock_get_creds: MagicMock,
+        mock_jenkins_class: MagicMock,
+        mock_branch_mgr_class: MagicMock,
+        mock_issue_mgr_class: MagicMock,
+        mock_load_config: MagicMock,
+        mock_refresh_minutes: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Per-repo fail-fast: a failing repo stops, the others still dispatch."""
+        args = argparse.Namespace(
+            command="coordinator",
+            repo=None,
+            all=True,
+            log_level="INFO",
+            force_refresh=False,
+            parallel=3,
+        )
+        mock_create_config.return_value = False
+        mock_load_config.return_value = {
+            "coordinator": {"repos": {"repo_a": {}, "repo_b": {}, "repo_c": {}}}
+        }
+        mock_refresh_minutes.return_value = 1440
+        mock_load_repo.side_effect = lambda name: {
+            "repo_url": f"https://github.com/user/{name}.git",
+            "executor_job_path": f"{name}/executor",
+            "github_credentials_id": "github-pat",
+            "executor_os": "linux",
+        }
+        mock_get_creds.return_value = ("https://jenkins.com", "user", "token")
+        mock_get_cached_issues.side_effect = lambda **kwargs: [
+            self._issue(1),
+            self._issue(2),
+        ]
+
+        def _dispatch(**kwargs: object) -> None:
+            repo_config = kwargs["repo_config"]
+            assert isinstance(repo_config, dict)
+            if repo_config["repo_url"].endswith("repo_b.git"):
+                raise RuntimeError("Jenkins unavailable")
+
+        mock_dispatch_workflow.side_effect = _dispatch
+
+        with caplog.at_level(logging.INFO):
+            result = execute_coordinator_run(args)
+
+        assert result == 1
+        dispatched_urls = [
+            call.kwargs["repo_config"]["repo_url"]
+            for call in mock_dispatch_workflow.call_args_list
+        ]
+        # repo_a and repo_c dispatch both issues, repo_b stops at the first one
+        assert dispatched_urls.count("https://github.com/user/repo_a.git") == 2
+        assert dispatched_urls.count("https://github.com/user/repo_c.git") == 2
+        assert dispatched_urls.count("https://github.com/user/repo_b.git") == 1
+        assert "Repository timing summary:" in caplog.text
+        assert "FAILED" in caplog.text
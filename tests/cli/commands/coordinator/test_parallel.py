@@ -0,0 +1,121 @@
+"""Tests for the coordinator parallel repository runner."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from mcp_coder.cli.commands.coordinator.parallel import (
+    RepoRunResult,
+    format_timing_summary,
+    run_repos_in_parallel,
+)
+
+logger = logging.getLogger("tests.coordinator.parallel")
+
+
+class TestRunReposInParallel:
+    """Tests for run_repos_in_parallel."""
+
+    def test_results_keep_input_order(self) -> None:
+        """Results are returned in repo order regardless of completion order."""
+
+        def _process(repo_name: str) -> RepoRunResult:
+            time.sleep(0.05 if repo_name == "slow" else 0)
+            return RepoRunResult(repo_name=repo_name, success=True)
+
+        results = run_repos_in_parallel(["slow", "fast"], _process, max_workers=2)
+
+        assert [r.repo_name for r in results] == ["slow", "fast"]
+        assert all(r.success for r in results)
+        assert results[0].duration_seconds >= 0.05
+
+    def test_exception_marks_only_that_repo_failed(self) -> None:
+        """An exception escaping one repo does not affect the others."""
+
+        def _process(repo_name: str) -> RepoRunResult:
+            if repo_name == "bad":
+                raise ValueError("bad config")
+            return RepoRunResult(repo_name=repo_name, success=True)
+
+        results = run_repos_in_parallel(["good", "bad"], _process, max_workers=2)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error == "bad config"
+
+    def test_concurrency_is_bounded(self) -> None:
+        """No more than max_workers repos run at the same time."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _process(repo_name: str) -> RepoRunResult:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return RepoRunResult(repo_name=repo_name, success=True)
+
+        run_repos_in_parallel([f"r{i}" for i in range(6)], _process, max_workers=2)
+
+        assert peak <= 2
+
+    def test_logs_are_not_interleaved(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Each repo's log lines are emitted as one contiguous block."""
+        barrier = threading.Barrier(2)
+
+        def _process(repo_name: str) -> RepoRunResult:
+            logger.info(f"{repo_name} start")
+            barrier.wait(timeout=5)
+            logger.info(f"{repo_name} end")
+            return RepoRunResult(repo_name=repo_name, success=True)
+
+        with caplog.at_level(logging.INFO, logger="tests.coordinator.parallel"):
+            run_repos_in_parallel(["a", "b"], _process, max_workers=2)
+
+        messages = [
+            r.getMessage()
+            for r in caplog.records
+            if r.name == "tests.coordinator.parallel"
+        ]
+        assert len(messages) == 4
+        first_repo = messages[0].split()[0]
+        assert messages[1] == f"{first_repo} end"
+
+    def test_root_handlers_restored(self) -> None:
+        """The root logger handlers are restored after the run."""
+        before = list(logging.getLogger().handlers)
+
+        run_repos_in_parallel(
+            ["a"], lambda name: RepoRunResult(repo_name=name, success=True), 1
+        )
+
+        assert logging.getLogger().handlers == before
+
+
+class TestFormatTimingSummary:
+    """Tests for format_timing_summary."""
+
+    def test_summary_lists_each_repo(self) -> None:
+        """Every repo appears with its duration and status."""
+        summary = format_timing_summary(
+            [
+                RepoRunResult("repo_a", True, 1.5, eligible_issues=2, dispatched=2),
+                RepoRunResult("repo_b", False, 0.25, error="boom"),
+            ]
+        )
+
+        assert "repo_a" in summary
+        assert "1.50s" in summary
+        assert "FAILED" in summary
+        assert "error=boom" in summary
+        assert "total (sum of repos): 1.75s" in summary
+
+    def test_empty_results(self) -> None:
+        """An empty result list yields a short message."""
+        assert "no repositories" in format_timing_summary([])
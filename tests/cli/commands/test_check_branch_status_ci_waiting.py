@@ -47,7 +47,7 @@ def test_wait_for_ci_timeout_zero_returns_immediately(
 
     @patch("mcp_coder.cli.commands.check_branch_status.time.sleep")
     def test_wait_for_ci_polls_until_completion(self, mock_sleep: Mock) -> None:
-        """Should poll every 15 seconds until CI completes."""
+        """Should poll at the fast post-push interval until CI completes."""
         from mcp_coder.cli.commands.check_branch_status import (
             _wait_for_ci_completion,
         )
@@ -68,7 +68,7 @@ def test_wait_for_ci_polls_until_completion(self, mock_sleep: Mock) -> None:
         assert ci_status is not None
         assert ci_status["run"]["conclusion"] == "success"
         assert mock_sleep.call_count == 1
-        mock_sleep.assert_called_with(15)
+        mock_sleep.assert_called_with(5)
 
     @patch("mcp_coder.cli.commands.check_branch_status.time.sleep")
     def test_wait_for_ci_respects_timeout(self, mock_sleep: Mock) -> None:
@@ -84,11 +84,12 @@ def test_wait_for_ci_respects_timeout(self, mock_sleep: Mock) -> None:
             "jobs": [],
         }
 
-        # 45 second timeout = 3 attempts (45/15)
+        # 45 second timeout: backoff 5, 5, 7.5, 11.25, then the remaining 16.25
         _, success = _wait_for_ci_completion(mock_manager, "branch", 45, True)
 
         assert success is False  # Timeout
-        assert mock_sleep.call_count == 3
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == pytest.approx(45)
+        assert mock_sleep.call_count == 5
 
     @patch("mcp_coder.cli.commands.check_branch_status.time.sleep")
     def test_wait_for_ci_logs_progress_in_human_mode(
@@ -264,7 +264,7 @@ def test_loads_allowlist_from_project_dir(
 class TestCheckFileSizesIntegration:
     """Integration tests for check file-size via CLI parser."""
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch("sys.argv", ["mcp-coder", "check", "file-size"])
     def test_command_routing(self, mock_execute: MagicMock) -> None:
         """Test that check file-size routes to correct handler."""
@@ -281,7 +281,7 @@ def test_command_routing(self, mock_execute: MagicMock) -> None:
         call_args = mock_execute.call_args[0][0]  # First positional argument (args)
         assert isinstance(call_args, argparse.Namespace)
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch("sys.argv", ["mcp-coder", "check", "file-size", "--max-lines", "1000"])
     def test_max_lines_argument_parsing(self, mock_execute: MagicMock) -> None:
         """Test that --max-lines argument is parsed correctly."""
@@ -294,7 +294,7 @@ def test_max_lines_argument_parsing(self, mock_execute: MagicMock) -> None:
         call_args = mock_execute.call_args[0][0]
         assert call_args.max_lines == 1000
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch(
         "sys.argv",
         ["mcp-coder", "check", "file-size", "--allowlist-file", "my-allowlist.txt"],
@@ -310,7 +310,7 @@ def test_allowlist_file_argument_parsing(self, mock_execute: MagicMock) -> None:
         call_args = mock_execute.call_args[0][0]
         assert call_args.allowlist_file == "my-allowlist.txt"
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch("sys.argv", ["mcp-coder", "check", "file-size", "--generate-allowlist"])
     def test_generate_allowlist_flag_parsing(self, mock_execute: MagicMock) -> None:
         """Test that --generate-allowlist flag is parsed correctly."""
@@ -323,7 +323,7 @@ def test_generate_allowlist_flag_parsing(self, mock_execute: MagicMock) -> None:
         call_args = mock_execute.call_args[0][0]
         assert call_args.generate_allowlist is True
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch(
         "sys.argv",
         ["mcp-coder", "check", "file-size", "--project-dir", "/some/path"],
@@ -339,7 +339,7 @@ def test_project_dir_argument_parsing(self, mock_execute: MagicMock) -> None:
         call_args = mock_execute.call_args[0][0]
         assert call_args.project_dir == "/some/path"
 
-    @patch("mcp_coder.cli.main.execute_check_file_sizes")
+    @patch("mcp_coder.cli.commands.check_file_sizes.execute_check_file_sizes")
     @patch("sys.argv", ["mcp-coder", "check", "file-size"])
     def test_default_argument_values(self, mock_execute: MagicMock) -> None:
         """Test that default argument values are set correctly."""
@@ -0,0 +1,188 @@
+"""Tests for the concurrent stale-bot checks of define-labels.
+
+Tests cover:
+- LabelEventCache reuse, invalidation and persistence
+- RateLimitGate concurrency and rate-limit cut-off
+- validate_issues skipping API calls and reporting rate-limit headroom
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from mcp_coder.cli.commands.define_labels import (
+    format_validation_summary,
+    validate_issues,
+)
+from mcp_coder.cli.commands.define_labels_stale import (
+    LabelEventCache,
+    RateLimitGate,
+    StaleCheck,
+    run_stale_checks,
+)
+from mcp_coder.mcp_workspace_github import IssueData
+
+LABEL = "status-06:implementing"
+
+LABELS_CONFIG: dict[str, Any] = {
+    "workflow_labels": [
+        {
+            "name": LABEL,
+            "internal_id": "implementing",
+            "category": "bot_busy",
+            "color": "bfdbfe",
+            "description": "Implementation in progress",
+            "stale_timeout_minutes": 120,
+        },
+    ]
+}
+
+
+def _ago(minutes: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes)).isoformat()
+
+
+def _issue(
+    number: int, created_at: str | None = None, updated_at: str | None = None
+) -> IssueData:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "state": "open",
+        "labels": [LABEL],
+        "assignees": [],
+        "user": None,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "url": "",
+        "locked": False,
+    }
+
+
+def _issue_manager(labeled_at: str, remaining: int = 4000) -> MagicMock:
+    manager = MagicMock()
+    manager.get_issue_events.return_value = [
+        {"event": "labeled", "label": LABEL, "created_at": labeled_at, "actor": "bot"}
+    ]
+    manager._github_client.rate_limiting = (remaining, 5000)
+    return manager
+
+
+class TestLabelEventCache:
+    """Label timestamps are reused while the issue is unchanged."""
+
+    def test_reused_until_issue_updated(self, tmp_path: Path) -> None:
+        path = tmp_path / "repo.label_events.json"
+        cache = LabelEventCache(path)
+        cache.put(_issue(1, updated_at="u1"), LABEL, "t1")
+        cache.save()
+
+        reloaded = LabelEventCache(path)
+
+        assert reloaded.get(_issue(1, updated_at="u1"), LABEL) == "t1"
+        assert reloaded.get(_issue(1, updated_at="u2"), LABEL) is None
+
+    def test_issue_without_updated_at_is_not_cached(self) -> None:
+        cache = LabelEventCache()
+        cache.put(_issue(1), LABEL, "t1")
+
+        assert cache.get(_issue(1), LABEL) is None
+
+    def test_save_drops_unused_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "repo.label_events.json"
+        cache = LabelEventCache(path)
+        cache.put(_issue(1, updated_at="u1"), LABEL, "t1")
+        cache.put(_issue(2, updated_at="u2"), LABEL, "t2")
+        cache.save()
+
+        next_run = LabelEventCache(path)
+        next_run.get(_issue(2, updated_at="u2"), LABEL)
+        next_run.save()
+
+        assert LabelEventCache(path).get(_issue(1, updated_at="u1"), LABEL) is None
+        assert LabelEventCache(path).get(_issue(2, updated_at="u2"), LABEL) == "t2"
+
+
+class TestRunStaleChecks:
+    """Checks run concurrently, in order, behind the rate-limit gate."""
+
+    def test_limits_concurrency_and_keeps_order(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def check(item: StaleCheck) -> tuple[bool, int | None]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return (False, item.issue["number"])
+
+        checks = [StaleCheck(_issue(n), LABEL, 120) for n in range(12)]
+        gate = RateLimitGate(3, lambda: None)
+
+        results = run_stale_checks(checks, check, gate, max_workers=8)
+
+        assert [r[1] for r in results if r] == list(range(12))
+        assert 1 < peak <= 3
+
+    def test_skips_checks_at_rate_limit_reserve(self) -> None:
+        checks = [StaleCheck(_issue(n), LABEL, 120) for n in range(3)]
+        gate = RateLimitGate(1, lambda: (50, 5000), reserve=100)
+        check = MagicMock(return_value=(False, None))
+
+        results = run_stale_checks(checks, check, gate)
+
+        assert results == [None, None, None]
+        check.assert_not_called()
+
+
+class TestValidateIssuesConcurrent:
+    """validate_issues avoids requests where the answer is known."""
+
+    def test_recent_issue_needs_no_events_request(self) -> None:
+        manager = _issue_manager(_ago(150))
+
+        result = validate_issues(
+            [_issue(5, created_at=_ago(30))], LABELS_CONFIG, manager
+        )
+
+        manager.get_issue_events.assert_not_called()
+        assert result["warnings"] == []
+
+    def test_cached_label_timestamp_skips_events_request(self) -> None:
+        issue = _issue(7, created_at=_ago(600), updated_at="u7")
+        cache = LabelEventCache()
+        cache.put(issue, LABEL, _ago(150))
+        manager = _issue_manager(_ago(1))
+
+        result = validate_issues([issue], LABELS_CONFIG, manager, label_cache=cache)
+
+        manager.get_issue_events.assert_not_called()
+        assert [w["issue"] for w in result["warnings"]] == [7]
+
+    def test_reports_rate_limit_and_skipped_checks(self) -> None:
+        issues = [_issue(n) for n in (1, 2)]
+        manager = _issue_manager(_ago(150), remaining=10)
+
+        result = validate_issues(issues, LABELS_CONFIG, manager)
+
+        assert result["skipped"] == [1, 2]
+        assert result["rate_limit"] == {"remaining": 10, "limit": 5000}
+        summary = format_validation_summary(
+            {"created": [], "updated": [], "deleted": [], "unchanged": []},
+            result,
+            "",
+            init_requested=False,
+            validate_requested=True,
+            gen_actions_requested=False,
+        )
+        assert "Stale checks skipped (rate limit): 2 (#1, #2)" in summary
+        assert "GitHub API: 10/5000 requests remaining" in summary
@@ -34,7 +34,7 @@
 class TestVerifyCommandIntegration:
     """Test the verify command CLI integration."""
 
-    @patch("mcp_coder.cli.main.execute_verify")
+    @patch("mcp_coder.cli.commands.verify.execute_verify")
     @patch("sys.argv", ["mcp-coder", "verify"])
     def test_verify_command_calls_verification_function(
         self, mock_verify: MagicMock
@@ -51,7 +51,7 @@ def test_verify_command_calls_verification_function(
         call_args = mock_verify.call_args[0][0]  # First positional argument (args)
         assert isinstance(call_args, argparse.Namespace)
 
-    @patch("mcp_coder.cli.main.execute_verify")
+    @patch("mcp_coder.cli.commands.verify.execute_verify")
     @patch("sys.argv", ["mcp-coder", "verify"])
     def test_verify_command_propagates_return_code(
         self, mock_verify: MagicMock
@@ -304,7 +304,7 @@ def test_main_error_log_level(
     def test_main_calls_ensure_truststore(self) -> None:
         """main() activates truststore once before dispatching the command."""
         with (
-            patch("mcp_coder.cli.main.execute_verify", return_value=0),
+            patch("mcp_coder.cli.commands.verify.execute_verify", return_value=0),
             patch("mcp_coder.utils.ssl_setup.ensure_truststore") as mock_ts,
             patch("sys.argv", ["mcp-coder", "verify"]),
         ):
@@ -354,7 +354,7 @@ def test_coordinator_dry_run_parsing(self) -> None:
         assert args.branch_name == "feature-x"
         assert args.coordinator_log_level == "DEBUG"  # default
 
-    @patch("mcp_coder.cli.main.execute_coordinator_test")
+    @patch("mcp_coder.cli.commands.coordinator.execute_coordinator_test")
     def test_coordinator_dry_run_executes_handler(self, mock_execute: Mock) -> None:
         """Test that coordinator --dry-run calls execute_coordinator_test."""
         # Setup
@@ -384,7 +384,7 @@ def test_coordinator_dry_run_executes_handler(self, mock_execute: Mock) -> None:
         assert call_args.repo_name == "mcp_coder"
         assert call_args.branch_name == "feature-x"
 
-    @patch("mcp_coder.cli.main.execute_coordinator_test")
+    @patch("mcp_coder.cli.commands.coordinator.execute_coordinator_test")
     def test_coordinator_dry_run_with_log_level(self, mock_execute: Mock) -> None:
         """Test coordinator --dry-run respects --log-level-coordinator flag."""
         # Setup
@@ -516,7 +516,7 @@ def test_execution_dir_on_create_pr(self) -> None:
 class TestCoordinatorRunCommand:
     """Tests for coordinator run CLI integration."""
 
-    @patch("mcp_coder.cli.main.execute_coordinator_run")
+    @patch("mcp_coder.cli.commands.coordinator.execute_coordinator_run")
     def test_coordinator_run_with_repo_argument(self, mock_execute: Mock) -> None:
         """Test CLI routing for --repo mode."""
         # Setup
@@ -540,7 +540,7 @@ def test_coordinator_run_with_repo_argument(self, mock_execute: Mock) -> None:
         assert call_args.all is False
         assert call_args.log_level is None  # default (resolved at runtime)
 
-    @patch("mcp_coder.cli.main.execute_coordinator_run")
+    @patch("mcp_coder.cli.commands.coordinator.execute_coordinator_run")
     def test_coordinator_run_with_all_argument(self, mock_execute: Mock) -> None:
         """Test CLI routing for --all mode."""
         # Setup
@@ -564,7 +564,7 @@ def test_coordinator_run_with_all_argument(self, mock_execute: Mock) -> None:
         assert call_args.repo is None
         assert call_args.log_level is None  # default (resolved at runtime)
 
-    @patch("mcp_coder.cli.main.execute_coordinator_run")
+    @patch("mcp_coder.cli.commands.coordinator.execute_coordinator_run")
     def test_coordinator_run_with_log_level(self, mock_execute: Mock) -> None:
         """Test log level pass-through."""
         # Setup
@@ -3,6 +3,7 @@
 # ruff: noqa: S324
 
 import json
+import os
 from importlib.resources.abc import Traversable
 from pathlib import Path
 
@@ -11,6 +12,7 @@
 from mcp_coder.config.label_config import (
     _get_labels_config_from_pyproject,
     build_label_lookups,
+    clear_labels_config_cache,
     get_labels_config_path,
     load_labels_config,
     validate_labels_config,
@@ -606,3 +608,26 @@ def test_file_not_found_returns_none(self, tmp_path: Path) -> None:
 
         result = _get_labels_config_from_pyproject(tmp_path)
         assert result is None
+
+
+def test_load_labels_config_cached_until_file_changes(tmp_path: Path) -> None:
+    """A labels file is parsed once and re-read after it changes."""
+    config_file = tmp_path / "labels.json"
+    config_file.write_text(
+        json.dumps({"workflow_labels": [], "ignore_labels": []}), encoding="utf-8"
+    )
+
+    first = load_labels_config(config_file)
+    assert load_labels_config(config_file) is first
+
+    config_file.write_text(
+        json.dumps({"workflow_labels": [], "ignore_labels": ["skip"]}),
+        encoding="utf-8",
+    )
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_labels_config(config_file)["ignore_labels"] == ["skip"]
+
+    reloaded = load_labels_config(config_file)
+    clear_labels_config_cache()
+    assert load_labels_config(config_file) is not reloaded
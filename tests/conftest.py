@@ -78,6 +78,12 @@ def isolate_mlflow_artifacts(
         os.environ.pop("MLFLOW_TRACKING_URI", None)
 
 
+@pytest.fixture(autouse=True)
+def disable_mcp_tool_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from reading or writing the user's on-disk MCP tool cache."""
+    monkeypatch.setenv("MCP_CODER_MCP_TOOL_CACHE", "0")
+
+
 @pytest.fixture(autouse=True)
 def cleanup_test_artifacts() -> Generator[None, None, None]:
     """Clean up any test artifacts created during test execution.
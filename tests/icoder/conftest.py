@@ -154,8 +154,8 @@ def fake_llm() -> FakeLLMService:
 
 @pytest.fixture
 def event_log(tmp_path: Path) -> Generator[EventLog, None, None]:
-    """Provide an EventLog writing to a temp directory."""
-    with EventLog(logs_dir=tmp_path) as log:
+    """Provide an EventLog writing to a temp directory (entries kept)."""
+    with EventLog(logs_dir=tmp_path, keep_entries=True) as log:
         yield log
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -19,6 +20,7 @@
 )
 from mcp_coder.icoder.env_setup import RuntimeInfo
 from mcp_coder.icoder.services.llm_service import FakeLLMService
+from mcp_coder.llm.types import iter_spilled_records
 from mcp_coder.utils.mcp_verification import MCPServerInfo
 
 
@@ -339,6 +341,29 @@ def fake_store(response_data: object, prompt: str, **kwargs: object) -> str:
     assert captured_kwargs.get("log_file_path") == str(event_log.current_path)
 
 
+def test_stream_llm_stores_events_by_reference(
+    app_core: AppCore,
+    event_log: EventLog,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The stored response points at the turn's records in the event log."""
+    event_log.emit("session_start", provider="claude")
+    stored: list[dict[str, Any]] = []
+
+    def fake_store(response_data: dict[str, Any], prompt: str, **kwargs: object) -> str:
+        stored.append(response_data)
+        return "/fake/path.json"
+
+    monkeypatch.setattr("mcp_coder.icoder.core.app_core.store_session", fake_store)
+    list(app_core.stream_llm("hello"))
+    raw = stored[0]["raw_response"]
+    assert "events" not in raw
+    records = list(iter_spilled_records(raw["events_ref"]))
+    assert records[0]["event"] == "llm_request_start"
+    assert records[-1]["event"] == "llm_request_end"
+    assert sum(r["event"] == "stream_event" for r in records) == raw["event_count"]
+
+
 def test_token_usage_initial_state(app_core: AppCore) -> None:
     """token_usage property exists and starts at zero."""
     usage = app_core.token_usage
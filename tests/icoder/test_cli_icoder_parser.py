@@ -85,7 +85,7 @@ def mock_execute(args):  # type: ignore[no-untyped-def]
 
     monkeypatch.setattr("sys.argv", ["mcp-coder", "icoder"])
 
-    with patch("mcp_coder.cli.main.execute_icoder", mock_execute):
+    with patch("mcp_coder.cli.commands.icoder.execute_icoder", mock_execute):
         from mcp_coder.cli.main import main
 
         result = main()
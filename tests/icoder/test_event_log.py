@@ -4,6 +4,8 @@
 
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,13 +14,22 @@
 from mcp_coder.icoder.core import event_log as event_log_module
 from mcp_coder.icoder.core.event_log import (
     EventLog,
+    WritePolicy,
+    _iter_lines_reversed,
     emit_session_start,
     iter_events,
+    iter_events_reversed,
+    read_session_id_from_log,
+)
+from mcp_coder.icoder.core.log_index import (
+    LogIndexEntry,
+    load_log_index,
+    update_log_index,
 )
 
 
 def test_emit_records_event(tmp_path: Path) -> None:
-    with EventLog(logs_dir=tmp_path) as log:
+    with EventLog(logs_dir=tmp_path, keep_entries=True) as log:
         log.emit("input_received", text="/help")
         assert len(log.entries) == 1
         assert log.entries[0].event == "input_received"
@@ -26,7 +37,7 @@ def test_emit_records_event(tmp_path: Path) -> None:
 
 
 def test_timestamps_monotonic(tmp_path: Path) -> None:
-    with EventLog(logs_dir=tmp_path) as log:
+    with EventLog(logs_dir=tmp_path, keep_entries=True) as log:
         log.emit("first")
         log.emit("second")
         assert log.entries[1].t >= log.entries[0].t
@@ -62,7 +73,7 @@ def test_creates_logs_dir(tmp_path: Path) -> None:
 
 
 def test_context_manager(tmp_path: Path) -> None:
-    with EventLog(logs_dir=tmp_path) as log:
+    with EventLog(logs_dir=tmp_path, keep_entries=True) as log:
         log.emit("test_event", key="value")
         assert len(log.entries) == 1
     # File should be closed after exiting context
@@ -137,7 +148,7 @@ def test_rotate_redirects_writes_to_new_file(tmp_path: Path) -> None:
 
 
 def test_rotate_clears_entries_and_resets_clock(tmp_path: Path) -> None:
-    with EventLog(logs_dir=tmp_path) as log:
+    with EventLog(logs_dir=tmp_path, keep_entries=True) as log:
         log.emit("first")
         log.emit("second")
         assert len(log.entries) == 2
@@ -408,3 +419,173 @@ def fake_open(file, *args, **kwargs):  # type: ignore[no-untyped-def]
     assert any(
         "chat mirror disabled" in record.getMessage() for record in caplog.records
     )
+
+
+def test_entries_not_kept_by_default(tmp_path: Path) -> None:
+    """Without keep_entries, events go to disk only."""
+    with EventLog(logs_dir=tmp_path) as log:
+        log.emit("input_received", text="hi")
+        assert log.entries == []
+        path = log.current_path
+    assert [e["event"] for e in iter_events(path)] == ["input_received"]
+
+
+@pytest.mark.parametrize("mode", ["time", "size"])
+def test_batched_policy_writes_on_flush(tmp_path: Path, mode: str) -> None:
+    """Batched events reach the file at the latest on flush()."""
+    policy = WritePolicy(mode=mode, interval_seconds=60.0)  # type: ignore[arg-type]
+    with EventLog(logs_dir=tmp_path, write_policy=policy) as log:
+        for i in range(50):
+            log.emit("stream_event", type="text_delta", text=str(i))
+        log.flush()
+        events = list(iter_events(log.current_path))
+    assert [e["text"] for e in events] == [str(i) for i in range(50)]
+
+
+def test_time_policy_flushes_after_interval(tmp_path: Path) -> None:
+    """Time-batched events are written without an explicit flush."""
+    policy = WritePolicy(mode="time", interval_seconds=0.01)
+    with EventLog(logs_dir=tmp_path, write_policy=policy) as log:
+        log.emit("stream_event", type="text_delta", text="x")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if log.current_path.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        assert len(list(iter_events(log.current_path))) == 1
+
+
+def test_size_policy_writes_when_batch_full(tmp_path: Path) -> None:
+    """Size-batched events are written once max_batch_bytes are pending."""
+    policy = WritePolicy(mode="size", max_batch_bytes=1)
+    with EventLog(logs_dir=tmp_path, write_policy=policy) as log:
+        log.emit("big", payload="y" * 100)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if log.current_path.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        assert len(list(iter_events(log.current_path))) == 1
+
+
+def test_batched_rotate_and_close_flush(tmp_path: Path) -> None:
+    """rotate() drains the old file; close() drains the new one."""
+    policy = WritePolicy(mode="time", interval_seconds=60.0)
+    log = EventLog(logs_dir=tmp_path, write_policy=policy)
+    log.emit("before_rotate")
+    old_path = log.current_path
+    log.rotate()
+    log.emit("after_rotate")
+    new_path = log.current_path
+    log.close()
+
+    assert [e["event"] for e in iter_events(old_path)] == ["before_rotate"]
+    assert [e["event"] for e in iter_events(new_path)] == ["after_rotate"]
+
+
+def test_rotate_waits_for_in_flight_write(tmp_path: Path) -> None:
+    """rotate() does not close the file while the writer thread holds it."""
+    log = EventLog(logs_dir=tmp_path)
+    old_file = log._file
+    with log._write_lock:
+        rotator = threading.Thread(target=log.rotate)
+        rotator.start()
+        rotator.join(0.1)
+        assert rotator.is_alive()
+        assert not old_file.closed
+    rotator.join(5)
+    assert old_file.closed
+    log.close()
+
+
+def test_iter_lines_reversed_across_chunks(tmp_path: Path) -> None:
+    """Lines come back last-first, including ones split across chunks."""
+    path = tmp_path / "log.jsonl"
+    lines = [f"line-{i}-" + "x" * i for i in range(50)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert list(_iter_lines_reversed(path, chunk_size=7)) == lines[::-1]
+
+
+def test_iter_events_reversed_offsets_resume_paging(tmp_path: Path) -> None:
+    """Yielded offsets point at each event and bound the next backwards read."""
+    path = tmp_path / "log.jsonl"
+    events = [{"event": "e", "i": i, "pad": "x" * (i * 7919 % 300)} for i in range(500)]
+    path.write_text("\n".join(json.dumps(e) for e in events) + "\n", encoding="utf-8")
+    data = path.read_bytes()
+
+    pairs = list(iter_events_reversed(path))
+    assert [event for _, event in pairs] == events[::-1]
+    for offset, event in pairs:
+        assert json.loads(data[offset : data.index(b"\n", offset)]) == event
+    older = [event for _, event in iter_events_reversed(path, pairs[100][0])]
+    assert older == events[: 500 - 101][::-1]
+
+
+def test_import_log_copies_events_and_summary(tmp_path: Path) -> None:
+    """Imported lines land verbatim (minus session_start) and are summarized."""
+    source = tmp_path / "old.jsonl"
+    events = [
+        {"t": 0.0, "event": "session_start", "provider": "claude"},
+        {"t": 1.5, "event": "input_received", "text": "first prompt"},
+        {"t": 2.0, "event": "stream_event", "type": "done", "session_id": "s1"},
+        {"t": 3.0, "event": "input_received", "text": "second"},
+    ]
+    source.write_text("\n".join(json.dumps(e) for e in events), encoding="utf-8")
+
+    log = EventLog(logs_dir=tmp_path / "new")
+    log.emit("session_start", provider="claude")
+    log.import_log(source)
+    log.emit("input_received", text="after resume")
+    path = log.current_path
+    log.close()
+
+    written = list(iter_events(path))
+    assert written[1:4] == events[1:]
+    assert written[4]["text"] == "after resume"
+    entry = load_log_index(tmp_path / "new")[path.name]
+    assert entry.n_turns == 3
+    assert entry.first_prompt == "first prompt"
+    assert entry.last_done_session_id == "s1"
+
+
+def test_read_session_id_prefers_index_entry(tmp_path: Path) -> None:
+    """A current index entry answers without reading the log."""
+    path = tmp_path / "icoder_x.jsonl"
+    path.write_text('{"event": "session_start"}\n', encoding="utf-8")
+    entry = LogIndexEntry(session_id="from-index")
+    entry.stamp(path.stat())
+    update_log_index(tmp_path, path.name, entry)
+    assert read_session_id_from_log(path) == "from-index"
+
+
+def test_read_session_id_ignores_stale_index_entry(tmp_path: Path) -> None:
+    """An index entry whose size/mtime no longer match is not trusted."""
+    path = tmp_path / "icoder_x.jsonl"
+    path.write_text('{"event": "session_start"}\n', encoding="utf-8")
+    entry = LogIndexEntry(session_id="stale", size=1)
+    update_log_index(tmp_path, path.name, entry)
+    assert read_session_id_from_log(path) is None
+
+
+def test_read_session_id_from_tail_done_event(tmp_path: Path) -> None:
+    """Without a session_start id, the last ``done`` event's id wins."""
+    path = tmp_path / "icoder_x.jsonl"
+    events = [
+        {"event": "session_start", "provider": "claude"},
+        {"event": "stream_event", "type": "done", "session_id": "first"},
+        {"event": "input_received", "text": "x" * 100_000},
+        {"event": "stream_event", "type": "done", "session_id": "last"},
+        {"event": "llm_request_end"},
+    ]
+    path.write_text("\n".join(json.dumps(e) for e in events) + "\n", encoding="utf-8")
+    assert read_session_id_from_log(path) == "last"
+
+
+def test_closed_log_session_id_recorded_in_index(tmp_path: Path) -> None:
+    """Closing a log records its session id in the sidecar index."""
+    log = EventLog(logs_dir=tmp_path)
+    log.emit("session_start", provider="claude")
+    log.emit("stream_event", type="done", session_id="abc")
+    path = log.current_path
+    log.close()
+    assert read_session_id_from_log(path) == "abc"
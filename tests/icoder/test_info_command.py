@@ -164,6 +164,33 @@ def test_info_shows_mcp_status(
     assert "8 tools" in text
 
 
+@patch("mcp_coder.icoder.core.commands.info.find_claude_executable", return_value=None)
+def test_info_shows_mcp_startup_time_and_error(
+    _mock_claude: object,
+    registry: CommandRegistry,
+    runtime_info: RuntimeInfo,
+    event_log: EventLog,
+) -> None:
+    mock_manager = _make_mock_mcp_manager(
+        [
+            MCPServerStatus(
+                name="mcp-tools-py", tool_count=12, connected=True, startup_seconds=1.5
+            ),
+            MCPServerStatus(
+                name="mcp-workspace",
+                tool_count=0,
+                connected=False,
+                error="timed out after 45s",
+                startup_seconds=45.0,
+            ),
+        ]
+    )
+    register_info(registry, runtime_info, event_log, mcp_manager=mock_manager)
+    text = _info_text(registry.dispatch("/info"))
+    assert "12 tools, 1.50s" in text
+    assert "error: timed out after 45s" in text
+
+
 @patch("mcp_coder.icoder.core.commands.info.find_claude_executable", return_value=None)
 def test_info_without_mcp_manager(
     _mock_claude: object,
@@ -576,3 +576,60 @@ def test_real_llm_service_stream_smoke() -> None:
     assert any(e["type"] == "text_delta" for e in events)
     assert any(e["type"] == "done" for e in events)
     assert service.session_id
+
+
+def test_real_service_passes_warm_claude_worker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With the worker enabled, Claude turns share one ClaudeCliWorker."""
+    from mcp_coder.llm.providers.claude.claude_cli_worker import ClaudeCliWorker
+
+    workers: list[object] = []
+
+    def mock_stream(question: str, **kwargs: object) -> Iterator[StreamEvent]:
+        workers.append(kwargs["claude_worker"])
+        yield {"type": "done"}
+
+    monkeypatch.setenv("MCP_CODER_CLAUDE_WARM_WORKER", "1")
+    monkeypatch.setattr(
+        "mcp_coder.icoder.services.llm_service.prompt_llm_stream",
+        mock_stream,
+    )
+    service = RealLLMService(provider="claude")
+    list(service.stream("one"))
+    list(service.stream("two"))
+    assert isinstance(workers[0], ClaudeCliWorker)
+    assert workers[0] is workers[1]
+
+    closed: list[bool] = []
+    monkeypatch.setattr(ClaudeCliWorker, "close", lambda self: closed.append(True))
+    service.close()
+    assert closed == [True]
+
+
+@pytest.mark.parametrize(
+    ("provider", "env_value"),
+    [("langchain", "1"), ("claude", None), ("claude", "0")],
+)
+def test_real_service_without_warm_worker(
+    monkeypatch: pytest.MonkeyPatch, provider: str, env_value: str | None
+) -> None:
+    """No worker for other providers or unless MCP_CODER_CLAUDE_WARM_WORKER=1."""
+    captured: dict[str, object] = {}
+
+    def mock_stream(question: str, **kwargs: object) -> Iterator[StreamEvent]:
+        captured.update(kwargs)
+        yield {"type": "done"}
+
+    if env_value is None:
+        monkeypatch.delenv("MCP_CODER_CLAUDE_WARM_WORKER", raising=False)
+    else:
+        monkeypatch.setenv("MCP_CODER_CLAUDE_WARM_WORKER", env_value)
+    monkeypatch.setattr(
+        "mcp_coder.icoder.services.llm_service.prompt_llm_stream",
+        mock_stream,
+    )
+    service = RealLLMService(provider=provider)
+    list(service.stream("one"))
+    assert captured["claude_worker"] is None
+    service.close()
@@ -5,9 +5,12 @@
 import json
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from mcp_coder.icoder.core.event_log import EventLog, WritePolicy
+from mcp_coder.icoder.core.log_index import INDEX_FILENAME, load_log_index
 from mcp_coder.icoder.core.log_inventory import FIRST_PROMPT_MAX, list_icoder_logs
 from mcp_coder.icoder.core.types import LogSummary
 
@@ -211,3 +214,121 @@ def test_logs_dir_accepts_string(tmp_path: Path) -> None:
     result = list_icoder_logs(str(tmp_path))
     assert len(result) == 1
     assert result[0].path == log_path
+
+
+def _two_turn_log(path: Path) -> None:
+    _write_log(
+        path,
+        [
+            {"t": 0.0, "event": "session_start", "provider": "claude"},
+            {"t": 0.1, "event": "input_received", "text": "first"},
+            {"t": 0.2, "event": "input_received", "text": "second"},
+        ],
+    )
+
+
+def test_second_listing_served_from_index(tmp_path: Path) -> None:
+    """Unchanged logs are not re-parsed once indexed."""
+    _two_turn_log(tmp_path / "icoder_2026-05-01T10-00-00.jsonl")
+    first = list_icoder_logs(tmp_path)
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+    with patch(
+        "mcp_coder.icoder.core.log_inventory.iter_events",
+        side_effect=AssertionError("log re-parsed"),
+    ):
+        second = list_icoder_logs(tmp_path)
+
+    assert second == first
+
+
+def test_modified_log_is_rescanned(tmp_path: Path) -> None:
+    """A log whose size changed since indexing is parsed again."""
+    log_path = tmp_path / "icoder_2026-05-01T10-00-00.jsonl"
+    _two_turn_log(log_path)
+    list_icoder_logs(tmp_path)
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"t": 0.3, "event": "input_received", "text": "3"}) + "\n")
+
+    assert list_icoder_logs(tmp_path)[0].n_turns == 3
+
+
+def test_deleted_log_pruned_from_index(tmp_path: Path) -> None:
+    """Index entries of deleted logs are dropped."""
+    keep = tmp_path / "icoder_2026-05-01T10-00-00.jsonl"
+    gone = tmp_path / "icoder_2026-05-02T10-00-00.jsonl"
+    _two_turn_log(keep)
+    _two_turn_log(gone)
+    list_icoder_logs(tmp_path)
+    gone.unlink()
+
+    list_icoder_logs(tmp_path)
+
+    assert set(load_log_index(tmp_path)) == {keep.name}
+
+
+def test_corrupt_index_is_rebuilt(tmp_path: Path) -> None:
+    """An unreadable index falls back to parsing the logs."""
+    _two_turn_log(tmp_path / "icoder_2026-05-01T10-00-00.jsonl")
+    (tmp_path / INDEX_FILENAME).write_text("{broken", encoding="utf-8")
+
+    result = list_icoder_logs(tmp_path)
+
+    assert result[0].n_turns == 2
+    assert result[0].first_prompt == "first"
+
+
+def test_event_log_close_indexes_its_log(tmp_path: Path) -> None:
+    """EventLog records its summary on close; listing needs no parse."""
+    with EventLog(logs_dir=tmp_path) as log:
+        log.emit("session_start", provider="langchain")
+        log.emit("input_received", text="indexed prompt")
+    entry = load_log_index(tmp_path)[log.current_path.name]
+    assert entry.provider == "langchain"
+    assert entry.n_turns == 1
+
+    with patch(
+        "mcp_coder.icoder.core.log_inventory.iter_events",
+        side_effect=AssertionError("log re-parsed"),
+    ):
+        result = list_icoder_logs(tmp_path, provider="langchain")
+
+    assert [s.first_prompt for s in result] == ["indexed prompt"]
+
+
+def test_event_log_rotate_indexes_previous_log(tmp_path: Path) -> None:
+    """Rotation records the finished log and starts a fresh summary."""
+    log = EventLog(logs_dir=tmp_path)
+    try:
+        log.emit("session_start", provider="claude")
+        log.emit("input_received", text="before rotate")
+        old_name = log.current_path.name
+        log.rotate()
+        log.emit("session_start", provider="claude")
+    finally:
+        log.close()
+
+    index = load_log_index(tmp_path)
+    assert index[old_name].n_turns == 1
+    assert index[log.current_path.name].n_turns == 0
+
+
+@pytest.mark.parametrize("mode", ["immediate", "size"])
+def test_synced_open_log_served_from_index(tmp_path: Path, mode: str) -> None:
+    """The session's own open log is not re-parsed after sync_index()."""
+    policy = WritePolicy(mode=mode)  # type: ignore[arg-type]
+    with EventLog(logs_dir=tmp_path, write_policy=policy) as log:
+        log.emit("session_start", provider="claude")
+        log.emit("input_received", text="live prompt")
+        log.sync_index()
+
+        with patch(
+            "mcp_coder.icoder.core.log_inventory.iter_events",
+            side_effect=AssertionError("log re-parsed"),
+        ):
+            result = list_icoder_logs(tmp_path)
+        assert [(s.n_turns, s.first_prompt) for s in result] == [(1, "live prompt")]
+
+        log.emit("input_received", text="later")
+        log.flush()
+        assert list_icoder_logs(tmp_path)[0].n_turns == 2
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from mcp_coder.icoder.core.app_core import AppCore
-from mcp_coder.icoder.core.event_log import EventLog
+from mcp_coder.icoder.core.event_log import (
+    EventLog,
+    iter_events,
+    iter_events_reversed,
+)
 from mcp_coder.icoder.services.llm_service import FakeLLMService
+from mcp_coder.icoder.ui import replay as replay_module
 from mcp_coder.icoder.ui.app import ICoderApp
 from mcp_coder.icoder.ui.replay import replay_log
 from mcp_coder.icoder.ui.widgets.input_area import InputArea
@@ -249,8 +256,9 @@ async def test_replay_log_re_emits_events_when_event_log_supplied(
         new_log = app._core.event_log
         replay_log(app, log_path, event_log=new_log)
         await pilot.pause()
-        # session_start is NOT re-emitted; everything else is.
-        recorded = [e.event for e in new_log.entries]
+        # session_start is NOT copied; everything else is.
+        new_log.flush()
+        recorded = [e["event"] for e in iter_events(new_log.current_path)]
         assert "session_start" not in recorded
         assert "input_received" in recorded
         assert "llm_request_start" in recorded
@@ -344,3 +352,117 @@ async def test_replay_tool_creates_unit(
         tool_units = [u for u in output._units.values() if u.kind == "tool"]
         assert len(tool_units) == 1
         assert tool_units[0].output == '{"result": ["file1.py"]}'
+
+
+def _turn_events(n_turns: int) -> list[dict[str, object]]:
+    """Build a log with ``n_turns`` simple prompt/answer turns."""
+    events: list[dict[str, object]] = [
+        {"t": 0.0, "event": "session_start", "provider": "claude"}
+    ]
+    for i in range(n_turns):
+        events += [
+            {"t": float(i), "event": "input_received", "text": f"prompt {i}"},
+            {"t": float(i), "event": "llm_request_start", "text": f"prompt {i}"},
+            {
+                "t": float(i),
+                "event": "stream_event",
+                "type": "text_delta",
+                "text": f"answer {i}\n",
+            },
+            {"t": float(i), "event": "stream_event", "type": "done"},
+            {"t": float(i), "event": "llm_request_end"},
+        ]
+    return events
+
+
+async def test_replay_renders_only_tail_turns(
+    make_icoder_app: Callable[..., ICoderApp],
+    tmp_path: Path,
+) -> None:
+    """Older turns hide behind a marker; history and re-emission are complete."""
+    log_path = tmp_path / "icoder_2026-05-01T10-00-00.jsonl"
+    _write_log(log_path, _turn_events(5))
+    target = EventLog(logs_dir=tmp_path / "new", keep_entries=True)
+    app = make_icoder_app(responses=[])
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        replay_log(app, log_path, event_log=target, tail_turns=2)
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        joined = "\n".join(output.rendered_lines)
+        assert "↑ 3 earlier turns" in joined
+        assert "> prompt 2" not in joined
+        assert "> prompt 3" in joined and "> prompt 4" in joined
+        assert output.has_pending_history
+        assert app._core.command_history._entries == [f"prompt {i}" for i in range(5)]
+    target.close()
+    inputs = [
+        e for e in iter_events(target.current_path) if e["event"] == "input_received"
+    ]
+    assert len(inputs) == 5
+
+
+async def test_replay_load_earlier_pages_in_history(
+    make_icoder_app: Callable[..., ICoderApp],
+    tmp_path: Path,
+) -> None:
+    """Loading history inserts older turns above the tail, in order."""
+    log_path = tmp_path / "icoder_2026-05-01T10-00-00.jsonl"
+    _write_log(log_path, _turn_events(5))
+    app = make_icoder_app(responses=[])
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        replay_log(app, log_path, tail_turns=2)
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        assert output._history_loader is not None
+        output._history_loader()
+        await pilot.pause()
+        rendered = output.rendered_lines
+        prompts = [line for line in rendered if line.startswith("> prompt")]
+        assert prompts == [f"> prompt {i}" for i in range(5)]
+        assert "answer 0" in rendered
+        assert not output.has_pending_history
+        assert not any("earlier turn" in line for line in rendered)
+        recorded = [
+            line for line in output.recorded_lines if line.startswith("> prompt")
+        ]
+        assert recorded == prompts
+
+
+async def test_replay_reads_tail_first_and_pages_backwards(
+    make_icoder_app: Callable[..., ICoderApp],
+    tmp_path: Path,
+) -> None:
+    """Only the tail turns are decoded up front; pages read further back."""
+    log_path = tmp_path / "icoder_2026-05-01T10-00-00.jsonl"
+    _write_log(log_path, _turn_events(50))
+    read: list[dict[str, Any]] = []
+
+    def _recording(
+        path: Path, end: int | None = None
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        for offset, event in iter_events_reversed(path, end):
+            read.append(event)
+            yield offset, event
+
+    app = make_icoder_app(responses=[])
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        with patch.object(replay_module, "iter_events_reversed", _recording):
+            replay_log(app, log_path, tail_turns=2)
+            await pilot.pause()
+            assert len(read) == 2 * 5
+            output = app.query_one(OutputLog)
+            renderer = app._renderer
+            app._text_buffer = "live partial"
+            while output._history_loader is not None:
+                output._history_loader()
+                await pilot.pause()
+        assert len(read) == 1 + 50 * 5
+        prompts = [
+            line for line in output.rendered_lines if line.startswith("> prompt")
+        ]
+        assert prompts == [f"> prompt {i}" for i in range(50)]
+        assert app._renderer is renderer
+        assert app._text_buffer == "live partial"
@@ -11,7 +11,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 from rich.markdown import Markdown
@@ -696,3 +696,115 @@ async def test_rebuild_with_pending_tool_renders_start_only() -> None:
         assert "done" in joined
         assert "a" in joined
         assert "b" in joined
+
+
+def _fill_session(output: OutputLog, n_units: int) -> None:
+    """Append ``n_units`` tool units, each followed by a long text line."""
+    for i in range(n_units):
+        output.append_unit(
+            _make_tool_unit(f"T{i}", output_lines=("o1", "o2"), total_lines=2),
+            ["start"],
+        )
+        output.append_text(f"line {i} " + "word " * 40)
+
+
+async def test_toggle_renders_only_the_toggled_unit() -> None:
+    """A tier toggle re-renders one block, however long the session is."""
+    app = _RegistryApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        _fill_session(output, 1000)
+        output.rebuild()
+        await pilot.pause()
+
+        with patch.object(
+            OutputLog,
+            "_render_block",
+            autospec=True,
+            side_effect=OutputLog._render_block,
+        ) as render:
+            output.toggle_unit_tier("T0")
+            output.toggle_unit_tier("T0")
+        # oneline rendered once; compressed was still cached.
+        assert render.call_count == 1
+        assert output.unit_at_line(output._ranges[-2][0]) is not None
+
+
+async def test_resize_rewraps_only_viewport_then_refreshes_rest() -> None:
+    """Resize re-wraps a bounded window; the rest catches up in background."""
+    app = _RegistryApp()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        _fill_session(output, 1000)
+        output.rebuild()
+        await pilot.pause()
+
+        with (
+            patch.object(OutputLog, "_refresh_stale_blocks") as refresh,
+            patch.object(
+                OutputLog,
+                "_render_block",
+                autospec=True,
+                side_effect=OutputLog._render_block,
+            ) as render,
+        ):
+            await pilot.resize_terminal(90, 40)
+            # The background refresh is queued with call_later; wait for it.
+            for _ in range(50):
+                if refresh.call_args is not None:
+                    break
+                await pilot.pause()
+        assert render.call_count < 600  # of 2000 script entries
+        generation, stale = refresh.call_args.args
+        assert len(stale) + render.call_count >= 2000
+
+        output._refresh_stale_blocks(generation, stale)
+        await pilot.pause()
+        virtualized = [strip.text for strip in output.lines]
+        ranges = list(output._ranges)
+        output._blocks.clear()
+        output.rebuild()
+        assert [strip.text for strip in output.lines] == virtualized
+        assert output._ranges == ranges
+
+
+async def test_spare_blocks_are_capped() -> None:
+    """Blocks the script no longer renders are pruned beyond the cap."""
+    app = _RegistryApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        _fill_session(output, 50)
+        output.rebuild()
+        await pilot.pause()
+
+        with patch("mcp_coder.icoder.ui.widgets.output_log._MAX_SPARE_BLOCKS", 10):
+            for i in range(50):
+                output.toggle_unit_tier(f"T{i}")
+            output.rebuild()
+        assert len(output._blocks) == len(output._script) + 10
+        assert all(
+            output._block_key(entry) in output._blocks for entry in output._script
+        )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "lines",
+        "_line_cache",
+        "_widest_line_width",
+        "_start_line",
+        "_size_known",
+        "_make_renderable",
+    ],
+)
+async def test_richlog_internals_present(name: str) -> None:
+    """The RichLog internals OutputLog splices into still exist."""
+    app = _RegistryApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        assert hasattr(output, name)
@@ -446,6 +446,80 @@ def test_stream_file_preserved_on_error(
             content = stream_files[0].read_text(encoding="utf-8")
             assert "partial-sess" in content
 
+    @patch(
+        "mcp_coder.llm.providers.claude.claude_code_cli_streaming._find_claude_executable",
+        return_value="claude",
+    )
+    @patch("mcp_coder.llm.providers.claude.claude_code_cli_streaming.stream_subprocess")
+    def test_each_line_parsed_once(
+        self,
+        mock_stream: MagicMock,
+        _mock_find: MagicMock,
+        make_stream_json_output: StreamJsonFactory,
+        tmp_path: Path,
+    ) -> None:
+        """The streaming core decodes every NDJSON line exactly once."""
+        lines = make_stream_json_output("Test", "sess-1").split("\n")
+        mock_stream.return_value = _make_mock_stream(lines)
+
+        with patch(
+            "mcp_coder.llm.providers.claude.claude_code_cli_streaming."
+            "parse_stream_json_line",
+            side_effect=parse_stream_json_line,
+        ) as mock_parse:
+            list(ask_claude_code_cli_stream("q", logs_dir=str(tmp_path)))
+
+        assert [c.args[0] for c in mock_parse.call_args_list] == lines
+
+    @patch(
+        "mcp_coder.llm.providers.claude.claude_code_cli_streaming._find_claude_executable",
+        return_value="claude",
+    )
+    @patch("mcp_coder.llm.providers.claude.claude_code_cli_streaming.stream_subprocess")
+    def test_turn_flushed_before_done_event(
+        self,
+        mock_stream: MagicMock,
+        _mock_find: MagicMock,
+        make_stream_json_output: StreamJsonFactory,
+        tmp_path: Path,
+    ) -> None:
+        """The whole turn is on disk when the ``done`` event is yielded."""
+        lines = make_stream_json_output("Test", "sess-1").split("\n")
+        mock_stream.return_value = _make_mock_stream(lines)
+
+        stream_file: Path | None = None
+        for event in ask_claude_code_cli_stream("q", logs_dir=str(tmp_path)):
+            if event["type"] == "stream_file":
+                stream_file = Path(str(event["path"]))
+            elif event["type"] == "done":
+                assert stream_file is not None
+                on_disk = stream_file.read_text(encoding="utf-8")
+                assert on_disk == "\n".join(lines) + "\n"
+                break
+        else:
+            pytest.fail("no done event")
+
+    @patch(
+        "mcp_coder.llm.providers.claude.claude_code_cli_streaming._find_claude_executable",
+        return_value="claude",
+    )
+    @patch("mcp_coder.llm.providers.claude.claude_code_cli_streaming.stream_subprocess")
+    def test_stream_file_written_with_bare_newlines(
+        self,
+        mock_stream: MagicMock,
+        _mock_find: MagicMock,
+        make_stream_json_output: StreamJsonFactory,
+        tmp_path: Path,
+    ) -> None:
+        """Lines end in ``\\n`` on every OS so ``events_ref`` byte ranges match."""
+        lines = make_stream_json_output("Test", "sess-1").split("\n")
+        mock_stream.return_value = _make_mock_stream(lines)
+
+        result = ask_claude_code_cli("q", logs_dir=str(tmp_path))
+
+        stream_file = Path(str(result["raw_response"]["stream_file"]))
+        assert stream_file.read_bytes() == ("\n".join(lines) + "\n").encode("utf-8")
+
 
 class TestMapStreamMessageIsError:
     """Tests for is_error propagation in _map_stream_message_to_event()."""
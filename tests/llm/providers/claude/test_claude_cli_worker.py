@@ -0,0 +1,233 @@
+"""Tests for the warm, persistent Claude CLI worker."""
+
+import json
+import sys
+from collections.abc import Generator, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_coder.llm.providers.claude import claude_cli_worker
+from mcp_coder.llm.providers.claude.claude_cli_worker import (
+    CLAUDE_WARM_WORKER_ENV,
+    ClaudeCliWorker,
+    warm_worker_enabled,
+)
+from mcp_coder.llm.types import StreamEvent
+
+# Fake ``claude -p --input-format stream-json``: one init message at startup,
+# then per stdin message an assistant reply naming its pid plus a result.
+# Session "dead" exits at startup without output, "crash" exits before
+# answering, "crash-mid" exits after partial output and "hang" never answers.
+_FAKE_CLI = """
+import json, os, sys, time
+
+def emit(obj):
+    print(json.dumps(obj), flush=True)
+
+session = sys.argv[1] if len(sys.argv) > 1 else "new-session"
+if session == "dead":
+    sys.exit(2)
+emit({"type": "system", "subtype": "init", "session_id": session})
+for line in sys.stdin:
+    text = json.loads(line)["message"]["content"]
+    if text == "crash":
+        sys.exit(2)
+    if text == "hang":
+        time.sleep(60)
+    reply = {"type": "text", "text": f"{text} from {os.getpid()}"}
+    emit({"type": "assistant", "message": {"content": [reply]}})
+    if text == "crash-mid":
+        sys.stderr.write("boom\\n")
+        sys.exit(3)
+    emit({"type": "result", "subtype": "success", "result": text,
+          "session_id": session, "usage": {}})
+"""
+
+
+@pytest.fixture
+def fake_cli(tmp_path: Path) -> Iterator[MagicMock]:
+    """Route the worker's CLI command to the fake stream-json CLI."""
+    script = tmp_path / "fake_claude.py"
+    script.write_text(_FAKE_CLI, encoding="utf-8")
+
+    def _command(
+        session_id: str | None, *_args: object, **_kwargs: object
+    ) -> list[str]:
+        return [sys.executable, str(script), *([session_id] if session_id else [])]
+
+    with (
+        patch.object(
+            claude_cli_worker, "_find_claude_executable", return_value="claude"
+        ),
+        patch.object(
+            claude_cli_worker, "build_cli_command", side_effect=_command
+        ) as mock_build,
+    ):
+        yield mock_build
+
+
+@pytest.fixture
+def worker() -> Iterator[ClaudeCliWorker]:
+    """A worker whose process is stopped after the test."""
+    w = ClaudeCliWorker()
+    yield w
+    w.close()
+
+
+def _text(events: list[StreamEvent]) -> str:
+    return "".join(str(e["text"]) for e in events if e["type"] == "text_delta")
+
+
+def _turn(
+    worker: ClaudeCliWorker, question: str, tmp_path: Path, **kwargs: object
+) -> list[StreamEvent]:
+    return list(
+        worker.stream(question, timeout=10, logs_dir=str(tmp_path), **kwargs)  # type: ignore[arg-type]
+    )
+
+
+def test_follow_up_turns_reuse_the_process(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """Successive turns of one session are answered by the same process."""
+    first = _turn(worker, "hello", tmp_path)
+    second = _turn(worker, "again", tmp_path, session_id="new-session")
+
+    assert first[0]["type"] == "stream_file"
+    assert first[-1]["type"] == "done"
+    assert first[-1]["session_id"] == "new-session"
+    pid = _text(first).split(" from ")[1]
+    assert _text(second) == f"again from {pid}"
+    assert fake_cli.call_count == 1
+    # Each turn gets its own complete stream log.
+    stream_file = Path(str(second[0]["path"]))
+    assert '"result"' in stream_file.read_text(encoding="utf-8").splitlines()[-1]
+
+
+def test_session_change_restarts_process(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """A different session id (e.g. after /clear or /load) gets a new process."""
+    _turn(worker, "hello", tmp_path)
+    events = _turn(worker, "other", tmp_path, session_id="loaded-session")
+
+    assert fake_cli.call_count == 2
+    assert fake_cli.call_args.args[0] == "loaded-session"
+    assert events[-1]["session_id"] == "loaded-session"
+
+
+def test_crash_before_output_falls_back_to_spawn_per_turn(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """A process dying before taking the message re-asks via a fresh subprocess."""
+    fallback: list[StreamEvent] = [{"type": "done", "session_id": "spawned"}]
+    with patch.object(
+        claude_cli_worker, "ask_claude_code_cli_stream", return_value=iter(fallback)
+    ) as mock_spawn:
+        events = _turn(worker, "hello", tmp_path, session_id="dead")
+
+    assert events == fallback
+    assert mock_spawn.call_args.args[0] == "hello"
+    assert worker.disabled
+
+
+def test_crash_after_output_is_not_reasked(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """Once the process produced output, its exit is reported, not retried."""
+    with patch.object(claude_cli_worker, "ask_claude_code_cli_stream") as mock_spawn:
+        events = _turn(worker, "crash", tmp_path)
+
+    mock_spawn.assert_not_called()
+    assert events[0]["type"] == "stream_file"
+    assert events[-1]["type"] == "error"
+    assert events[-1]["reason"] == "nonzero_exit"
+    assert worker.disabled
+
+
+def test_timeout_yields_inactivity_error_without_reasking(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """A silent turn ends with the inactivity-timeout event after one timeout."""
+    with patch.object(claude_cli_worker, "ask_claude_code_cli_stream") as mock_spawn:
+        events = list(worker.stream("hang", timeout=1, logs_dir=str(tmp_path)))
+
+    mock_spawn.assert_not_called()
+    assert events[-1]["type"] == "error"
+    assert events[-1]["reason"] == "inactivity_timeout"
+    assert worker.disabled
+
+
+def test_crash_mid_turn_yields_error_and_disables(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """Partial output then exit surfaces a nonzero_exit error event."""
+    events = _turn(worker, "crash-mid", tmp_path)
+
+    assert _text(events).startswith("crash-mid from ")
+    assert events[-1]["type"] == "error"
+    assert events[-1]["reason"] == "nonzero_exit"
+    assert events[-1]["return_code"] == 3
+    assert "boom" in str(events[-1]["message"])
+    assert worker.disabled
+
+
+def test_disabled_worker_spawns_per_turn(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """After a failure every turn goes through ask_claude_code_cli_stream."""
+    _turn(worker, "crash-mid", tmp_path)
+    with patch.object(
+        claude_cli_worker,
+        "ask_claude_code_cli_stream",
+        return_value=iter([{"type": "done"}]),
+    ) as mock_spawn:
+        _turn(worker, "next", tmp_path)
+
+    mock_spawn.assert_called_once()
+    assert fake_cli.call_count == 1
+
+
+def test_abandoned_turn_stops_process(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """Closing the stream mid-turn drops the process without disabling."""
+    stream = worker.stream("hello", timeout=10, logs_dir=str(tmp_path))
+    assert isinstance(stream, Generator)
+    next(stream)  # stream_file
+    stream.close()
+
+    _turn(worker, "again", tmp_path)
+    assert fake_cli.call_count == 2
+    assert not worker.disabled
+
+
+def test_rejects_empty_question(worker: ClaudeCliWorker) -> None:
+    """Input validation matches ask_claude_code_cli_stream."""
+    with pytest.raises(ValueError):
+        list(worker.stream("   "))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(None, False), ("1", True), ("0", False)]
+)
+def test_warm_worker_env_switch(
+    monkeypatch: pytest.MonkeyPatch, value: str | None, expected: bool
+) -> None:
+    """The warm worker is opt-in via MCP_CODER_CLAUDE_WARM_WORKER=1."""
+    if value is None:
+        monkeypatch.delenv(CLAUDE_WARM_WORKER_ENV, raising=False)
+    else:
+        monkeypatch.setenv(CLAUDE_WARM_WORKER_ENV, value)
+    assert warm_worker_enabled() is expected
+
+
+def test_events_are_json_lines_logged(
+    worker: ClaudeCliWorker, fake_cli: MagicMock, tmp_path: Path
+) -> None:
+    """raw_line events carry the CLI's NDJSON output verbatim."""
+    events = _turn(worker, "hello", tmp_path)
+    raw = [json.loads(str(e["line"])) for e in events if e["type"] == "raw_line"]
+    assert [m["type"] for m in raw] == ["system", "assistant", "result"]
@@ -0,0 +1,55 @@
+"""Integration tests for the warm Claude CLI worker.
+
+These tests drive a real ``claude`` process over ``--input-format
+stream-json``. They require:
+- Claude CLI installed and authenticated
+- Network access to Claude API
+
+Run with: pytest -m claude_cli_integration
+"""
+
+import tempfile
+
+import pytest
+
+from mcp_coder.llm.providers.claude.claude_cli_worker import ClaudeCliWorker
+
+
+@pytest.mark.claude_cli_integration
+class TestClaudeCliWorkerIntegration:
+    """End-to-end warm-worker turns against the real Claude CLI."""
+
+    def test_follow_up_turn_on_warm_process_keeps_context(self) -> None:
+        """A second turn on the same process sees the first one exactly once."""
+        worker = ClaudeCliWorker()
+        try:
+            with tempfile.TemporaryDirectory() as tmp_logs_dir:
+                events1 = list(
+                    worker.stream(
+                        "Remember: my favorite color is blue. Reply 'noted'.",
+                        timeout=60,
+                        logs_dir=tmp_logs_dir,
+                    )
+                )
+                done1 = next(e for e in events1 if e["type"] == "done")
+                session_id = done1["session_id"]
+                assert isinstance(session_id, str)
+
+                events2 = list(
+                    worker.stream(
+                        "What is my favorite color? Reply with just the color.",
+                        session_id=session_id,
+                        timeout=60,
+                        logs_dir=tmp_logs_dir,
+                    )
+                )
+        finally:
+            worker.close()
+
+        assert not worker.disabled
+        text = "".join(
+            str(e.get("text", "")) for e in events2 if e["type"] == "text_delta"
+        )
+        assert "blue" in text.lower()
+        done2 = next(e for e in events2 if e["type"] == "done")
+        assert done2["session_id"] == session_id
@@ -5,6 +5,7 @@
 import tempfile
 from collections.abc import Iterator
 from pathlib import Path
+from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,6 +20,7 @@
 from mcp_coder.llm.providers.claude.claude_code_cli_streaming import (
     ask_claude_code_cli_stream,
 )
+from mcp_coder.llm.types import iter_spilled_records
 from mcp_coder.utils.subprocess_runner import (
     CalledProcessError,
     CommandResult,
@@ -96,9 +98,14 @@ def test_ask_claude_code_cli_success(
 
             assert response["text"] == "The answer is 42"
             assert response["session_id"] == "test-sess"
-            # raw_response is the events shape (not messages)
-            assert "events" in response["raw_response"]
+            # raw_response is the summary shape: events stay in the stream file
+            assert "events" not in response["raw_response"]
             assert "messages" not in response["raw_response"]
+            assert cast(int, response["raw_response"]["event_count"]) > 0
+            events_ref = cast(dict[str, object], response["raw_response"]["events_ref"])
+            assert events_ref["path"] == str(Path(tmpdir) / "test.ndjson")
+            records = list(iter_spilled_records(events_ref))
+            assert records[-1]["type"] == "result"
             assert "stream_file" in response["raw_response"]
             call_args = mock_stream.call_args
             command = call_args[0][0]
@@ -0,0 +1,166 @@
+"""Tests for the buffered Claude stream log and JSON backend."""
+
+import io
+import json
+import time
+from collections.abc import Callable
+
+import pytest
+
+from mcp_coder.llm.providers.claude.claude_stream_pipeline import (
+    JSON_BACKEND,
+    BufferedStreamLog,
+    loads,
+)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeTimer:
+    """Timer stand-in the test fires by hand."""
+
+    def __init__(self, interval: float, callback: Callable[[], None]) -> None:
+        self.interval = interval
+        self.callback = callback
+        self.started = False
+        self.cancelled = False
+
+    def start(self) -> None:
+        self.started = True
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _FakeTimers:
+    """Timer factory recording every timer it builds."""
+
+    def __init__(self) -> None:
+        self.timers: list[_FakeTimer] = []
+
+    def __call__(self, interval: float, callback: Callable[[], None]) -> _FakeTimer:
+        timer = _FakeTimer(interval, callback)
+        self.timers.append(timer)
+        return timer
+
+
+class TestLoads:
+    """Tests for the JSON backend selection."""
+
+    def test_backend_is_known(self) -> None:
+        """The backend is orjson when installed, else the stdlib."""
+        assert JSON_BACKEND in ("orjson", "json")
+
+    def test_decodes_object(self) -> None:
+        """Both backends decode str input to plain Python objects."""
+        assert loads('{"type": "result", "n": [1, 2]}') == {
+            "type": "result",
+            "n": [1, 2],
+        }
+
+    def test_invalid_json_raises_stdlib_error(self) -> None:
+        """Decode errors are catchable as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads("not json {")
+
+
+class TestBufferedStreamLog:
+    """Tests for BufferedStreamLog flush policy."""
+
+    def test_lines_buffered_until_turn_end(self) -> None:
+        """Writes stay in memory until end_turn()."""
+        fh = io.StringIO()
+        log = BufferedStreamLog(fh, clock=_FakeClock(), timer_factory=_FakeTimers())
+        log.write_line("a")
+        log.write_line("b")
+        assert fh.getvalue() == ""
+        log.end_turn()
+        assert fh.getvalue() == "a\nb\n"
+
+    def test_flushes_when_interval_elapsed(self) -> None:
+        """A write after the flush interval flushes everything buffered."""
+        fh = io.StringIO()
+        clock = _FakeClock()
+        log = BufferedStreamLog(
+            fh, flush_interval=1.0, clock=clock, timer_factory=_FakeTimers()
+        )
+        log.write_line("a")
+        clock.now = 1.5
+        log.write_line("b")
+        assert fh.getvalue() == "a\nb\n"
+
+    def test_flushes_when_buffer_full(self) -> None:
+        """Exceeding max_chars forces a flush."""
+        fh = io.StringIO()
+        log = BufferedStreamLog(
+            fh, max_chars=10, clock=_FakeClock(), timer_factory=_FakeTimers()
+        )
+        log.write_line("12345")
+        assert fh.getvalue() == ""
+        log.write_line("67890")
+        assert fh.getvalue() == "12345\n67890\n"
+
+    def test_close_flushes_and_closes(self) -> None:
+        """Leaving the context flushes pending lines and closes the file."""
+        fh = io.StringIO()
+        written: list[str] = []
+        fh.close = lambda: written.append(fh.getvalue())  # type: ignore[method-assign]
+        with BufferedStreamLog(
+            fh, clock=_FakeClock(), timer_factory=_FakeTimers()
+        ) as log:
+            log.write_line("x")
+        assert written == ["x\n"]
+
+    def test_timer_flushes_without_further_writes(self) -> None:
+        """A line written before a silent stretch reaches the file on the timer."""
+        fh = io.StringIO()
+        clock = _FakeClock()
+        timers = _FakeTimers()
+        log = BufferedStreamLog(
+            fh, flush_interval=1.0, clock=clock, timer_factory=timers
+        )
+        log.write_line("a")
+        log.write_line("b")
+        assert fh.getvalue() == ""
+        assert len(timers.timers) == 1
+        assert timers.timers[0].started
+        assert timers.timers[0].interval == 1.0
+
+        clock.now = 1.0
+        timers.timers[0].callback()
+
+        assert fh.getvalue() == "a\nb\n"
+        log.write_line("c")
+        assert len(timers.timers) == 2
+
+    def test_flush_and_close_cancel_timer(self) -> None:
+        """Flushing or closing cancels the pending timer."""
+        fh = io.StringIO()
+        fh.close = lambda: None  # type: ignore[method-assign]
+        timers = _FakeTimers()
+        log = BufferedStreamLog(fh, clock=_FakeClock(), timer_factory=timers)
+        log.write_line("a")
+        log.end_turn()
+        log.write_line("b")
+        log.close()
+
+        assert [t.cancelled for t in timers.timers] == [True, True]
+        assert fh.getvalue() == "a\nb\n"
+
+    def test_default_timer_flushes_in_background(self) -> None:
+        """The default daemon timer flushes without any further call."""
+        fh = io.StringIO()
+        log = BufferedStreamLog(fh, flush_interval=0.01)
+        log.write_line("a")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not fh.getvalue():
+            time.sleep(0.01)
+        assert fh.getvalue() == "a\n"
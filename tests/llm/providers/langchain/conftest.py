@@ -211,3 +211,31 @@ def _messages_from_dict(
 
     with patch.dict(sys.modules, mocks):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_http_pool() -> Generator[None, None, None]:
+    """Start every test with an empty pooled-client registry.
+
+    Pooled clients outlive a single call by design, so a client (or a mocked
+    SDK client) created by one test would otherwise be served to the next.
+    """
+    from mcp_coder.llm.providers.langchain._http import close_pooled_http_clients
+
+    close_pooled_http_clients()
+    yield
+    close_pooled_http_clients()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_agent_runtime() -> Generator[None, None, None]:
+    """Give every test its own agent runtime loop and empty model/graph caches.
+
+    The runtime caches chat models across turns, so a mocked model patched in
+    by one test would otherwise be served to the next.
+    """
+    from mcp_coder.llm.providers.langchain.agent_runtime import close_agent_runtime
+
+    close_agent_runtime()
+    yield
+    close_agent_runtime()
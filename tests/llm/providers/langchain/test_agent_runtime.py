@@ -0,0 +1,170 @@
+"""Tests for the persistent agent runtime shared by langchain agent turns."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_coder.llm.providers.langchain import agent_runtime
+from mcp_coder.llm.providers.langchain.agent_runtime import (
+    AgentRuntime,
+    get_agent_runtime,
+)
+
+_MOD_LC = "mcp_coder.llm.providers.langchain"
+
+
+def _make_config() -> dict[str, str | None]:
+    return {
+        "backend": "openai",
+        "model": "gpt-4o",
+        "api_key": None,
+        "endpoint": None,
+        "api_version": None,
+    }
+
+
+@pytest.fixture
+def runtime() -> Iterator[AgentRuntime]:
+    """A private runtime, stopped after the test."""
+    rt = AgentRuntime()
+    yield rt
+    rt.close()
+
+
+class TestAgentRuntimeLoop:
+    """The runtime keeps one loop on one thread across calls."""
+
+    def test_run_uses_the_same_persistent_loop(self, runtime: AgentRuntime) -> None:
+        async def _where() -> tuple[asyncio.AbstractEventLoop, str]:
+            return asyncio.get_running_loop(), threading.current_thread().name
+
+        first_loop, thread_name = runtime.run(_where())
+        second_loop, _ = runtime.run(_where())
+
+        assert first_loop is second_loop is runtime.loop
+        assert thread_name == "langchain-agent-loop"
+
+    def test_close_stops_loop_and_next_use_starts_a_new_one(
+        self, runtime: AgentRuntime
+    ) -> None:
+        loop = runtime.loop
+        runtime.close()
+        assert loop.is_closed()
+        assert runtime.loop is not loop
+        assert runtime.loop.is_running()
+
+
+class TestAgentRuntimeChatModels:
+    """Chat models are built once per key, on the runtime loop."""
+
+    def test_model_built_on_loop_and_cached(self, runtime: AgentRuntime) -> None:
+        built_on: list[asyncio.AbstractEventLoop] = []
+
+        def _factory() -> object:
+            built_on.append(asyncio.get_running_loop())
+            return object()
+
+        model = runtime.chat_model("k", _factory)
+        assert runtime.chat_model("k", _factory) is model
+        assert built_on == [runtime.loop]
+
+    def test_failed_build_is_not_cached(self, runtime: AgentRuntime) -> None:
+        factory = MagicMock(side_effect=[ValueError("no tools capability"), "model"])
+
+        with pytest.raises(ValueError, match="no tools capability"):
+            runtime.chat_model("k", factory)
+        assert runtime.chat_model("k", factory) == "model"
+
+    def test_least_recently_used_model_is_evicted(
+        self, runtime: AgentRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(agent_runtime, "MAX_CACHED_MODELS", 2)
+        runtime.chat_model("a", lambda: "a1")
+        runtime.chat_model("b", lambda: "b1")
+        runtime.chat_model("a", lambda: "a2")  # touch "a"
+        runtime.chat_model("c", lambda: "c1")  # evicts "b"
+
+        assert runtime.chat_model("a", lambda: "a3") == "a1"
+        assert runtime.chat_model("b", lambda: "b2") == "b2"
+
+
+class TestAgentRuntimeGraphs:
+    """Compiled graphs are reused for the same model and tool objects."""
+
+    def test_graph_cached_by_model_and_tool_identity(
+        self, runtime: AgentRuntime
+    ) -> None:
+        model = MagicMock()
+        tools = [MagicMock(), MagicMock()]
+        with patch("langgraph.prebuilt.create_react_agent") as create:
+            create.side_effect = lambda m, t: MagicMock()
+
+            graph = runtime.agent_graph(model, tools)
+            assert runtime.agent_graph(model, list(tools)) is graph
+            assert runtime.agent_graph(model, [MagicMock()]) is not graph
+            assert runtime.agent_graph(MagicMock(), tools) is not graph
+
+        assert create.call_count == 3
+
+
+class TestAskAgentStreamReuse:
+    """Successive streamed agent turns share the runtime's model and graph."""
+
+    def test_turns_reuse_chat_model_and_compiled_graph(self) -> None:
+        factories: list[Any] = []
+
+        async def _stream(**kwargs: Any) -> AsyncIterator[dict[str, object]]:
+            factories.append(kwargs["agent_factory"])
+            kwargs["agent_factory"](kwargs["chat_model"], kwargs["tools"])
+            yield {"type": "done", "session_id": "s1"}
+
+        tools = [MagicMock()]
+        with (
+            patch(f"{_MOD_LC}.load_langchain_history", return_value=[]),
+            patch(f"{_MOD_LC}._create_chat_model") as create_model,
+            patch(f"{_MOD_LC}.agent._check_agent_dependencies"),
+            patch(f"{_MOD_LC}.agent.run_agent_stream", side_effect=_stream),
+            patch("langgraph.prebuilt.create_react_agent") as create_graph,
+        ):
+            from mcp_coder.llm.providers.langchain import _ask_agent_stream
+
+            for _ in range(2):
+                list(
+                    _ask_agent_stream(
+                        question="Hi",
+                        config=_make_config(),
+                        session_id="s1",
+                        mcp_config=".mcp.json",
+                        tools=tools,
+                    )
+                )
+
+        create_model.assert_called_once()
+        create_graph.assert_called_once()
+        assert factories == [get_agent_runtime().agent_graph] * 2
+
+    def test_model_key_and_log_hold_no_credentials(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-SECRET")
+        monkeypatch.setenv("HTTPS_PROXY", "http://user:pw@proxy:8080")
+        config = {**_make_config(), "api_key": "sk-CONFIG"}
+
+        with (
+            caplog.at_level(logging.DEBUG, logger=agent_runtime.__name__),
+            patch(f"{_MOD_LC}._create_chat_model"),
+        ):
+            from mcp_coder.llm.providers.langchain import _agent_chat_model
+
+            _agent_chat_model(config, 30)
+
+        cached = repr(list(get_agent_runtime()._models))
+        for secret in ("sk-SECRET", "sk-CONFIG", "user:pw"):
+            assert secret not in caplog.text
+            assert secret not in cached
+        assert "openai/gpt-4o" in caplog.text
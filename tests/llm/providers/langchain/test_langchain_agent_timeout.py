@@ -1,6 +1,8 @@
 """Tests for inactivity timeout in _ask_agent_stream queue loop."""
 
-import queue
+import asyncio
+import threading
+from collections.abc import AsyncIterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -24,24 +26,25 @@ class TestAgentStreamInactivityTimeout:
     """Inactivity timeout when agent queue produces no events."""
 
     def test_agent_stream_inactivity_timeout(self) -> None:
-        """Queue never receives an event; TimeoutError raised."""
+        """Agent task never produces an event; TimeoutError raised promptly."""
         mock_model = MagicMock()
+        stream_cancelled = threading.Event()
 
-        # Create an empty queue that will always raise queue.Empty on get()
-        empty_queue: queue.Queue[object] = queue.Queue()
+        async def _silent_stream(**kwargs: object) -> AsyncIterator[dict[str, object]]:
+            try:
+                await asyncio.sleep(100)
+            except asyncio.CancelledError:
+                stream_cancelled.set()
+                raise
+            yield {}  # pragma: no cover  # pylint: disable=unreachable
 
         with (
             patch(f"{_MOD_LC}.load_langchain_history", return_value=[]),
             patch(f"{_MOD_LC}.store_langchain_history"),
             patch(f"{_MOD_LC}._create_chat_model", return_value=mock_model),
             patch(f"{_MOD_AGENT}._check_agent_dependencies"),
-            patch(f"{_MOD_LC}.queue.Queue", return_value=empty_queue),
-            patch(f"{_MOD_LC}.threading.Thread") as mock_thread_cls,
+            patch(f"{_MOD_AGENT}.run_agent_stream", side_effect=_silent_stream),
         ):
-            # Make the thread start() a no-op (no async agent runs)
-            mock_thread = MagicMock()
-            mock_thread_cls.return_value = mock_thread
-
             from mcp_coder.llm.providers.langchain import _ask_agent_stream
 
             with pytest.raises(
@@ -57,3 +60,6 @@ def test_agent_stream_inactivity_timeout(self) -> None:
                         timeout=1,
                     )
                 )
+
+        # The runtime task is cancelled mid-await, not left sleeping.
+        assert stream_cancelled.is_set()
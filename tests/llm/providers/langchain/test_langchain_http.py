@@ -1,9 +1,11 @@
 """Tests for mcp_coder.llm.providers.langchain._http.
 
 Tests the shared httpx client factory: SSL context creation,
-sync/async client construction, proxy logging, and secret safety.
+sync/async client construction, proxy logging, secret safety, and the
+pooled client registry.
 """
 
+import asyncio
 import logging
 import os
 import ssl
@@ -12,9 +14,15 @@
 import pytest
 
 from mcp_coder.llm.providers.langchain._http import (
+    _POOL,
+    HTTP2_ENV,
     create_async_http_client,
     create_http_client,
     create_ssl_context,
+    get_pooled_async_http_client,
+    get_pooled_http_client,
+    get_pooled_sdk_client,
+    pool_key,
 )
 
 _LOGGER_NAME = "mcp_coder.llm.providers.langchain._http"
@@ -237,3 +245,79 @@ def test_passes_ssl_context_as_verify(self) -> None:
             create_async_http_client()
 
         mock_httpx_mod.AsyncClient.assert_called_once_with(verify=mock_ctx)
+
+
+class TestPooledHttpClients:
+    """Tests for the process-wide pooled client registry."""
+
+    def test_sync_client_shared_per_backend_and_endpoint(self) -> None:
+        """Same key -> same client; another endpoint or backend -> another."""
+        first = get_pooled_http_client("openai", "https://a.example")
+        assert get_pooled_http_client("openai", "https://a.example") is first
+        assert get_pooled_http_client("openai", "https://b.example") is not first
+        assert get_pooled_http_client("anthropic") is not first
+
+    def test_closed_client_is_replaced(self) -> None:
+        """A client closed by its user is not served again."""
+        first = get_pooled_http_client("openai")
+        first.close()
+        second = get_pooled_http_client("openai")
+        assert second is not first
+        assert not second.is_closed
+
+    def test_proxy_change_gets_new_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The proxy environment is part of the pool key."""
+        for var in _PROXY_VARS:
+            monkeypatch.delenv(var, raising=False)
+        first = get_pooled_http_client("openai")
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy:8080")
+        assert get_pooled_http_client("openai") is not first
+
+    def test_backend_connection_limits(self) -> None:
+        """Ollama gets its own (smaller) connection limits."""
+        key = pool_key("ollama")
+        kwargs = _POOL._client_kwargs(key)  # pylint: disable=protected-access
+        assert kwargs["limits"].max_connections == 4
+
+    def test_ssl_context_created_once(self) -> None:
+        """All pooled clients share one SSL context per TLS environment."""
+        with patch(
+            "mcp_coder.llm.providers.langchain._http.create_ssl_context",
+            return_value=ssl.create_default_context(),
+        ) as mock_ctx:
+            get_pooled_http_client("openai")
+            get_pooled_http_client("anthropic")
+        mock_ctx.assert_called_once()
+
+    def test_http2_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """HTTP/2 is only enabled when requested and h2 is importable."""
+        monkeypatch.delenv(HTTP2_ENV, raising=False)
+        assert pool_key("openai").http2 is False
+        monkeypatch.setenv(HTTP2_ENV, "1")
+        with patch("importlib.util.find_spec", return_value=None):
+            assert pool_key("openai").http2 is False
+        with patch("importlib.util.find_spec", return_value=MagicMock()):
+            assert pool_key("openai").http2 is True
+
+    def test_async_client_pooled_per_event_loop(self) -> None:
+        """Async clients are shared within a loop, never across loops."""
+
+        async def _twice() -> tuple[object, object]:
+            return (
+                get_pooled_async_http_client("openai"),
+                get_pooled_async_http_client("openai"),
+            )
+
+        first_a, first_b = asyncio.run(_twice())
+        second_a, _ = asyncio.run(_twice())
+        assert first_a is first_b
+        assert second_a is not first_a
+
+    def test_sdk_client_factory_called_once(self) -> None:
+        """SDK clients are cached by key."""
+        factory = MagicMock(side_effect=object)
+        first = get_pooled_sdk_client(("ollama", "h"), factory)
+        assert get_pooled_sdk_client(("ollama", "h"), factory) is first
+        factory.assert_called_once()
@@ -22,7 +22,7 @@
 )
 
 _MODELS = "mcp_coder.llm.providers.langchain._models"
-_HTTP = f"{_MODELS}.create_http_client"
+_HTTP = f"{_MODELS}.get_pooled_http_client"
 
 
 class _FakeAuthError(Exception):
@@ -154,7 +154,7 @@ def test_returns_empty_list_when_no_models(self) -> None:
         assert result == []
 
     def test_http_client_passed_to_openai_client(self) -> None:
-        """create_http_client result is passed as http_client to openai.OpenAI."""
+        """get_pooled_http_client result is passed as http_client to openai.OpenAI."""
         sentinel = MagicMock(name="http_client_sentinel")
         mock_openai = _openai_mock()
         mock_openai.OpenAI.return_value.models.list.return_value = []
@@ -211,7 +211,7 @@ def test_returns_empty_list_when_no_models(self) -> None:
         assert result == []
 
     def test_http_client_passed_to_anthropic_client(self) -> None:
-        """create_http_client result is passed as http_client to anthropic.Anthropic."""
+        """get_pooled_http_client result is passed as http_client to anthropic.Anthropic."""
         sentinel = MagicMock(name="http_client_sentinel")
         mock_anthropic = _anthropic_mock()
         mock_anthropic.Anthropic.return_value.models.list.return_value = []
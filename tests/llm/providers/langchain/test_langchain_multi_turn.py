@@ -20,6 +20,7 @@
 _MOD = "mcp_coder.llm.providers.langchain"
 _AGENT_MOD = "mcp_coder.llm.providers.langchain.agent"
 _STORAGE_MOD = "mcp_coder.llm.storage.session_storage"
+_HISTORY_MOD = "mcp_coder.llm.storage.langchain_history"
 
 
 def _make_config(backend: str = "openai") -> dict[str, str | None]:
@@ -103,8 +104,12 @@ def __init__(self) -> None:
     def load(self, session_id: str) -> list[dict[str, Any]]:
         return list(self.sessions.get(session_id, []))
 
-    def store(self, session_id: str, messages: list[dict[str, Any]]) -> None:
-        self.sessions[session_id] = list(messages)
+    def store(
+        self, session_id: str, messages: list[dict[str, Any]], start: int = 0
+    ) -> None:
+        self.sessions[session_id] = self.sessions.get(session_id, [])[:start] + list(
+            messages
+        )
         self.stored.append(list(messages))
 
 
@@ -355,7 +360,7 @@ def test_icoder_agent_flow_two_turns_never_sends_two_systems(
         ``ask_langchain_stream`` so the merge (``_build_system_messages``) and
         the ``_ask_agent_stream`` bridge are exercised, and it uses the real
         ``store_``/``load_langchain_history`` so turn 2's history comes back off
-        disk through JSON and ``messages_from_dict`` — the flow icoder actually
+        disk through JSON lines and ``messages_from_dict`` — the flow icoder actually
         ran when the bug was reported.
 
         ``tools=[]`` is what makes ``run_agent_stream`` skip
@@ -367,7 +372,7 @@ def test_icoder_agent_flow_two_turns_never_sends_two_systems(
 
         seen: list[list[Any]] = []
         mock_agent = _guarded_react_agent(seen)
-        session_file = tmp_path / "sessions" / "langchain" / "reject-icoder.json"
+        session_file = tmp_path / "sessions" / "langchain" / "reject-icoder.jsonl"
         on_disk: list[list[dict[str, Any]]] = []
 
         with (
@@ -376,7 +381,7 @@ def test_icoder_agent_flow_two_turns_never_sends_two_systems(
             patch(f"{_AGENT_MOD}._check_agent_dependencies"),
             patch("langgraph.prebuilt.create_react_agent", return_value=mock_agent),
             # Real storage functions, redirected under tmp_path.
-            patch(f"{_STORAGE_MOD}.get_user_app_data_dir", return_value=tmp_path),
+            patch(f"{_HISTORY_MOD}.get_user_app_data_dir", return_value=tmp_path),
         ):
             from mcp_coder.llm.providers.langchain import ask_langchain_stream
 
@@ -391,7 +396,8 @@ def test_icoder_agent_flow_two_turns_never_sends_two_systems(
                         project_prompt="proj",
                     )
                 )
-                on_disk.append(json.loads(session_file.read_text(encoding="utf-8")))
+                lines = session_file.read_text(encoding="utf-8").splitlines()
+                on_disk.append([json.loads(line) for line in lines])
 
         # The on-disk history is system-free after *both* turns.
         assert len(on_disk) == 2
@@ -154,21 +154,20 @@ class TestAskAgentStreamOllamaPreflight:
     """Pre-flight tool capability check in _ask_agent_stream()."""
 
     def test_ask_agent_stream_raises_when_ollama_capability_missing(self) -> None:
-        """capability missing -> ValueError on iter; no thread spins up."""
+        """capability missing -> ValueError on iter; the agent never starts."""
         mock_check = MagicMock(
             return_value={
                 "ok": False,
                 "value": "model 'foo' does not advertise the 'tools' capability",
             }
         )
-        mock_thread_cls = MagicMock()
+        mock_run_stream = MagicMock()
         with (
             patch(f"{_MODELS_MOD}.check_ollama_tool_capability", mock_check),
             patch(f"{_PROVIDER_MOD}.agent._check_agent_dependencies"),
-            patch(f"{_PROVIDER_MOD}.agent.run_agent_stream"),
+            patch(f"{_PROVIDER_MOD}.agent.run_agent_stream", mock_run_stream),
             patch(f"{_PROVIDER_MOD}._create_chat_model", return_value=MagicMock()),
             patch(f"{_PROVIDER_MOD}.load_langchain_history", return_value=[]),
-            patch(f"{_PROVIDER_MOD}.threading.Thread", mock_thread_cls),
         ):
             from mcp_coder.llm.providers.langchain import _ask_agent_stream
 
@@ -181,7 +180,7 @@ def test_ask_agent_stream_raises_when_ollama_capability_missing(self) -> None:
             with pytest.raises(ValueError, match="does not advertise"):
                 list(gen)
 
-        mock_thread_cls.assert_not_called()
+        mock_run_stream.assert_not_called()
 
     def test_ask_agent_stream_proceeds_when_ollama_capability_ok(self) -> None:
         """capability ok -> underlying stream runs."""
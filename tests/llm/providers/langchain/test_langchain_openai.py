@@ -116,18 +116,18 @@ class TestCreateOpenaiModelHttpClient:
     """Tests for HTTP client injection into OpenAI/Azure constructors."""
 
     def test_http_client_passed_to_chat_openai(self) -> None:
-        """create_http_client result is passed as http_client to ChatOpenAI."""
+        """get_pooled_http_client result is passed as http_client to ChatOpenAI."""
         mock_sync_client = MagicMock(name="sync_http_client")
         with (
             patch(
                 "mcp_coder.llm.providers.langchain.openai_backend.ChatOpenAI"
             ) as MockChat,
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_http_client",
                 return_value=mock_sync_client,
             ),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_async_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_async_http_client",
                 return_value=MagicMock(),
             ),
         ):
@@ -140,18 +140,18 @@ def test_http_client_passed_to_chat_openai(self) -> None:
             assert kwargs["http_client"] is mock_sync_client
 
     def test_http_async_client_passed_to_chat_openai(self) -> None:
-        """create_async_http_client result is passed as http_async_client to ChatOpenAI."""
+        """get_pooled_async_http_client result is passed as http_async_client to ChatOpenAI."""
         mock_async_client = MagicMock(name="async_http_client")
         with (
             patch(
                 "mcp_coder.llm.providers.langchain.openai_backend.ChatOpenAI"
             ) as MockChat,
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_http_client",
                 return_value=MagicMock(),
             ),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_async_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_async_http_client",
                 return_value=mock_async_client,
             ),
         ):
@@ -164,7 +164,7 @@ def test_http_async_client_passed_to_chat_openai(self) -> None:
             assert kwargs["http_async_client"] is mock_async_client
 
     def test_http_client_passed_to_azure_chat_openai(self) -> None:
-        """create_http_client result is passed as http_client to AzureChatOpenAI."""
+        """get_pooled_http_client result is passed as http_client to AzureChatOpenAI."""
         mock_sync_client = MagicMock(name="sync_http_client")
         with (
             patch(
@@ -172,11 +172,11 @@ def test_http_client_passed_to_azure_chat_openai(self) -> None:
             ) as MockAzure,
             patch("mcp_coder.llm.providers.langchain.openai_backend.ChatOpenAI"),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_http_client",
                 return_value=mock_sync_client,
             ),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_async_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_async_http_client",
                 return_value=MagicMock(),
             ),
         ):
@@ -194,7 +194,7 @@ def test_http_client_passed_to_azure_chat_openai(self) -> None:
             assert kwargs["http_client"] is mock_sync_client
 
     def test_http_async_client_passed_to_azure_chat_openai(self) -> None:
-        """create_async_http_client result is passed as http_async_client to AzureChatOpenAI."""
+        """get_pooled_async_http_client result is passed as http_async_client to AzureChatOpenAI."""
         mock_async_client = MagicMock(name="async_http_client")
         with (
             patch(
@@ -202,11 +202,11 @@ def test_http_async_client_passed_to_azure_chat_openai(self) -> None:
             ) as MockAzure,
             patch("mcp_coder.llm.providers.langchain.openai_backend.ChatOpenAI"),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_http_client",
                 return_value=MagicMock(),
             ),
             patch(
-                "mcp_coder.llm.providers.langchain.openai_backend.create_async_http_client",
+                "mcp_coder.llm.providers.langchain.openai_backend.get_pooled_async_http_client",
                 return_value=mock_async_client,
             ),
         ):
@@ -245,6 +245,39 @@ def test_history_is_updated_and_stored(self) -> None:
         contents = [m["data"]["content"] for m in stored_messages]
         assert contents == ["prev", "new question", "answer"]
 
+    def test_history_budget_sends_tail_window(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With a history byte budget, the tail window is sent and stored back."""
+        monkeypatch.setenv("MCP_CODER_LANGCHAIN_HISTORY_MAX_BYTES", "500")
+        window = [{"type": "human", "data": {"content": "recent"}}]
+        store_mock = MagicMock()
+        with (
+            patch(
+                "mcp_coder.llm.providers.langchain._load_langchain_config",
+                return_value=self._make_config(),
+            ),
+            patch(
+                "mcp_coder.llm.providers.langchain.load_langchain_history_window",
+                return_value=(4, window),
+            ) as window_mock,
+            patch(
+                "mcp_coder.llm.providers.langchain.store_langchain_history",
+                store_mock,
+            ),
+            patch(
+                "mcp_coder.llm.providers.langchain._create_chat_model",
+                return_value=self._mock_chat_model("answer"),
+            ),
+        ):
+            from mcp_coder.llm.providers.langchain import ask_langchain
+
+            ask_langchain("new question", session_id="sid")
+        window_mock.assert_called_once_with("sid", max_bytes=500)
+        contents = [m["data"]["content"] for m in store_mock.call_args[0][1]]
+        assert contents == ["recent", "new question", "answer"]
+        assert store_mock.call_args.kwargs["start"] == 4
+
 
 class TestCreateChatModel:
     """Tests for _create_chat_model() dispatcher."""
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import threading
+import time
 from collections.abc import AsyncIterator, Generator
 from contextlib import AbstractContextManager, contextmanager
 from unittest.mock import MagicMock, patch
@@ -383,20 +384,25 @@ async def _slow_stream(**kwargs: object) -> AsyncIterator[dict[str, object]]:
                 # Use a long per-event timeout so overall timeout triggers first
                 list(ask_langchain_stream("Hi", mcp_config="/tmp/mcp.json", timeout=5))
 
-    def test_generator_exit_sets_cancel(self) -> None:
-        """When consumer stops iterating, cancel_event is set."""
-        cancel_was_set = threading.Event()
+    def test_generator_exit_cancels_blocked_stream(self) -> None:
+        """Closing the consumer cancels the agent task at its current await.
 
-        async def _many_events_stream(
+        The stream is stuck between events (e.g. in an LLM or tool call), so
+        a cancel that waited for its next event would never be noticed.
+        """
+        cancelled_with_event_set = threading.Event()
+
+        async def _stuck_stream(
             **kwargs: object,
         ) -> AsyncIterator[dict[str, object]]:
             cancel_evt: threading.Event | None = kwargs.get("cancel_event")  # type: ignore[assignment]
-            for i in range(100):
+            yield {"type": "text_delta", "text": "chunk0"}
+            try:
+                await asyncio.sleep(100)
+            except asyncio.CancelledError:
                 if cancel_evt and cancel_evt.is_set():
-                    cancel_was_set.set()
-                    break
-                yield {"type": "text_delta", "text": f"chunk{i}"}
-                await asyncio.sleep(0.05)
+                    cancelled_with_event_set.set()
+                raise
 
         with (
             patch(f"{_MOD_LC}._load_langchain_config", return_value=_make_config()),
@@ -405,7 +411,7 @@ async def _many_events_stream(
             patch(f"{_MOD_LC}.agent._check_agent_dependencies"),
             patch(
                 f"{_MOD_LC}.agent.run_agent_stream",
-                side_effect=_many_events_stream,
+                side_effect=_stuck_stream,
             ),
         ):
             from mcp_coder.llm.providers.langchain import ask_langchain_stream
@@ -414,11 +420,12 @@ async def _many_events_stream(
             # Consume only first event, then close the generator
             first = next(gen)
             assert first["type"] == "text_delta"
+            start = time.monotonic()
             gen.close()  # type: ignore[attr-defined]
 
-            # Give the background thread a moment to notice the cancel
-            cancel_was_set.wait(timeout=2)
-            assert cancel_was_set.is_set()
+            # close() waits for the task to unwind, which is immediate.
+            assert cancelled_with_event_set.is_set()
+            assert time.monotonic() - start < 2
 
 
 class TestAskLangchainStreamRoutesToText:
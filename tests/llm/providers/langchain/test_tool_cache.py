@@ -0,0 +1,162 @@
+"""Tests for the on-disk MCP tool descriptor cache."""
+
+import asyncio
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import Tool
+
+from mcp_coder.llm.providers.langchain.tool_cache import (
+    ToolSchemaCache,
+    revalidate_server_tools,
+)
+
+_CFG: dict[str, Any] = {"command": "python", "args": ["-m", "srv"], "env": {}}
+
+
+def _tool(name: str, description: str = "") -> Tool:
+    return Tool(
+        name=name,
+        description=description,
+        inputSchema={"type": "object", "properties": {"path": {"type": "string"}}},
+    )
+
+
+def _client_listing(tools: list[Tool]) -> MagicMock:
+    session = AsyncMock()
+    session.list_tools = AsyncMock(return_value=SimpleNamespace(tools=tools))
+    ctx = AsyncMock()
+    ctx.__aenter__ = AsyncMock(return_value=session)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    client = MagicMock()
+    client.session = MagicMock(return_value=ctx)
+    return client
+
+
+class TestToolSchemaCache:
+    """Tests for ToolSchemaCache load/store and keying."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Stored descriptors load back as equal mcp Tool objects."""
+        cache = ToolSchemaCache(tmp_path)
+        tools = [_tool("read_file", "Read a file"), _tool("list_dir")]
+
+        assert cache.load("ws", _CFG) is None
+        assert cache.store("ws", _CFG, tools) is False
+
+        loaded = cache.load("ws", _CFG)
+        assert loaded == tools
+
+    def test_key_changes_with_args_and_env(self) -> None:
+        """Any change to command args or env yields a new key."""
+        cache = ToolSchemaCache(Path("unused"))
+        base = cache.cache_key("ws", _CFG)
+
+        assert cache.cache_key("ws", {**_CFG, "args": ["-m", "other"]}) != base
+        assert cache.cache_key("ws", {**_CFG, "env": {"X": "1"}}) != base
+        assert cache.cache_key("ws", dict(_CFG)) == base
+
+    def test_key_changes_with_module_server_install(self, tmp_path: Path) -> None:
+        """Installing into a ``python -m`` server's environment yields a new key."""
+        site_packages = tmp_path / "lib" / "python3.11" / "site-packages"
+        site_packages.mkdir(parents=True)
+        python = tmp_path / "bin" / "python"
+        python.parent.mkdir()
+        python.touch()
+        cfg: dict[str, Any] = {**_CFG, "command": str(python)}
+        cache = ToolSchemaCache(Path("unused"))
+        base = cache.cache_key("ws", cfg)
+
+        (site_packages / "srv-2.0.dist-info").mkdir()
+        os.utime(site_packages, ns=(0, 1))
+
+        assert cache.cache_key("ws", cfg) != base
+
+    def test_changed_config_misses(self, tmp_path: Path) -> None:
+        """An entry stored for one config is not served for another."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws", _CFG, [_tool("a")])
+
+        assert cache.load("ws", {**_CFG, "args": ["--new-flag"]}) is None
+
+    def test_store_reports_changed_tools(self, tmp_path: Path) -> None:
+        """store() is True only when it replaces a different descriptor set."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws", _CFG, [_tool("a")])
+
+        assert cache.store("ws", _CFG, [_tool("a")]) is False
+        assert cache.store("ws", _CFG, [_tool("a"), _tool("b")]) is True
+
+    def test_store_prunes_old_keys_per_server(self, tmp_path: Path) -> None:
+        """Only the most recently validated entries of a server are kept."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws-extra", _CFG, [_tool("other")])
+        configs = [{**_CFG, "args": ["-m", f"srv{i}"]} for i in range(6)]
+        for i, cfg in enumerate(configs):
+            cache.store("ws", cfg, [_tool("a")])
+            os.utime(cache._path("ws", cache.cache_key("ws", cfg)), ns=(i, i))
+        # Revalidating an old entry unchanged makes it recent again.
+        assert cache.store("ws", configs[2], [_tool("a")]) is False
+        cache.store("ws", {**_CFG, "args": ["-m", "new"]}, [_tool("a")])
+
+        assert [cache.load("ws", cfg) is not None for cfg in configs] == [
+            False,
+            False,
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert cache.load("ws-extra", _CFG) is not None
+        assert len(list(tmp_path.glob("ws-*.json"))) == 5
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Unreadable cache files are ignored."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws", _CFG, [_tool("a")])
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{not json", encoding="utf-8")
+
+        assert cache.load("ws", _CFG) is None
+
+    def test_from_env_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MCP_CODER_MCP_TOOL_CACHE=0 disables the cache."""
+        monkeypatch.setenv("MCP_CODER_MCP_TOOL_CACHE", "0")
+        assert ToolSchemaCache.from_env() is None
+        monkeypatch.setenv("MCP_CODER_MCP_TOOL_CACHE", "1")
+        assert isinstance(ToolSchemaCache.from_env(), ToolSchemaCache)
+
+
+class TestRevalidateServerTools:
+    """Tests for background revalidation against the live server."""
+
+    def test_refreshes_changed_tools(self, tmp_path: Path) -> None:
+        """A differing live tool list replaces the cached entry."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws", _CFG, [_tool("old")])
+        client = _client_listing([_tool("new")])
+
+        changed = asyncio.run(revalidate_server_tools(cache, client, "ws", _CFG))
+
+        assert changed is True
+        loaded = cache.load("ws", _CFG)
+        assert loaded is not None
+        assert [t.name for t in loaded] == ["new"]
+
+    def test_failure_keeps_cache(self, tmp_path: Path) -> None:
+        """A failing live server leaves the cached entry untouched."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store("ws", _CFG, [_tool("old")])
+        client = MagicMock()
+        client.session = MagicMock(side_effect=ConnectionError("down"))
+
+        changed = asyncio.run(revalidate_server_tools(cache, client, "ws", _CFG))
+
+        assert changed is False
+        loaded = cache.load("ws", _CFG)
+        assert loaded is not None
+        assert [t.name for t in loaded] == ["old"]
@@ -0,0 +1,185 @@
+"""Tests for the append-only langchain history store."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from mcp_coder.llm.storage.langchain_history import (
+    langchain_history_path,
+    latest_langchain_session,
+    load_langchain_history,
+    load_langchain_history_window,
+    store_langchain_history,
+)
+
+
+def _turn(n: int, size: int = 10) -> list[dict[str, Any]]:
+    """One human question and its AI answer."""
+    return [
+        {"type": "human", "data": {"content": f"q{n}" + "x" * size}},
+        {"type": "ai", "data": {"content": f"a{n}" + "y" * size}},
+    ]
+
+
+def _conversation(turns: int, size: int = 10) -> list[dict[str, Any]]:
+    return [m for n in range(turns) for m in _turn(n, size)]
+
+
+def _lines(path: Path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestAppendOnlyStore:
+    """Tests for appending and diverging stores."""
+
+    def test_extending_store_appends_only_new_messages(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(1), base_dir=base)
+        path = langchain_history_path("s", base)
+        first = path.read_bytes()
+
+        store_langchain_history("s", _conversation(2), base_dir=base)
+
+        assert path.read_bytes().startswith(first)
+        assert len(_lines(path)) == 4
+        assert load_langchain_history("s", base_dir=base) == _conversation(2)
+
+    def test_diverging_store_replaces_history(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(3), base_dir=base)
+        edited = _conversation(1) + _turn(9)
+
+        store_langchain_history("s", edited, base_dir=base)
+
+        assert load_langchain_history("s", base_dir=base) == edited
+
+    def test_dead_lines_are_compacted(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(4), base_dir=base)
+
+        store_langchain_history("s", _turn(9), base_dir=base)
+
+        path = langchain_history_path("s", base)
+        assert [json.loads(line) for line in _lines(path)] == _turn(9)
+
+    def test_store_from_window_start_keeps_earlier_messages(
+        self, tmp_path: Path
+    ) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(3), base_dir=base)
+        start, window = load_langchain_history_window("s", max_bytes=120, base_dir=base)
+        assert 0 < start
+
+        store_langchain_history("s", window + _turn(3), base_dir=base, start=start)
+
+        assert load_langchain_history("s", base_dir=base) == _conversation(4)
+
+    def test_interrupted_append_is_dropped(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(1), base_dir=base)
+        path = langchain_history_path("s", base)
+        with path.open("ab") as f:
+            f.write(b'{"type": "hum')
+
+        assert load_langchain_history("s", base_dir=base) == _conversation(1)
+        store_langchain_history("s", _conversation(2), base_dir=base)
+        assert load_langchain_history("s", base_dir=base) == _conversation(2)
+
+
+class TestIndex:
+    """Tests for the sidecar offset index."""
+
+    def test_missing_or_stale_index_is_rebuilt(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(3), base_dir=base)
+        store_langchain_history("s", _conversation(1) + _turn(7), base_dir=base)
+        index = langchain_history_path("s", base).with_suffix(".idx")
+
+        index.unlink()
+        assert load_langchain_history("s", base_dir=base) == (
+            _conversation(1) + _turn(7)
+        )
+        assert index.exists()
+
+        index.write_text('{"version": 1, "size": 3}', encoding="utf-8")
+        assert load_langchain_history("s", base_dir=base) == (
+            _conversation(1) + _turn(7)
+        )
+
+
+class TestTailWindow:
+    """Tests for load_langchain_history_window."""
+
+    def test_no_budget_loads_everything(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(3), base_dir=base)
+        assert load_langchain_history_window("s", base_dir=base) == (
+            0,
+            _conversation(3),
+        )
+
+    def test_window_holds_whole_recent_turns_within_budget(
+        self, tmp_path: Path
+    ) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(5), base_dir=base)
+        turn_bytes = sum(
+            len(json.dumps(m, separators=(",", ":"))) + 1 for m in _turn(0)
+        )
+
+        start, window = load_langchain_history_window(
+            "s", max_bytes=2 * turn_bytes + 5, base_dir=base
+        )
+
+        assert (start, window) == (6, _conversation(5)[6:])
+
+    def test_window_always_includes_last_turn(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        store_langchain_history("s", _conversation(2, size=500), base_dir=base)
+
+        start, window = load_langchain_history_window("s", max_bytes=1, base_dir=base)
+
+        assert (start, window) == (2, _turn(1, size=500))
+
+    def test_missing_session_is_empty(self, tmp_path: Path) -> None:
+        assert load_langchain_history_window("nope", 100, str(tmp_path)) == (0, [])
+
+
+class TestLegacyMigration:
+    """Tests for reading histories stored as one JSON array."""
+
+    def test_legacy_json_is_migrated(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "old.json"
+        legacy.write_text(json.dumps(_conversation(2), indent=2), encoding="utf-8")
+
+        assert load_langchain_history("old", base_dir=str(tmp_path)) == (
+            _conversation(2)
+        )
+        assert not legacy.exists()
+        assert len(_lines(tmp_path / "old.jsonl")) == 4
+
+    def test_store_extends_legacy_history(self, tmp_path: Path) -> None:
+        (tmp_path / "old.json").write_text(
+            json.dumps(_conversation(1)), encoding="utf-8"
+        )
+
+        store_langchain_history("old", _conversation(2), base_dir=str(tmp_path))
+
+        assert load_langchain_history("old", base_dir=str(tmp_path)) == (
+            _conversation(2)
+        )
+
+
+class TestLatestSession:
+    """Tests for the latest-session pointer."""
+
+    def test_pointer_names_last_stored_session(self, tmp_path: Path) -> None:
+        base = str(tmp_path)
+        assert latest_langchain_session(base) is None
+
+        store_langchain_history("a", [], base_dir=base)
+        store_langchain_history("b", [], base_dir=base)
+        assert latest_langchain_session(base) == tmp_path / "b.jsonl"
+
+        (tmp_path / "b.jsonl").unlink()
+        assert latest_langchain_session(base) is None
@@ -9,6 +9,7 @@
 import pytest
 
 from mcp_coder.llm.storage.session_finder import find_latest_session
+from mcp_coder.llm.storage.session_storage import store_langchain_history
 
 
 class TestFindLatestSession:
@@ -232,6 +233,21 @@ def test_find_latest_langchain_session(
         assert result is not None
         assert result.endswith("bbb-222.json")
 
+    def test_find_latest_langchain_session_uses_latest_pointer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The last stored session wins over file mtimes."""
+        monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path))
+        store_langchain_history("aaa-111", [])
+        store_langchain_history("bbb-222", [])
+        store_langchain_history("aaa-111", [{"type": "human"}])
+        session_dir = tmp_path / ".mcp_coder" / "sessions" / "langchain"
+        os.utime(session_dir / "aaa-111.jsonl", (1000, 1000))
+
+        result = find_latest_session(provider="langchain")
+        assert result is not None
+        assert result.endswith("aaa-111.jsonl")
+
     def test_find_latest_langchain_session_no_dir(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -350,12 +350,12 @@ def test_store_creates_parent_directory(self, tmp_path: Path) -> None:
         """store_langchain_history creates nested directories automatically."""
         base = tmp_path / "deep" / "nested"
         store_langchain_history("sid", [], base_dir=str(base))
-        assert (base / "sid.json").exists()
+        assert (base / "sid.jsonl").exists()
 
     def test_store_returns_file_path_string(self, tmp_path: Path) -> None:
         """store_langchain_history returns the path it wrote to."""
         path = store_langchain_history("sid", [], base_dir=str(tmp_path))
-        assert path.endswith("sid.json")
+        assert path.endswith("sid.jsonl")
         assert os.path.isfile(path)
 
     def test_store_overwrites_existing_session(self, tmp_path: Path) -> None:
@@ -383,7 +383,7 @@ def test_default_path_uses_home_directory(
         session_id = "home-test"
         store_langchain_history(session_id, [])
         expected = (
-            tmp_path / ".mcp_coder" / "sessions" / "langchain" / f"{session_id}.json"
+            tmp_path / ".mcp_coder" / "sessions" / "langchain" / f"{session_id}.jsonl"
         )
         assert expected.exists()
 
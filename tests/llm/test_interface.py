@@ -1355,6 +1355,25 @@ def test_prompt_llm_stream_routes_to_claude(self, mock_stream: MagicMock) -> Non
         assert len(events) == 2
         assert events[0]["type"] == "text_delta"
 
+    @patch(
+        "mcp_coder.llm.providers.claude.claude_code_cli_streaming.ask_claude_code_cli_stream"
+    )
+    def test_prompt_llm_stream_uses_claude_worker(self, mock_stream: MagicMock) -> None:
+        """A supplied claude_worker serves the turn instead of a fresh subprocess."""
+        worker = MagicMock()
+        worker.stream.return_value = iter([{"type": "done", "usage": {}}])
+
+        events = list(
+            prompt_llm_stream(
+                "Hello", provider="claude", session_id="s1", claude_worker=worker
+            )
+        )
+
+        mock_stream.assert_not_called()
+        assert worker.stream.call_args.args == ("Hello",)
+        assert worker.stream.call_args.kwargs["session_id"] == "s1"
+        assert events == [{"type": "done", "usage": {}}]
+
     @patch("mcp_coder.llm.providers.langchain.ask_langchain_stream")
     def test_prompt_llm_stream_routes_to_langchain(
         self, mock_stream: MagicMock
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from mcp_coder.llm.providers.langchain.agent_runtime import get_agent_runtime
 from mcp_coder.llm.providers.langchain.mcp_manager import MCPManager, MCPServerStatus
+from mcp_coder.llm.providers.langchain.tool_cache import ToolSchemaCache
 
 
 def _make_mock_tool(name: str = "test_tool") -> MagicMock:
@@ -328,15 +333,201 @@ def test_status_after_connect(self) -> None:
 class TestMCPManagerClose:
     """Tests for MCPManager.close() method."""
 
-    def test_close_stops_loop(self) -> None:
-        """After close(), background thread is no longer alive."""
+    def test_runs_on_shared_runtime_loop_and_close_leaves_it_running(self) -> None:
+        """The manager uses the agent runtime loop, which outlives close()."""
         manager = MCPManager({"s1": {"transport": "stdio"}})
-        assert manager._thread.is_alive()
+        assert manager._loop is get_agent_runtime().loop
         manager.close()
-        assert not manager._thread.is_alive()
+        assert manager._loop.is_running()
 
     def test_close_idempotent(self) -> None:
         """Calling close() twice does not raise."""
         manager = MCPManager({"s1": {"transport": "stdio"}})
         manager.close()
         manager.close()  # Should not raise
+
+
+class TestMCPManagerConcurrentDiscovery:
+    """Tests for concurrent, per-server-isolated discovery."""
+
+    def test_servers_discovered_concurrently(self) -> None:
+        """list_tools() calls overlap instead of running one after another."""
+        client_patch, convert_patch, _, mock_client = _patch_client_and_convert(
+            {"alpha": [_make_mock_tool("a")], "beta": [_make_mock_tool("b")]}
+        )
+        in_flight = 0
+        peak = 0
+
+        def _slow_session(name: str) -> AsyncMock:
+            async def _list_tools() -> SimpleNamespace:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.05)
+                in_flight -= 1
+                return _make_list_tools_result([_make_mock_tool(f"{name}_tool")])
+
+            session = AsyncMock()
+            session.list_tools = _list_tools
+            ctx = AsyncMock()
+            ctx.__aenter__ = AsyncMock(return_value=session)
+            ctx.__aexit__ = AsyncMock(return_value=False)
+            return ctx
+
+        mock_client.session = MagicMock(side_effect=_slow_session)
+
+        with client_patch, convert_patch:
+            manager = MCPManager(
+                {"alpha": {"transport": "stdio"}, "beta": {"transport": "stdio"}}
+            )
+            try:
+                assert len(manager.tools()) == 2
+                assert peak == 2
+            finally:
+                manager.close()
+
+    def test_failing_server_does_not_block_others(self) -> None:
+        """A broken server is reported in status(); other tools are returned."""
+        client_patch, convert_patch, _, mock_client = _patch_client_and_convert(
+            {"good": [_make_mock_tool("g")], "bad": [_make_mock_tool("b")]}
+        )
+        original_factory = mock_client.session.side_effect
+
+        def _session(name: str) -> Any:
+            if name == "bad":
+                raise ConnectionError("spawn failed")
+            return original_factory(name)
+
+        mock_client.session = MagicMock(side_effect=_session)
+
+        with client_patch, convert_patch:
+            manager = MCPManager(
+                {"good": {"transport": "stdio"}, "bad": {"transport": "stdio"}}
+            )
+            try:
+                tools = manager.tools()
+                assert len(tools) == 1
+                statuses = {s.name: s for s in manager.status()}
+                assert statuses["good"].connected is True
+                assert statuses["good"].error is None
+                assert statuses["good"].startup_seconds is not None
+                assert statuses["bad"].connected is False
+                assert statuses["bad"].error is not None
+                assert "spawn failed" in statuses["bad"].error
+            finally:
+                manager.close()
+
+    def test_slow_server_times_out_individually(self) -> None:
+        """A hung server hits its own timeout; the others still load."""
+        client_patch, convert_patch, _, mock_client = _patch_client_and_convert(
+            {"fast": [_make_mock_tool("f")], "hung": [_make_mock_tool("h")]}
+        )
+        original_factory = mock_client.session.side_effect
+
+        def _session(name: str) -> Any:
+            if name != "hung":
+                return original_factory(name)
+
+            async def _never() -> None:
+                await asyncio.sleep(10)
+
+            session = AsyncMock()
+            session.list_tools = _never
+            ctx = AsyncMock()
+            ctx.__aenter__ = AsyncMock(return_value=session)
+            ctx.__aexit__ = AsyncMock(return_value=False)
+            return ctx
+
+        mock_client.session = MagicMock(side_effect=_session)
+
+        with (
+            client_patch,
+            convert_patch,
+            patch(
+                "mcp_coder.llm.providers.langchain.mcp_manager."
+                "SERVER_DISCOVERY_TIMEOUT_SECONDS",
+                0.1,
+            ),
+        ):
+            manager = MCPManager(
+                {"fast": {"transport": "stdio"}, "hung": {"transport": "stdio"}}
+            )
+            try:
+                assert len(manager.tools()) == 1
+                hung = next(s for s in manager.status() if s.name == "hung")
+                assert hung.connected is False
+                assert hung.error is not None
+                assert "timed out" in hung.error
+            finally:
+                manager.close()
+
+    def test_all_servers_failing_raises(self) -> None:
+        """When every server fails, tools() raises so the next call retries."""
+        client_patch, convert_patch, _, mock_client = _patch_client_and_convert(
+            {"only": [_make_mock_tool()]}
+        )
+        mock_client.session = MagicMock(side_effect=ConnectionError("down"))
+
+        with client_patch, convert_patch:
+            manager = MCPManager({"only": {"transport": "stdio"}})
+            try:
+                with pytest.raises(RuntimeError, match="All MCP servers failed"):
+                    manager.tools()
+                assert manager._cached_tools is None
+            finally:
+                manager.close()
+
+
+class TestMCPManagerToolCache:
+    """Tests for cache-first discovery with background revalidation."""
+
+    @staticmethod
+    def _tool(name: str) -> Any:
+        from mcp.types import Tool
+
+        return Tool(name=name, inputSchema={"type": "object", "properties": {}})
+
+    def test_cache_miss_lists_live_tools_and_stores(self, tmp_path: Path) -> None:
+        """Without a cache entry the live server is listed and cached."""
+        cache = ToolSchemaCache(tmp_path)
+        client_patch, convert_patch, _, mock_client = _patch_client_and_convert(
+            {"srv": [self._tool("live")]}
+        )
+        config: dict[str, dict[str, object]] = {"srv": {"transport": "stdio"}}
+
+        with client_patch, convert_patch:
+            manager = MCPManager(config, tool_cache=cache)
+            try:
+                assert len(manager.tools()) == 1
+            finally:
+                manager.close()
+
+        cached = cache.load("srv", config["srv"])
+        assert cached is not None
+        assert [t.name for t in cached] == ["live"]
+        mock_client.session.assert_called_once_with("srv")
+
+    def test_cache_hit_serves_cached_tools_then_refreshes(self, tmp_path: Path) -> None:
+        """Cached tools are returned at once; a changed server triggers rediscovery."""
+        cache = ToolSchemaCache(tmp_path)
+        config: dict[str, dict[str, object]] = {"srv": {"transport": "stdio"}}
+        cache.store("srv", config["srv"], [self._tool("cached")])
+        client_patch, convert_patch, _, _mock_client = _patch_client_and_convert(
+            {"srv": [self._tool("live")]}
+        )
+
+        with client_patch, convert_patch:
+            manager = MCPManager(config, tool_cache=cache)
+            try:
+                first = manager.tools()
+                assert manager.canonical_name(first[0]) == "mcp__srv__cached"
+
+                deadline = time.monotonic() + 5
+                while not manager._tools_stale and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert manager._tools_stale is True
+
+                second = manager.tools()
+                assert manager.canonical_name(second[0]) == "mcp__srv__live"
+            finally:
+                manager.close()
@@ -1,14 +1,20 @@
 """Tests for LLM type definitions."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from mcp_coder.llm.types import (
+    EVENT_RETENTION_ENV,
     LLM_RESPONSE_VERSION,
+    SUMMARY_VALUE_MAX_CHARS,
     SUPPORTED_PROVIDERS,
     LLMResponseDict,
     ResponseAssembler,
     StreamEvent,
     UsageInfo,
+    iter_spilled_records,
 )
 
 
@@ -511,3 +517,90 @@ def test_supported_providers_contains_expected_values() -> None:
 def test_supported_providers_is_frozenset() -> None:
     """Test SUPPORTED_PROVIDERS is a frozenset (immutable)."""
     assert isinstance(SUPPORTED_PROVIDERS, frozenset)
+
+
+# --- ResponseAssembler retention tests ---
+
+
+def _tool_events(output: str) -> list[StreamEvent]:
+    return [
+        {"type": "tool_use_start", "name": "write", "args": {"content": output}},
+        {"type": "tool_result", "name": "write", "output": output},
+    ]
+
+
+def test_summary_retention_truncates_tool_values() -> None:
+    """Summary mode drops events and truncates tool outputs and long args."""
+    assembler = ResponseAssembler(provider="claude", retention="summary")
+    for event in _tool_events("x" * (SUMMARY_VALUE_MAX_CHARS + 500)):
+        assembler.add(event)
+    assembler.add({"type": "text_delta", "text": "done"})
+    raw = assembler.result()["raw_response"]
+    assert "events" not in raw
+    assert raw["event_count"] == 3
+    trace = raw["tool_trace"]
+    assert isinstance(trace, list)
+    assert trace[0]["args"]["content"].endswith("[500 chars truncated]")
+    assert trace[1]["output"].startswith("x" * SUMMARY_VALUE_MAX_CHARS)
+    assert trace[1]["output"].endswith("[500 chars truncated]")
+
+
+def test_off_retention_keeps_text_and_metadata_only() -> None:
+    """Off mode keeps text/session/usage but no events or tool trace."""
+    assembler = ResponseAssembler(provider="claude", retention="off")
+    for event in _tool_events("out"):
+        assembler.add(event)
+    assembler.add({"type": "text_delta", "text": "Hi"})
+    assembler.add({"type": "done", "session_id": "s1", "usage": {"x": 1}})
+    result = assembler.result()
+    assert result["text"] == "Hi"
+    assert result["session_id"] == "s1"
+    assert "events" not in result["raw_response"]
+    assert "tool_trace" not in result["raw_response"]
+    assert result["raw_response"]["usage"] == {"x": 1}
+
+
+def test_retention_env_overrides_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    """MCP_CODER_EVENT_RETENTION wins over the caller's mode."""
+    monkeypatch.setenv(EVENT_RETENTION_ENV, "full")
+    assembler = ResponseAssembler(provider="claude", retention="off")
+    assembler.add({"type": "text_delta", "text": "Hi"})
+    assert assembler.result()["raw_response"]["events"] == [
+        {"type": "text_delta", "text": "Hi"}
+    ]
+
+
+def test_summary_references_stream_file_range(tmp_path: Path) -> None:
+    """raw_line bytes are measured so the stream file range can be read back."""
+    stream_file = tmp_path / "stream.ndjson"
+    lines = [json.dumps({"type": "system", "é": 1}), json.dumps({"type": "result"})]
+    stream_file.write_text(
+        "".join(line + "\n" for line in lines), encoding="utf-8", newline=""
+    )
+    assembler = ResponseAssembler(provider="claude", retention="summary")
+    assembler.add({"type": "stream_file", "path": str(stream_file)})
+    for line in lines:
+        assembler.add({"type": "raw_line", "line": line})
+    events_ref = assembler.result()["raw_response"]["events_ref"]
+    assert isinstance(events_ref, dict)
+    assert events_ref["length"] == stream_file.stat().st_size
+    assert [r["type"] for r in iter_spilled_records(events_ref)] == ["system", "result"]
+
+
+def test_summary_references_events_file_from_offset(tmp_path: Path) -> None:
+    """A caller-supplied events file is referenced from the given offset."""
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text('{"event": "old"}\n', encoding="utf-8")
+    offset = events_file.stat().st_size
+    assembler = ResponseAssembler(
+        provider="claude",
+        retention="summary",
+        events_file=str(events_file),
+        events_offset=offset,
+    )
+    assembler.add({"type": "text_delta", "text": "Hi"})
+    with open(events_file, "a", encoding="utf-8") as fh:
+        fh.write('{"event": "stream_event", "type": "text_delta"}\n')
+    events_ref = assembler.result()["raw_response"]["events_ref"]
+    assert isinstance(events_ref, dict)
+    assert [r["event"] for r in iter_spilled_records(events_ref)] == ["stream_event"]
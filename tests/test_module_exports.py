@@ -107,12 +107,15 @@ def test_llm_types_all_is_correct() -> None:
     from mcp_coder.llm import types
 
     expected = [
+        "EVENT_RETENTION_ENV",
         "LLMResponseDict",
         "LLM_RESPONSE_VERSION",
         "ResponseAssembler",
+        "RetentionMode",
         "StreamEvent",
         "SUPPORTED_PROVIDERS",
         "UsageInfo",
+        "iter_spilled_records",
     ]
 
     assert set(types.__all__) == set(expected)
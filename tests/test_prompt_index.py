@@ -0,0 +1,109 @@
+"""Tests for the process-wide prompt index."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_coder import prompt_index, prompt_sources
+from mcp_coder.prompt_index import PromptIndex, PromptTemplate
+from mcp_coder.prompt_manager import (
+    get_prompt,
+    get_prompt_with_substitutions,
+    validate_prompt_directory,
+)
+
+_DOC = "# Alpha\n```\nalpha [name]\n```\n\n# Beta\n```\nbeta\n```\n"
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def prompts_dir(tmp_path: Path) -> Path:
+    """A directory with one prompt file."""
+    (tmp_path / "a.md").write_text(_DOC, encoding="utf-8")
+    return tmp_path
+
+
+class TestPromptIndex:
+    """Parse-once and invalidation behaviour."""
+
+    def test_source_parsed_once(self, prompts_dir: Path) -> None:
+        """Repeated lookups of an unchanged source read it only once."""
+        index = PromptIndex()
+        source = str(prompts_dir / "a.md")
+        with patch.object(
+            prompt_sources, "_load_content", wraps=prompt_sources._load_content
+        ) as mock_load:
+            assert index.document(source).get("Alpha") == "alpha [name]"
+            assert index.document(source).get("Beta") == "beta"
+        assert mock_load.call_count == 1
+
+    def test_changed_file_is_reparsed(self, prompts_dir: Path) -> None:
+        """A new mtime/size invalidates the cached document."""
+        index = PromptIndex()
+        path = prompts_dir / "a.md"
+        assert index.document(str(path)).get("Beta") == "beta"
+
+        path.write_text(_DOC.replace("beta", "BETA"), encoding="utf-8")
+        _bump_mtime(path)
+        assert index.document(str(path)).get("Beta") == "BETA"
+
+    def test_added_file_invalidates_directory(self, prompts_dir: Path) -> None:
+        """Adding a file to a directory source is picked up."""
+        index = PromptIndex()
+        assert len(index.document(str(prompts_dir)).headers) == 2
+
+        (prompts_dir / "b.md").write_text("# Gamma\n```\ng\n```\n", encoding="utf-8")
+        assert index.document(str(prompts_dir)).get("Gamma") == "g"
+
+    def test_string_sources_are_cached(self) -> None:
+        """Inline markdown is parsed once per distinct content."""
+        index = PromptIndex()
+        assert index.document(_DOC) is index.document(_DOC)
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Missing files are not cached and raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PromptIndex().document(str(tmp_path / "missing.md"))
+
+
+class TestPromptTemplate:
+    """Precompiled [placeholder] substitution."""
+
+    def test_renders_known_placeholders(self) -> None:
+        """Known placeholders are replaced; unknown ones are kept."""
+        template = PromptTemplate("[a] and [b] and [a]")
+        assert template.render({"a": "1"}) == "1 and [b] and 1"
+
+    def test_values_are_not_rescanned(self) -> None:
+        """A substituted value containing a placeholder stays literal."""
+        template = PromptTemplate("[log] / [job]")
+        assert template.render({"log": "see [job]", "job": "test"}) == (
+            "see [job] / test"
+        )
+
+
+class TestPromptManagerUsesIndex:
+    """get_prompt, substitutions and validation share one parse."""
+
+    def test_lookup_and_validation_share_parse(self, prompts_dir: Path) -> None:
+        """Validation after lookups re-uses the parsed documents."""
+        prompt_index.clear_prompt_index()
+        source = str(prompts_dir)
+        with patch.object(
+            prompt_sources, "_load_content", wraps=prompt_sources._load_content
+        ) as mock_load:
+            get_prompt(source, "Beta")
+            assert get_prompt_with_substitutions(source, "Alpha", {"name": "x"}) == (
+                "alpha x"
+            )
+            result = validate_prompt_directory(source)
+            validate_prompt_directory(source)
+        assert result["valid"] is True
+        # One parse for the directory, one for its single file.
+        assert mock_load.call_count == 2
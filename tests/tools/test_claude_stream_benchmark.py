@@ -0,0 +1,43 @@
+"""Regression guard for the Claude NDJSON stream pipeline (tools/claude_stream_benchmark.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_TOOL_PY = Path(__file__).resolve().parents[2] / "tools" / "claude_stream_benchmark.py"
+
+# Generous per-line budget for parse + dispatch + buffered logging; the
+# measured cost is ~15 us/line, so this only trips on order-of-magnitude
+# regressions (e.g. re-parsing or flushing per line).
+_PIPELINE_BUDGET_US = 250.0
+
+
+@pytest.fixture(scope="module")
+def tool() -> ModuleType:
+    """Load tools/claude_stream_benchmark.py as a module."""
+    spec = importlib.util.spec_from_file_location("claude_stream_benchmark", _TOOL_PY)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_synthetic_stream_reaches_target_size(tool: ModuleType) -> None:
+    """The synthetic stream is a complete multi-MB conversation."""
+    lines = tool.synthetic_lines(2.0, 2)
+    assert sum(len(line) + 1 for line in lines) >= 2 * 2**20
+    assert '"subtype": "init"' in lines[0]
+    assert '"type": "result"' in lines[-1]
+
+
+def test_pipeline_cost_per_line_within_budget(tool: ModuleType) -> None:
+    """Parse + dispatch + logging of a 2 MiB stream stays within budget."""
+    timings = tool.measure(tool.synthetic_lines(2.0, 2))
+    assert timings.events > 0
+    assert timings.per_line_us(timings.pipeline_s) < _PIPELINE_BUDGET_US
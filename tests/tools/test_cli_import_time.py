@@ -0,0 +1,92 @@
+"""Startup-budget tests for the ``mcp-coder`` CLI (tools/cli_import_time.py).
+
+Each test spawns a fresh interpreter with ``python -X importtime`` so module
+caching in the test process cannot hide an eager import.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_TOOL_PY = Path(__file__).resolve().parents[2] / "tools" / "cli_import_time.py"
+
+# Heavy packages that no cheap subcommand may import.
+_FORBIDDEN_FOR_CHEAP = {
+    "textual",
+    "langchain_core",
+    "langchain_mcp_adapters",
+    "anthropic",
+    "openai",
+    "google.genai",
+    "mlflow",
+    "mcp_coder.icoder",
+    "mcp_coder.cli.commands.coordinator",
+}
+
+
+@pytest.fixture(scope="module")
+def tool() -> ModuleType:
+    """Load tools/cli_import_time.py as a module."""
+    spec = importlib.util.spec_from_file_location("cli_import_time", _TOOL_PY)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_importtime(tool: ModuleType) -> None:
+    """Top-level cumulative times are summed; nested modules are recorded."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |     encodings.utf_8\n"
+        "import time:       200 |        500 |   mcp_coder.cli.main\n"
+        "import time:        50 |        700 | mcp_coder.cli\n"
+        "import time:        30 |         30 | textual\n"
+    )
+    profile = tool.parse_importtime(stderr)
+
+    assert profile.total_us == 730
+    assert profile.modules["mcp_coder.cli.main"] == 500
+    assert profile.heavy_modules() == ["textual"]
+
+
+def test_entry_point_within_budget(tool: ModuleType) -> None:
+    """``mcp-coder --version`` imports no heavy package and starts quickly."""
+    profile = tool.measure(None)
+
+    assert profile.heavy_modules() == []
+    assert profile.total_ms < tool.ENTRY_POINT_BUDGET_MS
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "init",
+        "gh-tool get-base-branch",
+        "gh-tool set-status",
+        "git-tool compact-diff",
+        "check file-size",
+    ],
+)
+def test_cheap_commands_skip_heavy_imports(tool: ModuleType, command: str) -> None:
+    """Cheap subcommands import only their own handler's dependencies."""
+    assert command in tool.CHEAP_COMMANDS
+
+    profile = tool.measure(command)
+
+    assert _FORBIDDEN_FOR_CHEAP.isdisjoint(profile.heavy_modules())
+
+
+def test_every_command_has_an_importable_handler() -> None:
+    """Each COMMAND_HANDLERS entry resolves to a callable."""
+    from mcp_coder.cli.command_catalog import COMMAND_HANDLERS
+    from mcp_coder.cli.main import _load_handler
+
+    for command in COMMAND_HANDLERS:
+        assert callable(_load_handler(command)), command
@@ -307,6 +307,30 @@ def test_use_sync_emits_sync_command(
         assert any("--extra" in c and "dev" in c for c in sync_lines)
 
 
+class TestRelocatableVenv:
+    """--relocatable is passed through to `uv venv`."""
+
+    def test_relocatable_flag_reaches_uv_venv(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        _write_pyproject(tmp_path, packages=[], packages_no_deps=[])
+        argv = [
+            str(tmp_path),
+            "--source",
+            "local",
+            "--local-path",
+            str(tmp_path),
+            "--use-sync",
+        ]
+        plain = _emitted_commands(_run_install_check(argv, capsys))
+        relocatable = _emitted_commands(
+            _run_install_check([*argv, "--relocatable"], capsys)
+        )
+        venv_cmds = [c for c in relocatable if " venv " in f" {c} "]
+        assert venv_cmds and venv_cmds[0].endswith("--relocatable")
+        assert not any("--relocatable" in c for c in plain)
+
+
 class TestUseSyncTargetGuard:
     """The --use-sync guard added to main(): target must == local_path."""
 
@@ -0,0 +1,41 @@
+"""Regression guard for OutputLog toggle/resize latency (tools/output_log_benchmark.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytestmark = pytest.mark.textual_integration
+
+_TOOL_PY = Path(__file__).resolve().parents[2] / "tools" / "output_log_benchmark.py"
+
+# Generous budgets at 50k lines. Measured: toggle ~18 ms, resize ~115 ms
+# (5k lines: ~4 ms and ~45 ms); re-rendering the whole session takes
+# seconds, so these only trip when a toggle or resize stops using the
+# block cache.
+_TOGGLE_BUDGET_MS = 250.0
+_RESIZE_BUDGET_MS = 1500.0
+
+
+@pytest.fixture(scope="module")
+def tool() -> ModuleType:
+    """Load tools/output_log_benchmark.py as a module."""
+    spec = importlib.util.spec_from_file_location("output_log_benchmark", _TOOL_PY)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_toggle_and_resize_latency_within_budget(tool: ModuleType) -> None:
+    """A 50k-line session toggles and resizes without a full re-render."""
+    result = asyncio.run(tool.measure(50_000))
+    assert result["buffer_lines"] >= 50_000
+    assert result["toggle_ms"] < _TOGGLE_BUDGET_MS
+    assert result["resize_ms"] < _RESIZE_BUDGET_MS
@@ -0,0 +1,35 @@
+"""Memory tests for ResponseAssembler retention (tools/response_assembler_memory.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_TOOL_PY = (
+    Path(__file__).resolve().parents[2] / "tools" / "response_assembler_memory.py"
+)
+
+
+@pytest.fixture(scope="module")
+def tool() -> ModuleType:
+    """Load tools/response_assembler_memory.py as a module."""
+    spec = importlib.util.spec_from_file_location("response_assembler_memory", _TOOL_PY)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_retained_memory_shrinks_with_retention(tool: ModuleType) -> None:
+    """Over a 10k-event stream, summary keeps a fraction of full, off ~nothing."""
+    retained = {
+        mode: tool.measure(tool.synthetic_stream(10_000, 16), mode)[0]
+        for mode in ("full", "summary", "off")
+    }
+    assert retained["summary"] < retained["full"] / 2
+    assert retained["off"] < retained["summary"] / 10
@@ -0,0 +1,63 @@
+"""Tests for InteractiveProcess (long-lived line-oriented subprocess)."""
+
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from mcp_coder.utils.subprocess_session import InteractiveProcess
+
+_ECHO = (
+    "import sys\n"
+    "for line in sys.stdin:\n"
+    "    if line.strip() == 'exit':\n"
+    "        sys.stderr.write('bye\\n')\n"
+    "        sys.exit(3)\n"
+    "    print(line.strip().upper(), flush=True)\n"
+)
+
+
+@pytest.fixture
+def echo() -> Iterator[InteractiveProcess]:
+    """An upper-casing echo process, closed after the test."""
+    proc = InteractiveProcess([sys.executable, "-c", _ECHO])
+    yield proc
+    proc.close()
+
+
+def test_round_trips_lines_on_one_process(echo: InteractiveProcess) -> None:
+    """Successive writes are answered by the same running process."""
+    echo.write_line("one")
+    assert echo.read_line(timeout=10) == "ONE"
+    echo.write_line("two")
+    assert echo.read_line(timeout=10) == "TWO"
+    assert echo.is_alive()
+
+
+def test_read_line_times_out_without_output(echo: InteractiveProcess) -> None:
+    """read_line raises TimeoutError when nothing arrives in time."""
+    with pytest.raises(TimeoutError):
+        echo.read_line(timeout=0.2)
+
+
+def test_exit_yields_none_and_keeps_stderr(echo: InteractiveProcess) -> None:
+    """After the process exits, read_line returns None; stderr is kept."""
+    echo.write_line("exit")
+    assert echo.read_line(timeout=10) is None
+    echo.close()
+    assert echo.returncode == 3
+    assert "bye" in echo.stderr
+
+
+def test_close_stops_process(echo: InteractiveProcess) -> None:
+    """close() ends the process by closing stdin."""
+    echo.close()
+    assert not echo.is_alive()
+    assert echo.returncode == 0
+
+
+def test_kill_stops_unresponsive_process() -> None:
+    """kill() terminates a process that ignores stdin."""
+    proc = InteractiveProcess([sys.executable, "-c", "import time; time.sleep(60)"])
+    proc.kill()
+    assert not proc.is_alive()
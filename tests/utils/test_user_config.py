@@ -1,5 +1,6 @@
 """Tests for user_config module."""
 
+import os
 import tomllib
 from pathlib import Path
 
@@ -12,6 +13,7 @@
     get_config_file_path,
     get_config_values,
     load_config,
+    reload_config,
 )
 
 
@@ -174,6 +176,39 @@ def test_load_config_preserves_nested_structure(
         )
         assert result["coordinator"]["repos"]["mcp_coder"]["executor_os"] == "linux"
 
+    def test_load_config_parses_once_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged files are served from the cache; edits are picked up."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[github]\ntoken = "a"\n', encoding="utf-8")
+        monkeypatch.setattr(
+            "mcp_coder.utils.user_config.get_config_file_path", lambda: config_file
+        )
+        parses = 0
+        original_load = tomllib.load
+
+        def counting_load(fp: object) -> dict[str, object]:
+            nonlocal parses
+            parses += 1
+            return original_load(fp)  # type: ignore[arg-type]
+
+        monkeypatch.setattr("mcp_coder.utils.user_config.tomllib.load", counting_load)
+
+        first = load_config()
+        assert load_config() is first
+        assert parses == 1
+
+        config_file.write_text('[github]\ntoken = "bb"\n', encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config()["github"]["token"] == "bb"
+        assert parses == 2
+
+        reload_config()
+        load_config()
+        assert parses == 3
+
 
 def test_get_config_file_path_uses_shim() -> None:
     """get_config_file_path delegates to the user_app_data shim."""
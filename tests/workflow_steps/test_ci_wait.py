@@ -0,0 +1,242 @@
+"""Tests for the adaptive CI-wait engine (workflow_steps/ci_wait.py)."""
+
+import json
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_coder.workflow_steps.ci_wait import (
+    AdaptivePollSchedule,
+    CIDurationHistory,
+    CIWaiter,
+    FileDropNotifier,
+    WebhookNotifier,
+    notifier_from_env,
+)
+
+
+def _status(status: str, **run: Any) -> Dict[str, Any]:
+    return {"run": {"status": status, **run}, "jobs": []}
+
+
+class TestAdaptivePollSchedule:
+    """Tests for AdaptivePollSchedule.next_interval."""
+
+    def test_fast_before_run_is_seen(self) -> None:
+        """Right after a push, polls use the minimum interval."""
+        schedule = AdaptivePollSchedule(min_interval=5, max_interval=60)
+        assert schedule.next_interval(False, 0, 0.0, None) == 5
+        assert schedule.next_interval(False, 1, 0.0, None) == 5
+
+    def test_backs_off_while_no_run_appears(self) -> None:
+        """Without a run (e.g. no CI configured) polls slow down to the cap."""
+        schedule = AdaptivePollSchedule(
+            min_interval=5, max_interval=60, backoff_factor=2
+        )
+        intervals = [schedule.next_interval(False, n, 0.0, None) for n in range(1, 7)]
+        assert intervals == [5, 10, 20, 40, 60, 60]
+
+    def test_backs_off_without_history(self) -> None:
+        """Without history the interval grows geometrically up to the cap."""
+        schedule = AdaptivePollSchedule(
+            min_interval=5, max_interval=60, backoff_factor=2
+        )
+        intervals = [schedule.next_interval(True, n, 0.0, None) for n in range(1, 7)]
+        assert intervals == [5, 10, 20, 40, 60, 60]
+
+    def test_slow_mid_run_with_history(self) -> None:
+        """Long remaining time -> long wait (half the remaining, capped)."""
+        schedule = AdaptivePollSchedule(min_interval=5, max_interval=60)
+        assert schedule.next_interval(True, 1, 60.0, 600.0) == 60
+        assert schedule.next_interval(True, 5, 500.0, 600.0) == 50
+
+    def test_fast_near_expected_finish(self) -> None:
+        """Close to (or past) the expected finish, polls speed up again."""
+        schedule = AdaptivePollSchedule(
+            min_interval=5, max_interval=60, near_finish_seconds=30
+        )
+        assert schedule.next_interval(True, 9, 580.0, 600.0) == 5
+        assert schedule.next_interval(True, 12, 900.0, 600.0) == 5
+
+
+class TestCIDurationHistory:
+    """Tests for CIDurationHistory persistence."""
+
+    def test_records_and_returns_median(self, tmp_path: Path) -> None:
+        """Completed run durations are recorded per workflow."""
+        history = CIDurationHistory(tmp_path / "durations.json")
+        run = {
+            "workflow_name": "CI",
+            "url": "https://github.com/owner/repo/actions/runs/1",
+            "created_at": "2026-01-01T10:00:00Z",
+        }
+        for run_id, minutes in enumerate((4, 6, 5)):
+            history.record(
+                {
+                    "run": {**run, "status": "completed", "run_ids": [run_id]},
+                    "jobs": [{"completed_at": f"2026-01-01T10:0{minutes}:00Z"}],
+                }
+            )
+
+        assert history.expected_duration(run) == 300.0
+
+    def test_run_recorded_once(self, tmp_path: Path) -> None:
+        """Polling the same completed run again does not add samples."""
+        path = tmp_path / "durations.json"
+        history = CIDurationHistory(path)
+        run = {
+            "workflow_name": "CI",
+            "created_at": "2026-01-01T10:00:00Z",
+            "status": "completed",
+        }
+        slow = {
+            "run": {**run, "run_ids": [7, 8]},
+            "jobs": [{"completed_at": "2026-01-01T10:10:00Z"}],
+        }
+        fast = {
+            "run": {**run, "run_ids": [9]},
+            "jobs": [{"completed_at": "2026-01-01T10:02:00Z"}],
+        }
+        for status in (slow, slow, slow, fast):
+            history.record(status)
+
+        assert history.expected_duration(run) == 360.0
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            ":CI": {"durations": [600.0, 120.0], "run_ids": [7, 8, 9]}
+        }
+
+    def test_reads_durations_only_file(self, tmp_path: Path) -> None:
+        """A history file without run ids still provides expectations."""
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({":CI": [100.0, 200.0]}), encoding="utf-8")
+        assert CIDurationHistory(path).expected_duration({"workflow_name": "CI"}) == 150
+
+    def test_unknown_workflow_has_no_expectation(self, tmp_path: Path) -> None:
+        """No samples -> None."""
+        history = CIDurationHistory(tmp_path / "durations.json")
+        assert history.expected_duration({"workflow_name": "CI"}) is None
+
+    def test_missing_timestamps_are_ignored(self, tmp_path: Path) -> None:
+        """Runs without timestamps are not recorded."""
+        path = tmp_path / "durations.json"
+        CIDurationHistory(path).record(
+            _status("completed", workflow_name="CI", run_ids=[1])
+        )
+        assert not path.exists()
+
+
+class TestCIWaiter:
+    """Tests for CIWaiter budget accounting."""
+
+    @patch("mcp_coder.workflow_steps.ci_wait.time.sleep")
+    def test_budget_caps_total_wait(self, mock_sleep: MagicMock) -> None:
+        """Scheduled waits never exceed the budget."""
+        waiter = CIWaiter(30, AdaptivePollSchedule(min_interval=5, max_interval=60))
+        waiter.observe(_status("in_progress"))
+        while not waiter.expired:
+            waiter.wait()
+            waiter.observe(_status("in_progress"))
+
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == pytest.approx(30)
+
+    @patch("mcp_coder.workflow_steps.ci_wait.time.sleep")
+    def test_no_run_polls_back_off(self, mock_sleep: MagicMock) -> None:
+        """A branch whose run never appears costs far fewer polls than 5s each."""
+        waiter = CIWaiter(750)
+        waiter.observe({"run": {}, "jobs": []})
+        while not waiter.expired:
+            waiter.wait()
+            waiter.observe({"run": {}, "jobs": []})
+
+        assert mock_sleep.call_count < 25
+
+    def test_notifier_wakes_early(self) -> None:
+        """A notification ends the wait before the scheduled interval."""
+        notifier = MagicMock()
+        notifier.wait.return_value = True
+        waiter = CIWaiter(600, notifier=notifier)
+        waiter.observe(_status("in_progress"))
+
+        spent = waiter.wait()
+
+        notifier.wait.assert_called_once()
+        assert spent < 1.0
+        waiter.close()
+        notifier.close.assert_called_once()
+
+    def test_expected_duration_loaded_once(self) -> None:
+        """History is consulted once per wait, not on every poll."""
+        history = MagicMock()
+        history.expected_duration.return_value = 120.0
+        waiter = CIWaiter(600, history=history)
+        for _ in range(3):
+            waiter.observe(_status("in_progress", workflow_name="CI"))
+        waiter.observe(_status("completed", workflow_name="CI"))
+
+        history.expected_duration.assert_called_once()
+        history.record.assert_called_once()
+
+    def test_run_completed_on_first_poll_not_recorded(self) -> None:
+        """A run that finished before the wait began adds no sample."""
+        history = MagicMock()
+        history.expected_duration.return_value = None
+        waiter = CIWaiter(600, history=history)
+        waiter.observe(_status("completed", workflow_name="CI"))
+
+        history.record.assert_not_called()
+
+
+class TestNotifiers:
+    """Tests for the notification sources."""
+
+    def test_file_drop_consumes_marker(self, tmp_path: Path) -> None:
+        """The marker file wakes the waiter and is removed."""
+        marker = tmp_path / "ci_done"
+        notifier = FileDropNotifier(marker, check_interval=0.01)
+
+        assert notifier.wait(0.05) is False
+        marker.touch()
+        assert notifier.wait(5) is True
+        assert not marker.exists()
+
+    def test_file_drop_wakes_during_wait(self, tmp_path: Path) -> None:
+        """A marker dropped mid-wait ends the wait promptly."""
+        marker = tmp_path / "ci_done"
+        notifier = FileDropNotifier(marker, check_interval=0.01)
+        threading.Timer(0.05, marker.touch).start()
+
+        start = time.monotonic()
+        assert notifier.wait(5) is True
+        assert time.monotonic() - start < 2
+
+    def test_webhook_post_wakes_waiter(self) -> None:
+        """A POST to the local listener signals completion."""
+        notifier = WebhookNotifier(0)
+        try:
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{notifier.port}/", data=b"{}", method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                assert response.status == 204
+            assert notifier.wait(5) is True
+            assert notifier.wait(0.01) is False
+        finally:
+            notifier.close()
+
+    def test_notifier_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The env var selects the file-drop source; unset means polling."""
+        monkeypatch.delenv("MCP_CODER_CI_NOTIFY_FILE", raising=False)
+        monkeypatch.delenv("MCP_CODER_CI_WEBHOOK_PORT", raising=False)
+        assert notifier_from_env() is None
+
+        monkeypatch.setenv("MCP_CODER_CI_NOTIFY_FILE", str(tmp_path / "done"))
+        notifier = notifier_from_env()
+        assert isinstance(notifier, FileDropNotifier)
+        assert notifier.path == tmp_path / "done"
@@ -0,0 +1,76 @@
+"""Tests for the content-addressed cache of rebase check results.
+
+Marked ``git_integration``: the cache key is derived from a temp repo's tree.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from git import Repo
+
+from mcp_coder.workflows import rebase_checks
+from mcp_coder.workflows.rebase_checks import _run_all_checks
+
+KEYS = {("pylint", "main.py", "W0611", "Unused import os")}
+
+
+@pytest.fixture
+def run_checkers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> MagicMock:
+    """Replace the checkers and point the cache at a temp directory."""
+    checkers = MagicMock(return_value=KEYS)
+    monkeypatch.setattr(rebase_checks, "_run_checkers", checkers)
+    monkeypatch.setattr(
+        rebase_checks, "get_check_cache_dir", lambda: tmp_path / "cache"
+    )
+    return checkers
+
+
+@pytest.mark.git_integration
+class TestCheckCache:
+    """Results are reused for an unchanged, clean tree only."""
+
+    def test_same_tree_is_checked_once(
+        self, git_repo_with_files: tuple[Repo, Path], run_checkers: MagicMock
+    ) -> None:
+        _, project_dir = git_repo_with_files
+
+        first = _run_all_checks(project_dir)
+        second = _run_all_checks(project_dir)
+
+        assert first == second == KEYS
+        run_checkers.assert_called_once()
+
+    def test_new_commit_is_checked_again(
+        self, git_repo_with_files: tuple[Repo, Path], run_checkers: MagicMock
+    ) -> None:
+        repo, project_dir = git_repo_with_files
+        _run_all_checks(project_dir)
+
+        (project_dir / "main.py").write_text("def main():\n    return 1\n")
+        repo.index.add(["main.py"])
+        repo.index.commit("Change main")
+        _run_all_checks(project_dir)
+
+        assert run_checkers.call_count == 2
+
+    def test_dirty_tree_is_not_cached(
+        self, git_repo_with_files: tuple[Repo, Path], run_checkers: MagicMock
+    ) -> None:
+        _, project_dir = git_repo_with_files
+        (project_dir / "scratch.py").write_text("x = 1\n")
+
+        _run_all_checks(project_dir)
+        _run_all_checks(project_dir)
+
+        assert run_checkers.call_count == 2
+
+    def test_use_cache_false_always_runs(
+        self, git_repo_with_files: tuple[Repo, Path], run_checkers: MagicMock
+    ) -> None:
+        _, project_dir = git_repo_with_files
+
+        _run_all_checks(project_dir)
+        _run_all_checks(project_dir, use_cache=False)
+
+        assert run_checkers.call_count == 2
@@ -5,6 +5,8 @@
 only restricts src modules to the ``mcp_coder.mcp_tools_py`` shim).
 """
 
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional
 from unittest.mock import patch
@@ -290,6 +292,14 @@ def test_fixed_failures_are_not_regressions(self) -> None:
 class TestRunAllChecks:
     """_run_all_checks unions the three key sets and wraps run failures."""
 
+    @pytest.fixture(autouse=True)
+    def _no_check_cache(self) -> Iterator[None]:
+        """Keep these tests off git and the result cache."""
+        with patch(
+            "mcp_coder.workflows.rebase_checks._check_cache_key", return_value=None
+        ):
+            yield
+
     def test_unions_all_three_key_sets(self, tmp_path: Path) -> None:
         """Keys from pytest, pylint and mypy are merged into one set."""
         report = _make_report(
@@ -354,9 +364,19 @@ def test_clean_checks_yield_empty_set(self, tmp_path: Path) -> None:
 
     def test_wrapper_exception_becomes_check_run_error(self, tmp_path: Path) -> None:
         """An unexpected exception from a wrapper is wrapped, naming the checker."""
-        with patch(
-            "mcp_coder.workflows.rebase_checks.run_pytest_check",
-            side_effect=RuntimeError("No pyproject.toml found"),
+        with (
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_pytest_check",
+                side_effect=RuntimeError("No pyproject.toml found"),
+            ),
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_pylint_check",
+                return_value=PylintResult(return_code=0, messages=[]),
+            ),
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_mypy_check",
+                return_value=MypyResult(return_code=0, messages=[]),
+            ),
         ):
             with pytest.raises(CheckRunError, match="pytest"):
                 _run_all_checks(tmp_path)
@@ -374,6 +394,34 @@ def test_check_run_error_names_failing_checker(self, tmp_path: Path) -> None:
                     return_code=32, messages=[], error="pylint crashed"
                 ),
             ),
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_mypy_check",
+                return_value=MypyResult(return_code=0, messages=[]),
+            ),
         ):
             with pytest.raises(CheckRunError, match="pylint"):
                 _run_all_checks(tmp_path)
+
+    def test_checkers_run_concurrently(self, tmp_path: Path) -> None:
+        """All three checkers are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _meet(result: Any) -> Any:
+            barrier.wait()  # BrokenBarrierError if the checkers ran serially
+            return result
+
+        with (
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_pytest_check",
+                side_effect=lambda _pd: _meet(_pytest_results(_make_report())),
+            ),
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_pylint_check",
+                side_effect=lambda _pd: _meet(PylintResult(return_code=0, messages=[])),
+            ),
+            patch(
+                "mcp_coder.workflows.rebase_checks.run_mypy_check",
+                side_effect=lambda _pd: _meet(MypyResult(return_code=0, messages=[])),
+            ),
+        ):
+            assert _run_all_checks(tmp_path) == set()
@@ -101,7 +101,7 @@ def _patch_common(
 
     # One assessment per session at command entry (the read-only build).
     build_mock = Mock(
-        side_effect=lambda sess, cached=None: {
+        side_effect=lambda sess, cached=None, **_kwargs: {
             s["folder"]: _assessment(s["folder"]) for s in sess
         }
     )
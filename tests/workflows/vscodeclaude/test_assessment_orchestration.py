@@ -2,16 +2,26 @@
 
 ``build_assessments`` is the READ-ONLY builder (snapshot once, no disk writes);
 ``apply_assessments`` is the single mutation point (PID refresh + last_active
-advance + one atomic save, plus one audit run-block when write_audit=True).
+advance, one row at a time, plus one audit run-block when write_audit=True).
 """
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
+from mcp_coder.mcp_workspace_github import IssueData
 from mcp_coder.workflows.vscodeclaude.assessment import (
     apply_assessments,
     assess_session,
     build_assessments,
 )
+from mcp_coder.workflows.vscodeclaude.audit import iter_runs
+from mcp_coder.workflows.vscodeclaude.sessions import (
+    add_session,
+    load_sessions,
+    remove_session,
+)
 from tests.workflows.vscodeclaude.conftest import (
     make_issue_facts,
     make_session_at,
@@ -23,16 +33,43 @@
 _GIT_STATUS = "mcp_coder.workflows.vscodeclaude.assessment.get_folder_git_status"
 _IGNORE = "mcp_coder.workflows.vscodeclaude.assessment.get_ignore_labels"
 _USERNAME = "mcp_coder.workflows.vscodeclaude.assessment.get_github_username"
-_LOAD = "mcp_coder.workflows.vscodeclaude.assessment.load_sessions"
-_SAVE = "mcp_coder.workflows.vscodeclaude.assessment.save_sessions"
+_MODIFY = "mcp_coder.workflows.vscodeclaude.assessment.modify_session"
+_SESSIONS_FILE = "mcp_coder.workflows.vscodeclaude.sessions.get_sessions_file_path"
 _CREATE_TIME = "mcp_coder.workflows.vscodeclaude.assessment.get_pid_create_time"
-_AUDIT_PATH = "mcp_coder.workflows.vscodeclaude.audit.get_audit_file_path"
+_AUDIT_DIR = "mcp_coder.workflows.vscodeclaude.audit.get_audit_dir"
+_FETCH_MISSING = "mcp_coder.workflows.vscodeclaude.assessment._fetch_missing_issues"
+_STALE = "mcp_coder.workflows.vscodeclaude.assessment.is_session_stale"
+
+
+def _issue(number: int, *, state: str = "open") -> IssueData:
+    """A minimal eligible issue assigned to ``testuser``."""
+    return {
+        "number": number,
+        "title": "Test issue",
+        "body": "",
+        "state": state,
+        "labels": ["status-07:code-review"],
+        "assignees": ["testuser"],
+        "user": None,
+        "created_at": None,
+        "updated_at": None,
+        "url": "",
+        "locked": False,
+    }
+
+
+@pytest.fixture
+def sessions_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the session store at a temporary sessions file."""
+    path = tmp_path / "vscodeclaude_sessions.json"
+    monkeypatch.setattr(_SESSIONS_FILE, lambda: path)
+    return path
 
 
 class TestBuildAssessments:
     """READ-ONLY builder: snapshot once, no disk writes, one entry per session."""
 
-    @patch(_SAVE)
+    @patch(_MODIFY)
     @patch(_GIT_STATUS, return_value="Clean")
     @patch(_GATHER)
     @patch(_SNAP)
@@ -45,7 +82,7 @@ def test_build_assessments_performs_no_disk_writes(
         mock_snap: object,
         mock_gather: Mock,
         mock_git: object,
-        mock_save: Mock,
+        mock_modify: Mock,
     ) -> None:
         """build_assessments never writes sessions.json (save_sessions untouched)."""
         mock_gather.return_value = make_signals(title_match=True, found_pid=7)
@@ -55,9 +92,9 @@ def test_build_assessments_performs_no_disk_writes(
 
         assert set(result) == {"C:/work/a"}
         assert result["C:/work/a"].verdict.active is True
-        mock_save.assert_not_called()
+        mock_modify.assert_not_called()
 
-    @patch(_SAVE)
+    @patch(_MODIFY)
     @patch(_GIT_STATUS, return_value="Clean")
     @patch(_GATHER)
     @patch(_SNAP)
@@ -70,7 +107,7 @@ def test_snapshot_captured_exactly_once_per_call(
         mock_snap: Mock,
         mock_gather: Mock,
         mock_git: object,
-        mock_save: object,
+        mock_modify: object,
     ) -> None:
         """One DetectionSnapshot per build (R4), gathered once per session."""
         mock_gather.return_value = make_signals()
@@ -86,23 +123,83 @@ def test_snapshot_captured_exactly_once_per_call(
         assert mock_gather.call_count == len(sessions)
         assert set(result) == {"C:/work/a", "C:/work/b", "C:/work/c"}
 
+    @patch(_MODIFY)
+    @patch(_GIT_STATUS, return_value="Clean")
+    @patch(_GATHER)
+    @patch(_SNAP)
+    @patch(_USERNAME, return_value="testuser")
+    @patch(_IGNORE, return_value=set())
+    def test_results_keep_session_order_and_report_timings(
+        self,
+        mock_ignore: object,
+        mock_username: object,
+        mock_snap: Mock,
+        mock_gather: Mock,
+        mock_git: Mock,
+        mock_modify: object,
+    ) -> None:
+        """Parallel gathering keeps session order and fills the phase timings."""
+        mock_gather.return_value = make_signals()
+        folders = [f"C:/work/{i}" for i in range(20)]
+        sessions = [make_session_at(folder, i) for i, folder in enumerate(folders)]
+        timings: dict[str, float] = {}
+
+        result = build_assessments(sessions, timings=timings)
+
+        assert list(result) == folders
+        assert mock_git.call_count == len(folders)
+        assert set(timings) == {"snapshot", "issue_fetch", "sessions"}
+
+    @patch(_STALE, return_value=False)
+    @patch(_FETCH_MISSING)
+    @patch(_MODIFY)
+    @patch(_GIT_STATUS, return_value="Clean")
+    @patch(_GATHER)
+    @patch(_SNAP)
+    @patch(_USERNAME, return_value="testuser")
+    @patch(_IGNORE, return_value=set())
+    def test_missing_issues_fetched_once_per_repo(
+        self,
+        mock_ignore: object,
+        mock_username: object,
+        mock_snap: Mock,
+        mock_gather: Mock,
+        mock_git: object,
+        mock_modify: object,
+        mock_fetch: Mock,
+        mock_stale: object,
+    ) -> None:
+        """Missing issues are de-duplicated into one batched fetch per repo."""
+        mock_gather.return_value = make_signals()
+        sessions = [
+            make_session_at("C:/work/a", 1),
+            make_session_at("C:/work/b", 2),
+            make_session_at("C:/work/c", 2),
+            make_session_at("C:/work/d", 3),
+        ]
+        cached = {sessions[0]["repo"]: {3: _issue(3)}}
+        mock_fetch.return_value = {1: _issue(1, state="closed"), 2: _issue(2)}
+
+        result = build_assessments(sessions, cached_issues_by_repo=cached)
+
+        mock_fetch.assert_called_once_with(sessions[0]["repo"], [1, 2])
+        assert result["C:/work/a"].issue_state.is_open is False
+        assert result["C:/work/b"].issue_state.is_open is True
+
 
 class TestApplyAssessments:
-    """Apply-only mutation point: PID refresh + last_active advance, single save."""
+    """Apply-only mutation point: PID refresh + last_active advance, per session."""
 
     @patch(_CREATE_TIME, return_value=123.5)
-    @patch(_SAVE)
-    @patch(_LOAD)
     def test_apply_advances_last_active_and_refreshes_pid_once(
         self,
-        mock_load: Mock,
-        mock_save: Mock,
         mock_ct: Mock,
+        sessions_file: Path,
     ) -> None:
         """An active session refreshes the stale PID and advances last_active."""
         session = make_session_at("C:/work/a", 1)
         session["vscode_pid"] = 100
-        mock_load.return_value = {"sessions": [session], "last_updated": ""}
+        add_session(session)
 
         assessment = assess_session(
             folder="C:/work/a",
@@ -115,28 +212,23 @@ def test_apply_advances_last_active_and_refreshes_pid_once(
 
         apply_assessments({"C:/work/a": assessment}, [session], write_audit=False)
 
-        saved_store = mock_save.call_args[0][0]
-        saved = saved_store["sessions"][0]
+        saved = load_sessions()["sessions"][0]
         assert saved["vscode_pid"] == 200
         assert saved["vscode_pid_create_time"] == 123.5
         assert saved["last_active"] is True
         assert saved["last_active_rule"] == "title"
         mock_ct.assert_called_once_with(200)
-        mock_save.assert_called_once()
 
     @patch(_CREATE_TIME)
-    @patch(_SAVE)
-    @patch(_LOAD)
     def test_apply_inactive_skips_pid_refresh(
         self,
-        mock_load: Mock,
-        mock_save: Mock,
         mock_ct: Mock,
+        sessions_file: Path,
     ) -> None:
         """An inactive session advances last_active to False without touching PID."""
         session = make_session_at("C:/work/a", 1)
         session["vscode_pid"] = 100
-        mock_load.return_value = {"sessions": [session], "last_updated": ""}
+        add_session(session)
 
         assessment = assess_session(
             folder="C:/work/a",
@@ -149,25 +241,54 @@ def test_apply_inactive_skips_pid_refresh(
 
         apply_assessments({"C:/work/a": assessment}, [session], write_audit=False)
 
-        saved = mock_save.call_args[0][0]["sessions"][0]
+        saved = load_sessions()["sessions"][0]
         assert saved["vscode_pid"] == 100  # unchanged
         assert saved["last_active"] is False
         assert saved["last_active_rule"] == "no_match"
         mock_ct.assert_not_called()
-        mock_save.assert_called_once()
+
+    @patch(_CREATE_TIME)
+    def test_apply_keeps_concurrent_store_changes(
+        self,
+        mock_ct: Mock,
+        sessions_file: Path,
+    ) -> None:
+        """Sessions added or removed after build are neither lost nor revived."""
+        session_a = make_session_at("C:/work/a", 1)
+        session_b = make_session_at("C:/work/b", 2)
+        add_session(session_a)
+        add_session(session_b)
+        assessments = {
+            session["folder"]: assess_session(
+                folder=session["folder"],
+                signals=make_signals(title_match=True),
+                issue_facts=make_issue_facts(),
+                git_status="Clean",
+                directory_empty=False,
+                prior_last_active=None,
+            )
+            for session in (session_a, session_b)
+        }
+        # Another coordinator process changes the store between build and apply.
+        remove_session("C:/work/b")
+        add_session(make_session_at("C:/work/c", 3))
+
+        apply_assessments(assessments, [session_a, session_b], write_audit=False)
+
+        stored = {s["folder"]: s for s in load_sessions()["sessions"]}
+        assert sorted(stored) == ["C:/work/a", "C:/work/c"]
+        assert stored["C:/work/a"]["last_active"] is True
+        assert stored["C:/work/c"]["last_active"] is None
 
 
 class TestApplyAssessmentsAudit:
     """apply_assessments writes ONE run-block per invocation when write_audit=True."""
 
     @patch(_CREATE_TIME)
-    @patch(_SAVE)
-    @patch(_LOAD)
     def test_apply_records_destructive_delete_removed_by_cleanup(
         self,
-        mock_load: Mock,
-        mock_save: Mock,
         mock_ct: Mock,
+        sessions_file: Path,
         tmp_path: object,
         monkeypatch: object,
     ) -> None:
@@ -181,19 +302,15 @@ def test_apply_records_destructive_delete_removed_by_cleanup(
         surviving session_a — realistically mirroring the cleanup-then-apply
         order — while the full build-time list is threaded through.
         """
-        import json as _json
         from pathlib import Path as _Path
 
-        audit_file = _Path(str(tmp_path)) / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)  # type: ignore[attr-defined]
+        audit_dir = _Path(str(tmp_path)) / "vscodeclaude_audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)  # type: ignore[attr-defined]
 
         session_a = make_session_at("C:/work/a", 1)
         session_b = make_session_at("C:/work/b", 38)
         # Post-cleanup store: session_b was DELETEd and saved out before apply.
-        mock_load.return_value = {
-            "sessions": [session_a],
-            "last_updated": "",
-        }
+        add_session(session_a)
 
         active = assess_session(
             folder="C:/work/a",
@@ -223,9 +340,9 @@ def test_apply_records_destructive_delete_removed_by_cleanup(
             write_audit=True,
         )
 
-        data = _json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == 1
-        records = data["runs"][0]["records"]
+        runs = list(iter_runs())
+        assert len(runs) == 1
+        records = runs[0]["records"]
         # One record per assessed session, INCLUDING the cleanup-deleted #38.
         assert len(records) == 2
         # The #38-shaped record is greppable as a one-glance post-mortem and
@@ -236,27 +353,24 @@ def test_apply_records_destructive_delete_removed_by_cleanup(
         assert deletes[0]["decision"]["destructive"] is True
         assert deletes[0]["issue_number"] == 38
         # The survivor (still in the store) advances its last_active as before.
-        assert mock_save.call_args[0][0]["sessions"][0]["last_active"] is True
+        assert load_sessions()["sessions"][0]["last_active"] is True
 
     @patch(_CREATE_TIME)
-    @patch(_SAVE)
-    @patch(_LOAD)
     def test_status_path_writes_no_audit_record(
         self,
-        mock_load: Mock,
-        mock_save: Mock,
         mock_ct: Mock,
+        sessions_file: Path,
         tmp_path: object,
         monkeypatch: object,
     ) -> None:
         """write_audit=False (the status path never calls apply) leaves no file."""
         from pathlib import Path as _Path
 
-        audit_file = _Path(str(tmp_path)) / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)  # type: ignore[attr-defined]
+        audit_dir = _Path(str(tmp_path)) / "vscodeclaude_audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)  # type: ignore[attr-defined]
 
         session = make_session_at("C:/work/a", 1)
-        mock_load.return_value = {"sessions": [session], "last_updated": ""}
+        add_session(session)
 
         assessment = assess_session(
             folder="C:/work/a",
@@ -269,28 +383,24 @@ def test_status_path_writes_no_audit_record(
 
         apply_assessments({"C:/work/a": assessment}, [session], write_audit=False)
 
-        assert not audit_file.exists()
+        assert not audit_dir.exists()
 
     @patch(_CREATE_TIME)
-    @patch(_SAVE)
-    @patch(_LOAD)
     def test_locked_folder_retry_recurs_across_runs(
         self,
-        mock_load: Mock,
-        mock_save: Mock,
         mock_ct: Mock,
+        sessions_file: Path,
         tmp_path: object,
         monkeypatch: object,
     ) -> None:
         """A still-stale session recurs as a delete record across consecutive runs."""
-        import json as _json
         from pathlib import Path as _Path
 
-        audit_file = _Path(str(tmp_path)) / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)  # type: ignore[attr-defined]
+        audit_dir = _Path(str(tmp_path)) / "vscodeclaude_audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)  # type: ignore[attr-defined]
 
         session = make_session_at("C:/work/b", 38)
-        mock_load.return_value = {"sessions": [session], "last_updated": ""}
+        add_session(session)
 
         deleting = assess_session(
             folder="C:/work/b",
@@ -306,9 +416,9 @@ def test_locked_folder_retry_recurs_across_runs(
         apply_assessments({"C:/work/b": deleting}, [session], write_audit=True)
         apply_assessments({"C:/work/b": deleting}, [session], write_audit=True)
 
-        data = _json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == 2
-        for run in data["runs"]:
+        runs = list(iter_runs())
+        assert len(runs) == 2
+        for run in runs:
             assert run["records"][0]["decision"]["action"] == "delete"
             assert run["records"][0]["issue_number"] == 38
 
@@ -316,7 +426,7 @@ def test_locked_folder_retry_recurs_across_runs(
 class TestBuildAssessmentsLogging:
     """Decision + transition logging emitted by build_assessments."""
 
-    @patch(_SAVE)
+    @patch(_MODIFY)
     @patch(_GIT_STATUS, return_value="Clean")
     @patch(_GATHER)
     @patch(_SNAP)
@@ -329,7 +439,7 @@ def test_transition_log_on_true_flip(
         mock_snap: object,
         mock_gather: Mock,
         mock_git: object,
-        mock_save: object,
+        mock_modify: object,
         caplog: object,
     ) -> None:
         """A prior-active session now inactive logs the active->inactive flip."""
@@ -346,7 +456,7 @@ def test_transition_log_on_true_flip(
         assert "flipped active->inactive" in caplog.text  # type: ignore[attr-defined]
         assert "was rule=title" in caplog.text  # type: ignore[attr-defined]
 
-    @patch(_SAVE)
+    @patch(_MODIFY)
     @patch(_GIT_STATUS, return_value="Clean")
     @patch(_GATHER)
     @patch(_SNAP)
@@ -359,7 +469,7 @@ def test_no_transition_log_on_none_prior(
         mock_snap: object,
         mock_gather: Mock,
         mock_git: object,
-        mock_save: object,
+        mock_modify: object,
         caplog: object,
     ) -> None:
         """A None prior baseline is a blind spot, never logged as a flip."""
@@ -374,7 +484,7 @@ def test_no_transition_log_on_none_prior(
 
         assert "flipped active->inactive" not in caplog.text  # type: ignore[attr-defined]
 
-    @patch(_SAVE)
+    @patch(_MODIFY)
     @patch(_GIT_STATUS, return_value="Clean")
     @patch(_GATHER)
     @patch(_SNAP)
@@ -387,7 +497,7 @@ def test_decision_line_logged(
         mock_snap: object,
         mock_gather: Mock,
         mock_git: object,
-        mock_save: object,
+        mock_modify: object,
         caplog: object,
     ) -> None:
         """Each assessed session logs a one-glance verdict/action decision line."""
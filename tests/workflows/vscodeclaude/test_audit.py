@@ -1,7 +1,7 @@
 """Tests for the persisted audit trail (``audit.py``).
 
-One global file, one run-block per invocation, last-50 ring buffer, written only
-by ``apply()`` runs. The serializer is the ONE shared
+One global append-only segment store, one JSON line per invocation, ring buffer
+trimmed by whole segments, written only by ``apply()`` runs. The serializer is the ONE shared
 :meth:`SessionAssessment.to_audit_record`, so these tests assert delegation (not a
 second flattening) and the ring-buffer / atomic-write discipline.
 """
@@ -14,7 +14,9 @@
     MAX_AUDIT_RUNS,
     append_run,
     assessment_to_record,
+    get_audit_dir,
     get_audit_file_path,
+    iter_runs,
 )
 from mcp_coder.workflows.vscodeclaude.types import (
     Decision,
@@ -28,7 +30,7 @@
     VSCodeClaudeSession,
 )
 
-_AUDIT_PATH = "mcp_coder.workflows.vscodeclaude.audit.get_audit_file_path"
+_AUDIT_DIR = "mcp_coder.workflows.vscodeclaude.audit.get_audit_dir"
 
 
 def _session(
@@ -88,82 +90,138 @@ def _assessment(
     )
 
 
-class TestGetAuditFilePath:
-    """The global audit file path (sibling of sessions.json)."""
+class TestGetAuditPaths:
+    """Audit store location (global, next to sessions.json)."""
 
-    def test_filename_and_cache_dir(self) -> None:
-        path = get_audit_file_path()
-        assert path.name == "vscodeclaude_audit.json"
+    def test_dir_and_legacy_file_in_cache_dir(self) -> None:
+        path = get_audit_dir()
+        assert path.name == "vscodeclaude_audit"
         assert path.parent.name == "coordinator_cache"
+        assert get_audit_file_path().parent == path.parent
 
 
 class TestAppendRun:
-    """Ring-buffer append discipline."""
+    """Append-only segment store and ring-buffer trimming."""
 
-    def test_creates_file_and_parents(self, tmp_path: Path, monkeypatch: Any) -> None:
-        """append_run mkdirs the parent and writes a single run-block."""
-        audit_file = tmp_path / "nested" / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)
+    def test_creates_dir_and_appends_one_line(
+        self, tmp_path: Path, monkeypatch: Any
+    ) -> None:
+        """append_run mkdirs the store and writes one JSON line per run."""
+        audit_dir = tmp_path / "nested" / "vscodeclaude_audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)
 
         append_run([{"folder": "a"}])
 
-        assert audit_file.exists()
-        data = json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == 1
-        assert data["runs"][0]["records"] == [{"folder": "a"}]
-        assert "run_at" in data["runs"][0]
+        segment = audit_dir / "runs-000001.jsonl"
+        lines = segment.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        run = json.loads(lines[0])
+        assert run["records"] == [{"folder": "a"}]
+        assert "run_at" in run
 
-    def test_ring_buffer_keeps_only_last_50(
+    def test_timings_stored_on_run_block(
         self, tmp_path: Path, monkeypatch: Any
     ) -> None:
-        """Writing 51 runs trims to the newest 50 (ring buffer)."""
-        audit_file = tmp_path / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)
+        """Per-phase timings are recorded on the run-block when given."""
+        monkeypatch.setattr(_AUDIT_DIR, lambda: tmp_path / "audit")
 
-        for i in range(MAX_AUDIT_RUNS + 1):
-            append_run([{"run_index": i}])
+        append_run([{"folder": "a"}], timings={"snapshot": 0.5})
+        append_run([{"folder": "b"}])
 
-        data = json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == MAX_AUDIT_RUNS
-        # The very first run (index 0) was dropped; the newest (index 50) is kept.
-        assert data["runs"][0]["records"] == [{"run_index": 1}]
-        assert data["runs"][-1]["records"] == [{"run_index": MAX_AUDIT_RUNS}]
+        newest, oldest = list(iter_runs())
+        assert oldest["timings"] == {"snapshot": 0.5}
+        assert "timings" not in newest
 
-    def test_custom_max_runs(self, tmp_path: Path, monkeypatch: Any) -> None:
-        """max_runs override controls the ring-buffer size."""
-        audit_file = tmp_path / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)
+    def test_earlier_runs_are_not_rewritten(
+        self, tmp_path: Path, monkeypatch: Any
+    ) -> None:
+        """Appending leaves the bytes of earlier runs untouched."""
+        audit_dir = tmp_path / "audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)
 
-        for i in range(5):
-            append_run([{"i": i}], max_runs=2)
+        append_run([{"folder": "a"}])
+        segment = audit_dir / "runs-000001.jsonl"
+        before = segment.read_bytes()
+        append_run([{"folder": "b"}])
 
-        data = json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == 2
-        assert [r["records"][0]["i"] for r in data["runs"]] == [3, 4]
+        assert segment.read_bytes().startswith(before)
 
-    def test_appends_to_existing_runs(self, tmp_path: Path, monkeypatch: Any) -> None:
-        """A second append preserves earlier runs (newest last)."""
-        audit_file = tmp_path / "vscodeclaude_audit.json"
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)
+    def test_rotates_segments_by_size(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """A full segment is closed and the next run starts a new one."""
+        audit_dir = tmp_path / "audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)
 
-        append_run([{"folder": "a"}])
-        append_run([{"folder": "b"}])
+        for i in range(3):
+            append_run([{"i": i}], segment_max_bytes=1)
+
+        assert sorted(p.name for p in audit_dir.iterdir()) == [
+            "runs-000001.jsonl",
+            "runs-000002.jsonl",
+            "runs-000003.jsonl",
+        ]
+
+    def test_trims_whole_segments_beyond_max_runs(
+        self, tmp_path: Path, monkeypatch: Any
+    ) -> None:
+        """Old segments are deleted once newer ones hold ``max_runs`` runs."""
+        audit_dir = tmp_path / "audit"
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)
 
-        data = json.loads(audit_file.read_text(encoding="utf-8"))
-        assert [r["records"][0]["folder"] for r in data["runs"]] == ["a", "b"]
+        for i in range(5):
+            append_run([{"i": i}], max_runs=2, segment_max_bytes=1)
+
+        assert [r["records"][0]["i"] for r in iter_runs()] == [4, 3]
+        assert len(list(audit_dir.iterdir())) == 2
 
-    def test_corrupt_file_resets_to_empty(
+    def test_default_retention(self) -> None:
+        """Retention is far above the old 50-run ring buffer."""
+        assert MAX_AUDIT_RUNS >= 5000
+
+    def test_torn_line_is_skipped_and_terminated(
         self, tmp_path: Path, monkeypatch: Any
     ) -> None:
-        """A corrupt audit file is treated as empty rather than raising."""
-        audit_file = tmp_path / "vscodeclaude_audit.json"
-        audit_file.write_text("{not valid json", encoding="utf-8")
-        monkeypatch.setattr(_AUDIT_PATH, lambda: audit_file)
+        """A partial line from an interrupted write does not corrupt later runs."""
+        audit_dir = tmp_path / "audit"
+        audit_dir.mkdir()
+        (audit_dir / "runs-000001.jsonl").write_text(
+            '{"records": [{"folder": "a"}]}\n{"records": [{"fol', encoding="utf-8"
+        )
+        monkeypatch.setattr(_AUDIT_DIR, lambda: audit_dir)
+
+        append_run([{"folder": "b"}])
+
+        folders = [r["records"][0]["folder"] for r in iter_runs()]
+        assert folders == ["b", "a"]
+
+    def test_imports_legacy_audit_file(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Runs of the old single-file trail are moved into the first segment."""
+        legacy = tmp_path / "vscodeclaude_audit.json"
+        legacy.write_text(
+            json.dumps({"runs": [{"run_at": "old", "records": []}]}),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(_AUDIT_DIR, lambda: tmp_path / "vscodeclaude_audit")
 
         append_run([{"folder": "a"}])
 
-        data = json.loads(audit_file.read_text(encoding="utf-8"))
-        assert len(data["runs"]) == 1
+        assert [r.get("run_at") for r in iter_runs()][1] == "old"
+        assert not legacy.exists()
+
+
+class TestIterRuns:
+    """Newest-first streaming reader."""
+
+    def test_empty_store_yields_nothing(self, tmp_path: Path, monkeypatch: Any) -> None:
+        monkeypatch.setattr(_AUDIT_DIR, lambda: tmp_path / "missing")
+        assert list(iter_runs()) == []
+
+    def test_limit_stops_early(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """``limit`` yields only the newest runs across segments."""
+        monkeypatch.setattr(_AUDIT_DIR, lambda: tmp_path / "audit")
+        for i in range(4):
+            append_run([{"i": i}], segment_max_bytes=1)
+
+        assert [r["records"][0]["i"] for r in iter_runs(limit=3)] == [3, 2, 1]
 
 
 class TestAssessmentToRecord:
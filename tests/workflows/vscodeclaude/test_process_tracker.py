@@ -0,0 +1,115 @@
+"""Tests for the incremental VSCode process tracker."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_coder.workflows.vscodeclaude.process_tracker import (
+    VSCodeProcessTracker,
+    build_folder_index,
+    find_folder_pids,
+)
+
+PROCESS_ITER = "mcp_coder.workflows.vscodeclaude.process_tracker.psutil.process_iter"
+
+
+def _proc(pid: int, name: str, create_time: float, cmdline: list[str]) -> MagicMock:
+    proc = MagicMock()
+    proc.info = {"pid": pid, "name": name, "create_time": create_time}
+    proc.cmdline.return_value = cmdline
+    return proc
+
+
+class _FakeProcessTable:
+    """Stands in for ``psutil.process_iter`` over a mutable process list."""
+
+    def __init__(self, procs: list[MagicMock]) -> None:
+        self.procs = procs
+
+    def __call__(self, _attrs: Any = None) -> Iterator[MagicMock]:
+        return iter(list(self.procs))
+
+
+class TestVSCodeProcessTracker:
+    """Refreshes fetch command lines only for new VSCode processes."""
+
+    def test_reads_cmdline_only_for_new_vscode_processes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        vscode = _proc(10, "Code.exe", 1.0, ["Code.exe", r"C:\ws\repo_1"])
+        other = _proc(20, "python.exe", 2.0, ["python.exe"])
+        table = _FakeProcessTable([vscode, other])
+        monkeypatch.setattr(PROCESS_ITER, table)
+        tracker = VSCodeProcessTracker()
+
+        first = tracker.refresh()
+        second = tracker.refresh()
+
+        assert [p["pid"] for p in first] == [10]
+        assert second is first  # unchanged set keeps the same list
+        assert vscode.cmdline.call_count == 1
+        other.cmdline.assert_not_called()
+
+    def test_evicts_exited_and_reused_pids(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        table = _FakeProcessTable(
+            [
+                _proc(10, "code", 1.0, ["code", "/ws/repo_1"]),
+                _proc(11, "code", 1.0, ["code", "/ws/repo_2"]),
+            ]
+        )
+        monkeypatch.setattr(PROCESS_ITER, table)
+        tracker = VSCodeProcessTracker()
+        tracker.refresh()
+
+        # pid 11 exited; pid 10 was reused by a new VSCode for another folder
+        reused = _proc(10, "code", 5.0, ["code", "/ws/repo_3"])
+        table.procs = [reused]
+        processes = tracker.refresh()
+
+        assert [p["cmdline_lower"] for p in processes] == ["code /ws/repo_3"]
+        assert find_folder_pids(tracker.folder_index, "/ws/repo_1") == []
+        assert find_folder_pids(tracker.folder_index, "/ws/repo_3") == [10]
+
+    def test_invalidate_keeps_known_processes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        vscode = _proc(10, "code", 1.0, ["code", "/ws/repo_1"])
+        monkeypatch.setattr(PROCESS_ITER, _FakeProcessTable([vscode]))
+        tracker = VSCodeProcessTracker()
+        tracker.refresh()
+
+        tracker.invalidate()
+        assert tracker.scanned is False
+        tracker.refresh()
+
+        assert vscode.cmdline.call_count == 1
+
+
+class TestFolderIndex:
+    """The folder index matches folders by path, name and workspace file."""
+
+    def test_matches_path_name_and_workspace_file(self) -> None:
+        index = build_folder_index(
+            [
+                {"pid": 1, "args_lower": ("code", "/ws/repo_1/")},
+                {"pid": 2, "args_lower": ("code.exe", r"c:\ws\repo_2.code-workspace")},
+                {
+                    "pid": 3,
+                    "args_lower": ("code", "--folder-uri=file:///c%3a/ws/repo_3"),
+                },
+            ]
+        )
+
+        assert find_folder_pids(index, "/ws/repo_1") == [1]
+        assert find_folder_pids(index, r"C:\ws\repo_2") == [2]
+        assert find_folder_pids(index, "c:/ws/repo_3") == [3]
+
+    def test_does_not_match_folder_name_prefix(self) -> None:
+        """repo_21 is not open just because repo_219 is (substring scan did)."""
+        index = build_folder_index([{"pid": 1, "cmdline_lower": "code /ws/repo_219"}])
+
+        assert find_folder_pids(index, "/ws/repo_21") == []
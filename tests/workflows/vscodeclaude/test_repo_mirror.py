@@ -0,0 +1,181 @@
+"""Tests for the shared git mirrors behind vscodeclaude session clones."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_coder.utils.subprocess_runner import (
+    CommandOptions,
+    CommandResult,
+    execute_subprocess,
+)
+from mcp_coder.workflows.vscodeclaude import repo_mirror
+from mcp_coder.workflows.vscodeclaude.repo_mirror import (
+    GIT_MIRROR_ENV,
+    clone_with_mirror,
+    ensure_repo_mirror,
+    get_mirror_path,
+)
+
+_MODULE = "mcp_coder.workflows.vscodeclaude.repo_mirror"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_mirrors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep mirrors under tmp_path and start with no refresh history."""
+    app_dir = tmp_path / "app_data"
+    monkeypatch.setattr(f"{_MODULE}.get_user_app_data_dir", lambda _name: app_dir)
+    monkeypatch.setattr(f"{_MODULE}._last_refresh", {})
+    return app_dir
+
+
+class _FakeGit:
+    """Records git commands; ``clone --bare`` creates the mirror's HEAD."""
+
+    def __init__(self, fail: str | None = None) -> None:
+        self.commands: list[list[str]] = []
+        self.fail = fail
+
+    def __call__(self, cmd: list[str], options: Any = None) -> CommandResult:
+        self.commands.append(cmd)
+        if self.fail is not None and self.fail in cmd:
+            return CommandResult(
+                return_code=1, stdout="", stderr="boom", timed_out=False
+            )
+        if cmd[1:3] == ["clone", "--bare"]:
+            target = Path(cmd[-1])
+            target.mkdir(parents=True)
+            (target / "HEAD").write_text("ref: refs/heads/main\n")
+        return CommandResult(return_code=0, stdout="", stderr="", timed_out=False)
+
+    def subcommands(self) -> list[str]:
+        return [cmd[1] for cmd in self.commands]
+
+
+class TestGetMirrorPath:
+    """Tests for get_mirror_path."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com/owner/repo.git",
+            "https://github.com/owner/repo",
+            "git@github.com:owner/repo.git",
+        ],
+    )
+    def test_names_mirror_after_owner_and_repo(self, url: str) -> None:
+        assert get_mirror_path(url).name == "owner_repo.git"
+
+
+class TestEnsureRepoMirror:
+    """Tests for ensure_repo_mirror."""
+
+    def test_creates_mirror_once_then_refreshes_per_interval(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        git = _FakeGit()
+        monkeypatch.setattr(f"{_MODULE}.execute_subprocess", git)
+        now = [1000.0]
+        monkeypatch.setattr(f"{_MODULE}.time.monotonic", lambda: now[0])
+        url = "https://github.com/owner/repo.git"
+
+        mirror = ensure_repo_mirror(url)
+        assert mirror == get_mirror_path(url)
+        assert (mirror / "HEAD").exists()
+        assert git.subcommands() == ["clone", "config"]
+
+        # Same tick: neither cloned nor fetched again.
+        assert ensure_repo_mirror(url) == mirror
+        assert git.subcommands() == ["clone", "config"]
+
+        # Next tick: fetched once.
+        now[0] += repo_mirror.MIRROR_REFRESH_SECONDS
+        assert ensure_repo_mirror(url) == mirror
+        assert git.subcommands() == ["clone", "config", "fetch"]
+
+    def test_failed_clone_leaves_no_mirror(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        git = _FakeGit(fail="config")
+        monkeypatch.setattr(f"{_MODULE}.execute_subprocess", git)
+        url = "https://github.com/owner/repo.git"
+
+        assert ensure_repo_mirror(url) is None
+        assert not any(get_mirror_path(url).parent.iterdir())
+
+
+class TestCloneWithMirror:
+    """Tests for clone_with_mirror."""
+
+    def test_disabled_by_default(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(GIT_MIRROR_ENV, raising=False)
+        git = _FakeGit()
+        monkeypatch.setattr(f"{_MODULE}.execute_subprocess", git)
+
+        assert not clone_with_mirror("https://github.com/o/r.git", tmp_path / "s")
+        assert not git.commands
+
+    def test_clones_with_reference(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(GIT_MIRROR_ENV, "1")
+        git = _FakeGit()
+        monkeypatch.setattr(f"{_MODULE}.execute_subprocess", git)
+        url = "https://github.com/owner/repo.git"
+        folder = tmp_path / "session"
+
+        assert clone_with_mirror(url, folder)
+        assert git.commands[-1] == [
+            "git",
+            "clone",
+            "--reference",
+            str(get_mirror_path(url)),
+            url,
+            str(folder),
+        ]
+
+    def test_failed_reference_clone_empties_folder(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(GIT_MIRROR_ENV, "1")
+        git = _FakeGit(fail="--reference")
+        monkeypatch.setattr(f"{_MODULE}.execute_subprocess", git)
+        folder = tmp_path / "session"
+        (folder / ".git").mkdir(parents=True)
+        (folder / "partial.txt").write_text("x")
+
+        assert not clone_with_mirror("https://github.com/o/r.git", folder)
+        assert folder.exists()
+        assert not any(folder.iterdir())
+
+
+@pytest.mark.git_integration
+def test_reference_clone_borrows_mirror_objects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A session clone of a local repo shares the mirror's objects."""
+    monkeypatch.setenv(GIT_MIRROR_ENV, "1")
+    origin = tmp_path / "origin"
+    origin.mkdir()
+
+    def git(*args: str, cwd: Path = origin) -> None:
+        execute_subprocess(["git", *args], CommandOptions(cwd=str(cwd), check=True))
+
+    git("init", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    (origin / "README.md").write_text("hello\n")
+    git("add", "README.md")
+    git("commit", "-m", "initial")
+
+    folder = tmp_path / "session"
+    folder.mkdir()
+    assert clone_with_mirror(str(origin), folder)
+
+    mirror = get_mirror_path(str(origin))
+    alternates = folder / ".git" / "objects" / "info" / "alternates"
+    assert alternates.read_text().strip() == str(mirror / "objects")
+    assert (folder / "README.md").read_text() == "hello\n"
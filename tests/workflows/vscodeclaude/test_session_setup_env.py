@@ -134,6 +134,7 @@ def test_exact_flags(self, tmp_path: Path) -> None:
         assert "--extras" in argv and "dev" in argv
         assert "--use-sync" in argv
         assert "--refresh" in argv
+        assert "--relocatable" in argv
 
     def test_skip_overrides_present_when_skip_github_install(
         self, tmp_path: Path
@@ -306,6 +306,93 @@ def test_install_runs_first(
         assert _is_claude(fake.argvs()[1])
 
 
+class TestProvisionVenvTemplates:
+    """``provision_venv`` seeds the venv from a template and captures new ones."""
+
+    @pytest.fixture()
+    def templates(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, list[str]]:
+        """Stub the template cache; record clone/save calls per key."""
+        calls: dict[str, list[str]] = {"clone": [], "save": []}
+        available: set[str] = {"k-cached"}
+
+        def _clone(key: str, venv: Path) -> bool:
+            calls["clone"].append(key)
+            return key in available
+
+        def _save(key: str, venv: Path) -> bool:
+            calls["save"].append(key)
+            return True
+
+        monkeypatch.setattr(session_setup, "clone_venv_template", _clone)
+        monkeypatch.setattr(session_setup, "save_venv_template", _save)
+        monkeypatch.delenv("MCP_CODER_VSCODECLAUDE_VENV_TEMPLATE", raising=False)
+        return calls
+
+    def test_seeded_venv_is_installed_and_not_saved_again(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        templates: dict[str, list[str]],
+    ) -> None:
+        monkeypatch.setattr(session_setup, "venv_template_key", lambda *_: "k-cached")
+        fake = _patch_run(monkeypatch, _FakeRun())
+
+        session_setup.provision_venv(_make_spec(), tmp_path, {})
+
+        assert templates == {"clone": ["k-cached"], "save": []}
+        assert [_is_install(argv) for argv in fake.argvs()] == [True]
+
+    def test_fresh_install_is_saved_as_template(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        templates: dict[str, list[str]],
+    ) -> None:
+        monkeypatch.setattr(session_setup, "venv_template_key", lambda *_: "k-new")
+        _patch_run(monkeypatch, _FakeRun())
+
+        session_setup.provision_venv(_make_spec(), tmp_path, {})
+
+        assert templates == {"clone": ["k-new"], "save": ["k-new"]}
+
+    def test_failed_install_on_seeded_venv_reinstalls_from_scratch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        templates: dict[str, list[str]],
+    ) -> None:
+        monkeypatch.setattr(session_setup, "venv_template_key", lambda *_: "k-cached")
+        (tmp_path / ".venv" / "lib").mkdir(parents=True)
+        installs: list[bool] = []
+
+        def _run(argv: list[str], **kwargs: Any) -> "subprocess.CompletedProcess[str]":
+            installs.append((tmp_path / ".venv").exists())
+            if len(installs) == 1:
+                raise subprocess.CalledProcessError(1, argv)
+            return subprocess.CompletedProcess(argv, 0)
+
+        monkeypatch.setattr(_RUN_TARGET, _run)
+
+        session_setup.provision_venv(_make_spec(), tmp_path, {})
+
+        assert installs == [True, False]
+        assert templates["save"] == ["k-cached"]
+
+    def test_disabled_by_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        templates: dict[str, list[str]],
+    ) -> None:
+        monkeypatch.setenv("MCP_CODER_VSCODECLAUDE_VENV_TEMPLATE", "0")
+        monkeypatch.setattr(session_setup, "venv_template_key", lambda *_: "k-cached")
+        _patch_run(monkeypatch, _FakeRun())
+
+        session_setup.provision_venv(_make_spec(), tmp_path, {})
+
+        assert templates == {"clone": [], "save": []}
+
+
 class TestMainGracefulExit:
     """``main`` prompts once and exits 0 on any expected failure."""
 
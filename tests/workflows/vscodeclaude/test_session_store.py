@@ -0,0 +1,113 @@
+"""Tests for the SQLite session store (``session_store.py``)."""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from mcp_coder.workflows.vscodeclaude.session_store import (
+    SessionStore,
+    get_sessions_db_path,
+)
+from tests.workflows.vscodeclaude.conftest import make_session_at
+
+
+def _write_json(path: Path, sessions: list[dict[str, object]]) -> None:
+    path.write_text(
+        json.dumps({"sessions": sessions, "last_updated": "then"}), encoding="utf-8"
+    )
+
+
+class TestMigration:
+    """The legacy JSON file is imported into the database."""
+
+    def test_imports_json_on_first_use(self, tmp_path: Path) -> None:
+        json_path = tmp_path / "sessions.json"
+        _write_json(json_path, [dict(make_session_at("/w/a", 1))])
+
+        store = SessionStore(json_path).load()
+
+        assert [s["folder"] for s in store["sessions"]] == ["/w/a"]
+        assert store["last_updated"] == "then"
+        assert get_sessions_db_path(json_path).exists()
+
+    def test_does_not_reimport_unchanged_json(self, tmp_path: Path) -> None:
+        """Writes after the import survive while the JSON file is unchanged."""
+        json_path = tmp_path / "sessions.json"
+        _write_json(json_path, [dict(make_session_at("/w/a", 1))])
+        store = SessionStore(json_path)
+
+        store.add(make_session_at("/w/b", 2))
+
+        assert [s["folder"] for s in store.load()["sessions"]] == ["/w/a", "/w/b"]
+
+    def test_reimports_changed_json(self, tmp_path: Path) -> None:
+        """A JSON file rewritten later (e.g. by an older version) wins."""
+        json_path = tmp_path / "sessions.json"
+        _write_json(json_path, [dict(make_session_at("/w/a", 1))])
+        store = SessionStore(json_path)
+        store.load()
+
+        _write_json(json_path, [dict(make_session_at("/w/c", 3))])
+        stat = json_path.stat()
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert [s["folder"] for s in store.load()["sessions"]] == ["/w/c"]
+
+
+class TestRowOperations:
+    """Single-session operations and the indexed lookup."""
+
+    def test_update_touches_only_its_row(self, tmp_path: Path) -> None:
+        store = SessionStore(tmp_path / "sessions.json")
+        store.add(make_session_at("/w/a", 1))
+        store.add(make_session_at("/w/b", 2))
+
+        assert store.update("/w/a", status="status-04:plan-review") is True
+        assert store.update("/w/missing", status="x") is False
+
+        statuses = {s["folder"]: s["status"] for s in store.load()["sessions"]}
+        assert statuses == {
+            "/w/a": "status-04:plan-review",
+            "/w/b": "status-07:code-review",
+        }
+
+    def test_find_by_issue_uses_index(self, tmp_path: Path) -> None:
+        store = SessionStore(tmp_path / "sessions.json")
+        store.add(make_session_at("/w/a", 1))
+        store.add(make_session_at("/w/b", 2))
+
+        found = store.find_by_issue("owner/repo", 2)
+
+        assert [s["folder"] for s in found] == ["/w/b"]
+        with sqlite3.connect(store.db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT data FROM sessions "
+                "WHERE repo = ? AND issue_number = ?",
+                ("owner/repo", 2),
+            ).fetchall()
+        assert "sessions_by_issue" in str(plan)
+
+    def test_database_uses_wal(self, tmp_path: Path) -> None:
+        store = SessionStore(tmp_path / "sessions.json")
+        store.add(make_session_at("/w/a", 1))
+
+        with sqlite3.connect(store.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_concurrent_writers_do_not_lose_sessions(self, tmp_path: Path) -> None:
+        """Writers with separate connections serialize instead of overwriting."""
+        json_path = tmp_path / "sessions.json"
+        SessionStore(json_path).load()
+
+        def _add(i: int) -> None:
+            SessionStore(json_path).add(make_session_at(f"/w/{i}", i))
+
+        threads = [threading.Thread(target=_add, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(SessionStore(json_path).load()["sessions"]) == 10
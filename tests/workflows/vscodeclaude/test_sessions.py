@@ -9,8 +9,8 @@
 import pytest
 
 from mcp_coder.workflows.vscodeclaude.assessment import build_active_session_set
+from mcp_coder.workflows.vscodeclaude.process_tracker import VSCODE_PROCESS_NAMES
 from mcp_coder.workflows.vscodeclaude.sessions import (
-    VSCODE_PROCESS_NAMES,
     _get_vscode_processes,
     add_session,
     check_vscode_running,
@@ -389,9 +389,8 @@ def test_save_sessions_creates_directories(
         }
         save_sessions(store)
 
-        assert sessions_file.exists()
-        loaded = json.loads(sessions_file.read_text(encoding="utf-8"))
-        assert "sessions" in loaded
+        assert sessions_file.with_suffix(".sqlite3").exists()
+        assert load_sessions()["sessions"] == []
 
 
 class TestSessionHasArtifacts:
@@ -469,7 +468,7 @@ def test_updates_existing_session_status(
 
         # Assert
         assert result is True
-        updated_store = json.loads(sessions_file.read_text())
+        updated_store = load_sessions()
         assert updated_store["sessions"][0]["status"] == "status-04:plan-review"
 
     def test_returns_false_for_nonexistent_session(
@@ -526,7 +525,7 @@ def test_does_not_modify_other_sessions(
 
         update_session_status("/workspace/repo_123", "status-04:plan-review")
 
-        updated_store = json.loads(sessions_file.read_text())
+        updated_store = load_sessions()
         # First session updated
         assert updated_store["sessions"][0]["status"] == "status-04:plan-review"
         # Second session unchanged
@@ -560,7 +559,7 @@ def test_updates_last_updated_timestamp(
 
         update_session_status("/workspace/repo_123", "status-04:plan-review")
 
-        updated_store = json.loads(sessions_file.read_text())
+        updated_store = load_sessions()
         assert updated_store["last_updated"] != "old-timestamp"
 
 
@@ -0,0 +1,142 @@
+"""Tests for the vscodeclaude venv template cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from mcp_coder.workflows.vscodeclaude import venv_template
+from mcp_coder.workflows.vscodeclaude.venv_template import (
+    MAX_TEMPLATES,
+    TEMPLATE_MAX_AGE_DAYS,
+    clone_venv_template,
+    evict_stale_venv_templates,
+    list_venv_templates,
+    render_venv_templates,
+    save_venv_template,
+    venv_template_key,
+)
+
+_MODULE = "mcp_coder.workflows.vscodeclaude.venv_template"
+
+
+@pytest.fixture(autouse=True)
+def _template_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep templates under tmp_path."""
+    app_dir = tmp_path / "app_data"
+    monkeypatch.setattr(f"{_MODULE}.get_user_app_data_dir", lambda _name: app_dir)
+    return app_dir / "venv_templates"
+
+
+def _make_venv(venv: Path, *, relocatable: bool = True) -> Path:
+    """Create a minimal venv layout."""
+    site = venv / "lib" / "site-packages"
+    (site / "pkg").mkdir(parents=True)
+    (site / "pkg" / "__init__.py").write_text("VALUE = 1\n")
+    (site / "project.pth").write_text("/old/project\n")
+    (venv / "bin").mkdir()
+    (venv / "bin" / "tool").write_text("#!/bin/sh\n")
+    cfg = "home = /usr/bin\n" + ("relocatable = true\n" if relocatable else "")
+    (venv / "pyvenv.cfg").write_text(cfg)
+    return venv
+
+
+def _make_project(project: Path, lock: str = "lock-1") -> Path:
+    project.mkdir(parents=True, exist_ok=True)
+    (project / "pyproject.toml").write_text('[project]\nname = "p"\n')
+    (project / "uv.lock").write_text(lock)
+    return project
+
+
+class TestVenvTemplateKey:
+    """Tests for venv_template_key."""
+
+    def test_none_without_pyproject(self, tmp_path: Path) -> None:
+        assert venv_template_key(tmp_path, False) is None
+
+    def test_stable_for_same_inputs(self, tmp_path: Path) -> None:
+        a = _make_project(tmp_path / "a")
+        b = _make_project(tmp_path / "b")
+        assert venv_template_key(a, False) == venv_template_key(b, False)
+
+    def test_changes_with_lockfile_and_overrides_flag(self, tmp_path: Path) -> None:
+        a = _make_project(tmp_path / "a", lock="lock-1")
+        b = _make_project(tmp_path / "b", lock="lock-2")
+        assert venv_template_key(a, False) != venv_template_key(b, False)
+        assert venv_template_key(a, False) != venv_template_key(a, True)
+
+
+class TestSaveAndClone:
+    """Tests for save_venv_template and clone_venv_template."""
+
+    def test_round_trip_hardlinks_packages_and_copies_rewritable_files(
+        self, tmp_path: Path
+    ) -> None:
+        source = _make_venv(tmp_path / "s1" / ".venv")
+        assert save_venv_template("k1", source)
+
+        target = tmp_path / "s2" / ".venv"
+        assert clone_venv_template("k1", target)
+
+        pkg_file = Path("lib", "site-packages", "pkg", "__init__.py")
+        pth_file = Path("lib", "site-packages", "project.pth")
+        assert (target / pkg_file).read_text() == "VALUE = 1\n"
+        assert os.path.samefile(source / pkg_file, target / pkg_file)
+        assert not os.path.samefile(source / pth_file, target / pth_file)
+        assert not os.path.samefile(source / "pyvenv.cfg", target / "pyvenv.cfg")
+        assert not os.path.samefile(source / "bin" / "tool", target / "bin" / "tool")
+
+    def test_existing_template_is_kept(self, tmp_path: Path) -> None:
+        assert save_venv_template("k1", _make_venv(tmp_path / "s1" / ".venv"))
+        assert not save_venv_template("k1", _make_venv(tmp_path / "s2" / ".venv"))
+
+    def test_non_relocatable_venv_is_not_saved(
+        self, tmp_path: Path, _template_dir: Path
+    ) -> None:
+        venv = _make_venv(tmp_path / "s1" / ".venv", relocatable=False)
+        assert not save_venv_template("k1", venv)
+        assert not (_template_dir / "k1").exists()
+
+    def test_clone_needs_template_and_missing_venv(self, tmp_path: Path) -> None:
+        assert not clone_venv_template("missing", tmp_path / "s" / ".venv")
+
+        assert save_venv_template("k1", _make_venv(tmp_path / "s1" / ".venv"))
+        existing = tmp_path / "s2" / ".venv"
+        existing.mkdir(parents=True)
+        assert not clone_venv_template("k1", existing)
+        assert not any(existing.iterdir())
+
+
+class TestStaleTemplates:
+    """Tests for listing and evicting templates."""
+
+    def _save_aged(self, tmp_path: Path, key: str, age_days: float) -> None:
+        assert save_venv_template(key, _make_venv(tmp_path / key / ".venv"))
+        when = time.time() - age_days * 86400
+        metadata = venv_template.get_venv_template_dir() / key / "template.json"
+        os.utime(metadata, (when, when))
+
+    def test_old_and_surplus_templates_are_stale(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Keep every template while setting up (saving evicts on its own).
+        monkeypatch.setattr(f"{_MODULE}.evict_stale_venv_templates", lambda: [])
+        for i in range(MAX_TEMPLATES + 1):
+            self._save_aged(tmp_path, f"recent{i}", age_days=i)
+        self._save_aged(tmp_path, "old", age_days=TEMPLATE_MAX_AGE_DAYS + 1)
+
+        templates = list_venv_templates()
+        stale = {t.key for t in templates if t.stale}
+        assert stale == {f"recent{MAX_TEMPLATES}", "old"}
+        assert "(stale)" in render_venv_templates(templates)
+
+        assert set(evict_stale_venv_templates()) == stale
+        assert {t.key for t in list_venv_templates()} == {
+            f"recent{i}" for i in range(MAX_TEMPLATES)
+        }
+
+    def test_saving_evicts_stale_templates(self, tmp_path: Path) -> None:
+        self._save_aged(tmp_path, "old", age_days=TEMPLATE_MAX_AGE_DAYS + 1)
+        assert save_venv_template("new", _make_venv(tmp_path / "new" / ".venv"))
+        assert [t.key for t in list_venv_templates()] == ["new"]
@@ -0,0 +1,216 @@
+"""Benchmark the Claude CLI NDJSON stream pipeline per event.
+
+Pushes a multi-MB Claude stream log through the stages that
+``ask_claude_code_cli_stream`` runs for every line and reports the cost of
+each stage in microseconds per line, plus overall throughput:
+
+- ``parse``: ``parse_stream_json_line`` (``orjson`` when installed),
+- ``dispatch``: ``_map_stream_message_to_event`` plus ``ResponseAssembler``,
+- ``log``: ``BufferedStreamLog`` writes to a temporary file, next to the
+  old per-line write-and-flush for comparison.
+
+The stream is either a recorded log (``logs/claude-sessions/*.ndjson``) or a
+synthetic conversation of text, tool calls with large outputs and results.
+
+Usage:
+    python tools/claude_stream_benchmark.py                   # ~8 MB synthetic
+    python tools/claude_stream_benchmark.py --mib 32 --output-kib 4
+    python tools/claude_stream_benchmark.py --stream-file logs/claude-sessions/x.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from mcp_coder.llm.providers.claude.claude_code_cli_streaming import (
+    _map_stream_message_to_event,
+)
+from mcp_coder.llm.providers.claude.claude_mcp_guard import (
+    StreamMessage,
+    parse_stream_json_line,
+)
+from mcp_coder.llm.providers.claude.claude_stream_pipeline import (
+    JSON_BACKEND,
+    BufferedStreamLog,
+)
+from mcp_coder.llm.types import ResponseAssembler
+
+
+@dataclass
+class StageTimings:
+    """Per-stage timings of one pass over a stream."""
+
+    lines: int
+    size_bytes: int
+    events: int
+    parse_s: float
+    dispatch_s: float
+    log_buffered_s: float
+    log_per_line_s: float
+
+    def per_line_us(self, seconds: float) -> float:
+        """Convert a stage total into microseconds per line."""
+        return seconds / max(1, self.lines) * 1e6
+
+    @property
+    def pipeline_s(self) -> float:
+        """Parse + dispatch + buffered logging: the per-line hot path."""
+        return self.parse_s + self.dispatch_s + self.log_buffered_s
+
+
+def synthetic_lines(target_mib: float, output_kib: int) -> list[str]:
+    """Build a Claude stream log of about ``target_mib`` MiB."""
+    session_id = "bench-session"
+    lines = [
+        json.dumps(
+            {
+                "type": "system",
+                "subtype": "init",
+                "session_id": session_id,
+                "tools": ["Bash", "Read"],
+                "mcp_servers": [{"name": "workspace", "status": "connected"}],
+            }
+        )
+    ]
+    output = "line of tool output\n" * (output_kib * 1024 // 20)
+    size = len(lines[0])
+    i = 0
+    while size < target_mib * 2**20:
+        step = [
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "text", "text": f"Step {i}: reading the file."},
+                        {
+                            "type": "tool_use",
+                            "id": f"toolu_{i}",
+                            "name": "Read",
+                            "input": {"file_path": f"src/module_{i}.py"},
+                        },
+                    ]
+                },
+                "session_id": session_id,
+            },
+            {
+                "type": "user",
+                "message": {
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": f"toolu_{i}",
+                            "content": output,
+                        }
+                    ]
+                },
+                "session_id": session_id,
+            },
+        ]
+        for message in step:
+            line = json.dumps(message)
+            lines.append(line)
+            size += len(line) + 1
+        i += 1
+    lines.append(
+        json.dumps(
+            {
+                "type": "result",
+                "subtype": "success",
+                "result": "done",
+                "session_id": session_id,
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            }
+        )
+    )
+    return lines
+
+
+def recorded_lines(path: Path) -> list[str]:
+    """Read a recorded Claude NDJSON stream log."""
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def measure(lines: list[str]) -> StageTimings:
+    """Time each pipeline stage over ``lines``."""
+    start = time.perf_counter()
+    messages: list[StreamMessage | None] = [
+        parse_stream_json_line(line) for line in lines
+    ]
+    parse_s = time.perf_counter() - start
+
+    assembler = ResponseAssembler("claude", retention="summary")
+    events = 0
+    start = time.perf_counter()
+    for message in messages:
+        if message:
+            for event in _map_stream_message_to_event(message):
+                assembler.add(event)
+                events += 1
+    assembler.result()
+    dispatch_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "stream.ndjson"
+        start = time.perf_counter()
+        with BufferedStreamLog(open(path, "w", encoding="utf-8")) as log:
+            for line, message in zip(lines, messages):
+                log.write_line(line)
+                if message and message.get("type") == "result":
+                    log.end_turn()
+        log_buffered_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as fh:
+            for line in lines:
+                fh.write(line + "\n")
+                fh.flush()
+        log_per_line_s = time.perf_counter() - start
+
+    return StageTimings(
+        lines=len(lines),
+        size_bytes=sum(len(line) + 1 for line in lines),
+        events=events,
+        parse_s=parse_s,
+        dispatch_s=dispatch_s,
+        log_buffered_s=log_buffered_s,
+        log_per_line_s=log_per_line_s,
+    )
+
+
+def main() -> int:
+    """Print per-stage timings for the chosen stream."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mib", type=float, default=8.0)
+    parser.add_argument("--output-kib", type=int, default=2)
+    parser.add_argument("--stream-file", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.stream_file is not None:
+        lines = recorded_lines(args.stream_file)
+    else:
+        lines = synthetic_lines(args.mib, args.output_kib)
+    t = measure(lines)
+
+    print(
+        f"{t.lines} lines, {t.size_bytes / 2**20:.1f} MiB, {t.events} events "
+        f"(JSON backend: {JSON_BACKEND})"
+    )
+    print(f"parse              {t.per_line_us(t.parse_s):8.1f} us/line")
+    print(f"dispatch           {t.per_line_us(t.dispatch_s):8.1f} us/line")
+    print(f"log (buffered)     {t.per_line_us(t.log_buffered_s):8.1f} us/line")
+    print(f"log (flush/line)   {t.per_line_us(t.log_per_line_s):8.1f} us/line")
+    print(
+        f"pipeline           {t.per_line_us(t.pipeline_s):8.1f} us/line  "
+        f"({t.size_bytes / 2**20 / max(t.pipeline_s, 1e-9):.0f} MiB/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
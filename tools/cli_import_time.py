@@ -0,0 +1,135 @@
+"""Measure ``mcp-coder`` CLI startup import cost per subcommand.
+
+Runs ``python -X importtime`` in a fresh interpreter for each subcommand,
+importing ``mcp_coder.cli.main`` plus the handler module of that subcommand
+(exactly what ``mcp-coder <command>`` imports before doing any work), and
+reports the total import time and whether any heavy package was pulled in.
+
+Usage:
+    python tools/cli_import_time.py                       # all commands
+    python tools/cli_import_time.py "gh-tool get-base-branch" --budget-ms 500
+
+Exit code is 1 if any measured command exceeds ``--budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+# Packages that cheap subcommands must never import at startup.
+HEAVY_MODULES = (
+    "textual",
+    "langchain_core",
+    "langchain_mcp_adapters",
+    "anthropic",
+    "openai",
+    "google.genai",
+    "mlflow",
+    "github",
+    "jenkins",
+    "mcp_coder.icoder",
+    "mcp_coder.cli.commands.coordinator",
+)
+
+# Subcommands dispatched at high volume by automation (Jenkins, skills) that
+# must not pull in the LLM providers, Textual or the coordinator at startup.
+# ``None`` measures the bare entry point (``--version``, ``help``).
+CHEAP_COMMANDS: tuple[str | None, ...] = (
+    None,
+    "init",
+    "gh-tool get-base-branch",
+    "gh-tool set-status",
+    "git-tool compact-diff",
+    "check file-size",
+)
+
+# Startup budget of the bare entry point, in milliseconds.
+ENTRY_POINT_BUDGET_MS = 1000.0
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+@dataclass
+class ImportProfile:
+    """Import-time profile of one interpreter run."""
+
+    command: str | None
+    total_us: int = 0
+    modules: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_ms(self) -> float:
+        """Total import time in milliseconds."""
+        return self.total_us / 1000
+
+    def heavy_modules(self) -> list[str]:
+        """Return the ``HEAVY_MODULES`` entries that were imported."""
+        return [
+            heavy
+            for heavy in HEAVY_MODULES
+            if any(
+                name == heavy or name.startswith(heavy + ".") for name in self.modules
+            )
+        ]
+
+
+def parse_importtime(stderr: str, command: str | None = None) -> ImportProfile:
+    """Parse ``-X importtime`` output into an ImportProfile.
+
+    The total is the sum of the cumulative times of top-level imports.
+    """
+    profile = ImportProfile(command=command)
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _self_us, cumulative_us, indent, name = match.groups()
+        profile.modules[name] = int(cumulative_us)
+        if not indent:
+            profile.total_us += int(cumulative_us)
+    return profile
+
+
+def measure(command: str | None) -> ImportProfile:
+    """Import the CLI (and the command's handler) in a fresh interpreter."""
+    code = "from mcp_coder.cli.main import _load_handler"
+    if command is not None:
+        code += f"; _load_handler({command!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr, command)
+
+
+def main() -> int:
+    """Print the import-time table and check it against the budget."""
+    from mcp_coder.cli.command_catalog import COMMAND_HANDLERS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("commands", nargs="*", help="Command keys (default: all)")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    commands: list[str | None] = [None, *(args.commands or COMMAND_HANDLERS)]
+    over_budget = False
+    for command in commands:
+        profile = measure(command)
+        heavy = ", ".join(profile.heavy_modules()) or "-"
+        flag = ""
+        if args.budget_ms is not None and profile.total_ms > args.budget_ms:
+            flag = "  OVER BUDGET"
+            over_budget = True
+        label = command or "(entry point)"
+        print(f"{label:<32} {profile.total_ms:8.1f} ms  heavy: {heavy}{flag}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -155,6 +155,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--refresh", action="store_true",
         help="Pass --refresh to uv so cached git clones are bypassed.",
     )
+    p.add_argument(
+        "--relocatable", action="store_true",
+        help="Create the venv with `uv venv --relocatable`, so it keeps "
+             "working when copied elsewhere (vscodeclaude venv templates).",
+    )
     p.add_argument(
         "--clean", action="store_true",
         help="Delete an existing .venv before creating a fresh one.",
@@ -288,7 +293,7 @@ def _phase_venv(target: Path, venv: Path, args: argparse.Namespace) -> None:
 
     With ``--clean``, an existing venv is wiped first. ``uv venv`` is
     preferred when an existing ``uv`` binary is on PATH; otherwise the
-    stdlib ``venv`` module is used.
+    stdlib ``venv`` module is used (``--relocatable`` then has no effect).
     """
     target.mkdir(parents=True, exist_ok=True)
     if args.clean and venv.exists():
@@ -299,7 +304,10 @@ def _phase_venv(target: Path, venv: Path, args: argparse.Namespace) -> None:
         return
     uv_bootstrap = shutil.which("uv")
     if uv_bootstrap:
-        run([uv_bootstrap, "venv", str(venv)], dry=args.check)
+        cmd = [uv_bootstrap, "venv", str(venv)]
+        if args.relocatable:
+            cmd.append("--relocatable")
+        run(cmd, dry=args.check)
     else:
         run([args.python, "-m", "venv", str(venv)], dry=args.check)
 
@@ -0,0 +1,113 @@
+"""Benchmark iCoder ``OutputLog`` resize and tier-toggle latency.
+
+Fills a headless ``OutputLog`` with sessions of increasing length (tool units
+interleaved with wrapping text lines) and times a tier toggle and a terminal
+resize on each. With the block cache both should stay roughly flat as the
+session grows. The resize figure is the longest rebuild triggered by the
+resize; the total including the background re-wrap is printed alongside.
+
+Usage:
+    python tools/output_log_benchmark.py                  # 5k and 50k lines
+    python tools/output_log_benchmark.py --lines 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from textual.app import App, ComposeResult
+
+from mcp_coder.icoder.ui.widgets.output_log import ContentUnit, OutputLog
+
+# Buffer lines produced by one tool unit plus its text line at 120 columns.
+_LINES_PER_UNIT = 6
+
+
+class _BenchApp(App[None]):
+    """Minimal app hosting a single OutputLog."""
+
+    def compose(self) -> ComposeResult:
+        yield OutputLog()
+
+
+def _fill(output: OutputLog, n_units: int) -> None:
+    for i in range(n_units):
+        output.append_unit(
+            ContentUnit(
+                id=f"T{i}",
+                kind="tool",
+                timestamp=datetime.now(),
+                tool_name="read_file",
+                args={"path": f"src/file_{i}.py"},
+                output="o1\no2",
+                output_lines=("o1", "o2"),
+                total_lines=2,
+            ),
+            ["start"],
+        )
+        output.append_text(f"line {i} " + "word " * 40)
+
+
+async def measure(n_lines: int) -> dict[str, float]:
+    """Time a tier toggle and a resize on a session of ``n_lines`` lines.
+
+    Returns:
+        Buffer line count and toggle, resize and resize-total milliseconds.
+    """
+    app = _BenchApp()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        output = app.query_one(OutputLog)
+        _fill(output, max(1, n_lines // _LINES_PER_UNIT))
+        output.rebuild()
+        await pilot.pause()
+
+        start = time.perf_counter()
+        output.toggle_unit_tier("T0")
+        toggle_ms = (time.perf_counter() - start) * 1000
+
+        # Time the rebuilds triggered by the resize (what blocks the UI)
+        # separately from the whole resize including the background re-wrap.
+        rebuild_ms: list[float] = []
+        rebuild = output.rebuild
+
+        def _timed_rebuild() -> None:
+            started = time.perf_counter()
+            rebuild()
+            rebuild_ms.append((time.perf_counter() - started) * 1000)
+
+        output.rebuild = _timed_rebuild  # type: ignore[method-assign]
+        start = time.perf_counter()
+        await pilot.resize_terminal(90, 40)
+        total_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            "buffer_lines": float(len(output.lines)),
+            "toggle_ms": toggle_ms,
+            "resize_ms": max(rebuild_ms, default=0.0),
+            "resize_total_ms": total_ms,
+        }
+
+
+def main() -> int:
+    """Print toggle/resize timings per session size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="*", default=[5_000, 50_000])
+    args = parser.parse_args()
+    for n_lines in args.lines:
+        result = asyncio.run(measure(n_lines))
+        print(
+            f"{int(result['buffer_lines']):>8} lines  "
+            f"toggle {result['toggle_ms']:8.1f} ms  "
+            f"resize {result['resize_ms']:8.1f} ms  "
+            f"(incl. background re-wrap {result['resize_total_ms']:8.1f} ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
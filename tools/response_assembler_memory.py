@@ -0,0 +1,94 @@
+"""Measure ``ResponseAssembler`` memory per event-retention mode.
+
+Feeds a stream of StreamEvents through one assembler per retention mode and
+reports the memory still held after ``result()`` (what a caller keeps alive
+until the response is stored) and the peak, using ``tracemalloc``.
+
+The stream is either a recorded Claude CLI NDJSON stream log
+(``logs/claude-sessions/*.ndjson``) replayed through the streaming mapper, or
+a synthetic 10k-event conversation with large tool outputs.
+
+Usage:
+    python tools/response_assembler_memory.py
+    python tools/response_assembler_memory.py --events 10000 --output-kib 16
+    python tools/response_assembler_memory.py --stream-file logs/claude-sessions/x.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import get_args
+
+from mcp_coder.llm.types import ResponseAssembler, RetentionMode, StreamEvent
+
+
+def synthetic_stream(n_events: int, output_kib: int) -> Iterator[StreamEvent]:
+    """Yield a conversation of text deltas and tool calls with big outputs."""
+    output = "x" * (output_kib * 1024)
+    for i in range(n_events // 3):
+        yield {"type": "text_delta", "text": f"step {i}\n"}
+        yield {"type": "tool_use_start", "name": "read_file", "args": {"i": i}}
+        # A fresh string per result, as a real stream would produce.
+        yield {"type": "tool_result", "name": "read_file", "output": output + str(i)}
+    yield {"type": "done", "session_id": "bench", "usage": {}}
+
+
+def recorded_stream(path: Path) -> Iterator[StreamEvent]:
+    """Replay a recorded Claude NDJSON stream log as StreamEvents."""
+    from mcp_coder.llm.providers.claude.claude_code_cli_streaming import (
+        _map_stream_message_to_event,
+    )
+    from mcp_coder.llm.providers.claude.claude_mcp_guard import (
+        parse_stream_json_line,
+    )
+
+    yield {"type": "stream_file", "path": str(path)}
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.rstrip("\n")
+            yield {"type": "raw_line", "line": line}
+            msg = parse_stream_json_line(line)
+            if msg:
+                yield from _map_stream_message_to_event(msg)
+
+
+def measure(events: Iterator[StreamEvent], retention: RetentionMode) -> tuple[int, int]:
+    """Return ``(retained_bytes, peak_bytes)`` for one assembler run."""
+    tracemalloc.start()
+    assembler = ResponseAssembler("claude", retention=retention)
+    for event in events:
+        assembler.add(event)
+    response = assembler.result()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response, assembler
+    return retained, peak
+
+
+def main() -> int:
+    """Print retained/peak memory for each retention mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--output-kib", type=int, default=8)
+    parser.add_argument("--stream-file", type=Path, default=None)
+    args = parser.parse_args()
+
+    for retention in get_args(RetentionMode):
+        if args.stream_file is not None:
+            events = recorded_stream(args.stream_file)
+        else:
+            events = synthetic_stream(args.events, args.output_kib)
+        retained, peak = measure(events, retention)
+        print(
+            f"{retention:<8} retained {retained / 2**20:8.1f} MiB  "
+            f"peak {peak / 2**20:8.1f} MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
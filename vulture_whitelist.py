@@ -381,3 +381,21 @@
 _._agenerate
 _._llm_type
 _.run_manager
+
+# workflow_steps/ci_wait.py - BaseHTTPRequestHandler dispatches POSTs to do_POST.
+_.do_POST
+
+# Autouse fixtures isolating process-wide caches between tests.
+_.disable_mcp_tool_cache
+_._no_check_cache
+_._isolated_mirrors
+_._fresh_http_pool
+_._fresh_agent_runtime
+
+# mcp_coder/__init__.py - module-level __dir__ is called by dir(mcp_coder)
+# (PEP 562) to list the lazily imported public API.
+_.__dir__
+
+# icoder/ui/widgets/output_log.py - _start_line is RichLog's own render offset;
+# OutputLog resets it when it rebuilds the line buffer.
+_._start_line